@@ -2,8 +2,12 @@
 
 namespace App\Http\Controllers;
 
+use App\Jobs\ImportEcommerceContacts;
 use App\Models\CrmContact;
+use App\Models\CrmContactImport;
+use App\Models\Order;
 use App\Models\Workspace;
+use App\Services\EcommerceContactImporter;
 use Illuminate\Http\Request;
 use Illuminate\Support\Str;
 use Illuminate\Validation\Rule;
@@ -420,47 +424,16 @@ public function analytics(Request $request)
             }
         }
 
-        $query = CrmContact::query();
-        
         if ($workspaceId) {
-            $query->where('workspace_id', $workspaceId);
+            $workspaceIds = [$workspaceId];
         } else {
             // Get contacts from all workspaces user has access to
-            $userWorkspaceIds = auth()->user()->workspaces()->pluck('workspaces.id');
-            $query->whereIn('workspace_id', $userWorkspaceIds);
+            $workspaceIds = auth()->user()->workspaces()->pluck('workspaces.id');
         }
 
-        $totalContacts = $query->count();
-        $activeContacts = $query->where('status', 'active')->count();
-        $inactiveContacts = $query->where('status', 'inactive')->count();
-        $blockedContacts = $query->where('status', 'blocked')->count();
-
-        $hotLeads = $query->where('lead_score', '>=', 80)->count();
-        $warmLeads = $query->where('lead_score', '>=', 60)->where('lead_score', '<', 80)->count();
-        $coldLeads = $query->where('lead_score', '>=', 40)->where('lead_score', '<', 60)->count();
-        $unqualifiedLeads = $query->where('lead_score', '<', 40)->count();
-
-        $followUpNeeded = $query->where(function ($q) {
-            $q->whereNull('last_contacted_at')
-              ->orWhere('last_contacted_at', '<=', now()->subDays(30));
-        })->count();
-
-        $averageLeadScore = $query->avg('lead_score') ?? 0;
-
         return response()->json([
             'success' => true,
-            'analytics' => [
-                'total_contacts' => $totalContacts,
-                'active_contacts' => $activeContacts,
-                'inactive_contacts' => $inactiveContacts,
-                'blocked_contacts' => $blockedContacts,
-                'hot_leads' => $hotLeads,
-                'warm_leads' => $warmLeads,
-                'cold_leads' => $coldLeads,
-                'unqualified_leads' => $unqualifiedLeads,
-                'follow_up_needed' => $followUpNeeded,
-                'average_lead_score' => round($averageLeadScore, 2),
-            ]
+            'analytics' => CrmContact::analyticsFor($workspaceIds)
         ]);
     }
 
@@ -545,80 +518,64 @@ public function contactAnalytics(Request $request, CrmContact $crmContact)
     /**
      * Import contacts from e-commerce orders.
      */
-    public function importFromEcommerce(Request $request)
+    public function importFromEcommerce(Request $request, EcommerceContactImporter $importer)
     {
         $workspaceId = $request->input('workspace_id');
         
         // Validate workspace access
-        if ($workspaceId) {
-            $workspace = Workspace::find($workspaceId);
-            if (!$workspace || !$workspace->members()->where('user_id', auth()->id())->exists()) {
-                return response()->json([
-                    'success' => false,
-                    'message' => 'Unauthorized access to workspace'
-                ], 403);
-            }
+        $workspace = Workspace::find($workspaceId);
+        if (!$workspace || !$workspace->members()->where('user_id', auth()->id())->exists()) {
+            return response()->json([
+                'success' => false,
+                'message' => 'Unauthorized access to workspace'
+            ], 403);
         }
 
-        // Get orders from e-commerce system
-        $orders = \App\Models\Order::where('workspace_id', $workspaceId)
-            ->whereNotNull('customer_email')
-            ->get();
+        $import = CrmContactImport::create([
+            'workspace_id' => $workspaceId,
+            'created_by' => auth()->id(),
+            'status' => 'queued',
+            'total_orders' => Order::where('workspace_id', $workspaceId)->whereNotNull('customer_email')->count()
+        ]);
 
-        $importedCount = 0;
-        $updatedCount = 0;
-
-        foreach ($orders as $order) {
-            // Check if contact already exists
-            $existingContact = CrmContact::where('email', $order->customer_email)
-                ->where('workspace_id', $workspaceId)
-                ->first();
-
-            if ($existingContact) {
-                // Update existing contact
-                $existingContact->update([
-                    'phone' => $existingContact->phone ?: $order->customer_phone,
-                    'notes' => $existingContact->notes . "\n\nImported from order #{$order->order_number}",
-                    'lead_score' => min(100, $existingContact->lead_score + 10), // Increase lead score
-                    'last_contacted_at' => now(),
-                ]);
-                $updatedCount++;
-            } else {
-                // Create new contact
-                $nameParts = explode(' ', $order->customer_name, 2);
-                $firstName = $nameParts[0] ?? '';
-                $lastName = $nameParts[1] ?? '';
-
-                CrmContact::create([
-                    'id' => Str::uuid(),
-                    'workspace_id' => $workspaceId,
-                    'first_name' => $firstName,
-                    'last_name' => $lastName,
-                    'email' => $order->customer_email,
-                    'phone' => $order->customer_phone,
-                    'notes' => "Imported from e-commerce order #{$order->order_number}",
-                    'tags' => ['customer', 'e-commerce'],
-                    'status' => 'active',
-                    'lead_score' => 50,
-                    'custom_fields' => [
-                        'source' => 'e-commerce',
-                        'first_order_date' => $order->created_at,
-                        'total_orders' => 1,
-                    ],
-                    'created_by' => auth()->id(),
-                    'last_contacted_at' => now(),
-                ]);
-                $importedCount++;
-            }
+        // Large imports run on the queue; clients poll the import for progress
+        if ($import->total_orders > CrmContactImport::SYNC_LIMIT) {
+            ImportEcommerceContacts::dispatch($import->id);
+
+            return response()->json([
+                'success' => true,
+                'data' => array_merge($import->progress(), [
+                    'message' => 'Contact import queued'
+                ])
+            ], 202);
         }
 
+        $importer->run($import);
+
         return response()->json([
             'success' => true,
-            'data' => [
-                'imported_count' => $importedCount,
-                'updated_count' => $updatedCount,
+            'data' => array_merge($import->progress(), [
                 'message' => 'Contacts imported successfully from e-commerce orders'
-            ]
+            ])
+        ]);
+    }
+
+    /**
+     * Get the progress of a contact import.
+     */
+    public function importStatus(CrmContactImport $import)
+    {
+        // Check if user has access to this import's workspace
+        if (!$import->workspace->members()->where('user_id', auth()->id())->exists()) {
+            return response()->json([
+                'success' => false,
+                'message' => 'Unauthorized access to workspace'
+            ], 403);
+        }
+
+        return response()->json([
+            'success' => true,
+            'data' => $import->progress()
         ]);
     }
 }
\ No newline at end of file
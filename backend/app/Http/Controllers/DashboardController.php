@@ -3,13 +3,7 @@
 namespace App\Http\Controllers;
 
 use App\Models\Workspace;
-use App\Models\PaymentTransaction;
-use App\Models\SocialMediaPost;
-use App\Models\LinkInBioPage;
-use App\Models\EmailCampaign;
-use App\Models\CrmContact;
-use App\Models\Course;
-use App\Models\Product;
+use App\Models\WorkspaceCounter;
 use App\Models\ActivityLog;
 use Illuminate\Http\Request;
 use Illuminate\Support\Facades\DB;
@@ -32,27 +26,20 @@ public function getStats($workspaceId)
             ], 403);
         }
 
-        // Get various statistics
+        // Read from the materialized counters instead of counting the source tables
+        $counters = WorkspaceCounter::forWorkspace($workspaceId);
+
         $stats = [
-            'totalRevenue' => PaymentTransaction::where('workspace_id', $workspaceId)
-                ->where('payment_status', 'paid')
-                ->sum('amount'),
-            'totalPosts' => SocialMediaPost::where('workspace_id', $workspaceId)->count(),
-            'activeLinks' => LinkInBioPage::where('workspace_id', $workspaceId)
-                ->where('is_active', true)
-                ->count(),
-            'emailCampaigns' => EmailCampaign::where('workspace_id', $workspaceId)->count(),
-            'crmContacts' => CrmContact::where('workspace_id', $workspaceId)->count(),
-            'courses' => Course::where('workspace_id', $workspaceId)->count(),
-            'products' => Product::where('workspace_id', $workspaceId)->count(),
-            'monthlyRevenue' => PaymentTransaction::where('workspace_id', $workspaceId)
-                ->where('payment_status', 'paid')
-                ->whereMonth('created_at', now()->month)
-                ->sum('amount'),
-            'totalViews' => LinkInBioPage::where('workspace_id', $workspaceId)
-                ->sum('total_views'),
-            'totalClicks' => LinkInBioPage::where('workspace_id', $workspaceId)
-                ->sum('total_clicks')
+            'totalRevenue' => $counters->revenue_total,
+            'totalPosts' => $counters->posts_count,
+            'activeLinks' => $counters->active_link_pages_count,
+            'emailCampaigns' => $counters->email_campaigns_count,
+            'crmContacts' => $counters->contacts_count,
+            'courses' => $counters->courses_count,
+            'products' => $counters->products_count,
+            'monthlyRevenue' => $counters->monthlyRevenue(),
+            'totalViews' => $counters->link_views_total,
+            'totalClicks' => $counters->link_clicks_total
         ];
 
         return response()->json([
@@ -104,18 +91,14 @@ public function getQuickStats($workspaceId)
             ], 403);
         }
 
+        $counters = WorkspaceCounter::forWorkspace($workspaceId);
+
         $stats = [
-            'totalPosts' => SocialMediaPost::where('workspace_id', $workspaceId)->count(),
-            'activeLinks' => LinkInBioPage::where('workspace_id', $workspaceId)
-                ->where('is_active', true)
-                ->count(),
-            'coursesCreated' => Course::where('workspace_id', $workspaceId)->count(),
-            'totalSales' => PaymentTransaction::where('workspace_id', $workspaceId)
-                ->where('payment_status', 'paid')
-                ->sum('amount'),
-            'leadsCaptured' => CrmContact::where('workspace_id', $workspaceId)
-                ->where('status', 'lead')
-                ->count()
+            'totalPosts' => $counters->posts_count,
+            'activeLinks' => $counters->active_link_pages_count,
+            'coursesCreated' => $counters->courses_count,
+            'totalSales' => $counters->revenue_total,
+            'leadsCaptured' => $counters->leads_count
         ];
 
         return response()->json([
@@ -139,33 +122,35 @@ public function getWorkspaceOverview($workspaceId)
             ], 403);
         }
 
+        $counters = WorkspaceCounter::forWorkspace($workspaceId);
+
         $overview = [
             'workspace' => $workspace,
-            'members_count' => $workspace->members()->count(),
+            'members_count' => $counters->members_count,
             'features' => [
                 'social_media' => [
-                    'posts' => SocialMediaPost::where('workspace_id', $workspaceId)->count(),
-                    'accounts' => $workspace->socialMediaAccounts()->count()
+                    'posts' => $counters->posts_count,
+                    'accounts' => $counters->social_accounts_count
                 ],
                 'link_in_bio' => [
-                    'pages' => LinkInBioPage::where('workspace_id', $workspaceId)->count(),
-                    'total_views' => LinkInBioPage::where('workspace_id', $workspaceId)->sum('total_views')
+                    'pages' => $counters->link_pages_count,
+                    'total_views' => $counters->link_views_total
                 ],
                 'email' => [
-                    'campaigns' => EmailCampaign::where('workspace_id', $workspaceId)->count(),
-                    'total_sent' => EmailCampaign::where('workspace_id', $workspaceId)->sum('sent_count')
+                    'campaigns' => $counters->email_campaigns_count,
+                    'total_sent' => $counters->emails_sent_total
                 ],
                 'crm' => [
-                    'contacts' => CrmContact::where('workspace_id', $workspaceId)->count(),
-                    'leads' => CrmContact::where('workspace_id', $workspaceId)->where('status', 'lead')->count()
+                    'contacts' => $counters->contacts_count,
+                    'leads' => $counters->leads_count
                 ],
                 'courses' => [
-                    'total' => Course::where('workspace_id', $workspaceId)->count(),
-                    'published' => Course::where('workspace_id', $workspaceId)->where('status', 'published')->count()
+                    'total' => $counters->courses_count,
+                    'published' => $counters->published_courses_count
                 ],
                 'products' => [
-                    'total' => Product::where('workspace_id', $workspaceId)->count(),
-                    'active' => Product::where('workspace_id', $workspaceId)->where('status', 'active')->count()
+                    'total' => $counters->products_count,
+                    'active' => $counters->active_products_count
                 ]
             ]
         ];
@@ -19,7 +19,10 @@ class PaymentController extends Controller
     
     public function __construct()
     {
-        $this->stripeService = new \Stripe\StripeClient(config('services.stripe.secret'));
+        $this->stripeService = new \Stripe\StripeClient(array_filter([
+            'api_key' => config('services.stripe.secret'),
+            'api_base' => config('services.stripe.api_base'),
+        ]));
     }
 
     /**
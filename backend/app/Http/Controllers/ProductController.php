@@ -404,56 +404,16 @@ public function analytics(Request $request)
             }
         }
 
-        $query = Product::query();
-        
         if ($workspaceId) {
-            $query->where('workspace_id', $workspaceId);
+            $workspaceIds = [$workspaceId];
         } else {
             // Get products from all workspaces user has access to
-            $userWorkspaceIds = auth()->user()->workspaces()->pluck('workspaces.id');
-            $query->whereIn('workspace_id', $userWorkspaceIds);
+            $workspaceIds = auth()->user()->workspaces()->pluck('workspaces.id');
         }
 
-        $totalProducts = $query->count();
-        $activeProducts = $query->where('status', 'active')->count();
-        $draftProducts = $query->where('status', 'draft')->count();
-        $archivedProducts = $query->where('status', 'archived')->count();
-
-        $physicalProducts = $query->where('type', 'physical')->count();
-        $digitalProducts = $query->where('type', 'digital')->count();
-        $serviceProducts = $query->where('type', 'service')->count();
-
-        $inStockProducts = $query->where(function ($q) {
-            $q->where('track_inventory', false)
-              ->orWhere('stock_quantity', '>', 0);
-        })->count();
-
-        $outOfStockProducts = $query->where('track_inventory', true)
-                                   ->where('stock_quantity', '<=', 0)
-                                   ->count();
-
-        $lowStockProducts = $query->where('track_inventory', true)
-                                  ->where('stock_quantity', '>', 0)
-                                  ->where('stock_quantity', '<=', 10)
-                                  ->count();
-
-        $totalInventoryValue = $query->sum(\DB::raw('price * stock_quantity'));
-
         return response()->json([
             'success' => true,
-            'analytics' => [
-                'total_products' => $totalProducts,
-                'active_products' => $activeProducts,
-                'draft_products' => $draftProducts,
-                'archived_products' => $archivedProducts,
-                'physical_products' => $physicalProducts,
-                'digital_products' => $digitalProducts,
-                'service_products' => $serviceProducts,
-                'in_stock_products' => $inStockProducts,
-                'out_of_stock_products' => $outOfStockProducts,
-                'low_stock_products' => $lowStockProducts,
-                'total_inventory_value' => $totalInventoryValue,
-            ]
+            'analytics' => Product::analyticsFor($workspaceIds)
         ]);
     }
 
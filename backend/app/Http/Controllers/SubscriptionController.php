@@ -20,6 +20,11 @@ class SubscriptionController extends Controller
     public function __construct()
     {
         Stripe::setApiKey(config('services.stripe.secret'));
+
+        // Point the SDK at a local stand-in server for offline load tests
+        if (config('services.stripe.api_base')) {
+            Stripe::$apiBase = config('services.stripe.api_base');
+        }
     }
 
     /**
@@ -2,6 +2,7 @@
 
 namespace App\Http\Controllers;
 
+use App\Jobs\SendInvitationBatchEmails;
 use App\Models\WorkspaceInvitation;
 use App\Models\InvitationBatch;
 use App\Models\Workspace;
@@ -197,7 +198,7 @@ public function bulkStore(Request $request, $workspaceId)
 
             $validator = Validator::make($request->all(), [
                 'batch_name' => 'required|string|max:255',
-                'invitations' => 'required|array|min:1|max:100',
+                'invitations' => 'required|array|min:1|max:' . InvitationBatch::MAX_INVITATIONS,
                 'invitations.*.email' => 'required|email',
                 'invitations.*.role' => 'required|in:owner,admin,editor,contributor,viewer,guest',
                 'invitations.*.department' => 'nullable|string|max:255',
@@ -221,100 +222,37 @@ public function bulkStore(Request $request, $workspaceId)
                 'created_by' => $user->id,
                 'name' => $request->batch_name,
                 'total_invitations' => count($invitations),
+                'status' => 'processing',
                 'batch_data' => ['invitations' => $invitations]
             ]);
 
-            $results = [];
-            $successful = 0;
-            $failed = 0;
-
-            foreach ($invitations as $invitationData) {
-                try {
-                    // Check if user is already a member
-                    $existingMember = WorkspaceMember::where('workspace_id', $workspaceId)
-                        ->whereHas('user', function ($query) use ($invitationData) {
-                            $query->where('email', $invitationData['email']);
-                        })
-                        ->first();
-
-                    if ($existingMember) {
-                        $results[] = [
-                            'email' => $invitationData['email'],
-                            'success' => false,
-                            'error' => 'User is already a member'
-                        ];
-                        $failed++;
-                        continue;
-                    }
-
-                    // Check for existing pending invitation
-                    $existingInvitation = WorkspaceInvitation::where('workspace_id', $workspaceId)
-                        ->where('email', $invitationData['email'])
-                        ->where('status', 'pending')
-                        ->first();
-
-                    if ($existingInvitation) {
-                        $results[] = [
-                            'email' => $invitationData['email'],
-                            'success' => false,
-                            'error' => 'Pending invitation already exists'
-                        ];
-                        $failed++;
-                        continue;
-                    }
-
-                    // Create invitation
-                    $invitation = WorkspaceInvitation::create([
-                        'workspace_id' => $workspaceId,
-                        'invited_by' => $user->id,
-                        'email' => $invitationData['email'],
-                        'role' => $invitationData['role'],
-                        'department' => $invitationData['department'] ?? null,
-                        'position' => $invitationData['position'] ?? null,
-                        'personal_message' => $invitationData['personal_message'] ?? null,
-                        'expires_at' => now()->addDays(7)
-                    ]);
-
-                    // Send invitation email
-                    $emailSent = $this->sendInvitationEmail($invitation, $workspace);
-
-                    $results[] = [
-                        'email' => $invitationData['email'],
-                        'success' => true,
-                        'invitation_id' => $invitation->id,
-                        'email_sent' => $emailSent
-                    ];
-                    $successful++;
-                } catch (\Exception $e) {
-                    $results[] = [
-                        'email' => $invitationData['email'],
-                        'success' => false,
-                        'error' => $e->getMessage()
-                    ];
-                    $failed++;
-                }
+            try {
+                $results = $batch->createInvitations($invitations);
+            } catch (\Exception $e) {
+                $batch->markAsFailed();
+                throw $e;
             }
 
-            // Update batch with results
-            $batch->update([
-                'successful_invitations' => $successful,
-                'failed_invitations' => $failed,
-                'status' => $failed === 0 ? 'completed' : 'completed_with_errors',
-                'completed_at' => now()
-            ]);
+            // Emails go out from the queue in chunks; the batch tracks their progress
+            if ($batch->successful_invitations > 0) {
+                SendInvitationBatchEmails::dispatch($batch->id);
+            } else {
+                $batch->markAsCompleted();
+            }
 
             return response()->json([
                 'success' => true,
                 'data' => [
                     'batch_id' => $batch->id,
+                    'status' => $batch->status,
                     'results' => $results,
                     'summary' => [
                         'total' => count($invitations),
-                        'successful' => $successful,
-                        'failed' => $failed
+                        'successful' => $batch->successful_invitations,
+                        'failed' => $batch->failed_invitations
                     ]
                 ],
-                'message' => 'Bulk invitations processed successfully'
+                'message' => 'Bulk invitations created, emails are being sent'
             ]);
         } catch (\Exception $e) {
             return response()->json([
@@ -324,6 +262,51 @@ public function bulkStore(Request $request, $workspaceId)
         }
     }
 
+    /**
+     * Get the progress of a bulk invitation batch
+     */
+    public function showBatch($batchId)
+    {
+        try {
+            $user = Auth::user();
+
+            $batch = InvitationBatch::findOrFail($batchId);
+
+            // Verify user has access to the batch's workspace
+            $member = WorkspaceMember::where('workspace_id', $batch->workspace_id)
+                ->where('user_id', $user->id)
+                ->whereIn('role', ['owner', 'admin'])
+                ->first();
+
+            if (!$member) {
+                return response()->json([
+                    'success' => false,
+                    'message' => 'Unauthorized access to workspace'
+                ], 403);
+            }
+
+            return response()->json([
+                'success' => true,
+                'data' => [
+                    'batch_id' => $batch->id,
+                    'name' => $batch->name,
+                    'status' => $batch->status,
+                    'total' => $batch->total_invitations,
+                    'successful' => $batch->successful_invitations,
+                    'failed' => $batch->failed_invitations,
+                    'emails_sent' => $batch->emails_sent,
+                    'emails_failed' => $batch->emails_failed,
+                    'completed_at' => $batch->completed_at
+                ]
+            ]);
+        } catch (\Exception $e) {
+            return response()->json([
+                'success' => false,
+                'message' => 'Failed to fetch invitation batch: ' . $e->getMessage()
+            ], 500);
+        }
+    }
+
     /**
      * Get invitation by token
      */
@@ -625,25 +608,7 @@ public function analytics($workspaceId)
                 ], 403);
             }
 
-            $invitations = WorkspaceInvitation::where('workspace_id', $workspaceId)->get();
-
-            $analytics = [
-                'overview' => [
-                    'total' => $invitations->count(),
-                    'pending' => $invitations->where('status', 'pending')->count(),
-                    'accepted' => $invitations->where('status', 'accepted')->count(),
-                    'declined' => $invitations->where('status', 'declined')->count(),
-                    'expired' => $invitations->where('status', 'expired')->count(),
-                    'cancelled' => $invitations->where('status', 'cancelled')->count()
-                ],
-                'distribution' => [
-                    'roles' => $invitations->groupBy('role')->map->count(),
-                    'departments' => $invitations->whereNotNull('department')->groupBy('department')->map->count()
-                ],
-                'acceptance_rate' => $invitations->count() > 0 
-                    ? round(($invitations->where('status', 'accepted')->count() / $invitations->count()) * 100, 1)
-                    : 0
-            ];
+            $analytics = WorkspaceInvitation::analyticsFor($workspaceId);
 
             return response()->json([
                 'success' => true,
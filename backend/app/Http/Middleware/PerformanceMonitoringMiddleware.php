@@ -11,37 +11,91 @@
 
 class PerformanceMonitoringMiddleware
 {
+    /**
+     * Queries kept for the slow-request log. Every query is counted, but the full query log
+     * would hold the bindings of every bulk insert in memory until the request ends.
+     */
+    private const LOGGED_QUERIES = 50;
+
+    /**
+     * Event dispatcher the query listener is registered on; registered once per dispatcher
+     * so long-running workers do not pile up a listener per request.
+     */
+    private static ?object $events = null;
+
+    private static bool $measuring = false;
+
+    private static int $queryCount = 0;
+
+    private static array $queries = [];
+
     /**
      * Handle an incoming request.
      */
     public function handle(Request $request, Closure $next): Response
     {
+        if (!config('app.performance_headers')) {
+            return $next($request);
+        }
+
         $startTime = microtime(true);
         $startMemory = memory_get_usage();
         
-        // Enable query logging for performance monitoring
-        DB::enableQueryLog();
+        // Count queries for performance monitoring
+        $this->listenForQueries();
+        self::$queryCount = 0;
+        self::$queries = [];
+        self::$measuring = true;
         
-        $response = $next($request);
+        try {
+            $response = $next($request);
+        } finally {
+            self::$measuring = false;
+        }
         
         $endTime = microtime(true);
         $endMemory = memory_get_usage();
         
-        $this->recordPerformanceMetrics($request, $response, [
+        $metrics = [
             'execution_time' => ($endTime - $startTime) * 1000, // milliseconds
             'memory_usage' => ($endMemory - $startMemory) / 1024 / 1024, // MB
-            'query_count' => count(DB::getQueryLog()),
-            'queries' => DB::getQueryLog()
-        ]);
+            'query_count' => self::$queryCount,
+            'queries' => self::$queries
+        ];
+        
+        // Add performance headers; set before recording so the monitor's own cache
+        // queries are not counted
+        $response->headers->set('X-Response-Time', round($metrics['execution_time'], 2) . 'ms');
+        $response->headers->set('X-Memory-Usage', round($metrics['memory_usage'], 2) . 'MB');
+        $response->headers->set('X-Query-Count', $metrics['query_count']);
         
-        // Add performance headers
-        $response->headers->set('X-Response-Time', round(($endTime - $startTime) * 1000, 2) . 'ms');
-        $response->headers->set('X-Memory-Usage', round(($endMemory - $startMemory) / 1024 / 1024, 2) . 'MB');
-        $response->headers->set('X-Query-Count', count(DB::getQueryLog()));
+        $this->recordPerformanceMetrics($request, $response, $metrics);
         
         return $response;
     }
     
+    /**
+     * Register the query counter on the current event dispatcher
+     */
+    private function listenForQueries(): void
+    {
+        $events = app('events');
+        if (self::$events === $events) {
+            return;
+        }
+        
+        DB::listen(function ($query) {
+            if (!self::$measuring) {
+                return;
+            }
+            self::$queryCount++;
+            if (count(self::$queries) < self::LOGGED_QUERIES) {
+                self::$queries[] = ['query' => $query->sql, 'time' => $query->time];
+            }
+        });
+        self::$events = $events;
+    }
+    
     /**
      * Record performance metrics
      */
@@ -82,8 +136,10 @@ private function recordPerformanceMetrics(Request $request, Response $response,
             ]));
         }
         
-        // Store metrics for analytics
-        $this->storeMetrics($performanceData);
+        // Store metrics for analytics; every request rewrites the same cache entry
+        if (config('app.performance_metrics')) {
+            $this->storeMetrics($performanceData);
+        }
     }
     
     /**
@@ -0,0 +1,53 @@
+<?php
+
+namespace App\Jobs;
+
+use App\Models\CrmContactImport;
+use App\Services\EcommerceContactImporter;
+use Illuminate\Contracts\Queue\ShouldQueue;
+use Illuminate\Foundation\Queue\Queueable;
+
+/**
+ * Runs a large e-commerce contact import in slices. Each job works for at most
+ * TIME_BUDGET seconds, staying under the queue's retry_after, then queues the next slice,
+ * which resumes after the last committed chunk.
+ */
+class ImportEcommerceContacts implements ShouldQueue
+{
+    use Queueable;
+
+    /**
+     * Seconds one job spends importing before handing over to the next.
+     */
+    public const TIME_BUDGET = 60;
+
+    /**
+     * Create a new job instance.
+     */
+    public function __construct(public string $importId)
+    {
+    }
+
+    /**
+     * Execute the job.
+     */
+    public function handle(EcommerceContactImporter $importer): void
+    {
+        $import = CrmContactImport::find($this->importId);
+        if (!$import || $import->isFinished()) {
+            return;
+        }
+
+        if (!$importer->run($import, self::TIME_BUDGET)) {
+            static::dispatch($this->importId);
+        }
+    }
+
+    /**
+     * Handle a job failure.
+     */
+    public function failed(?\Throwable $exception): void
+    {
+        CrmContactImport::find($this->importId)?->markAsFailed($exception?->getMessage() ?? 'Import failed');
+    }
+}
@@ -0,0 +1,46 @@
+<?php
+
+namespace App\Jobs;
+
+use App\Models\Workspace;
+use App\Models\WorkspaceCounter;
+use Illuminate\Contracts\Queue\ShouldQueue;
+use Illuminate\Foundation\Queue\Queueable;
+use Illuminate\Support\Facades\Log;
+
+/**
+ * Recounts workspace_counters from the source tables, correcting drift from writes
+ * that bypass model events (bulk inserts, query-builder updates, cascading deletes).
+ */
+class ReconcileWorkspaceCounters implements ShouldQueue
+{
+    use Queueable;
+
+    /**
+     * Create a new job instance; without a workspace every workspace is reconciled.
+     */
+    public function __construct(public ?string $workspaceId = null)
+    {
+    }
+
+    /**
+     * Execute the job.
+     */
+    public function handle(): void
+    {
+        if ($this->workspaceId) {
+            WorkspaceCounter::reconcile($this->workspaceId);
+            return;
+        }
+
+        $reconciled = 0;
+        Workspace::query()->select('id')->chunkById(200, function ($workspaces) use (&$reconciled) {
+            foreach ($workspaces as $workspace) {
+                WorkspaceCounter::reconcile($workspace->id);
+                $reconciled++;
+            }
+        });
+
+        Log::info("Reconciled workspace counters", ['workspaces' => $reconciled]);
+    }
+}
@@ -0,0 +1,93 @@
+<?php
+
+namespace App\Jobs;
+
+use App\Models\InvitationBatch;
+use App\Models\WorkspaceInvitation;
+use App\Services\ElasticMailService;
+use Illuminate\Contracts\Queue\ShouldQueue;
+use Illuminate\Foundation\Queue\Queueable;
+use Illuminate\Support\Facades\Log;
+
+/**
+ * Emails the invitations of a bulk batch one chunk per job, recording progress on the
+ * batch. Each chunk queues the next, so a large batch never outlives a worker timeout.
+ * Every invitation is marked as it is emailed, so a retried chunk only sends the rest.
+ */
+class SendInvitationBatchEmails implements ShouldQueue
+{
+    use Queueable;
+
+    /**
+     * Invitations emailed per job.
+     */
+    public const CHUNK_SIZE = 200;
+
+    /**
+     * Create a new job instance, resuming after the given invitation id.
+     */
+    public function __construct(public string $batchId, public ?string $afterId = null)
+    {
+    }
+
+    /**
+     * Execute the job.
+     */
+    public function handle(ElasticMailService $emailService): void
+    {
+        $batch = InvitationBatch::with(['workspace', 'creator'])->find($this->batchId);
+        if (!$batch || $batch->isCompleted()) {
+            return;
+        }
+
+        // Invitations cancelled before their turn, or already emailed by an attempt
+        // of this job that died partway through, are skipped
+        $invitations = $batch->invitations()
+            ->where('status', 'pending')
+            ->whereNull('email_sent_at')
+            ->whereNull('email_failed_at')
+            ->when($this->afterId, fn($query) => $query->where('id', '>', $this->afterId))
+            ->orderBy('id')
+            ->limit(self::CHUNK_SIZE)
+            ->get();
+
+        foreach ($invitations as $invitation) {
+            $invitation->setRelation('workspace', $batch->workspace);
+            $invitation->setRelation('inviter', $batch->creator);
+            $batch->recordEmail($invitation, $this->send($emailService, $invitation));
+        }
+
+        if ($invitations->count() === self::CHUNK_SIZE) {
+            static::dispatch($this->batchId, $invitations->last()->id);
+            return;
+        }
+
+        $batch->refresh()->markAsCompleted();
+    }
+
+    /**
+     * Send one invitation email.
+     */
+    private function send(ElasticMailService $emailService, WorkspaceInvitation $invitation): bool
+    {
+        try {
+            $workspace = $invitation->workspace;
+            $htmlContent = view('emails.workspace_invitation', [
+                'invitation' => $invitation,
+                'workspace' => $workspace,
+                'inviteUrl' => config('app.frontend_url') . '/accept-invitation/' . $invitation->token
+            ])->render();
+
+            $result = $emailService->sendEmail(
+                $invitation->email,
+                "You've been invited to join {$workspace->name}",
+                $htmlContent
+            );
+
+            return $result['success'] ?? false;
+        } catch (\Exception $e) {
+            Log::error('Failed to send invitation email: ' . $e->getMessage(), ['invitation_id' => $invitation->id]);
+            return false;
+        }
+    }
+}
@@ -2,6 +2,7 @@
 
 namespace App\Models;
 
+use App\Services\CachingService;
 use Illuminate\Database\Eloquent\Model;
 use Illuminate\Database\Eloquent\Relations\BelongsTo;
 use Illuminate\Database\Eloquent\Relations\HasMany;
@@ -9,6 +10,14 @@
 
 class CrmContact extends Model
 {
+    /**
+     * Per-workspace figures behind the CRM analytics endpoint.
+     */
+    private const ANALYTICS_FIGURES = [
+        'total', 'active', 'inactive', 'blocked', 'hot', 'warm', 'cold', 'unqualified', 'follow_up',
+        'lead_score_sum', 'scored',
+    ];
+
     /**
      * Indicates if the IDs are auto-incrementing.
      */
@@ -66,6 +75,97 @@ protected static function booted(): void
                 $contact->id = (string) Str::uuid();
             }
         });
+
+        static::saved(fn($contact) => $contact->forgetWorkspaceAnalytics());
+        static::deleted(fn($contact) => $contact->forgetWorkspaceAnalytics());
+    }
+
+    /**
+     * Contact analytics summed over the given workspaces.
+     */
+    public static function analyticsFor(iterable $workspaceIds): array
+    {
+        $totals = array_fill_keys(self::ANALYTICS_FIGURES, 0);
+        foreach (static::workspaceAnalytics(collect($workspaceIds)->all()) as $figures) {
+            foreach ($figures as $figure => $value) {
+                $totals[$figure] += $value;
+            }
+        }
+
+        return [
+            'total_contacts' => $totals['total'],
+            'active_contacts' => $totals['active'],
+            'inactive_contacts' => $totals['inactive'],
+            'blocked_contacts' => $totals['blocked'],
+            'hot_leads' => $totals['hot'],
+            'warm_leads' => $totals['warm'],
+            'cold_leads' => $totals['cold'],
+            'unqualified_leads' => $totals['unqualified'],
+            'follow_up_needed' => $totals['follow_up'],
+            'average_lead_score' => $totals['scored'] ? round($totals['lead_score_sum'] / $totals['scored'], 2) : 0,
+        ];
+    }
+
+    /**
+     * Raw figures per workspace: cached ones as they are, the rest from a single
+     * SUM(CASE ...) pass grouped by workspace.
+     */
+    public static function workspaceAnalytics(array $workspaceIds): array
+    {
+        $figures = [];
+        $missing = [];
+        foreach (array_unique($workspaceIds) as $workspaceId) {
+            $cached = CachingService::getCachedContactAnalytics($workspaceId);
+            if ($cached === null) {
+                $missing[] = $workspaceId;
+            } else {
+                $figures[$workspaceId] = $cached;
+            }
+        }
+
+        if (empty($missing)) {
+            return $figures;
+        }
+
+        $rows = static::query()
+            ->toBase()
+            ->selectRaw("workspace_id, COUNT(*) as total,
+                SUM(CASE WHEN status = 'active' THEN 1 ELSE 0 END) as active,
+                SUM(CASE WHEN status = 'inactive' THEN 1 ELSE 0 END) as inactive,
+                SUM(CASE WHEN status = 'blocked' THEN 1 ELSE 0 END) as blocked,
+                SUM(CASE WHEN lead_score >= 80 THEN 1 ELSE 0 END) as hot,
+                SUM(CASE WHEN lead_score >= 60 AND lead_score < 80 THEN 1 ELSE 0 END) as warm,
+                SUM(CASE WHEN lead_score >= 40 AND lead_score < 60 THEN 1 ELSE 0 END) as cold,
+                SUM(CASE WHEN lead_score < 40 THEN 1 ELSE 0 END) as unqualified,
+                SUM(CASE WHEN last_contacted_at IS NULL OR last_contacted_at <= ? THEN 1 ELSE 0 END) as follow_up,
+                SUM(lead_score) as lead_score_sum,
+                COUNT(lead_score) as scored", [now()->subDays(30)->toDateTimeString()])
+            ->whereIn('workspace_id', $missing)
+            ->groupBy('workspace_id')
+            ->get()
+            ->keyBy('workspace_id');
+
+        foreach ($missing as $workspaceId) {
+            $row = $rows->get($workspaceId);
+            $figures[$workspaceId] = [];
+            foreach (self::ANALYTICS_FIGURES as $figure) {
+                $figures[$workspaceId][$figure] = (int) ($row->{$figure} ?? 0);
+            }
+            CachingService::cacheContactAnalytics($workspaceId, $figures[$workspaceId]);
+        }
+
+        return $figures;
+    }
+
+    /**
+     * Drop cached analytics for the workspace this contact is in (and was in, if it moved).
+     */
+    public function forgetWorkspaceAnalytics(): void
+    {
+        $workspaceIds = array_filter(array_unique([$this->workspace_id, $this->getOriginal('workspace_id')]));
+        foreach ($workspaceIds as $workspaceId) {
+            CachingService::clearContactAnalyticsCache($workspaceId);
+        }
     }
 
     /**
@@ -0,0 +1,87 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Concerns\HasUuids;
+use Illuminate\Database\Eloquent\Model;
+use Illuminate\Database\Eloquent\Relations\BelongsTo;
+
+class CrmContactImport extends Model
+{
+    use HasUuids;
+
+    /**
+     * Imports with more orders than this run on the queue instead of inside the request.
+     */
+    public const SYNC_LIMIT = 10000;
+
+    protected $fillable = [
+        'workspace_id',
+        'created_by',
+        'source',
+        'status',
+        'total_orders',
+        'processed_orders',
+        'imported_count',
+        'updated_count',
+        'skipped_count',
+        'last_order_id',
+        'error',
+        'started_at',
+        'completed_at'
+    ];
+
+    protected $casts = [
+        'total_orders' => 'integer',
+        'processed_orders' => 'integer',
+        'imported_count' => 'integer',
+        'updated_count' => 'integer',
+        'skipped_count' => 'integer',
+        'started_at' => 'datetime',
+        'completed_at' => 'datetime'
+    ];
+
+    public function workspace(): BelongsTo
+    {
+        return $this->belongsTo(Workspace::class);
+    }
+
+    public function creator(): BelongsTo
+    {
+        return $this->belongsTo(User::class, 'created_by');
+    }
+
+    public function isFinished(): bool
+    {
+        return in_array($this->status, ['completed', 'failed']);
+    }
+
+    public function markAsFailed(string $error): void
+    {
+        $this->update([
+            'status' => 'failed',
+            'error' => $error,
+            'completed_at' => now()
+        ]);
+    }
+
+    /**
+     * Progress as reported to clients polling the import.
+     */
+    public function progress(): array
+    {
+        return [
+            'import_id' => $this->id,
+            'status' => $this->status,
+            'total_orders' => $this->total_orders,
+            'processed_orders' => $this->processed_orders,
+            'imported_count' => $this->imported_count,
+            'updated_count' => $this->updated_count,
+            'skipped_count' => $this->skipped_count,
+            'percent' => $this->total_orders > 0 ? round($this->processed_orders / $this->total_orders * 100, 1) : 100,
+            'error' => $this->error,
+            'started_at' => $this->started_at,
+            'completed_at' => $this->completed_at
+        ];
+    }
+}
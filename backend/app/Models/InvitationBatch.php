@@ -2,16 +2,34 @@
 
 namespace App\Models;
 
+use App\Services\CachingService;
 use Illuminate\Database\Eloquent\Concerns\HasUuids;
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Database\Eloquent\Model;
 use Illuminate\Database\Eloquent\Relations\BelongsTo;
 use Illuminate\Database\Eloquent\Relations\HasMany;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Str;
 
 class InvitationBatch extends Model
 {
     use HasFactory, HasUuids;
 
+    /**
+     * Most invitations one bulk request may carry.
+     */
+    public const MAX_INVITATIONS = 50000;
+
+    /**
+     * Emails checked per whereIn lookup, well inside every driver's bound-parameter limit.
+     */
+    private const LOOKUP_CHUNK = 1000;
+
+    /**
+     * Invitations written per insert statement.
+     */
+    private const INSERT_CHUNK = 500;
+
     protected $fillable = [
         'workspace_id',
         'created_by',
@@ -19,12 +37,16 @@ class InvitationBatch extends Model
         'total_invitations',
         'successful_invitations',
         'failed_invitations',
+        'emails_sent',
+        'emails_failed',
         'status',
         'batch_data',
         'completed_at'
     ];
 
     protected $casts = [
+        'emails_sent' => 'integer',
+        'emails_failed' => 'integer',
         'batch_data' => 'array',
         'completed_at' => 'datetime'
     ];
@@ -44,10 +66,120 @@ public function invitations(): HasMany
         return $this->hasMany(WorkspaceInvitation::class, 'batch_id');
     }
 
+    /**
+     * Create the batch's invitations with set-based queries. Existing members and pending
+     * invitations are found with chunked whereIn lookups and everything else is bulk-inserted,
+     * so the cost no longer grows by four queries per invitation. Returns one result per entry.
+     */
+    public function createInvitations(array $invitations): array
+    {
+        $emails = array_values(array_unique(array_column($invitations, 'email')));
+        $members = $this->emailsMatching($emails, fn($chunk) => WorkspaceMember::query()
+            ->join('users', 'users.id', '=', 'workspace_members.user_id')
+            ->where('workspace_members.workspace_id', $this->workspace_id)
+            ->whereIn('users.email', $chunk)
+            ->pluck('users.email'));
+        $pending = $this->emailsMatching($emails, fn($chunk) => WorkspaceInvitation::query()
+            ->where('workspace_id', $this->workspace_id)
+            ->where('status', 'pending')
+            ->whereIn('email', $chunk)
+            ->pluck('email'));
+
+        $now = now();
+        $expiresAt = now()->addDays(7);
+        $rows = [];
+        $results = [];
+
+        foreach ($invitations as $invitationData) {
+            $email = $invitationData['email'];
+
+            if (isset($members[$email])) {
+                $results[] = ['email' => $email, 'success' => false, 'error' => 'User is already a member'];
+                continue;
+            }
+
+            // Also catches an address repeated within the batch
+            if (isset($pending[$email])) {
+                $results[] = ['email' => $email, 'success' => false, 'error' => 'Pending invitation already exists'];
+                continue;
+            }
+            $pending[$email] = true;
+
+            $id = (string) Str::uuid();
+            $rows[] = [
+                'id' => $id,
+                'workspace_id' => $this->workspace_id,
+                'invited_by' => $this->created_by,
+                'batch_id' => $this->id,
+                'email' => $email,
+                'role' => $invitationData['role'],
+                'department' => $invitationData['department'] ?? null,
+                'position' => $invitationData['position'] ?? null,
+                'personal_message' => $invitationData['personal_message'] ?? null,
+                'token' => Str::random(64),
+                'status' => 'pending',
+                'expires_at' => $expiresAt,
+                'created_at' => $now,
+                'updated_at' => $now
+            ];
+            $results[] = ['email' => $email, 'success' => true, 'invitation_id' => $id, 'email_queued' => true];
+        }
+
+        DB::transaction(function () use ($rows) {
+            foreach (array_chunk($rows, self::INSERT_CHUNK) as $chunk) {
+                WorkspaceInvitation::insert($chunk);
+            }
+        });
+
+        // Bulk inserts fire no model events
+        CachingService::clearInvitationAnalyticsCache($this->workspace_id);
+        CachingService::clearWorkspaceInvitationsCache($this->workspace_id);
+
+        $this->update([
+            'successful_invitations' => count($rows),
+            'failed_invitations' => count($invitations) - count($rows)
+        ]);
+
+        return $results;
+    }
+
+    /**
+     * Run a lookup over the emails in chunks, returning the matches as a set.
+     */
+    private function emailsMatching(array $emails, callable $lookup): array
+    {
+        $matches = [];
+        foreach (array_chunk($emails, self::LOOKUP_CHUNK) as $chunk) {
+            foreach ($lookup($chunk) as $email) {
+                $matches[$email] = true;
+            }
+        }
+
+        return $matches;
+    }
+
+    /**
+     * Mark one invitation as emailed or failed and count it on the batch, once: an
+     * invitation that already carries a marker is neither counted nor picked up again.
+     */
+    public function recordEmail(WorkspaceInvitation $invitation, bool $sent): void
+    {
+        DB::transaction(function () use ($invitation, $sent) {
+            $marked = WorkspaceInvitation::whereKey($invitation->id)
+                ->whereNull('email_sent_at')
+                ->whereNull('email_failed_at')
+                ->update([$sent ? 'email_sent_at' : 'email_failed_at' => now()]);
+
+            if ($marked) {
+                static::whereKey($this->id)->increment($sent ? 'emails_sent' : 'emails_failed');
+            }
+        });
+    }
+
     public function markAsCompleted(): void
     {
         $this->update([
-            'status' => $this->failed_invitations === 0 ? 'completed' : 'completed_with_errors',
+            'status' => $this->failed_invitations === 0 && !$this->emails_failed ? 'completed' : 'completed_with_errors',
             'completed_at' => now()
         ]);
     }
@@ -2,12 +2,21 @@
 
 namespace App\Models;
 
+use App\Services\CachingService;
 use Illuminate\Database\Eloquent\Model;
 use Illuminate\Database\Eloquent\Relations\BelongsTo;
 use Illuminate\Support\Str;
 
 class Product extends Model
 {
+    /**
+     * Per-workspace figures behind the product analytics endpoint.
+     */
+    private const ANALYTICS_FIGURES = [
+        'total', 'active', 'draft', 'archived', 'physical', 'digital', 'service', 'in_stock', 'out_of_stock',
+        'low_stock', 'inventory_value',
+    ];
+
     /**
      * Indicates if the IDs are auto-incrementing.
      */
@@ -76,6 +85,100 @@ protected static function booted(): void
                 $product->id = (string) Str::uuid();
             }
         });
+
+        static::saved(fn($product) => $product->forgetWorkspaceAnalytics());
+        static::deleted(fn($product) => $product->forgetWorkspaceAnalytics());
+    }
+
+    /**
+     * Product analytics summed over the given workspaces.
+     */
+    public static function analyticsFor(iterable $workspaceIds): array
+    {
+        $totals = array_fill_keys(self::ANALYTICS_FIGURES, 0);
+        foreach (static::workspaceAnalytics(collect($workspaceIds)->all()) as $figures) {
+            foreach ($figures as $figure => $value) {
+                $totals[$figure] += $value;
+            }
+        }
+
+        return [
+            'total_products' => $totals['total'],
+            'active_products' => $totals['active'],
+            'draft_products' => $totals['draft'],
+            'archived_products' => $totals['archived'],
+            'physical_products' => $totals['physical'],
+            'digital_products' => $totals['digital'],
+            'service_products' => $totals['service'],
+            'in_stock_products' => $totals['in_stock'],
+            'out_of_stock_products' => $totals['out_of_stock'],
+            'low_stock_products' => $totals['low_stock'],
+            'total_inventory_value' => round($totals['inventory_value'], 2),
+        ];
+    }
+
+    /**
+     * Raw figures per workspace: cached ones as they are, the rest from a single
+     * SUM(CASE ...) pass grouped by workspace.
+     */
+    public static function workspaceAnalytics(array $workspaceIds): array
+    {
+        $figures = [];
+        $missing = [];
+        foreach (array_unique($workspaceIds) as $workspaceId) {
+            $cached = CachingService::getCachedProductAnalytics($workspaceId);
+            if ($cached === null) {
+                $missing[] = $workspaceId;
+            } else {
+                $figures[$workspaceId] = $cached;
+            }
+        }
+
+        if (empty($missing)) {
+            return $figures;
+        }
+
+        $rows = static::query()
+            ->toBase()
+            ->selectRaw("workspace_id, COUNT(*) as total,
+                SUM(CASE WHEN status = 'active' THEN 1 ELSE 0 END) as active,
+                SUM(CASE WHEN status = 'draft' THEN 1 ELSE 0 END) as draft,
+                SUM(CASE WHEN status = 'archived' THEN 1 ELSE 0 END) as archived,
+                SUM(CASE WHEN type = 'physical' THEN 1 ELSE 0 END) as physical,
+                SUM(CASE WHEN type = 'digital' THEN 1 ELSE 0 END) as digital,
+                SUM(CASE WHEN type = 'service' THEN 1 ELSE 0 END) as service,
+                SUM(CASE WHEN track_inventory = ? OR stock_quantity > 0 THEN 1 ELSE 0 END) as in_stock,
+                SUM(CASE WHEN track_inventory = ? AND stock_quantity <= 0 THEN 1 ELSE 0 END) as out_of_stock,
+                SUM(CASE WHEN track_inventory = ? AND stock_quantity > 0 AND stock_quantity <= 10 THEN 1 ELSE 0 END)
+                    as low_stock,
+                SUM(price * stock_quantity) as inventory_value", [false, true, true])
+            ->whereIn('workspace_id', $missing)
+            ->groupBy('workspace_id')
+            ->get()
+            ->keyBy('workspace_id');
+
+        foreach ($missing as $workspaceId) {
+            $row = $rows->get($workspaceId);
+            $figures[$workspaceId] = [];
+            foreach (self::ANALYTICS_FIGURES as $figure) {
+                $value = $row->{$figure} ?? 0;
+                $figures[$workspaceId][$figure] = $figure === 'inventory_value' ? (float) $value : (int) $value;
+            }
+            CachingService::cacheProductAnalytics($workspaceId, $figures[$workspaceId]);
+        }
+
+        return $figures;
+    }
+
+    /**
+     * Drop cached analytics for the workspace this product is in (and was in, if it moved).
+     */
+    public function forgetWorkspaceAnalytics(): void
+    {
+        $workspaceIds = array_filter(array_unique([$this->workspace_id, $this->getOriginal('workspace_id')]));
+        foreach ($workspaceIds as $workspaceId) {
+            CachingService::clearProductAnalyticsCache($workspaceId);
+        }
     }
 
     /**
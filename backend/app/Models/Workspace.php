@@ -5,6 +5,7 @@
 use Illuminate\Database\Eloquent\Model;
 use Illuminate\Database\Eloquent\Relations\BelongsTo;
 use Illuminate\Database\Eloquent\Relations\HasMany;
+use Illuminate\Database\Eloquent\Relations\HasOne;
 use Illuminate\Support\Str;
 
 class Workspace extends Model
@@ -75,6 +76,14 @@ public function members(): HasMany
         return $this->hasMany(WorkspaceMember::class);
     }
 
+    /**
+     * Get the materialized dashboard counters for this workspace.
+     */
+    public function counters(): HasOne
+    {
+        return $this->hasOne(WorkspaceCounter::class);
+    }
+
     /**
      * Get social media accounts for this workspace.
      */
@@ -0,0 +1,281 @@
+<?php
+
+namespace App\Models;
+
+use Illuminate\Database\Eloquent\Model;
+use Illuminate\Database\Eloquent\Relations\BelongsTo;
+use Illuminate\Support\Carbon;
+use Illuminate\Support\Facades\DB;
+
+class WorkspaceCounter extends Model
+{
+    /**
+     * Models whose rows are counted, kept in sync by WorkspaceCounterObserver.
+     */
+    public const SOURCES = [
+        WorkspaceMember::class,
+        SocialMediaAccount::class,
+        SocialMediaPost::class,
+        LinkInBioPage::class,
+        EmailCampaign::class,
+        CrmContact::class,
+        Course::class,
+        Product::class,
+        PaymentTransaction::class,
+    ];
+
+    /**
+     * Counter columns holding money rather than row counts.
+     */
+    private const MONEY_COLUMNS = ['revenue_total', 'revenue_month_total'];
+
+    /**
+     * The primary key for the model.
+     */
+    protected $primaryKey = 'workspace_id';
+
+    /**
+     * Indicates if the IDs are auto-incrementing.
+     */
+    public $incrementing = false;
+
+    /**
+     * The "type" of the auto-incrementing ID.
+     */
+    protected $keyType = 'string';
+
+    /**
+     * The attributes that are mass assignable.
+     */
+    protected $fillable = [
+        'workspace_id',
+        'members_count',
+        'social_accounts_count',
+        'posts_count',
+        'link_pages_count',
+        'active_link_pages_count',
+        'link_views_total',
+        'link_clicks_total',
+        'email_campaigns_count',
+        'emails_sent_total',
+        'contacts_count',
+        'leads_count',
+        'courses_count',
+        'published_courses_count',
+        'products_count',
+        'active_products_count',
+        'revenue_total',
+        'revenue_month_total',
+        'revenue_month',
+        'reconciled_at',
+    ];
+
+    /**
+     * Get the attributes that should be cast.
+     */
+    protected function casts(): array
+    {
+        return [
+            'workspace_id' => 'string',
+            'members_count' => 'integer',
+            'social_accounts_count' => 'integer',
+            'posts_count' => 'integer',
+            'link_pages_count' => 'integer',
+            'active_link_pages_count' => 'integer',
+            'link_views_total' => 'integer',
+            'link_clicks_total' => 'integer',
+            'email_campaigns_count' => 'integer',
+            'emails_sent_total' => 'integer',
+            'contacts_count' => 'integer',
+            'leads_count' => 'integer',
+            'courses_count' => 'integer',
+            'published_courses_count' => 'integer',
+            'products_count' => 'integer',
+            'active_products_count' => 'integer',
+            'revenue_total' => 'float',
+            'revenue_month_total' => 'float',
+            'reconciled_at' => 'datetime',
+        ];
+    }
+
+    /**
+     * Get the workspace these counters belong to.
+     */
+    public function workspace(): BelongsTo
+    {
+        return $this->belongsTo(Workspace::class);
+    }
+
+    /**
+     * Get the counters for a workspace, building them from the source tables on first use.
+     * Returns null if the workspace is gone.
+     */
+    public static function forWorkspace(string $workspaceId): ?self
+    {
+        return static::find($workspaceId) ?? static::reconcile($workspaceId);
+    }
+
+    /**
+     * Revenue from paid transactions created in the current calendar month.
+     */
+    public function monthlyRevenue(): float
+    {
+        return $this->revenue_month === now()->format('Y-m') ? $this->revenue_month_total : 0.0;
+    }
+
+    /**
+     * What one row of a source model adds to its workspace's counters, given its raw attributes.
+     * Attributes missing from a freshly created model take the column's database default.
+     */
+    public static function contribution(Model $model, array $attributes): array
+    {
+        return match (true) {
+            $model instanceof WorkspaceMember => ['members_count' => 1],
+            $model instanceof SocialMediaAccount => ['social_accounts_count' => 1],
+            $model instanceof SocialMediaPost => ['posts_count' => 1],
+            $model instanceof LinkInBioPage => [
+                'link_pages_count' => 1,
+                'active_link_pages_count' => (int) (bool) ($attributes['is_active'] ?? true),
+                'link_views_total' => (int) ($attributes['total_views'] ?? 0),
+                'link_clicks_total' => (int) ($attributes['total_clicks'] ?? 0),
+            ],
+            $model instanceof EmailCampaign => [
+                'email_campaigns_count' => 1,
+                'emails_sent_total' => (int) ($attributes['sent_count'] ?? 0),
+            ],
+            $model instanceof CrmContact => [
+                'contacts_count' => 1,
+                'leads_count' => (int) (($attributes['status'] ?? 'active') === 'lead'),
+            ],
+            $model instanceof Course => [
+                'courses_count' => 1,
+                'published_courses_count' => (int) (($attributes['status'] ?? 'draft') === 'published'),
+            ],
+            $model instanceof Product => [
+                'products_count' => 1,
+                'active_products_count' => (int) (($attributes['status'] ?? 'draft') === 'active'),
+            ],
+            $model instanceof PaymentTransaction => static::revenueContribution($attributes),
+            default => [],
+        };
+    }
+
+    /**
+     * Paid transactions count towards total revenue, and towards this month's if created this month.
+     */
+    private static function revenueContribution(array $attributes): array
+    {
+        if (($attributes['payment_status'] ?? 'pending') !== 'paid') {
+            return [];
+        }
+
+        $amount = (float) ($attributes['amount'] ?? 0);
+        $created = isset($attributes['created_at']) ? Carbon::parse($attributes['created_at']) : now();
+
+        return [
+            'revenue_total' => $amount,
+            'revenue_month_total' => $created->format('Y-m') === now()->format('Y-m') ? $amount : 0,
+        ];
+    }
+
+    /**
+     * Atomically add deltas to a workspace's counters. A workspace without a counters row
+     * yet is reconciled instead, which already includes the change being recorded.
+     */
+    public static function adjust(?string $workspaceId, array $deltas): void
+    {
+        $deltas = array_filter($deltas, fn($delta) => $delta != 0);
+        if (empty($workspaceId) || empty($deltas)) {
+            return;
+        }
+
+        $month = now()->format('Y-m');
+        $changes = [];
+        foreach ($deltas as $column => $delta) {
+            $amount = in_array($column, self::MONEY_COLUMNS, true) ? sprintf('%.2F', $delta) : (int) $delta;
+            $changes[$column] = $column === 'revenue_month_total'
+                ? DB::raw("CASE WHEN revenue_month = '{$month}' THEN revenue_month_total + {$amount} ELSE {$amount} END")
+                : DB::raw("{$column} + {$amount}");
+        }
+        // Assigned after revenue_month_total, which compares against the old value
+        if (isset($changes['revenue_month_total'])) {
+            $changes['revenue_month'] = $month;
+        }
+
+        if (static::whereKey($workspaceId)->update($changes) === 0) {
+            static::reconcile($workspaceId);
+        }
+    }
+
+    /**
+     * Recount a workspace's counters from the source tables. Returns null if the workspace is gone.
+     */
+    public static function reconcile(string $workspaceId): ?self
+    {
+        if (!Workspace::whereKey($workspaceId)->exists()) {
+            return null;
+        }
+
+        $monthStart = now()->startOfMonth()->toDateTimeString();
+
+        $links = LinkInBioPage::where('workspace_id', $workspaceId)
+            ->selectRaw('COUNT(*) as pages, SUM(CASE WHEN is_active = ? THEN 1 ELSE 0 END) as active, '
+                . 'SUM(total_views) as views, SUM(total_clicks) as clicks', [true])
+            ->toBase()
+            ->first();
+        $emails = EmailCampaign::where('workspace_id', $workspaceId)
+            ->selectRaw('COUNT(*) as campaigns, SUM(sent_count) as sent')
+            ->toBase()
+            ->first();
+        $contacts = CrmContact::where('workspace_id', $workspaceId)
+            ->selectRaw('COUNT(*) as total, SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as leads', ['lead'])
+            ->toBase()
+            ->first();
+        $courses = Course::where('workspace_id', $workspaceId)
+            ->selectRaw('COUNT(*) as total, SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as published', ['published'])
+            ->toBase()
+            ->first();
+        $products = Product::where('workspace_id', $workspaceId)
+            ->selectRaw('COUNT(*) as total, SUM(CASE WHEN status = ? THEN 1 ELSE 0 END) as active', ['active'])
+            ->toBase()
+            ->first();
+        $revenue = PaymentTransaction::where('workspace_id', $workspaceId)
+            ->where('payment_status', 'paid')
+            ->selectRaw('SUM(amount) as total, SUM(CASE WHEN created_at >= ? THEN amount ELSE 0 END) as month',
+                [$monthStart])
+            ->toBase()
+            ->first();
+
+        // Concurrent first uses both reach this point; the row is created once and
+        // every caller then overwrites it with its recount
+        static::query()->insertOrIgnore([
+            'workspace_id' => $workspaceId,
+            'created_at' => now(),
+            'updated_at' => now()
+        ]);
+
+        static::whereKey($workspaceId)->update([
+            'members_count' => WorkspaceMember::where('workspace_id', $workspaceId)->count(),
+            'social_accounts_count' => SocialMediaAccount::where('workspace_id', $workspaceId)->count(),
+            'posts_count' => SocialMediaPost::where('workspace_id', $workspaceId)->count(),
+            'link_pages_count' => (int) $links->pages,
+            'active_link_pages_count' => (int) $links->active,
+            'link_views_total' => (int) $links->views,
+            'link_clicks_total' => (int) $links->clicks,
+            'email_campaigns_count' => (int) $emails->campaigns,
+            'emails_sent_total' => (int) $emails->sent,
+            'contacts_count' => (int) $contacts->total,
+            'leads_count' => (int) $contacts->leads,
+            'courses_count' => (int) $courses->total,
+            'published_courses_count' => (int) $courses->published,
+            'products_count' => (int) $products->total,
+            'active_products_count' => (int) $products->active,
+            'revenue_total' => (float) $revenue->total,
+            'revenue_month_total' => (float) $revenue->month,
+            'revenue_month' => now()->format('Y-m'),
+            'reconciled_at' => now(),
+        ]);
+
+        return static::find($workspaceId);
+    }
+}
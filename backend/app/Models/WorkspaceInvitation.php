@@ -2,6 +2,8 @@
 
 namespace App\Models;
 
+use App\Services\CachingService;
+use Illuminate\Database\Eloquent\Builder;
 use Illuminate\Database\Eloquent\Concerns\HasUuids;
 use Illuminate\Database\Eloquent\Factories\HasFactory;
 use Illuminate\Database\Eloquent\Model;
@@ -12,9 +14,15 @@ class WorkspaceInvitation extends Model
 {
     use HasFactory, HasUuids;
 
+    /**
+     * Statuses counted in the analytics overview.
+     */
+    public const STATUSES = ['pending', 'accepted', 'declined', 'expired', 'cancelled'];
+
     protected $fillable = [
         'workspace_id',
         'invited_by',
+        'batch_id',
         'email',
         'role',
         'department',
@@ -27,6 +35,8 @@ class WorkspaceInvitation extends Model
         'declined_reason',
         'accepted_at',
         'declined_at',
+        'email_sent_at',
+        'email_failed_at',
         'metadata'
     ];
 
@@ -34,6 +44,8 @@ class WorkspaceInvitation extends Model
         'expires_at' => 'datetime',
         'accepted_at' => 'datetime',
         'declined_at' => 'datetime',
+        'email_sent_at' => 'datetime',
+        'email_failed_at' => 'datetime',
         'metadata' => 'array'
     ];
 
@@ -50,6 +62,71 @@ protected static function boot()
                 $invitation->expires_at = now()->addDays(7);
             }
         });
+
+        static::saved(fn($invitation) => $invitation->forgetAnalytics());
+        static::deleted(fn($invitation) => $invitation->forgetAnalytics());
+    }
+
+    /**
+     * Invitation analytics for a workspace. Counted with GROUP BY queries over the
+     * workspace's indexes and cached until one of its invitations changes.
+     */
+    public static function analyticsFor(string $workspaceId): array
+    {
+        $cached = CachingService::getCachedInvitationAnalytics($workspaceId);
+        if ($cached !== null) {
+            return $cached;
+        }
+
+        $invitations = static::where('workspace_id', $workspaceId);
+        // Covered by idx_workspace_status_created
+        $statuses = static::countsBy($invitations->clone(), 'status');
+        // Covered by idx_role_workspace
+        $roles = static::countsBy($invitations->clone(), 'role');
+        $departments = static::countsBy($invitations->clone()->whereNotNull('department'), 'department');
+
+        $total = array_sum($statuses);
+        $overview = ['total' => $total];
+        foreach (self::STATUSES as $status) {
+            $overview[$status] = $statuses[$status] ?? 0;
+        }
+
+        $analytics = [
+            'overview' => $overview,
+            'distribution' => [
+                'roles' => $roles,
+                'departments' => $departments
+            ],
+            'acceptance_rate' => $total > 0 ? round(($overview['accepted'] / $total) * 100, 1) : 0
+        ];
+
+        CachingService::cacheInvitationAnalytics($workspaceId, $analytics);
+
+        return $analytics;
+    }
+
+    /**
+     * Number of invitations matching a query per value of a column.
+     */
+    private static function countsBy(Builder $query, string $column): array
+    {
+        return $query->selectRaw("{$column}, COUNT(*) as total")
+            ->groupBy($column)
+            ->toBase()
+            ->pluck('total', $column)
+            ->map(fn($total) => (int) $total)
+            ->all();
+    }
+
+    /**
+     * Drop cached analytics for the workspace this invitation is in (and was in, if it moved).
+     */
+    public function forgetAnalytics(): void
+    {
+        $workspaceIds = array_filter(array_unique([$this->workspace_id, $this->getOriginal('workspace_id')]));
+        foreach ($workspaceIds as $workspaceId) {
+            CachingService::clearInvitationAnalyticsCache($workspaceId);
+        }
     }
 
     public function workspace(): BelongsTo
@@ -62,6 +139,11 @@ public function inviter(): BelongsTo
         return $this->belongsTo(User::class, 'invited_by');
     }
 
+    public function batch(): BelongsTo
+    {
+        return $this->belongsTo(InvitationBatch::class, 'batch_id');
+    }
+
     public function isExpired(): bool
     {
         return $this->expires_at < now();
@@ -0,0 +1,70 @@
+<?php
+
+namespace App\Observers;
+
+use App\Models\WorkspaceCounter;
+use Illuminate\Database\Eloquent\Model;
+
+/**
+ * Keeps workspace_counters in step with the models listed in WorkspaceCounter::SOURCES.
+ * Query-builder writes bypass model events; ReconcileWorkspaceCounters corrects those.
+ */
+class WorkspaceCounterObserver
+{
+    /**
+     * Handle the model "created" event.
+     */
+    public function created(Model $model): void
+    {
+        WorkspaceCounter::adjust(
+            $model->getAttribute('workspace_id'),
+            WorkspaceCounter::contribution($model, $model->getAttributes())
+        );
+    }
+
+    /**
+     * Handle the model "updated" event.
+     */
+    public function updated(Model $model): void
+    {
+        $before = $model->getRawOriginal();
+        $after = $model->getAttributes();
+        $oldWorkspace = $before['workspace_id'] ?? null;
+        $newWorkspace = $after['workspace_id'] ?? null;
+        $old = WorkspaceCounter::contribution($model, $before);
+        $new = WorkspaceCounter::contribution($model, $after);
+
+        if ($oldWorkspace !== $newWorkspace) {
+            WorkspaceCounter::adjust($oldWorkspace, $this->negate($old));
+            WorkspaceCounter::adjust($newWorkspace, $new);
+            return;
+        }
+
+        $deltas = [];
+        foreach (array_keys($old + $new) as $column) {
+            $deltas[$column] = ($new[$column] ?? 0) - ($old[$column] ?? 0);
+        }
+        WorkspaceCounter::adjust($newWorkspace, $deltas);
+    }
+
+    /**
+     * Handle the model "deleted" event.
+     */
+    public function deleted(Model $model): void
+    {
+        $original = $model->getRawOriginal();
+
+        WorkspaceCounter::adjust(
+            $original['workspace_id'] ?? null,
+            $this->negate(WorkspaceCounter::contribution($model, $original))
+        );
+    }
+
+    /**
+     * Flip the sign of every counter delta.
+     */
+    private function negate(array $deltas): array
+    {
+        return array_map(fn($delta) => -$delta, $deltas);
+    }
+}
@@ -2,6 +2,8 @@
 
 namespace App\Providers;
 
+use App\Models\WorkspaceCounter;
+use App\Observers\WorkspaceCounterObserver;
 use Illuminate\Support\ServiceProvider;
 
 class AppServiceProvider extends ServiceProvider
@@ -19,6 +21,8 @@ public function register(): void
      */
     public function boot(): void
     {
-        //
+        foreach (WorkspaceCounter::SOURCES as $model) {
+            $model::observe(WorkspaceCounterObserver::class);
+        }
     }
 }
@@ -141,6 +141,33 @@ public static function clearWorkspaceInvitationsCache(string $workspaceId): bool
         return self::forget($key);
     }
     
+    /**
+     * Cache workspace invitation analytics
+     */
+    public static function cacheInvitationAnalytics(string $workspaceId, array $analytics): bool
+    {
+        $key = "invitation_analytics:{$workspaceId}";
+        return self::put($key, $analytics, 1800); // 30 minutes
+    }
+
+    /**
+     * Get cached workspace invitation analytics
+     */
+    public static function getCachedInvitationAnalytics(string $workspaceId): ?array
+    {
+        $key = "invitation_analytics:{$workspaceId}";
+        return self::get($key);
+    }
+
+    /**
+     * Clear workspace invitation analytics cache
+     */
+    public static function clearInvitationAnalyticsCache(string $workspaceId): bool
+    {
+        $key = "invitation_analytics:{$workspaceId}";
+        return self::forget($key);
+    }
+
     /**
      * Cache user permissions
      */
@@ -190,7 +217,61 @@ public static function getCachedWorkspaceAnalytics(string $workspaceId): ?array
         $key = "workspace_analytics:{$workspaceId}";
         return self::get($key);
     }
-    
+
+    /**
+     * Cache CRM contact analytics figures for a workspace
+     */
+    public static function cacheContactAnalytics(string $workspaceId, array $figures): bool
+    {
+        $key = "contact_analytics:{$workspaceId}";
+        return self::put($key, $figures, 600); // 10 minutes, bounds follow-up drift
+    }
+
+    /**
+     * Get cached CRM contact analytics figures
+     */
+    public static function getCachedContactAnalytics(string $workspaceId): ?array
+    {
+        $key = "contact_analytics:{$workspaceId}";
+        return self::get($key);
+    }
+
+    /**
+     * Clear cached CRM contact analytics figures
+     */
+    public static function clearContactAnalyticsCache(string $workspaceId): bool
+    {
+        $key = "contact_analytics:{$workspaceId}";
+        return self::forget($key);
+    }
+
+    /**
+     * Cache product analytics figures for a workspace
+     */
+    public static function cacheProductAnalytics(string $workspaceId, array $figures): bool
+    {
+        $key = "product_analytics:{$workspaceId}";
+        return self::put($key, $figures, 3600); // 1 hour
+    }
+
+    /**
+     * Get cached product analytics figures
+     */
+    public static function getCachedProductAnalytics(string $workspaceId): ?array
+    {
+        $key = "product_analytics:{$workspaceId}";
+        return self::get($key);
+    }
+
+    /**
+     * Clear cached product analytics figures
+     */
+    public static function clearProductAnalyticsCache(string $workspaceId): bool
+    {
+        $key = "product_analytics:{$workspaceId}";
+        return self::forget($key);
+    }
+
     /**
      * Increment counter
      */
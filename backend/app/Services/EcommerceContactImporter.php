@@ -0,0 +1,175 @@
+<?php
+
+namespace App\Services;
+
+use App\Models\CrmContact;
+use App\Models\CrmContactImport;
+use App\Models\Order;
+use App\Models\WorkspaceCounter;
+use Illuminate\Support\Carbon;
+use Illuminate\Support\Collection;
+use Illuminate\Support\Facades\DB;
+use Illuminate\Support\Str;
+
+class EcommerceContactImporter
+{
+    /**
+     * Orders read per chunk. A chunk costs one order query, one contact lookup and a few
+     * batched writes, committed together with the import's cursor.
+     */
+    public const CHUNK_SIZE = 1000;
+
+    /**
+     * Contacts written per insert or upsert statement.
+     */
+    private const WRITE_CHUNK = 500;
+
+    /**
+     * Contact columns an order can change.
+     */
+    private const UPDATED_COLUMNS = ['phone', 'notes', 'lead_score', 'last_contacted_at', 'updated_at'];
+
+    /**
+     * Import a workspace's e-commerce customers as CRM contacts, resuming after the last
+     * committed chunk. With a time budget the import stops between chunks once it is spent;
+     * returns whether every order has been imported.
+     */
+    public function run(CrmContactImport $import, ?int $seconds = null): bool
+    {
+        $deadline = $seconds ? microtime(true) + $seconds : null;
+
+        $import->update([
+            'status' => 'processing',
+            'started_at' => $import->started_at ?? now()
+        ]);
+
+        $finished = Order::where('workspace_id', $import->workspace_id)
+            ->whereNotNull('customer_email')
+            ->when($import->last_order_id, fn($query) => $query->where('id', '>', $import->last_order_id))
+            ->select(['id', 'order_number', 'customer_name', 'customer_email', 'customer_phone', 'created_at'])
+            ->toBase()
+            ->chunkById(self::CHUNK_SIZE, function ($orders) use ($import, $deadline) {
+                DB::transaction(fn() => $this->importChunk($import, $orders));
+
+                return $deadline === null || microtime(true) < $deadline;
+            });
+
+        if (!$finished) {
+            return false;
+        }
+
+        // Bulk writes fire no model events
+        CachingService::clearContactAnalyticsCache($import->workspace_id);
+        WorkspaceCounter::reconcile($import->workspace_id);
+
+        $import->update([
+            'status' => 'completed',
+            'completed_at' => now()
+        ]);
+
+        return true;
+    }
+
+    /**
+     * Fold one chunk of orders into the workspace's contacts. Orders are grouped by customer
+     * so each contact is written once, with the same outcome as applying the orders one by
+     * one: a new customer's first order creates the contact and every other order updates it.
+     * Emails already taken by a contact in another workspace are skipped.
+     */
+    private function importChunk(CrmContactImport $import, Collection $orders): void
+    {
+        $customers = $orders->groupBy('customer_email');
+        $contacts = CrmContact::whereIn('email', $customers->keys()->all())
+            ->toBase()
+            ->get()
+            ->keyBy('email');
+
+        $now = now();
+        $inserts = [];
+        $updates = [];
+        $imported = 0;
+        $updated = 0;
+        $skipped = 0;
+
+        foreach ($customers as $email => $customerOrders) {
+            $contact = $contacts->get($email);
+
+            if ($contact && $contact->workspace_id !== $import->workspace_id) {
+                $skipped += $customerOrders->count();
+                continue;
+            }
+
+            if ($contact) {
+                $updates[] = $this->applyOrders((array) $contact, $customerOrders, $now);
+                $updated += $customerOrders->count();
+                continue;
+            }
+
+            $inserts[] = $this->applyOrders($this->newContact($import, $customerOrders->first(), $now),
+                $customerOrders->slice(1), $now);
+            $imported++;
+            $updated += $customerOrders->count() - 1;
+        }
+
+        foreach (array_chunk($inserts, self::WRITE_CHUNK) as $chunk) {
+            CrmContact::insert($chunk);
+        }
+        foreach (array_chunk($updates, self::WRITE_CHUNK) as $chunk) {
+            CrmContact::upsert($chunk, ['id'], self::UPDATED_COLUMNS);
+        }
+
+        $import->update([
+            'processed_orders' => $import->processed_orders + $orders->count(),
+            'imported_count' => $import->imported_count + $imported,
+            'updated_count' => $import->updated_count + $updated,
+            'skipped_count' => $import->skipped_count + $skipped,
+            'last_order_id' => $orders->last()->id
+        ]);
+    }
+
+    /**
+     * The contact row a customer's first order creates.
+     */
+    private function newContact(CrmContactImport $import, object $order, Carbon $now): array
+    {
+        $nameParts = explode(' ', $order->customer_name, 2);
+
+        return [
+            'id' => (string) Str::uuid(),
+            'workspace_id' => $import->workspace_id,
+            'first_name' => $nameParts[0] ?? '',
+            'last_name' => $nameParts[1] ?? '',
+            'email' => $order->customer_email,
+            'phone' => $order->customer_phone,
+            'notes' => "Imported from e-commerce order #{$order->order_number}",
+            'tags' => json_encode(['customer', 'e-commerce']),
+            'status' => 'active',
+            'lead_score' => 50,
+            'custom_fields' => json_encode([
+                'source' => 'e-commerce',
+                'first_order_date' => Carbon::parse($order->created_at),
+                'total_orders' => 1,
+            ]),
+            'created_by' => $import->created_by,
+            'last_contacted_at' => $now,
+            'created_at' => $now,
+            'updated_at' => $now
+        ];
+    }
+
+    /**
+     * Apply a customer's orders, in order, to a raw contact row.
+     */
+    private function applyOrders(array $contact, iterable $orders, Carbon $now): array
+    {
+        foreach ($orders as $order) {
+            $contact['phone'] = $contact['phone'] ?: $order->customer_phone;
+            $contact['notes'] = $contact['notes'] . "\n\nImported from order #{$order->order_number}";
+            $contact['lead_score'] = min(100, $contact['lead_score'] + 10); // Increase lead score
+            $contact['last_contacted_at'] = $now;
+            $contact['updated_at'] = $now;
+        }
+
+        return $contact;
+    }
+}
@@ -15,6 +15,7 @@ class ElasticMailService
     public function __construct()
     {
         $this->apiKey = config('services.elasticmail.api_key');
+        $this->baseUrl = config('services.elasticmail.base_url', $this->baseUrl);
         $this->fromEmail = config('services.elasticmail.from_email');
         $this->fromName = config('services.elasticmail.from_name');
     }
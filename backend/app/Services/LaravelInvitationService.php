@@ -315,25 +315,7 @@ public function cancelInvitation($invitationId)
     public function getInvitationAnalytics($workspaceId, $filters = [])
     {
         try {
-            $invitations = WorkspaceInvitation::where('workspace_id', $workspaceId)->get();
-
-            $analytics = [
-                'overview' => [
-                    'total' => $invitations->count(),
-                    'pending' => $invitations->where('status', 'pending')->count(),
-                    'accepted' => $invitations->where('status', 'accepted')->count(),
-                    'declined' => $invitations->where('status', 'declined')->count(),
-                    'expired' => $invitations->where('status', 'expired')->count(),
-                    'cancelled' => $invitations->where('status', 'cancelled')->count()
-                ],
-                'distribution' => [
-                    'roles' => $invitations->groupBy('role')->map->count()->toArray(),
-                    'departments' => $invitations->whereNotNull('department')->groupBy('department')->map->count()->toArray()
-                ],
-                'acceptance_rate' => $invitations->count() > 0 
-                    ? round(($invitations->where('status', 'accepted')->count() / $invitations->count()) * 100, 1)
-                    : 0
-            ];
+            $analytics = WorkspaceInvitation::analyticsFor($workspaceId);
 
             return ['success' => true, 'data' => $analytics];
         } catch (\Exception $e) {
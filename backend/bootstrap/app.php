@@ -1,5 +1,6 @@
 <?php
 
+use App\Http\Middleware\PerformanceMonitoringMiddleware;
 use Illuminate\Foundation\Application;
 use Illuminate\Foundation\Configuration\Exceptions;
 use Illuminate\Foundation\Configuration\Middleware;
@@ -13,7 +14,9 @@
         health: '/up',
     )
     ->withMiddleware(function (Middleware $middleware): void {
-        //
+        // X-Response-Time, X-Memory-Usage and X-Query-Count on API responses when
+        // app.performance_headers (PERF_HEADERS) is on; a pass-through otherwise
+        $middleware->api(append: [PerformanceMonitoringMiddleware::class]);
     })
     ->withExceptions(function (Exceptions $exceptions): void {
         //
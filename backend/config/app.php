@@ -27,6 +27,23 @@
 
     'frontend_url' => env('FRONTEND_URL', 'http://localhost:3000'),
 
+    /*
+    |--------------------------------------------------------------------------
+    | Performance Monitoring
+    |--------------------------------------------------------------------------
+    |
+    | When enabled, API responses carry X-Response-Time, X-Memory-Usage and
+    | X-Query-Count headers for the load and budget harness, and slow or
+    | query-heavy requests are logged. Storing per-request metrics in the
+    | cache rewrites one shared entry per request, so it is opt-in as well.
+    | Keep both off in production.
+    |
+    */
+
+    'performance_headers' => (bool) env('PERF_HEADERS', false),
+
+    'performance_metrics' => (bool) env('PERF_METRICS', false),
+
     /*
     |--------------------------------------------------------------------------
     | Application Environment
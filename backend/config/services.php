@@ -45,12 +45,14 @@
         'key' => env('STRIPE_KEY'),
         'secret' => env('STRIPE_SECRET'),
         'webhook_secret' => env('STRIPE_WEBHOOK_SECRET'),
+        'api_base' => env('STRIPE_API_BASE'),
     ],
 
     'elasticmail' => [
         'api_key' => env('ELASTICMAIL_API_KEY'),
         'from_email' => env('MAIL_FROM_ADDRESS'),
         'from_name' => env('MAIL_FROM_NAME'),
+        'base_url' => env('ELASTICMAIL_BASE_URL', 'https://api.elasticemail.com/v2'),
     ],
 
 ];
@@ -0,0 +1,48 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        Schema::create('workspace_counters', function (Blueprint $table) {
+            $table->uuid('workspace_id')->primary();
+            $table->integer('members_count')->default(0);
+            $table->integer('social_accounts_count')->default(0);
+            $table->integer('posts_count')->default(0);
+            $table->integer('link_pages_count')->default(0);
+            $table->integer('active_link_pages_count')->default(0);
+            $table->bigInteger('link_views_total')->default(0);
+            $table->bigInteger('link_clicks_total')->default(0);
+            $table->integer('email_campaigns_count')->default(0);
+            $table->bigInteger('emails_sent_total')->default(0);
+            $table->integer('contacts_count')->default(0);
+            $table->integer('leads_count')->default(0);
+            $table->integer('courses_count')->default(0);
+            $table->integer('published_courses_count')->default(0);
+            $table->integer('products_count')->default(0);
+            $table->integer('active_products_count')->default(0);
+            $table->decimal('revenue_total', 15, 2)->default(0);
+            $table->decimal('revenue_month_total', 15, 2)->default(0);
+            $table->string('revenue_month', 7)->nullable();
+            $table->timestamp('reconciled_at')->nullable();
+            $table->timestamps();
+
+            $table->foreign('workspace_id')->references('id')->on('workspaces')->onDelete('cascade');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::dropIfExists('workspace_counters');
+    }
+};
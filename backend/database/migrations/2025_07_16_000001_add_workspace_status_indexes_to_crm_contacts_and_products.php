@@ -0,0 +1,37 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        // The analytics aggregation groups by workspace; SQLite does not index foreign keys
+        Schema::table('crm_contacts', function (Blueprint $table) {
+            $table->index(['workspace_id', 'status'], 'idx_crm_contacts_workspace_status');
+        });
+
+        Schema::table('products', function (Blueprint $table) {
+            $table->index(['workspace_id', 'status'], 'idx_products_workspace_status');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('crm_contacts', function (Blueprint $table) {
+            $table->dropIndex('idx_crm_contacts_workspace_status');
+        });
+
+        Schema::table('products', function (Blueprint $table) {
+            $table->dropIndex('idx_products_workspace_status');
+        });
+    }
+};
@@ -0,0 +1,32 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        // Let the department and role breakdowns of invitation analytics group from an index
+        // alone; idx_role_workspace leads with role and cannot seek to one workspace
+        Schema::table('workspace_invitations', function (Blueprint $table) {
+            $table->index(['workspace_id', 'department'], 'idx_workspace_department');
+            $table->index(['workspace_id', 'role'], 'idx_workspace_role');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('workspace_invitations', function (Blueprint $table) {
+            $table->dropIndex('idx_workspace_department');
+            $table->dropIndex('idx_workspace_role');
+        });
+    }
+};
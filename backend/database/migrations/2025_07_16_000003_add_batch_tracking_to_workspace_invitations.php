@@ -0,0 +1,46 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        // Links bulk-created invitations to their batch so the email job can page through them,
+        // and marks each one once it is emailed so a retried chunk does not email it again
+        Schema::table('workspace_invitations', function (Blueprint $table) {
+            $table->uuid('batch_id')->nullable()->after('invited_by');
+            $table->timestamp('email_sent_at')->nullable()->after('declined_at');
+            $table->timestamp('email_failed_at')->nullable()->after('email_sent_at');
+
+            $table->foreign('batch_id')->references('id')->on('invitation_batches')->onDelete('set null');
+            $table->index(['batch_id', 'id'], 'idx_batch_id');
+        });
+
+        Schema::table('invitation_batches', function (Blueprint $table) {
+            $table->integer('emails_sent')->default(0)->after('failed_invitations');
+            $table->integer('emails_failed')->default(0)->after('emails_sent');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('workspace_invitations', function (Blueprint $table) {
+            $table->dropForeign(['batch_id']);
+            $table->dropIndex('idx_batch_id');
+            $table->dropColumn(['batch_id', 'email_sent_at', 'email_failed_at']);
+        });
+
+        Schema::table('invitation_batches', function (Blueprint $table) {
+            $table->dropColumn(['emails_sent', 'emails_failed']);
+        });
+    }
+};
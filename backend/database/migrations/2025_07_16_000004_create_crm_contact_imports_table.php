@@ -0,0 +1,54 @@
+<?php
+
+use Illuminate\Database\Migrations\Migration;
+use Illuminate\Database\Schema\Blueprint;
+use Illuminate\Support\Facades\Schema;
+
+return new class extends Migration
+{
+    /**
+     * Run the migrations.
+     */
+    public function up(): void
+    {
+        Schema::create('crm_contact_imports', function (Blueprint $table) {
+            $table->uuid('id')->primary();
+            $table->uuid('workspace_id');
+            $table->uuid('created_by');
+            $table->string('source')->default('e-commerce');
+            $table->enum('status', ['queued', 'processing', 'completed', 'failed'])->default('queued');
+            $table->integer('total_orders')->default(0);
+            $table->integer('processed_orders')->default(0);
+            $table->integer('imported_count')->default(0);
+            $table->integer('updated_count')->default(0);
+            $table->integer('skipped_count')->default(0);
+            $table->uuid('last_order_id')->nullable();
+            $table->text('error')->nullable();
+            $table->timestamp('started_at')->nullable();
+            $table->timestamp('completed_at')->nullable();
+            $table->timestamps();
+
+            $table->foreign('workspace_id')->references('id')->on('workspaces')->onDelete('cascade');
+            $table->foreign('created_by')->references('id')->on('users')->onDelete('cascade');
+
+            $table->index(['workspace_id', 'status']);
+        });
+
+        // The importer pages through a workspace's orders by id
+        Schema::table('orders', function (Blueprint $table) {
+            $table->index(['workspace_id', 'id'], 'idx_orders_workspace_id');
+        });
+    }
+
+    /**
+     * Reverse the migrations.
+     */
+    public function down(): void
+    {
+        Schema::table('orders', function (Blueprint $table) {
+            $table->dropIndex('idx_orders_workspace_id');
+        });
+
+        Schema::dropIfExists('crm_contact_imports');
+    }
+};
@@ -84,6 +84,7 @@
     Route::post('workspaces/{workspace}/invitations', [WorkspaceInvitationController::class, 'store']);
     Route::post('workspaces/{workspace}/invitations/bulk', [WorkspaceInvitationController::class, 'bulkStore']);
     Route::get('workspaces/{workspace}/invitations/analytics', [WorkspaceInvitationController::class, 'analytics']);
+    Route::get('invitation-batches/{batch}', [WorkspaceInvitationController::class, 'showBatch']);
     Route::post('invitations/{invitation}/resend', [WorkspaceInvitationController::class, 'resend']);
     Route::delete('invitations/{invitation}', [WorkspaceInvitationController::class, 'cancel']);
     Route::post('invitations/{token}/accept', [WorkspaceInvitationController::class, 'accept']);
@@ -114,6 +115,7 @@
     Route::get('crm-contacts/{crmContact}/communications', [CrmCommunicationController::class, 'getContactCommunications']);
     Route::post('crm-contacts/{crmContact}/communications', [CrmCommunicationController::class, 'addContactCommunication']);
     Route::post('crm-contacts/import/ecommerce', [CrmContactController::class, 'importFromEcommerce']);
+    Route::get('crm-contacts/imports/{import}', [CrmContactController::class, 'importStatus']);
     
     // CRM Deals routes
     Route::apiResource('crm-deals', CrmDealController::class);
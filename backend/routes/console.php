@@ -1,8 +1,17 @@
 <?php
 
+use App\Jobs\ReconcileWorkspaceCounters;
 use Illuminate\Foundation\Inspiring;
 use Illuminate\Support\Facades\Artisan;
+use Illuminate\Support\Facades\Schedule;
 
 Artisan::command('inspire', function () {
     $this->comment(Inspiring::quote());
 })->purpose('Display an inspiring quote');
+
+Artisan::command('workspace-counters:reconcile {workspace? : Only reconcile this workspace}', function (?string $workspace = null) {
+    ReconcileWorkspaceCounters::dispatchSync($workspace);
+    $this->info($workspace ? "Reconciled counters for workspace {$workspace}" : 'Reconciled counters for all workspaces');
+})->purpose('Recount the dashboard counters from the source tables');
+
+Schedule::job(new ReconcileWorkspaceCounters)->hourly()->withoutOverlapping();
@@ -4,18 +4,29 @@ Comprehensive Backend Testing Script for Mewayz Laravel Application
 Tests core API endpoints, authentication, database connectivity, and business features
 """
 
-import requests
+import argparse
 import json
 import sys
+import time
 from datetime import datetime
 
+from tests.harness import baseline, budgets
+from tests.harness.client import get_client
+from tests.harness.metrics import MetricsRegistry, print_latency_table
+from tests.harness.runner import DEFAULT_CONCURRENCY, DependencyRunner, exclusive, provides, requires
+from tests.harness.sink import ResultSink
+
 class BackendTester:
-    def __init__(self):
-        self.base_url = "http://localhost:8001/api"  # Using the backend URL from frontend .env
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY):
+        self.client = get_client()
+        self.base_url = self.client.base_url
         self.token = None
         self.user_id = None
         self.workspace_id = None
         self.test_results = []
+        self.concurrency = concurrency
+        self.metrics = MetricsRegistry()
+        self.client.add_listener(self.metrics)
         
     def log_test(self, test_name, success, message="", details=""):
         """Log test results"""
@@ -35,7 +46,6 @@ class BackendTester:
     
     def make_request(self, method, endpoint, data=None, headers=None):
         """Make HTTP request with error handling"""
-        url = f"{self.base_url}{endpoint}"
         default_headers = {'Content-Type': 'application/json'}
         
         if headers:
@@ -43,27 +53,14 @@ class BackendTester:
             
         if self.token and 'Authorization' not in default_headers:
             default_headers['Authorization'] = f'Bearer {self.token}'
-        
-        try:
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=default_headers, timeout=10)
-            elif method.upper() == 'POST':
-                response = requests.post(url, json=data, headers=default_headers, timeout=10)
-            elif method.upper() == 'PUT':
-                response = requests.put(url, json=data, headers=default_headers, timeout=10)
-            elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=default_headers, timeout=10)
-            else:
-                return None, f"Unsupported method: {method}"
-                
-            return response, None
-        except requests.exceptions.RequestException as e:
-            return None, str(e)
+
+        return self.client.request(method, endpoint, data, default_headers)
     
+    @provides('server')
     def test_backend_service_status(self):
         """Test if backend service is running on port 8001"""
         try:
-            response = requests.get("http://localhost:8001", timeout=5)
+            response = self.client.ping(timeout=5)
             if response.status_code in [200, 404]:  # 404 is OK for Laravel without root route
                 self.log_test("Backend Service Status", True, "Laravel backend running on port 8001")
                 return True
@@ -74,6 +71,8 @@ class BackendTester:
             self.log_test("Backend Service Status", False, f"Backend service not accessible: {str(e)}")
             return False
     
+    @requires('server')
+    @provides('auth', 'user')
     def test_user_registration(self):
         """Test user registration endpoint"""
         test_email = f"testuser_{datetime.now().strftime('%Y%m%d_%H%M%S')}@mewayz.com"
@@ -108,6 +107,8 @@ class BackendTester:
             self.log_test("User Registration", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('user')
+    @provides('auth')
     def test_user_login(self):
         """Test user login endpoint"""
         if not self.user_id:
@@ -144,6 +145,7 @@ class BackendTester:
             self.log_test("User Login", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth')
     def test_authenticated_user_data(self):
         """Test getting authenticated user data"""
         if not self.token:
@@ -173,6 +175,8 @@ class BackendTester:
             self.log_test("Get User Data", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth')
+    @provides('workspace')
     def test_workspace_creation(self):
         """Test workspace creation"""
         if not self.token:
@@ -208,6 +212,7 @@ class BackendTester:
             self.log_test("Workspace Creation", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth')
     def test_workspace_listing(self):
         """Test workspace listing"""
         if not self.token:
@@ -237,6 +242,7 @@ class BackendTester:
             self.log_test("Workspace Listing", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth', 'workspace')
     def test_social_media_endpoints(self):
         """Test social media management endpoints"""
         if not self.token or not self.workspace_id:
@@ -266,6 +272,7 @@ class BackendTester:
             self.log_test("Social Media Endpoints", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth')
     def test_link_in_bio_endpoints(self):
         """Test link-in-bio management endpoints"""
         if not self.token:
@@ -294,6 +301,7 @@ class BackendTester:
             self.log_test("Link-in-Bio Endpoints", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth')
     def test_crm_endpoints(self):
         """Test CRM contact management endpoints"""
         if not self.token:
@@ -322,6 +330,7 @@ class BackendTester:
             self.log_test("CRM Endpoints", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth')
     def test_course_endpoints(self):
         """Test course management endpoints"""
         if not self.token:
@@ -350,6 +359,7 @@ class BackendTester:
             self.log_test("Course Endpoints", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth')
     def test_product_endpoints(self):
         """Test product management endpoints"""
         if not self.token:
@@ -378,6 +388,8 @@ class BackendTester:
             self.log_test("Product Endpoints", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @exclusive
+    @requires('auth')
     def test_authentication_protection(self):
         """Test that protected endpoints require authentication"""
         # Test without token
@@ -400,6 +412,7 @@ class BackendTester:
             self.token = old_token
             return False
     
+    @requires('auth')
     def test_database_connectivity(self):
         """Test database connectivity through API operations"""
         if not self.token:
@@ -434,6 +447,7 @@ class BackendTester:
             self.log_test("Database Connectivity", False, f"Database operation failed with HTTP {response.status_code}")
             return False
     
+    @requires('auth', 'workspace')
     def test_ecommerce_stock_management(self):
         """Test e-commerce stock management endpoint"""
         if not self.token or not self.workspace_id:
@@ -495,6 +509,7 @@ class BackendTester:
             self.log_test("E-commerce Stock Management", False, "Invalid JSON response from product creation")
             return False
     
+    @requires('auth', 'workspace')
     def test_ecommerce_order_management(self):
         """Test e-commerce order management endpoints"""
         if not self.token or not self.workspace_id:
@@ -576,6 +591,7 @@ class BackendTester:
             self.log_test("E-commerce Order Management", False, f"Orders list failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth')
     def test_ecommerce_inventory_alerts(self):
         """Test e-commerce inventory alerts endpoint"""
         if not self.token:
@@ -604,6 +620,7 @@ class BackendTester:
             self.log_test("E-commerce Inventory Alerts", False, f"Inventory alerts failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth')
     def test_ecommerce_product_categories(self):
         """Test e-commerce product categories endpoint"""
         if not self.token:
@@ -632,6 +649,7 @@ class BackendTester:
             self.log_test("E-commerce Product Categories", False, f"Product categories failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth', 'workspace')
     def test_ecommerce_product_analytics(self):
         """Test individual product analytics endpoint"""
         if not self.token or not self.workspace_id:
@@ -688,6 +706,7 @@ class BackendTester:
             self.log_test("E-commerce Product Analytics", False, "Invalid JSON response from product creation")
             return False
     
+    @requires('auth', 'workspace')
     def test_crm_pipeline_management(self):
         """Test CRM pipeline and deals management"""
         if not self.token or not self.workspace_id:
@@ -746,6 +765,7 @@ class BackendTester:
                 self.log_test("CRM Pipeline Management", False, "Invalid JSON response from pipeline retrieval")
                 return False
 
+    @requires('auth', 'workspace')
     def test_crm_deals_management(self):
         """Test CRM deals CRUD operations"""
         if not self.token or not self.workspace_id:
@@ -852,6 +872,7 @@ class BackendTester:
             self.log_test("CRM Deals Management", False, "Invalid JSON response from contact creation")
             return False
 
+    @requires('auth', 'workspace')
     def test_crm_tasks_management(self):
         """Test CRM tasks CRUD operations"""
         if not self.token or not self.workspace_id:
@@ -913,6 +934,7 @@ class BackendTester:
             self.log_test("CRM Tasks Management", False, f"Task creation failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_crm_communications_management(self):
         """Test CRM communications CRUD operations"""
         if not self.token or not self.workspace_id:
@@ -993,6 +1015,7 @@ class BackendTester:
             self.log_test("CRM Communications Management", False, "Invalid JSON response from contact creation")
             return False
 
+    @requires('auth', 'workspace')
     def test_crm_contact_analytics(self):
         """Test CRM contact analytics endpoints"""
         if not self.token or not self.workspace_id:
@@ -1056,6 +1079,7 @@ class BackendTester:
             self.log_test("CRM Contact Analytics", False, "Invalid JSON response from contact creation")
             return False
 
+    @requires('auth', 'workspace')
     def test_crm_automation_rules(self):
         """Test CRM automation rules CRUD operations"""
         if not self.token or not self.workspace_id:
@@ -1129,6 +1153,7 @@ class BackendTester:
             self.log_test("CRM Automation Rules", False, f"Automation rule creation failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_marketing_analytics(self):
         """Test Marketing Hub analytics endpoint"""
         if not self.token or not self.workspace_id:
@@ -1169,6 +1194,7 @@ class BackendTester:
         self.log_test("Marketing Analytics", True, "Marketing analytics working correctly for all time ranges")
         return True
 
+    @requires('auth', 'workspace')
     def test_marketing_automation(self):
         """Test Marketing Hub automation endpoints"""
         if not self.token or not self.workspace_id:
@@ -1253,6 +1279,7 @@ class BackendTester:
             self.log_test("Marketing Automation", False, f"Marketing automation list failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_marketing_content_management(self):
         """Test Marketing Hub content management endpoints"""
         if not self.token or not self.workspace_id:
@@ -1332,6 +1359,7 @@ class BackendTester:
             self.log_test("Marketing Content Management", False, f"Content library failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_marketing_lead_magnets(self):
         """Test Marketing Hub lead magnets endpoints"""
         if not self.token or not self.workspace_id:
@@ -1402,6 +1430,7 @@ class BackendTester:
             self.log_test("Marketing Lead Magnets", False, f"Lead magnets list failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_marketing_social_media_management(self):
         """Test Marketing Hub social media management endpoints"""
         if not self.token or not self.workspace_id:
@@ -1464,6 +1493,7 @@ class BackendTester:
             self.log_test("Marketing Social Media Management", False, f"Social calendar failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_marketing_conversion_funnels(self):
         """Test Marketing Hub conversion funnel analytics"""
         if not self.token or not self.workspace_id:
@@ -1514,6 +1544,7 @@ class BackendTester:
             self.log_test("Marketing Conversion Funnels", False, f"Conversion funnels failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_instagram_content_calendar(self):
         """Test Instagram content calendar endpoint"""
         if not self.token or not self.workspace_id:
@@ -1559,6 +1590,7 @@ class BackendTester:
         self.log_test("Instagram Content Calendar", True, "Content calendar endpoint working correctly with date filtering")
         return True
 
+    @requires('auth', 'workspace')
     def test_instagram_stories_management(self):
         """Test Instagram stories listing and creation endpoints"""
         if not self.token or not self.workspace_id:
@@ -1644,6 +1676,7 @@ class BackendTester:
             self.log_test("Instagram Stories Management", False, f"Story creation failed with HTTP {create_response.status_code}: {create_response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_instagram_hashtag_research(self):
         """Test Instagram hashtag research endpoint"""
         if not self.token or not self.workspace_id:
@@ -1711,6 +1744,7 @@ class BackendTester:
         self.log_test("Instagram Hashtag Research", True, "Hashtag research endpoint working correctly with all filters")
         return True
 
+    @requires('auth', 'workspace')
     def test_instagram_hashtag_analytics(self):
         """Test Instagram hashtag analytics creation/update endpoint"""
         if not self.token or not self.workspace_id:
@@ -1787,6 +1821,7 @@ class BackendTester:
             self.log_test("Instagram Hashtag Analytics", False, f"Hashtag analytics creation failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_instagram_analytics_dashboard(self):
         """Test Instagram analytics dashboard endpoint"""
         if not self.token or not self.workspace_id:
@@ -1830,6 +1865,7 @@ class BackendTester:
         self.log_test("Instagram Analytics Dashboard", True, "Analytics dashboard working correctly for all time periods")
         return True
 
+    @requires('auth', 'workspace')
     def test_instagram_competitor_analysis(self):
         """Test Instagram competitor analysis endpoints"""
         if not self.token or not self.workspace_id:
@@ -1910,6 +1946,7 @@ class BackendTester:
             self.log_test("Instagram Competitor Analysis", False, f"Competitor addition failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_instagram_optimal_posting_times(self):
         """Test Instagram optimal posting times endpoint"""
         if not self.token or not self.workspace_id:
@@ -1972,6 +2009,7 @@ class BackendTester:
             return False
 
     # Template Marketplace Tests
+    @requires('auth', 'workspace')
     def test_template_marketplace_browsing(self):
         """Test template marketplace browsing with filtering"""
         if not self.token or not self.workspace_id:
@@ -2022,6 +2060,7 @@ class BackendTester:
             self.log_test("Template Marketplace Browsing", False, f"Marketplace browsing failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth')
     def test_template_categories(self):
         """Test template categories retrieval"""
         if not self.token:
@@ -2050,6 +2089,7 @@ class BackendTester:
             self.log_test("Template Categories", False, f"Template categories failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth')
     def test_template_collections(self):
         """Test template collections with featured and sorting options"""
         if not self.token:
@@ -2086,6 +2126,7 @@ class BackendTester:
             self.log_test("Template Collections", False, f"Template collections failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth')
     def test_template_details(self):
         """Test individual template details with related templates"""
         if not self.token:
@@ -2138,6 +2179,7 @@ class BackendTester:
             self.log_test("Template Details", False, "Invalid JSON response from marketplace templates")
             return False
 
+    @requires('auth')
     def test_collection_details(self):
         """Test individual collection details"""
         if not self.token:
@@ -2190,6 +2232,7 @@ class BackendTester:
             self.log_test("Collection Details", False, "Invalid JSON response from marketplace collections")
             return False
 
+    @requires('auth', 'workspace')
     def test_template_purchase(self):
         """Test template purchasing with workspace validation"""
         if not self.token or not self.workspace_id:
@@ -2257,6 +2300,7 @@ class BackendTester:
             self.log_test("Template Purchase", False, "Invalid JSON response from marketplace templates")
             return False
 
+    @requires('auth', 'workspace')
     def test_collection_purchase(self):
         """Test collection purchasing"""
         if not self.token or not self.workspace_id:
@@ -2324,6 +2368,7 @@ class BackendTester:
             self.log_test("Collection Purchase", False, "Invalid JSON response from marketplace collections")
             return False
 
+    @requires('auth', 'workspace')
     def test_user_purchases(self):
         """Test user purchase history with filtering"""
         if not self.token or not self.workspace_id:
@@ -2368,6 +2413,7 @@ class BackendTester:
             self.log_test("User Purchases", False, f"User purchases failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth')
     def test_template_reviews(self):
         """Test template reviews with sorting and filtering"""
         if not self.token:
@@ -2429,6 +2475,7 @@ class BackendTester:
             self.log_test("Template Reviews", False, "Invalid JSON response from marketplace templates")
             return False
 
+    @requires('auth', 'workspace')
     def test_template_review_submission(self):
         """Test review submission with validation"""
         if not self.token or not self.workspace_id:
@@ -2500,6 +2547,7 @@ class BackendTester:
             return False
 
     # Template Creator Tests
+    @requires('auth', 'workspace')
     def test_creator_templates(self):
         """Test creator's template listing with filtering"""
         if not self.token or not self.workspace_id:
@@ -2547,6 +2595,7 @@ class BackendTester:
             self.log_test("Creator Templates", False, f"Creator templates failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_template_creation(self):
         """Test template creation with validation"""
         if not self.token or not self.workspace_id:
@@ -2625,6 +2674,7 @@ class BackendTester:
             self.log_test("Template Creation", False, "Invalid JSON response from categories")
             return False
 
+    @requires('auth', 'workspace')
     def test_template_updating(self):
         """Test template updating"""
         if not self.token or not self.workspace_id:
@@ -2684,6 +2734,7 @@ class BackendTester:
             self.log_test("Template Updating", False, "Invalid JSON response from creator templates")
             return False
 
+    @requires('auth', 'workspace')
     def test_template_deletion(self):
         """Test template deletion"""
         if not self.token or not self.workspace_id:
@@ -2736,6 +2787,7 @@ class BackendTester:
             self.log_test("Template Deletion", False, "Invalid JSON response from creator templates")
             return False
 
+    @requires('auth', 'workspace')
     def test_template_publishing(self):
         """Test template publishing"""
         if not self.token or not self.workspace_id:
@@ -2788,6 +2840,7 @@ class BackendTester:
             self.log_test("Template Publishing", False, "Invalid JSON response from creator templates")
             return False
 
+    @requires('auth')
     def test_creator_collections(self):
         """Test creator's collections"""
         if not self.token:
@@ -2824,6 +2877,7 @@ class BackendTester:
             self.log_test("Creator Collections", False, f"Creator collections failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_collection_creation(self):
         """Test collection creation"""
         if not self.token or not self.workspace_id:
@@ -2896,6 +2950,7 @@ class BackendTester:
             self.log_test("Collection Creation", False, "Invalid JSON response from creator templates")
             return False
 
+    @requires('auth', 'workspace')
     def test_template_analytics(self):
         """Test template analytics"""
         if not self.token or not self.workspace_id:
@@ -2960,6 +3015,7 @@ class BackendTester:
             self.log_test("Template Analytics", False, "Invalid JSON response from creator templates")
             return False
 
+    @requires('auth', 'workspace')
     def test_creator_dashboard(self):
         """Test creator dashboard stats"""
         if not self.token or not self.workspace_id:
@@ -3011,6 +3067,7 @@ class BackendTester:
         return True
 
     # Phase 8: Advanced Analytics & Gamification + Team Management Tests
+    @requires('auth', 'workspace')
     def test_analytics_dashboard(self):
         """Test unified analytics dashboard"""
         if not self.token or not self.workspace_id:
@@ -3048,6 +3105,7 @@ class BackendTester:
         self.log_test("Analytics Dashboard", True, "Analytics dashboard working correctly for all time periods")
         return True
 
+    @requires('auth', 'workspace')
     def test_analytics_module_specific(self):
         """Test module-specific analytics"""
         if not self.token or not self.workspace_id:
@@ -3085,6 +3143,7 @@ class BackendTester:
         self.log_test("Analytics Module Specific", True, "Module-specific analytics working correctly for all modules")
         return True
 
+    @requires('auth', 'workspace')
     def test_analytics_track_event(self):
         """Test analytics event tracking"""
         if not self.token or not self.workspace_id:
@@ -3129,6 +3188,7 @@ class BackendTester:
             self.log_test("Analytics Track Event", False, f"Event tracking failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_analytics_export(self):
         """Test analytics data export"""
         if not self.token or not self.workspace_id:
@@ -3161,6 +3221,7 @@ class BackendTester:
             self.log_test("Analytics Export", False, f"Analytics export failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_analytics_real_time(self):
         """Test real-time analytics"""
         if not self.token or not self.workspace_id:
@@ -3199,6 +3260,7 @@ class BackendTester:
             self.log_test("Analytics Real Time", False, f"Real-time analytics failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_analytics_custom_report(self):
         """Test custom analytics reports"""
         if not self.token or not self.workspace_id:
@@ -3245,6 +3307,7 @@ class BackendTester:
             self.log_test("Analytics Custom Report", False, f"Custom report failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_gamification_dashboard(self):
         """Test user gamification dashboard"""
         if not self.token or not self.workspace_id:
@@ -3292,6 +3355,7 @@ class BackendTester:
             self.log_test("Gamification Dashboard", False, f"Gamification dashboard failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_gamification_achievements(self):
         """Test achievements list"""
         if not self.token or not self.workspace_id:
@@ -3335,6 +3399,7 @@ class BackendTester:
             self.log_test("Gamification Achievements", False, f"Achievements list failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_gamification_leaderboard(self):
         """Test gamification leaderboard"""
         if not self.token or not self.workspace_id:
@@ -3367,6 +3432,7 @@ class BackendTester:
             self.log_test("Gamification Leaderboard", False, f"Leaderboard failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_gamification_progress(self):
         """Test user progress tracking"""
         if not self.token or not self.workspace_id:
@@ -3399,6 +3465,7 @@ class BackendTester:
             self.log_test("Gamification Progress", False, f"Progress failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_gamification_update_progress(self):
         """Test updating user progress"""
         if not self.token or not self.workspace_id:
@@ -3438,6 +3505,7 @@ class BackendTester:
             self.log_test("Gamification Update Progress", False, f"Progress update failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_gamification_check_achievements(self):
         """Test checking for new achievements"""
         if not self.token or not self.workspace_id:
@@ -3470,6 +3538,7 @@ class BackendTester:
             self.log_test("Gamification Check Achievements", False, f"Achievement check failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_gamification_stats(self):
         """Test achievement statistics"""
         if not self.token or not self.workspace_id:
@@ -3507,6 +3576,7 @@ class BackendTester:
             self.log_test("Gamification Stats", False, f"Achievement stats failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth')
     def test_gamification_initialize_achievements(self):
         """Test initializing default achievements"""
         if not self.token:
@@ -3537,6 +3607,7 @@ class BackendTester:
             self.log_test("Gamification Initialize Achievements", False, f"Achievement initialization failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_team_dashboard(self):
         """Test team dashboard"""
         if not self.token or not self.workspace_id:
@@ -3575,6 +3646,7 @@ class BackendTester:
             self.log_test("Team Dashboard", False, f"Team dashboard failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_team_members(self):
         """Test team members management"""
         if not self.token or not self.workspace_id:
@@ -3616,6 +3688,7 @@ class BackendTester:
             self.log_test("Team Members", False, f"Team members failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_team_invite(self):
         """Test team member invitation"""
         if not self.token or not self.workspace_id:
@@ -3679,6 +3752,7 @@ class BackendTester:
             self.log_test("Team Invite", False, "Invalid JSON response from team roles")
             return False
 
+    @requires('auth', 'workspace')
     def test_team_roles(self):
         """Test team roles management"""
         if not self.token or not self.workspace_id:
@@ -3711,6 +3785,7 @@ class BackendTester:
             self.log_test("Team Roles", False, f"Team roles failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_team_role_creation(self):
         """Test team role creation"""
         if not self.token or not self.workspace_id:
@@ -3760,6 +3835,7 @@ class BackendTester:
             self.log_test("Team Role Creation", False, f"Role creation failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_team_activities(self):
         """Test team activities tracking"""
         if not self.token or not self.workspace_id:
@@ -3801,6 +3877,7 @@ class BackendTester:
             self.log_test("Team Activities", False, f"Team activities failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_team_notifications(self):
         """Test team notifications"""
         if not self.token or not self.workspace_id:
@@ -3842,6 +3919,7 @@ class BackendTester:
             self.log_test("Team Notifications", False, f"Team notifications failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_team_initialize_roles(self):
         """Test initializing default team roles"""
         if not self.token or not self.workspace_id:
@@ -3877,6 +3955,7 @@ class BackendTester:
             self.log_test("Team Initialize Roles", False, f"Role initialization failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_critical_bug_fixes_team_management(self):
         """Test critical bug fixes for Team Management endpoints that were previously failing with 500 errors"""
         if not self.token or not self.workspace_id:
@@ -3970,6 +4049,7 @@ class BackendTester:
         self.log_test("Team Management Critical Bug Fixes", True, "All Team Management endpoints working without 500 errors")
         return True
     
+    @requires('auth', 'workspace')
     def test_critical_bug_fixes_gamification(self):
         """Test critical bug fixes for Gamification endpoints that were previously failing with 500 errors"""
         if not self.token or not self.workspace_id:
@@ -4065,6 +4145,7 @@ class BackendTester:
         self.log_test("Gamification Critical Bug Fixes", True, "All Gamification endpoints working without 500 errors")
         return True
 
+    @requires('auth')
     def test_workspace_setup_wizard_goals(self):
         """Test workspace setup wizard - goals endpoint"""
         if not self.token:
@@ -4104,6 +4185,7 @@ class BackendTester:
             self.log_test("Workspace Setup Wizard - Goals", False, f"Goals endpoint failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth')
     def test_workspace_setup_wizard_features_by_goal(self):
         """Test workspace setup wizard - features by goal endpoint"""
         if not self.token:
@@ -4162,6 +4244,7 @@ class BackendTester:
             self.log_test("Workspace Setup Wizard - Features by Goal", False, "Invalid JSON response from goals endpoint")
             return False
 
+    @requires('auth')
     def test_workspace_setup_wizard_subscription_plans(self):
         """Test workspace setup wizard - subscription plans endpoint"""
         if not self.token:
@@ -4201,6 +4284,7 @@ class BackendTester:
             self.log_test("Workspace Setup Wizard - Subscription Plans", False, f"Subscription plans endpoint failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_workspace_setup_progress(self):
         """Test workspace setup progress save and retrieve"""
         if not self.token or not self.workspace_id:
@@ -4263,6 +4347,7 @@ class BackendTester:
             self.log_test("Workspace Setup Progress", False, f"Setup progress save failed with HTTP {save_response.status_code}: {save_response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_workspace_complete_setup(self):
         """Test workspace complete setup endpoint"""
         if not self.token or not self.workspace_id:
@@ -4299,6 +4384,7 @@ class BackendTester:
             self.log_test("Workspace Complete Setup", False, f"Setup completion failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth')
     def test_subscription_current(self):
         """Test get current subscription endpoint"""
         if not self.token:
@@ -4336,6 +4422,7 @@ class BackendTester:
             self.log_test("Current Subscription", False, f"Current subscription endpoint failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth')
     def test_subscription_plans(self):
         """Test get subscription plans endpoint"""
         if not self.token:
@@ -4375,6 +4462,7 @@ class BackendTester:
             self.log_test("Subscription Plans", False, f"Subscription plans endpoint failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth')
     def test_subscription_checkout(self):
         """Test create Stripe checkout session endpoint"""
         if not self.token:
@@ -4416,6 +4504,7 @@ class BackendTester:
             self.log_test("Subscription Checkout", False, f"Checkout session creation failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth')
     def test_subscription_usage(self):
         """Test get subscription usage stats endpoint"""
         if not self.token:
@@ -4450,6 +4539,7 @@ class BackendTester:
             self.log_test("Subscription Usage", False, f"Subscription usage endpoint failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_stripe_integration_fixes(self):
         """Test the Stripe integration fixes mentioned in the review request"""
         print("🔧 Testing Stripe Integration Fixes")
@@ -4470,6 +4560,7 @@ class BackendTester:
         # Test 5: Get subscription usage stats
         self.test_subscription_usage_stats_fixed()
     
+    @requires('auth', 'workspace')
     def test_free_subscription_creation(self):
         """Test POST /api/subscription/free - Create free subscription (NEW)"""
         if not self.token or not self.workspace_id:
@@ -4503,6 +4594,7 @@ class BackendTester:
             self.log_test("Free Subscription Creation", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth', 'workspace')
     def test_stripe_checkout_session_creation(self):
         """Test POST /api/subscription/checkout - Stripe checkout session creation (FIXED)"""
         if not self.token or not self.workspace_id:
@@ -4537,6 +4629,7 @@ class BackendTester:
             self.log_test("Stripe Checkout Session Creation", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth', 'workspace')
     def test_workspace_complete_setup_fixed(self):
         """Test POST /api/workspaces/{id}/complete-setup - Complete workspace setup (FIXED)"""
         if not self.token or not self.workspace_id:
@@ -4572,6 +4665,7 @@ class BackendTester:
             self.log_test("Workspace Complete Setup (Fixed)", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth')
     def test_current_subscription_fixed(self):
         """Test GET /api/subscription/current - Get current subscription (Fixed)"""
         if not self.token:
@@ -4604,6 +4698,7 @@ class BackendTester:
             self.log_test("Current Subscription (Fixed)", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
     
+    @requires('auth')
     def test_subscription_usage_stats_fixed(self):
         """Test GET /api/subscription/usage - Get subscription usage stats (Fixed)"""
         if not self.token:
@@ -4636,6 +4731,7 @@ class BackendTester:
             self.log_test("Subscription Usage Stats (Fixed)", False, f"HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth')
     def test_goals_endpoint(self):
         """Test workspace setup wizard goals endpoint (baseline working)"""
         if not self.token:
@@ -4665,6 +4761,7 @@ class BackendTester:
             self.log_test("Goals Endpoint", False, f"Goals endpoint failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth')
     def test_current_subscription_endpoint(self):
         """Test current subscription endpoint (baseline working)"""
         if not self.token:
@@ -4693,6 +4790,7 @@ class BackendTester:
             self.log_test("Current Subscription Endpoint", False, f"Current subscription failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth')
     def test_subscription_plans_endpoint(self):
         """Test subscription plans endpoint (baseline working)"""
         if not self.token:
@@ -4722,6 +4820,7 @@ class BackendTester:
             self.log_test("Subscription Plans Endpoint", False, f"Subscription plans failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_workspace_setup_progress(self):
         """Test workspace setup progress endpoints (critical failing)"""
         if not self.token or not self.workspace_id:
@@ -4789,6 +4888,7 @@ class BackendTester:
             self.log_test("Workspace Setup Progress", False, f"Setup progress save failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_workspace_complete_setup(self):
         """Test workspace complete setup endpoint (critical failing)"""
         if not self.token or not self.workspace_id:
@@ -4829,6 +4929,7 @@ class BackendTester:
             self.log_test("Workspace Complete Setup", False, f"Complete setup failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_team_dashboard(self):
         """Test team dashboard endpoint (critical failing)"""
         if not self.token or not self.workspace_id:
@@ -4862,6 +4963,7 @@ class BackendTester:
             self.log_test("Team Dashboard", False, f"Team dashboard failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_team_members(self):
         """Test team members endpoint (critical failing)"""
         if not self.token or not self.workspace_id:
@@ -4895,6 +4997,7 @@ class BackendTester:
             self.log_test("Team Members", False, f"Team members failed with HTTP {response.status_code}: {response.text[:200]}")
             return False
 
+    @requires('auth', 'workspace')
     def test_stripe_checkout_session(self):
         """Test Stripe checkout session creation (critical failing)"""
         if not self.token or not self.workspace_id:
@@ -4943,56 +5046,50 @@ class BackendTester:
         print("=" * 80)
         print()
         
+        def section(title):
+            return f"{title}\n{'-' * 40}\n"
+        
+        runner = DependencyRunner(self.concurrency)
+        
         # 1. Infrastructure Status
-        print("1. INFRASTRUCTURE STATUS")
-        print("-" * 40)
-        if not self.test_backend_service_status():
-            print("❌ Backend service not running. Stopping tests.")
-            return False
+        runner.add(self.test_backend_service_status, critical=True,
+                   on_fail="❌ Backend service not running. Stopping tests.",
+                   header=section("1. INFRASTRUCTURE STATUS"))
         
         # 2. Authentication System
-        print("\n2. AUTHENTICATION SYSTEM")
-        print("-" * 40)
-        if not self.test_user_registration():
-            print("❌ User registration failed. Stopping tests.")
-            return False
-            
-        if not self.test_user_login():
-            print("⚠️ User login failed, but continuing with registration token...")
-        
-        if not self.test_authenticated_user_data():
-            print("❌ User authentication failed. Stopping tests.")
-            return False
+        runner.add(self.test_user_registration, critical=True,
+                   on_fail="❌ User registration failed. Stopping tests.",
+                   header=section("\n2. AUTHENTICATION SYSTEM"))
+        runner.add(self.test_user_login,
+                   on_fail="⚠️ User login failed, but continuing with registration token...")
+        runner.add(self.test_authenticated_user_data, critical=True,
+                   on_fail="❌ User authentication failed. Stopping tests.")
         
         # 3. Workspace Management
-        print("\n3. WORKSPACE MANAGEMENT")
-        print("-" * 40)
-        self.test_workspace_creation()
-        self.test_workspace_listing()
+        runner.add(self.test_workspace_creation, header=section("\n3. WORKSPACE MANAGEMENT"))
+        runner.add(self.test_workspace_listing)
         
         # 4. Fixed Critical Endpoints (Previously Failing)
-        print("\n4. FIXED CRITICAL ENDPOINTS (Previously Failing)")
-        print("-" * 40)
-        self.test_workspace_setup_progress()
-        self.test_workspace_complete_setup()
-        self.test_team_dashboard()
-        self.test_team_members()
-        self.test_stripe_checkout_session()
+        runner.add(self.test_workspace_setup_progress,
+                   header=section("\n4. FIXED CRITICAL ENDPOINTS (Previously Failing)"))
+        runner.add(self.test_workspace_complete_setup)
+        runner.add(self.test_team_dashboard)
+        runner.add(self.test_team_members)
+        runner.add(self.test_stripe_checkout_session)
         
         # 5. Baseline Working Endpoints (Verification)
-        print("\n5. BASELINE WORKING ENDPOINTS (Verification)")
-        print("-" * 40)
-        self.test_goals_endpoint()
-        self.test_current_subscription_endpoint()
-        self.test_subscription_plans_endpoint()
+        runner.add(self.test_goals_endpoint, header=section("\n5. BASELINE WORKING ENDPOINTS (Verification)"))
+        runner.add(self.test_current_subscription_endpoint)
+        runner.add(self.test_subscription_plans_endpoint)
         
         # 6. Endpoints Needing Retesting
-        print("\n6. ENDPOINTS NEEDING RETESTING")
-        print("-" * 40)
-        self.test_ecommerce_stock_management()
-        self.test_crm_deals_management()
-        self.test_crm_tasks_management()
-        self.test_crm_automation_rules()
+        runner.add(self.test_ecommerce_stock_management, header=section("\n6. ENDPOINTS NEEDING RETESTING"))
+        runner.add(self.test_crm_deals_management)
+        runner.add(self.test_crm_tasks_management)
+        runner.add(self.test_crm_automation_rules)
+        
+        if not runner.run(self):
+            return False
         
         # Print summary
         self.print_test_summary()
@@ -5012,6 +5109,8 @@ class BackendTester:
         print(f"Tests Passed: {passed}/{total} ({success_rate:.1f}%)")
         print()
         
+        print_latency_table(self.metrics)
+        
         # Categorize results
         critical_failures = []
         working_endpoints = []
@@ -5064,6 +5163,28 @@ class BackendTester:
         return self.run_comprehensive_tests()
 
 if __name__ == "__main__":
-    tester = BackendTester()
+    parser = argparse.ArgumentParser(description="Mewayz backend endpoint tests")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help="Maximum number of independent tests run at once (1 = sequential)")
+    parser.add_argument('--results', metavar='PATH',
+                        help="Stream test results to this JSONL file (.gz to compress) instead of keeping them in memory")
+    baseline.add_arguments(parser)
+    budgets.add_arguments(parser)
+    args = parser.parse_args()
+    
+    tester = BackendTester(concurrency=args.concurrency)
+    if args.results:
+        tester.test_results = ResultSink(args.results, source='backend_test')
+    start = time.perf_counter()
     success = tester.run_all_tests()
+    elapsed = time.perf_counter() - start
+    if args.results:
+        tester.test_results.close()
+    
+    # Pass rates alone miss slowdowns; gate on latency/query regressions against a saved baseline
+    if success:
+        success = baseline.gate(tester.metrics, elapsed, args.save_baseline, args.compare_baseline,
+                                args.baseline_label, 'backend_test', baseline.tolerances_from_args(args),
+                                baseline.load_overrides(args.tolerance_overrides), throughput=False)
+    success = budgets.enforce(tester.metrics, budgets.load_budgets(args.query_budgets)) and success
     sys.exit(0 if success else 1)
\ No newline at end of file
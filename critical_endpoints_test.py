@@ -4,14 +4,16 @@ Critical Endpoints Testing Script for Mewayz Laravel Application
 Tests the specific endpoints mentioned in the review request after PHP Laravel backend fix
 """
 
-import requests
 import json
 import sys
 from datetime import datetime
 
+from tests.harness.client import get_client
+
 class CriticalEndpointsTester:
     def __init__(self):
-        self.base_url = "http://localhost:8001/api"
+        self.client = get_client()
+        self.base_url = self.client.base_url
         self.token = None
         self.user_id = None
         self.workspace_id = None
@@ -35,7 +37,6 @@ class CriticalEndpointsTester:
     
     def make_request(self, method, endpoint, data=None, headers=None):
         """Make HTTP request with error handling"""
-        url = f"{self.base_url}{endpoint}"
         default_headers = {'Content-Type': 'application/json'}
         
         if headers:
@@ -43,27 +44,13 @@ class CriticalEndpointsTester:
             
         if self.token and 'Authorization' not in default_headers:
             default_headers['Authorization'] = f'Bearer {self.token}'
-        
-        try:
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=default_headers, timeout=10)
-            elif method.upper() == 'POST':
-                response = requests.post(url, json=data, headers=default_headers, timeout=10)
-            elif method.upper() == 'PUT':
-                response = requests.put(url, json=data, headers=default_headers, timeout=10)
-            elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=default_headers, timeout=10)
-            else:
-                return None, f"Unsupported method: {method}"
-                
-            return response, None
-        except requests.exceptions.RequestException as e:
-            return None, str(e)
+
+        return self.client.request(method, endpoint, data, default_headers)
     
     def test_backend_service_status(self):
         """Test if backend service is running on port 8001"""
         try:
-            response = requests.get("http://localhost:8001", timeout=5)
+            response = self.client.ping(timeout=5)
             if response.status_code in [200, 404]:  # 404 is OK for Laravel without root route
                 self.log_test("Backend Service Status", True, "Laravel backend running on port 8001")
                 return True
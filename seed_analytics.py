@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Script to seed analytics events for AnalyticsController and dashboard benchmarking
+Generates tens of millions of events across a set of workspaces with skewed workspace
+activity, partitioned over a process pool and merged into the SQLite database
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from tests.harness.seeding import (DEFAULT_DB_PATH, BulkLoader, ParallelLoader, TimestampSampler, ZipfSampler,
+                                   account_email, new_uuid, seed_accounts, unique_tag)
+
+# (module, action, weight)
+EVENTS = (
+    ('dashboard', 'view', 30), ('crm', 'view', 12), ('crm', 'create', 3), ('crm', 'update', 4),
+    ('ecommerce', 'view', 10), ('ecommerce', 'purchase', 2), ('social_media', 'view', 8),
+    ('social_media', 'publish', 2), ('email', 'send', 4), ('email', 'open', 6), ('email', 'click', 3),
+    ('courses', 'view', 5), ('courses', 'enroll', 1), ('link_in_bio', 'click', 8), ('analytics', 'export', 2),
+)
+ENTITY_TYPES = {'crm': 'contact', 'ecommerce': 'product', 'social_media': 'post', 'email': 'campaign',
+                'courses': 'course', 'link_in_bio': 'page'}
+SOURCES = ('web', 'mobile', 'api')
+
+COLUMNS = ('id', 'workspace_id', 'user_id', 'module', 'action', 'entity_type', 'entity_id', 'metadata', 'value',
+           'timestamp', 'created_at', 'updated_at')
+
+
+def event_rows(index, start, count, rng, context):
+    """Rows start..start+count-1 of the analytics table; runs in a worker process"""
+    accounts = context['accounts']
+    workspaces = ZipfSampler(len(accounts), rng=rng)
+    timestamps = TimestampSampler(days=context['days'], rng=rng)
+    events = [(module, action) for module, action, _ in EVENTS]
+    weights = [weight for _, _, weight in EVENTS]
+    metadata = [json.dumps({'source': source}) for source in SOURCES]
+
+    for event_index in range(count):
+        user_id, workspace_id = accounts[workspaces.sample()]
+        module, action = rng.choices(events, weights)[0]
+        entity_type = ENTITY_TYPES.get(module)
+        timestamp = timestamps.sample()
+        value = round(rng.uniform(5, 500), 2) if action == 'purchase' else 0
+        yield (new_uuid(), workspace_id, user_id, module, action, entity_type,
+               new_uuid() if entity_type else None, metadata[(start + event_index) % len(metadata)], value,
+               timestamp, timestamp, timestamp)
+
+
+class AnalyticsSeeder:
+    def __init__(self, db_path=DEFAULT_DB_PATH, rows=1000000, workspaces=100, days=365, workers=0,
+                 partition_rows=1000000, serial=False, seed=None):
+        self.db_path = db_path
+        self.rows = rows
+        self.workspaces = workspaces
+        self.days = days
+        self.workers = workers
+        self.partition_rows = partition_rows
+        self.serial = serial
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.tag = unique_tag()
+
+    def run(self):
+        print(f"🚀 Seeding {self.rows:,} analytics events across {self.workspaces:,} workspaces into {self.db_path}")
+        print("=" * 50)
+        start = time.perf_counter()
+
+        with BulkLoader(self.db_path) as loader:
+            loader.require_tables('users', 'workspaces', 'workspace_members', 'analytics')
+
+            print("🌱 Seeding users and workspaces...")
+            accounts = seed_accounts(loader, self.workspaces, self.rng, TimestampSampler(days=self.days, rng=self.rng),
+                                     self.tag)
+            context = {'accounts': accounts, 'days': self.days}
+
+            print("🌱 Seeding analytics events...")
+            if self.serial:
+                loader.insert('analytics', COLUMNS, event_rows(0, 0, self.rows, self.rng, context))
+            else:
+                ParallelLoader(loader, self.workers, self.partition_rows).insert(
+                    'analytics', COLUMNS, event_rows, self.rows, self.seed, context)
+
+            loader.analyze('analytics')
+
+        elapsed = time.perf_counter() - start
+        print(f"\n✅ Analytics seeding completed: {sum(loader.row_counts.values()):,} rows in {elapsed:.1f}s")
+        print(f"   Log in as {account_email(self.tag, 0)} / password (busiest workspaces are Zipf-ranked)")
+        return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seed analytics events for benchmarking")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="Path to the Laravel SQLite database")
+    parser.add_argument('--rows', type=int, default=1000000, help="Number of analytics events (up to 50M+)")
+    parser.add_argument('--workspaces', type=int, default=100, help="Workspaces (each with an owner) to spread events over")
+    parser.add_argument('--days', type=int, default=365, help="Events are spread over this many past days")
+    parser.add_argument('--workers', type=int, default=0, help="Generator processes (0 = one per CPU)")
+    parser.add_argument('--partition-rows', type=int, default=1000000, help="Rows per generated partition file")
+    parser.add_argument('--serial', action='store_true', help="Generate in this process with plain batched inserts")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for reproducible datasets")
+    args = parser.parse_args()
+
+    seeder = AnalyticsSeeder(args.db, args.rows, args.workspaces, args.days, args.workers, args.partition_rows,
+                             args.serial, args.seed)
+    success = seeder.run()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Script to seed e-commerce orders and CRM contacts for import benchmarking
+Fills one workspace with a configurable number of orders, a share of repeat customers
+and a share of customers that already exist as CRM contacts
+"""
+
+import argparse
+import json
+import random
+import sys
+
+from tests.harness.seeding import (DEFAULT_DB_PATH, BulkLoader, TimestampSampler, ZipfSampler, account_email,
+                                   new_uuid, seed_accounts, unique_tag)
+
+FIRST_NAMES = ['James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda', 'David', 'Elizabeth',
+               'William', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica', 'Thomas', 'Sarah', 'Chris', 'Karen']
+LAST_NAMES = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez', 'Martinez',
+              'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin']
+ORDER_STATUSES = (('completed', 55), ('delivered', 20), ('shipped', 8), ('processing', 7), ('pending', 6),
+                  ('cancelled', 4))
+PAYMENT_METHODS = ('stripe', 'paypal', 'card')
+
+
+class OrderDatasetGenerator:
+    """
+    Generates `orders` orders for a single workspace.
+
+    `repeat_share` is the fraction of orders placed by returning customers; returning
+    customers are picked with Zipf-like skew so a few customers have many orders.
+    `existing_share` is the fraction of distinct customers already present in
+    crm_contacts, which exercises the update path of importFromEcommerce.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, orders=1000, repeat_share=0.3, existing_share=0.2,
+                 workspace_id=None, user_id=None, seed=None):
+        self.db_path = db_path
+        self.orders = orders
+        self.repeat_share = repeat_share
+        self.existing_share = existing_share
+        self.workspace_id = workspace_id
+        self.user_id = user_id
+        self.rng = random.Random(seed)
+        self.timestamps = TimestampSampler(days=730, rng=self.rng)
+        self.tag = unique_tag()
+        self.login_email = None
+        self.customer_count = max(1, int(round(orders * (1 - repeat_share))))
+
+    def customer(self, index):
+        first = FIRST_NAMES[index % len(FIRST_NAMES)]
+        last = LAST_NAMES[(index // len(FIRST_NAMES)) % len(LAST_NAMES)]
+        return f"{first} {last}", f"customer{index}.{self.tag}@example.test"
+
+    def run(self):
+        print(f"🚀 Seeding {self.orders:,} orders ({self.customer_count:,} customers) into {self.db_path}")
+        print("=" * 50)
+
+        with BulkLoader(self.db_path) as loader:
+            loader.require_tables('users', 'workspaces', 'workspace_members', 'orders', 'crm_contacts')
+
+            if not self.workspace_id:
+                print("🌱 Seeding workspace owner...")
+                [(self.user_id, self.workspace_id)] = seed_accounts(loader, 1, self.rng, self.timestamps, self.tag)
+                self.login_email = account_email(self.tag, 0)
+
+            print("🌱 Seeding orders...")
+            loader.insert('orders', (
+                'id', 'workspace_id', 'order_number', 'customer_name', 'customer_email', 'customer_phone',
+                'status', 'subtotal', 'tax', 'shipping', 'total', 'payment_status', 'payment_method',
+                'created_by', 'created_at', 'updated_at'
+            ), self.order_rows())
+
+            print("🌱 Seeding existing CRM contacts...")
+            loader.insert('crm_contacts', (
+                'id', 'workspace_id', 'first_name', 'last_name', 'email', 'phone', 'notes', 'tags', 'status',
+                'lead_score', 'custom_fields', 'created_by', 'created_at', 'updated_at'
+            ), self.contact_rows())
+
+            loader.analyze('orders', 'crm_contacts')
+
+        print(f"\n✅ Order dataset seeded for workspace {self.workspace_id}")
+        if self.login_email:
+            print(f"   Login: {self.login_email} / password")
+        return True
+
+    def order_rows(self):
+        rng = self.rng
+        statuses, weights = zip(*ORDER_STATUSES)
+        returning = ZipfSampler(self.customer_count, s=1.0, rng=rng)
+        phones = {}
+        new_customers = 0
+
+        for i in range(self.orders):
+            # The first order of every customer is guaranteed; later ones are repeats
+            remaining_new = self.customer_count - new_customers
+            if remaining_new and (new_customers == 0 or rng.random() * (self.orders - i) < remaining_new):
+                index = new_customers
+                new_customers += 1
+            else:
+                index = returning.sample() % max(1, new_customers)
+            name, email = self.customer(index)
+            if index not in phones:
+                phones[index] = None if rng.random() < 0.3 else f"+1555{rng.randrange(10 ** 7):07d}"
+
+            status = rng.choices(statuses, weights)[0]
+            subtotal = round(rng.uniform(10, 400), 2)
+            tax = round(subtotal * 0.08, 2)
+            shipping = 0.0 if subtotal > 100 else 7.99
+            created_at = self.timestamps.sample()
+            yield (
+                new_uuid(), self.workspace_id, f"ORD-{self.tag}-{i:08d}", name, email, phones[index], status,
+                subtotal, tax, shipping, round(subtotal + tax + shipping, 2),
+                'refunded' if status == 'cancelled' else 'paid', rng.choice(PAYMENT_METHODS),
+                self.user_id, created_at, created_at
+            )
+
+    def contact_rows(self):
+        rng = self.rng
+        tags = json.dumps(['customer'])
+        for index in range(self.customer_count):
+            if rng.random() >= self.existing_share:
+                continue
+            name, email = self.customer(index)
+            first, _, last = name.partition(' ')
+            created_at = self.timestamps.sample()
+            yield (
+                new_uuid(), self.workspace_id, first, last, email, None, "Existing contact", tags, 'active',
+                rng.randint(0, 80), json.dumps({'source': 'manual'}), self.user_id, created_at, created_at
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Seed orders and CRM contacts for importFromEcommerce benchmarks")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="Path to the Laravel SQLite database")
+    parser.add_argument('--orders', type=int, default=1000, help="Number of orders to generate (1k to 5M)")
+    parser.add_argument('--repeat-share', type=float, default=0.3,
+                        help="Fraction of orders placed by returning customers")
+    parser.add_argument('--existing-share', type=float, default=0.2,
+                        help="Fraction of customers that already exist as CRM contacts")
+    parser.add_argument('--workspace-id', help="Existing workspace to fill (default: create a new owner and workspace)")
+    parser.add_argument('--user-id', help="Order creator / contact owner when --workspace-id is given")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for reproducible datasets")
+    args = parser.parse_args()
+
+    if args.workspace_id and not args.user_id:
+        parser.error("--user-id is required with --workspace-id")
+
+    generator = OrderDatasetGenerator(args.db, args.orders, args.repeat_share, args.existing_share,
+                                      args.workspace_id, args.user_id, args.seed)
+    success = generator.run()
+    sys.exit(0 if success else 1)
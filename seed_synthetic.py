@@ -0,0 +1,631 @@
+#!/usr/bin/env python3
+"""
+Script to fill every application table with synthetic data derived from the migrations
+Reads column types, nullability, enums and foreign keys through tests.harness.schema, plans
+the tables in dependency order and generates referentially consistent rows at a chosen scale:
+children follow their most specific parent (a task inherits the workspace and contact of its
+deal), user references inside a workspace point at that workspace's members, and every
+workspace owner is an active member. Columns are generated a whole table at a time, with
+NumPy when it is installed and the random module otherwise.
+"""
+
+import argparse
+import os
+import random
+import re
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from tests.harness.schema import dependency_order, parse_migrations
+from tests.harness.seeding import (DEFAULT_DB_PATH, REPO_ROOT, SEED_PASSWORD_HASH, BulkLoader, account_email,
+                                   unique_tag)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; generation falls back to the random module
+    np = None
+
+# Row counts for tables nothing else owns, multiplied by --scale
+ROOT_ROWS = {'users': 200}
+DEFAULT_ROOT_ROWS = 10
+
+# Lookup tables that do not grow with the scale factor
+FIXED_ROWS = {'features': 24, 'template_categories': 12, 'achievements': 20}
+
+# Rows per row of the table's parent (see PARENTS / choose_parent)
+FANOUT = {
+    'workspaces': 0.5, 'workspace_members': 4, 'subscriptions': 1, 'workspace_features': 6, 'team_roles': 4,
+    'social_media_accounts': 3, 'social_media_posts': 15, 'social_media_schedules': 5, 'link_in_bio_pages': 2,
+    'crm_contacts': 200, 'crm_pipeline_stages': 6, 'crm_deals': 0.4, 'crm_tasks': 2, 'crm_communications': 3,
+    'crm_automation_rules': 3, 'courses': 3, 'course_modules': 5, 'course_lessons': 6, 'course_enrollments': 25,
+    'products': 50, 'orders': 100, 'email_campaigns': 10, 'email_templates': 8, 'email_audiences': 4,
+    'activity_logs': 200, 'analytics': 500, 'payment_transactions': 5, 'workspace_invitations': 20,
+    'invitation_batches': 2, 'templates': 4, 'template_collections': 0.1, 'template_collection_items': 5,
+    'template_purchases': 3, 'template_reviews': 2, 'template_usages': 2, 'user_achievements': 5,
+    'user_progress': 10, 'team_activities': 50, 'team_notifications': 20, 'team_tasks': 10,
+}
+DEFAULT_FANOUT = 5
+
+# Parent foreign key column where the heuristic would pick the wrong one
+PARENTS = {
+    'templates': 'workspace_id',
+    'template_purchases': 'template_id',
+    'template_reviews': 'template_id',
+    'template_usages': 'template_purchase_id',
+}
+
+# Rebuilt from other tables by the application, never generated (see reconcile_counters)
+DERIVED_TABLES = frozenset(['workspace_counters', 'crm_contact_imports'])
+ARTISAN = os.path.join(REPO_ROOT, 'backend', 'artisan')
+
+# Generated right after the tables they need, so later tables can draw users from them
+EARLY_TABLES = ('workspace_members',)
+
+# Scope column and the table used to find the users belonging to a scope
+SCOPE_COLUMN = 'workspace_id'
+SCOPED_USERS = ('workspace_members', 'user_id')
+
+NULL_SHARE = 0.3        # nullable plain columns left empty
+OPTIONAL_FK_SHARE = 0.8  # nullable foreign keys that get a value
+CHILD_LAG_DAYS = 30     # children are created up to this long after their parent
+
+FIRST_NAMES = ('Ada', 'Grace', 'Linus', 'Margaret', 'Alan', 'Barbara', 'Dennis', 'Frances', 'Ken', 'Radia')
+LAST_NAMES = ('Lovelace', 'Hopper', 'Torvalds', 'Hamilton', 'Turing', 'Liskov', 'Ritchie', 'Allen', 'Thompson')
+WORDS = ('growth', 'launch', 'summer', 'brand', 'client', 'weekly', 'premium', 'starter', 'social', 'insight',
+         'campaign', 'studio', 'academy', 'digital', 'local', 'creator')
+SENTENCES = (
+    "Generated for load testing.",
+    "Synthetic record created from the migration schema.",
+    "Follow up next week with the updated proposal.",
+    "Imported from the e-commerce storefront.",
+)
+JSON_LISTS = re.compile(r'(tags|categories|images|features|items|links|permissions|modules|steps|attachments|'
+                        r'recipients|keywords|hashtags|platforms|segments|lessons|resources)$')
+UNIQUE_STRINGS = re.compile(r'(slug|token|number|sku|code|session_id|_key|uuid)$')
+
+
+class PythonColumns:
+    """Whole-column generators on top of random.Random; values are plain lists"""
+
+    def __init__(self, seed=None):
+        self.rng = random.Random(seed)
+
+    def integers(self, low, high, n):
+        return [self.rng.randrange(low, high) for _ in range(n)]
+
+    def uniform(self, low, high, n, digits=2):
+        return [round(self.rng.uniform(low, high), digits) for _ in range(n)]
+
+    def choice(self, values, n):
+        return [self.rng.choice(values) for _ in range(n)]
+
+    def mask(self, share, n):
+        return [self.rng.random() < share for _ in range(n)]
+
+    def indexes(self, size, n, skew=0.0):
+        if skew <= 0:
+            return [int(self.rng.random() * size) for _ in range(n)]
+        weights = [1.0 / (rank ** skew) for rank in range(1, size + 1)]
+        return self.rng.choices(range(size), weights, k=n)
+
+    def covering(self, size, n, skew=0.0):
+        """Parent indexes where each parent gets at least one row when n >= size"""
+        if n < size:
+            return self.indexes(size, n, skew)
+        return list(range(size)) + self.indexes(size, n - size, skew)
+
+    def take(self, values, indexes):
+        return [values[i] for i in indexes]
+
+    def where(self, mask, values, other=None):
+        return [value if keep else other for keep, value in zip(mask, values)]
+
+    def numbered(self, template, start, n):
+        return [template.format(i) for i in range(start, start + n)]
+
+    def epochs_after(self, base, span, now):
+        return [min(now, b + int(self.rng.random() * span)) for b in base]
+
+    def epochs(self, n, span, now):
+        return [now - int(self.rng.random() * span) for _ in range(n)]
+
+    def format_times(self, epochs, fmt='%Y-%m-%d %H:%M:%S'):
+        return [datetime.fromtimestamp(e).strftime(fmt) for e in epochs]
+
+    def uuids(self, n):
+        data = self.rng.randbytes(16 * n).hex()
+        return [f"{data[i:i + 8]}-{data[i + 8:i + 12]}-4{data[i + 13:i + 16]}-"
+                f"{'89ab'[int(data[i + 16], 16) & 3]}{data[i + 17:i + 20]}-{data[i + 20:i + 32]}"
+                for i in range(0, 32 * n, 32)]
+
+    def in_groups(self, group_values, group_of, groups_of_rows):
+        """For each row, a random value among those sharing its group (None if the group is empty)"""
+        members = {}
+        for value, group in zip(group_values, group_of):
+            members.setdefault(group, []).append(value)
+        return [self.rng.choice(members[g]) if g in members else None for g in groups_of_rows]
+
+    def tolist(self, values):
+        return values
+
+
+class NumpyColumns(PythonColumns):
+    """Same generators vectorized with NumPy; values are arrays until tolist()"""
+
+    def __init__(self, seed=None):
+        super().__init__(seed)
+        self.np_rng = np.random.default_rng(seed)
+
+    def integers(self, low, high, n):
+        return self.np_rng.integers(low, high, n)
+
+    def uniform(self, low, high, n, digits=2):
+        return np.round(self.np_rng.uniform(low, high, n), digits)
+
+    def choice(self, values, n):
+        return np.asarray(values, dtype=object)[self.np_rng.integers(0, len(values), n)]
+
+    def mask(self, share, n):
+        return self.np_rng.random(n) < share
+
+    def indexes(self, size, n, skew=0.0):
+        if skew <= 0:
+            return self.np_rng.integers(0, size, n)
+        weights = 1.0 / np.arange(1, size + 1) ** skew
+        return self.np_rng.choice(size, n, p=weights / weights.sum())
+
+    def covering(self, size, n, skew=0.0):
+        if n < size:
+            return self.indexes(size, n, skew)
+        return np.concatenate([np.arange(size), self.indexes(size, n - size, skew)])
+
+    def take(self, values, indexes):
+        return np.asarray(values, dtype=object)[np.asarray(indexes, dtype=np.int64)]
+
+    def where(self, mask, values, other=None):
+        result = np.asarray(values, dtype=object).copy()
+        result[~np.asarray(mask, dtype=bool)] = other
+        return result
+
+    def numbered(self, template, start, n):
+        prefix, _, suffix = template.partition('{}')
+        return np.char.add(np.char.add(prefix, np.arange(start, start + n).astype(str)), suffix).astype(object)
+
+    def epochs_after(self, base, span, now):
+        return np.minimum(now, np.asarray(base, dtype=np.int64) + self.np_rng.integers(0, span, len(base)))
+
+    def epochs(self, n, span, now):
+        return now - self.np_rng.integers(0, span, n)
+
+    def format_times(self, epochs, fmt='%Y-%m-%d %H:%M:%S'):
+        # datetime64 has no time zone, so shift to local time like datetime.fromtimestamp does
+        offset = int(datetime.now().astimezone().utcoffset().total_seconds())
+        local = (np.asarray(epochs, dtype=np.int64) + offset).astype('datetime64[s]')
+        text = np.char.replace(np.datetime_as_string(local, unit='s'), 'T', ' ')
+        if fmt == '%Y-%m-%d':
+            return text.astype('<U10').astype(object)
+        if fmt == '%H:%M:%S':
+            return np.array([value[11:] for value in text], dtype=object)
+        return text.astype(object)
+
+    def in_groups(self, group_values, group_of, groups_of_rows):
+        values = np.asarray(group_values, dtype=object)
+        group_of = np.asarray(group_of, dtype=np.int64)
+        rows = np.asarray(groups_of_rows, dtype=np.int64)
+        order = np.argsort(group_of, kind='stable')
+        sorted_groups = group_of[order]
+        starts = np.searchsorted(sorted_groups, rows, 'left')
+        sizes = np.searchsorted(sorted_groups, rows, 'right') - starts
+        picks = starts + (self.np_rng.random(len(rows)) * sizes).astype(np.int64)
+        result = np.full(len(rows), None, dtype=object)
+        found = sizes > 0
+        result[found] = values[order[picks[found]]]
+        return result
+
+    def tolist(self, values):
+        return values.tolist() if isinstance(values, np.ndarray) else values
+
+
+class Generated:
+    """What later tables need from a generated table: keys, scope, foreign keys and creation times"""
+
+    def __init__(self, name, count):
+        self.name = name
+        self.count = count
+        self.columns = {}
+        self.scope = None
+        self.created = None
+        self.parent_index = None
+
+
+class SyntheticSeeder:
+    def __init__(self, db_path=DEFAULT_DB_PATH, scale=1.0, days=365, skew=0.0, only=None, fanout=None,
+                 use_numpy=True, plan_only=False, seed=None):
+        self.db_path = db_path
+        self.scale = scale
+        self.days = days
+        self.skew = skew
+        self.only = set(only) if only else None
+        self.fanout = dict(FANOUT, **(fanout or {}))
+        self.plan_only = plan_only
+        self.tag = unique_tag()
+        self.columns = NumpyColumns(seed) if use_numpy and np is not None else PythonColumns(seed)
+        self.now = int(time.time())
+        self.tables = parse_migrations()
+        self.generated = {}
+
+    # Planning
+
+    def choose_parent(self, table, order):
+        """Foreign key whose rows this table hangs off, preferring the one that shares most scope columns"""
+        candidates = [fk for fk in table.foreign_keys if fk.table in order and fk.table != table.name]
+        if not candidates:
+            return None
+        if table.name in PARENTS:
+            return table.foreign_key(PARENTS[table.name])
+
+        own = {fk.column for fk in table.foreign_keys}
+
+        def score(fk):
+            parent = self.tables[fk.table]
+            shared = sum(1 for pfk in parent.foreign_keys if pfk.column in own and pfk.column != fk.column)
+            return (shared, fk.column == SCOPE_COLUMN, not table.columns[fk.column].nullable
+                    if fk.column in table.columns else False)
+
+        return max(candidates, key=score)
+
+    def plan(self):
+        """[(table name, parent fk or None, row count, deferred columns)] in generation order"""
+        order, deferred = dependency_order(self.tables)
+        order = self.hoist(order, deferred)
+        counts = {}
+        plan = []
+        order = [name for name in order if name not in DERIVED_TABLES]
+        for name in order:
+            table = self.tables[name]
+            parent = self.choose_parent(table, order[:order.index(name)])
+            if name in FIXED_ROWS:
+                count = FIXED_ROWS[name]
+            elif parent is None:
+                count = max(1, round(ROOT_ROWS.get(name, DEFAULT_ROOT_ROWS) * self.scale))
+            else:
+                count = max(1, round(counts[parent.table] * self.table_fanout(table, parent)))
+            counts[name] = count
+            plan.append((name, parent, count, deferred.get(name, set())))
+        if self.only:
+            plan = [entry for entry in plan if entry[0] in self.only or self.needed_by_only(entry[0], plan)]
+        return plan
+
+    def table_fanout(self, table, parent):
+        """Rows per parent row; exactly one when the primary key is the parent's key"""
+        if table.primary_key is not None and table.primary_key.name == parent.column:
+            return 1
+        return self.fanout.get(table.name, DEFAULT_FANOUT)
+
+    def hoist(self, order, deferred):
+        """Move EARLY_TABLES up to just after their required parents, deferring nullable ones"""
+        for name in EARLY_TABLES:
+            if name not in order:
+                continue
+            table = self.tables[name]
+            order.remove(name)
+            required = {fk.table for fk in table.foreign_keys
+                        if not table.columns[fk.column].nullable and fk.table != name}
+            position = max(order.index(dep) for dep in required) + 1 if required else 0
+            order.insert(position, name)
+            placed = set(order[:position])
+            deferred.setdefault(name, set()).update(
+                fk.column for fk in table.foreign_keys if fk.table not in placed and fk.table != name)
+        return order
+
+    def needed_by_only(self, name, plan):
+        """Whether a table is a (transitive) parent of one selected with --only"""
+        wanted = set(self.only)
+        for entry_name, _, _, _ in reversed(plan):
+            if entry_name in wanted:
+                wanted |= self.tables[entry_name].dependencies
+        return name in wanted
+
+    # Generation
+
+    def scoped_users(self, scope):
+        source = self.generated.get(SCOPED_USERS[0])
+        if source is None or source.scope is None:
+            return None
+        return self.columns.in_groups(source.columns[SCOPED_USERS[1]], source.scope, scope)
+
+    def foreign_values(self, table, fk, n, state, deferred):
+        """Values of a non-parent foreign key column, kept inside the row's scope where possible"""
+        column = table.columns.get(fk.column)
+        target = self.generated.get(fk.table)
+        if target is None or fk.column in deferred or fk.table == table.name:
+            return [None] * n if column is None or column.nullable else None
+        values = None
+        if state.scope is not None:
+            if target.scope is not None:
+                values = self.columns.in_groups(target.columns[fk.references], target.scope, state.scope)
+            elif fk.table == 'users':
+                values = self.scoped_users(state.scope)
+        if values is None:
+            values = self.columns.take(target.columns[fk.references],
+                                       self.columns.indexes(target.count, n, self.skew))
+        if column is not None and column.nullable:
+            values = self.columns.where(self.columns.mask(OPTIONAL_FK_SHARE, n), values)
+        elif values is not None and any(value is None for value in self.columns.tolist(values)):
+            # Rows whose scope has nothing to point at fall back to any row of the target
+            fallback = self.columns.take(target.columns[fk.references],
+                                         self.columns.indexes(target.count, n, self.skew))
+            values = [v if v is not None else f for v, f in zip(self.columns.tolist(values),
+                                                                 self.columns.tolist(fallback))]
+        return values
+
+    def plain_values(self, table, column, n, start, created):
+        """Values for a column that is not a key, chosen by type and name"""
+        name = column.name
+        cols = self.columns
+        length = column.length or 255
+
+        if column.kind == 'enum':
+            values = cols.choice(column.values, n)
+        elif column.kind == 'boolean':
+            values = cols.where(cols.mask(0.8 if name.startswith(('is_', 'has_')) else 0.5, n),
+                                [1] * n, 0)
+        elif column.kind == 'integer':
+            if re.search(r'(rating|stars)$', name):
+                values = cols.integers(1, 6, n)
+            elif re.search(r'(percent|percentage|probability|progress|score)', name):
+                values = cols.integers(0, 101, n)
+            elif re.search(r'(order|position|sort|priority|level|quantity)$', name):
+                values = cols.integers(0, 20, n)
+            else:
+                values = cols.integers(0, 1000, n)
+        elif column.kind == 'decimal':
+            ceiling = min(10 ** ((column.precision or 8) - (column.scale or 2)) - 1, 10000)
+            if re.search(r'(rating)$', name):
+                ceiling = min(ceiling, 5)
+            elif re.search(r'(percent|percentage|rate)', name):
+                ceiling = min(ceiling, 100)
+            values = cols.uniform(0, ceiling, n, column.scale or 2)
+        elif column.kind in ('timestamp', 'date', 'time'):
+            fmt = {'timestamp': '%Y-%m-%d %H:%M:%S', 'date': '%Y-%m-%d', 'time': '%H:%M:%S'}[column.kind]
+            epochs = created if name in ('created_at', 'updated_at') else \
+                cols.epochs_after(created, CHILD_LAG_DAYS * 86400, self.now + 90 * 86400)
+            values = cols.format_times(epochs, fmt)
+        elif column.kind == 'json':
+            values = ['[]' if JSON_LISTS.search(name) else '{}'] * n
+        elif column.kind == 'text':
+            values = cols.choice(SENTENCES, n)
+        elif column.kind == 'uuid':
+            values = cols.uuids(n)
+        elif name == 'password':
+            values = [SEED_PASSWORD_HASH] * n
+        elif name == 'email' and table.name == 'users':
+            values = [account_email(self.tag, i) for i in range(start, start + n)]
+        elif 'email' in name:
+            values = cols.numbered(f"{table.name}_{self.tag}_{{}}@mewayz.test", start, n)
+        elif column.unique or UNIQUE_STRINGS.search(name):
+            values = cols.numbered(f"{name.replace('_', '-')[:20]}-{self.tag}-{{}}", start, n)
+        elif name == 'first_name':
+            values = cols.choice(FIRST_NAMES, n)
+        elif name == 'last_name':
+            values = cols.choice(LAST_NAMES, n)
+        elif re.search(r'(phone)', name):
+            values = cols.numbered("+1555{}", 1000000 + start, n)
+        elif re.search(r'(url|website|avatar|image|thumbnail|logo|photo)', name):
+            values = cols.numbered(f"https://example.com/{table.name}/{{}}", start, n)
+        elif name == 'currency':
+            values = ['USD'] * n
+        elif re.search(r'(color|colour)', name):
+            values = cols.choice(('#4f46e5', '#16a34a', '#dc2626', '#f59e0b'), n)
+        elif re.search(r'(_type|type)$', name):
+            values = cols.choice(('standard', 'custom', 'default'), n)
+        elif re.search(r'(name|title|subject|username|label|company)', name):
+            words = cols.choice(WORDS, n)
+            numbers = cols.numbered("{}", start, n)
+            values = [f"{w.title()} {table.name.rstrip('s').replace('_', ' ').title()} {i}"[:length]
+                      for w, i in zip(cols.tolist(words), cols.tolist(numbers))]
+        else:
+            values = cols.choice(WORDS, n)
+
+        if column.nullable and name not in ('created_at', 'updated_at'):
+            values = cols.where(cols.mask(1 - NULL_SHARE, n), values)
+        return values
+
+    def generate(self, name, parent, count, deferred, db_columns):
+        """Build every column of one table; returns (column names, column arrays, Generated)"""
+        table = self.tables[name]
+        cols = self.columns
+        state = Generated(name, count)
+        data = {}
+        start = 0
+
+        if parent is not None:
+            source = self.generated[parent.table]
+            fanout = self.table_fanout(table, parent)
+            index = cols.covering(source.count, count, self.skew) if fanout >= 1 else \
+                cols.indexes(source.count, count, self.skew)
+            state.parent_index = index
+            data[parent.column] = cols.take(source.columns[parent.references], index)
+            state.created = cols.epochs_after(cols.take(source.created, index), CHILD_LAG_DAYS * 86400, self.now)
+            # Inherit scope and any foreign key the parent shares by name (task.contact_id from its deal)
+            for column, values in source.columns.items():
+                if column != parent.references and table.foreign_key(column) and column not in data:
+                    data[column] = cols.take(values, index)
+            if parent.column == SCOPE_COLUMN:
+                state.scope = index
+            elif source.scope is not None and table.foreign_key(SCOPE_COLUMN):
+                state.scope = cols.take(source.scope, index)
+        else:
+            state.created = cols.epochs(count, self.days * 86400, self.now)
+        if name == 'workspaces':
+            state.scope = cols.numbered("{}", 0, count)
+            state.scope = [int(i) for i in cols.tolist(state.scope)]
+
+        primary = table.primary_key
+        if primary is not None and primary.kind == 'uuid' and primary.name not in data:
+            data[primary.name] = cols.uuids(count)
+
+        for fk in table.foreign_keys:
+            inherited = data.get(fk.column)
+            column = table.columns.get(fk.column)
+            if inherited is not None and (column is None or column.nullable):
+                continue
+            values = self.foreign_values(table, fk, count, state, deferred)
+            if values is None:
+                raise RuntimeError(f"{name}.{fk.column} needs rows from {fk.table}, which was not generated")
+            if inherited is not None:
+                # The parent's column was optional but this one is not: fill only the gaps
+                values = [own if own is not None else fresh
+                          for own, fresh in zip(cols.tolist(inherited), cols.tolist(values))]
+            data[fk.column] = values
+
+        for column in table.columns.values():
+            if column.name in data or column.autoincrement or column.name not in db_columns:
+                continue
+            if column.name == 'remember_token':
+                continue
+            data[column.name] = self.plain_values(table, column, count, start, state.created)
+
+        hook = ROW_HOOKS.get(name)
+        if hook:
+            hook(self, data, state)
+
+        keep = self.unique_rows(table, data, count)
+        if keep is not None:
+            data = {column: cols.take(values, keep) for column, values in data.items()}
+            state.scope = cols.take(state.scope, keep) if state.scope is not None else None
+            state.created = cols.take(state.created, keep)
+            state.count = len(keep)
+
+        keys = {fk.column for fk in table.foreign_keys}
+        if primary is not None:
+            keys.add(primary.name)
+        state.columns = {column: data[column] for column in keys if column in data}
+        names = [column for column in data if column in db_columns]
+        return names, [data[column] for column in names], state
+
+    def unique_rows(self, table, data, count):
+        """Row indexes to keep so composite unique indexes hold, or None if nothing repeats"""
+        if not table.unique_sets:
+            return None
+        seen = [set() for _ in table.unique_sets]
+        keep = []
+        lists = {column: self.columns.tolist(values) for column, values in data.items()}
+        for row in range(count):
+            keys = [tuple(lists[column][row] if column in lists else None for column in columns)
+                    for columns in table.unique_sets]
+            if any(key in seen_keys for key, seen_keys in zip(keys, seen)):
+                continue
+            for key, seen_keys in zip(keys, seen):
+                seen_keys.add(key)
+            keep.append(row)
+        return keep if len(keep) < count else None
+
+    def run(self):
+        plan = self.plan()
+        engine = 'NumPy' if isinstance(self.columns, NumpyColumns) else 'random module'
+        total = sum(count for _, _, count, _ in plan)
+        print(f"🚀 Seeding {len(plan)} tables (~{total:,} rows, scale {self.scale}) into {self.db_path} using {engine}")
+        print("=" * 50)
+        for position, (name, parent, count, deferred) in enumerate(plan, 1):
+            source = f"{count:>10,} rows  <- {parent.table}.{parent.column}" if parent else f"{count:>10,} rows"
+            extra = f"  (empty: {', '.join(sorted(deferred))})" if deferred else ""
+            print(f"{position:>3}. {name:<30}{source}{extra}")
+        if self.plan_only:
+            return True
+
+        start = time.perf_counter()
+        with BulkLoader(self.db_path) as loader:
+            existing = {row[0] for row in loader.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+            print("\n🌱 Generating rows...")
+            for name, parent, count, deferred in plan:
+                if name not in existing or (parent is not None and parent.table not in self.generated):
+                    print(f"   ⚠️ {name}: skipped ({'table missing' if name not in existing else 'parent skipped'})")
+                    continue
+                db_columns = {row[1] for row in loader.conn.execute(f"PRAGMA table_info({name})")}
+                names, values, state = self.generate(name, parent, count, deferred, db_columns)
+                rows = zip(*(self.columns.tolist(column) for column in values))
+                loader.insert(name, [f'"{column}"' for column in names], rows)
+                self.generated[name] = state
+            loader.analyze(*[name for name in self.generated])
+
+        if 'workspaces' in self.generated:
+            self.reconcile_counters()
+
+        elapsed = time.perf_counter() - start
+        print(f"\n✅ Synthetic seeding completed: {sum(loader.row_counts.values()):,} rows in {elapsed:.1f}s")
+        workspaces = self.generated.get('workspaces')
+        if workspaces is not None and workspaces.parent_index is not None:
+            owner = int(self.columns.tolist(workspaces.parent_index)[0])
+            print(f"   Log in as {account_email(self.tag, owner)} / password")
+        return True
+
+    def reconcile_counters(self):
+        """Rows were bulk-loaded past the model events, so rebuild workspace_counters through artisan"""
+        print("\n🔢 Reconciling workspace counters...")
+        try:
+            result = subprocess.run(['php', ARTISAN, 'workspace-counters:reconcile'], capture_output=True, text=True,
+                                    timeout=3600, env=dict(os.environ, DB_DATABASE=os.path.abspath(self.db_path)))
+        except FileNotFoundError:
+            print("   ⚠️ php not found; counters are built on each workspace's first dashboard request")
+            return
+        if result.returncode != 0:
+            print(f"   ⚠️ Reconcile failed: {(result.stderr or result.stdout).strip()[:300]}")
+
+
+def owner_memberships(seeder, data, state):
+    """First membership row of every workspace belongs to its owner, who invited the rest"""
+    workspaces = seeder.generated['workspaces']
+    scope = seeder.columns.tolist(state.scope)
+    owners = seeder.columns.tolist(seeder.columns.take(workspaces.columns['owner_id'], scope))
+    user_ids = list(seeder.columns.tolist(data['user_id']))
+    roles = list(seeder.columns.tolist(data['role'])) if 'role' in data else None
+    statuses = list(seeder.columns.tolist(data['status'])) if 'status' in data else None
+    inviters = [None] * len(scope)
+    seen = set()
+    for row, workspace in enumerate(scope):
+        if workspace in seen:
+            inviters[row] = owners[row]
+            if roles is not None and roles[row] == 'owner':
+                roles[row] = 'admin'
+            continue
+        seen.add(workspace)
+        user_ids[row] = owners[row]
+        if roles is not None:
+            roles[row] = 'owner'
+        if statuses is not None:
+            statuses[row] = 'active'
+    data['user_id'] = user_ids
+    if 'invited_by' in data:
+        data['invited_by'] = inviters
+    if roles is not None:
+        data['role'] = roles
+    if statuses is not None:
+        data['status'] = statuses
+
+
+ROW_HOOKS = {'workspace_members': owner_memberships}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fill every table with synthetic data planned from the migrations")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="Path to the Laravel SQLite database")
+    parser.add_argument('--scale', type=float, default=1.0, help="Multiplier for root row counts (1.0 = 200 users)")
+    parser.add_argument('--days', type=int, default=365, help="Root rows are spread over this many past days")
+    parser.add_argument('--skew', type=float, default=0.0,
+                        help="Zipf exponent for how children spread over parents (0 = uniform)")
+    parser.add_argument('--only', nargs='+', help="Seed these tables plus the parents they need")
+    parser.add_argument('--fanout', action='append', default=[], metavar='TABLE=N',
+                        help="Rows per parent row for a table, e.g. crm_contacts=1000")
+    parser.add_argument('--no-numpy', action='store_true', help="Generate with the random module even if NumPy exists")
+    parser.add_argument('--plan', action='store_true', help="Print the generation plan and exit")
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for reproducible datasets")
+    args = parser.parse_args()
+
+    fanout = {table: float(value) for table, value in (item.split('=', 1) for item in args.fanout)}
+    seeder = SyntheticSeeder(args.db, args.scale, args.days, args.skew, args.only, fanout, not args.no_numpy,
+                             args.plan, args.seed)
+    success = seeder.run()
+    sys.exit(0 if success else 1)
@@ -3,14 +3,23 @@
 Script to seed template marketplace data for testing
 """
 
-import requests
+import argparse
 import json
+import random
+import sys
 import uuid
+from array import array
 from datetime import datetime
 
+from tests.harness.client import get_client
+from tests.harness.seeding import (DEFAULT_DB_PATH, BulkLoader, TimestampSampler, ZipfSampler, new_uuid, seed_accounts,
+                                   unique_tag)
+
 class TemplateDataSeeder:
-    def __init__(self):
-        self.base_url = "http://localhost:8001/api"
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self.client = get_client()
+        self.base_url = self.client.base_url
         self.token = None
         self.user_id = None
         self.workspace_id = None
@@ -23,8 +32,8 @@ class TemplateDataSeeder:
             "password": "password123"
         }
         
-        response = requests.post(f"{self.base_url}/auth/login", json=data)
-        if response.status_code == 200:
+        response, error = self.client.request('POST', '/auth/login', data)
+        if response is not None and response.status_code == 200:
             result = response.json()
             if result.get('success') and result.get('token'):
                 self.token = result['token']
@@ -38,9 +47,9 @@ class TemplateDataSeeder:
     def get_workspace(self):
         """Get a workspace for testing"""
         headers = {'Authorization': f'Bearer {self.token}'}
-        response = requests.get(f"{self.base_url}/workspaces", headers=headers)
+        response, error = self.client.request('GET', '/workspaces', headers=headers)
         
-        if response.status_code == 200:
+        if response is not None and response.status_code == 200:
             result = response.json()
             if result.get('success') and result.get('workspaces'):
                 workspaces = result['workspaces']
@@ -100,7 +109,7 @@ class TemplateDataSeeder:
         import sqlite3
         
         try:
-            conn = sqlite3.connect('/app/backend/database/database.sqlite')
+            conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
             for category in categories:
@@ -171,7 +180,7 @@ class TemplateDataSeeder:
         import sqlite3
         
         try:
-            conn = sqlite3.connect('/app/backend/database/database.sqlite')
+            conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
             for template in templates:
@@ -243,7 +252,7 @@ class TemplateDataSeeder:
         import sqlite3
         
         try:
-            conn = sqlite3.connect('/app/backend/database/database.sqlite')
+            conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
             for collection in collections:
@@ -316,7 +325,332 @@ class TemplateDataSeeder:
         
         return True
 
+
+# Rows generated per unit of --scale; --scale 20 loads roughly 11M rows
+SCALE_VOLUMES = {
+    'users': 2000,
+    'templates': 20000,
+    'collections': 500,
+    'purchases': 150000,
+    'reviews': 60000,
+    'usages': 300000,
+}
+
+CATEGORY_NAMES = [
+    ('Email Marketing', 'mail', 'email'), ('Newsletters', 'newspaper', 'newsletter'),
+    ('Social Media', 'share', 'social_media'), ('Instagram Stories', 'camera', 'social_media'),
+    ('Landing Pages', 'globe', 'landing_page'), ('Sales Funnels', 'filter', 'landing_page'),
+    ('Link in Bio', 'link', 'link_in_bio'), ('Creator Bio Pages', 'user', 'link_in_bio'),
+    ('Online Courses', 'book', 'course'), ('Course Lessons', 'play', 'course'),
+    ('Marketing Campaigns', 'megaphone', 'marketing'), ('Ad Creatives', 'image', 'marketing'),
+    ('Blog Posts', 'edit', 'blog_post'), ('Product Launches', 'rocket', 'marketing'),
+    ('E-commerce', 'shopping-cart', 'email'), ('Events', 'calendar', 'social_media'),
+]
+
+TEMPLATE_STATUSES = (('active', 85), ('draft', 8), ('inactive', 4), ('archived', 3))
+PURCHASE_STATUSES = (('completed', 90), ('pending', 4), ('failed', 4), ('refunded', 2))
+REVIEW_STATUSES = (('active', 85), ('pending', 10), ('hidden', 5))
+RATING_WEIGHTS = (2, 3, 10, 30, 55)  # 1..5 stars
+PAID_PRICES = (9.99, 19.99, 29.99, 49.99, 99.00)
+USAGE_TYPES = ('creation', 'customization', 'export', 'preview', 'download')
+USAGE_CONTEXTS = ('email_campaign', 'link_in_bio', 'social_media_post', 'course_content',
+                  'marketing_material', 'landing_page', 'other')
+LICENSE_TYPES = ('standard', 'extended', 'commercial', 'unlimited')
+
+
+def weighted(rng, choices):
+    values, weights = zip(*choices)
+    return lambda: rng.choices(values, weights)[0]
+
+
+class MarketplaceScaleSeeder:
+    """
+    Generates a marketplace at `scale` x SCALE_VOLUMES directly in SQLite.
+
+    Template popularity is Zipf-distributed, so a few templates collect most purchases,
+    reviews and usages. Activity is sampled before templates are written so each
+    template's purchase_count, download_count and rating columns match its child rows.
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH, scale=1.0, seed=None):
+        self.db_path = db_path
+        self.scale = scale
+        self.rng = random.Random(seed)
+        self.timestamps = TimestampSampler(days=730, rng=self.rng)
+        self.volumes = {name: max(1, int(count * scale)) for name, count in SCALE_VOLUMES.items()}
+
+    def run(self):
+        print(f"🚀 Seeding template marketplace at scale {self.scale:g} into {self.db_path}")
+        print("=" * 50)
+        for name, count in self.volumes.items():
+            print(f"   - {count:,} {name}")
+        print()
+
+        with BulkLoader(self.db_path) as loader:
+            loader.require_tables('users', 'workspaces', 'workspace_members', 'template_categories', 'templates',
+                                  'template_collections', 'template_collection_items', 'template_purchases',
+                                  'template_reviews', 'template_usages')
+
+            print("🌱 Seeding users and workspaces...")
+            self.accounts = seed_accounts(loader, self.volumes['users'], self.rng, self.timestamps)
+            self.creators = self.accounts[:max(1, len(self.accounts) // 20)]
+
+            print("🌱 Planning marketplace activity...")
+            self.plan_activity()
+
+            print("🌱 Seeding categories, templates and collections...")
+            self.seed_categories(loader)
+            self.seed_templates(loader)
+            self.seed_collections(loader)
+
+            print("🌱 Seeding purchases, reviews and usages...")
+            self.seed_purchases(loader)
+            self.seed_reviews(loader)
+            self.seed_usages(loader)
+
+            loader.analyze('templates', 'template_collections', 'template_collection_items',
+                           'template_purchases', 'template_reviews', 'template_usages')
+
+        total = sum(loader.row_counts.values())
+        print(f"\n✅ Template Marketplace scale seeding completed: {total:,} rows")
+        return True
+
+    def plan_activity(self):
+        """Sample which template every purchase, review and usage belongs to"""
+        rng = self.rng
+        template_count = self.volumes['templates']
+        collection_count = self.volumes['collections']
+        templates = ZipfSampler(template_count, rng=rng)
+        collections = ZipfSampler(collection_count, rng=rng)
+
+        self.template_prices = [0.0 if rng.random() < 0.4 else rng.choice(PAID_PRICES) for _ in range(template_count)]
+        self.purchase_counts = array('I', bytes(4 * template_count))
+        self.download_counts = array('I', bytes(4 * template_count))
+        self.rating_sums = array('I', bytes(4 * template_count))
+        self.rating_counts = array('I', bytes(4 * template_count))
+        self.collection_purchases = array('I', bytes(4 * collection_count))
+
+        # Purchases: 5% are whole collections (stored as collection index + template_count)
+        purchase_status = weighted(rng, list(enumerate(w for _, w in PURCHASE_STATUSES)))
+        self.purchase_targets = array('I')
+        self.purchase_statuses = array('B')
+        for _ in range(self.volumes['purchases']):
+            status = purchase_status()
+            if rng.random() < 0.05:
+                target = collections.sample()
+                self.purchase_targets.append(template_count + target)
+                if status == 0:
+                    self.collection_purchases[target] += 1
+            else:
+                target = templates.sample()
+                self.purchase_targets.append(target)
+                if status == 0:
+                    self.purchase_counts[target] += 1
+            self.purchase_statuses.append(status)
+
+        review_status = weighted(rng, list(enumerate(w for _, w in REVIEW_STATUSES)))
+        self.review_templates = array('I')
+        self.review_ratings = array('B')
+        self.review_statuses = array('B')
+        for _ in range(self.volumes['reviews']):
+            template = templates.sample()
+            rating = rng.choices((1, 2, 3, 4, 5), RATING_WEIGHTS)[0]
+            status = review_status()
+            self.review_templates.append(template)
+            self.review_ratings.append(rating)
+            self.review_statuses.append(status)
+            if status == 0:
+                self.rating_sums[template] += rating
+                self.rating_counts[template] += 1
+
+        self.usage_templates = array('I')
+        self.usage_types = array('B')
+        for _ in range(self.volumes['usages']):
+            template = templates.sample()
+            usage_type = rng.randrange(len(USAGE_TYPES))
+            self.usage_templates.append(template)
+            self.usage_types.append(usage_type)
+            if USAGE_TYPES[usage_type] == 'download':
+                self.download_counts[template] += 1
+
+        self.collection_sampler = templates
+
+    def seed_categories(self, loader):
+        self.categories = []
+        tag = unique_tag()
+        rows = []
+        for i, (name, icon, template_type) in enumerate(CATEGORY_NAMES):
+            category_id = new_uuid()
+            self.categories.append((category_id, template_type, name))
+            rows.append((category_id, name, f"{name.lower().replace(' ', '-')}-{tag}",
+                         f"Professional {name.lower()} templates", icon, '#3B82F6', i + 1, True, 0))
+        loader.insert('template_categories', (
+            'id', 'name', 'slug', 'description', 'icon', 'color', 'sort_order', 'is_active', 'template_count'
+        ), rows)
+
+    def seed_templates(self, loader):
+        rng = self.rng
+        status = weighted(rng, TEMPLATE_STATUSES)
+        template_data = json.dumps({
+            'html': '<div>{{title}}</div><p>{{content}}</p>',
+            'css': 'body { font-family: Arial, sans-serif; }',
+            'variables': ['title', 'content']
+        })
+        features = json.dumps(['Responsive design', 'Easy customization'])
+        requirements = json.dumps(['Basic HTML knowledge'])
+        self.template_ids = [new_uuid() for _ in range(self.volumes['templates'])]
+        category_counts = [0] * len(self.categories)
+
+        def rows():
+            for i, template_id in enumerate(self.template_ids):
+                category_index = rng.randrange(len(self.categories))
+                category_id, template_type, category_name = self.categories[category_index]
+                category_counts[category_index] += 1
+                creator_id, workspace_id = self.creators[rng.randrange(len(self.creators))]
+                template_status = status()
+                approved = template_status == 'active'
+                created_at = self.timestamps.sample()
+                price = self.template_prices[i]
+                rating_count = self.rating_counts[i]
+                rating_average = round(self.rating_sums[i] / rating_count, 2) if rating_count else 0.0
+                yield (
+                    template_id, workspace_id, creator_id, category_id,
+                    f"{category_name} Template {i + 1}",
+                    f"Professional {category_name.lower()} template for modern businesses",
+                    template_type, template_data, price, price == 0, price >= 49.99,
+                    template_status, 'approved' if approved else 'pending',
+                    json.dumps([template_type, 'professional', 'modern']), features, requirements,
+                    rng.choice(LICENSE_TYPES), self.download_counts[i], self.purchase_counts[i],
+                    rating_average, rating_count, creator_id, created_at if approved else None,
+                    created_at, created_at
+                )
+
+        loader.insert('templates', (
+            'id', 'workspace_id', 'creator_id', 'template_category_id', 'title', 'description',
+            'template_type', 'template_data', 'price', 'is_free', 'is_premium', 'status', 'approval_status',
+            'tags', 'features', 'requirements', 'license_type', 'download_count', 'purchase_count',
+            'rating_average', 'rating_count', 'created_by', 'approved_at', 'created_at', 'updated_at'
+        ), rows())
+
+        loader.conn.executemany(
+            "UPDATE template_categories SET template_count = ? WHERE id = ?",
+            [(count, category[0]) for count, category in zip(category_counts, self.categories)]
+        )
+
+    def seed_collections(self, loader):
+        rng = self.rng
+        self.collection_ids = [new_uuid() for _ in range(self.volumes['collections'])]
+        self.collection_prices = []
+        items = []
+        collection_rows = []
+        for i, collection_id in enumerate(self.collection_ids):
+            creator_id, _ = self.creators[rng.randrange(len(self.creators))]
+            size = rng.randint(10, 30)
+            members = set()
+            while len(members) < min(size, len(self.template_ids)):
+                members.add(self.collection_sampler.sample())
+            created_at = self.timestamps.sample()
+            for sort_order, template_index in enumerate(members):
+                items.append((new_uuid(), collection_id, self.template_ids[template_index], sort_order + 1,
+                              created_at, created_at))
+            price = round(sum(self.template_prices[t] for t in members) * 0.6, 2)
+            self.collection_prices.append(price)
+            collection_rows.append((
+                collection_id, creator_id, f"Template Bundle {i + 1}",
+                "A curated bundle of top marketplace templates", price, 25, i % 25 == 0, True,
+                json.dumps(['bundle']), len(members), self.collection_purchases[i], 0.0, 0,
+                creator_id, created_at, created_at
+            ))
+
+        loader.insert('template_collections', (
+            'id', 'creator_id', 'title', 'description', 'price', 'discount_percentage', 'is_featured',
+            'is_active', 'tags', 'template_count', 'purchase_count', 'rating_average', 'rating_count',
+            'created_by', 'created_at', 'updated_at'
+        ), collection_rows)
+        loader.insert('template_collection_items', (
+            'id', 'template_collection_id', 'template_id', 'sort_order', 'created_at', 'updated_at'
+        ), items)
+
+    def seed_purchases(self, loader):
+        rng = self.rng
+        template_count = len(self.template_ids)
+
+        def rows():
+            for target, status in zip(self.purchase_targets, self.purchase_statuses):
+                user_id, workspace_id = self.accounts[rng.randrange(len(self.accounts))]
+                purchased_at = self.timestamps.sample()
+                if target >= template_count:
+                    collection = target - template_count
+                    template_id, collection_id, purchase_type = None, self.collection_ids[collection], 'collection'
+                    price = self.collection_prices[collection]
+                else:
+                    template_id, collection_id, purchase_type = self.template_ids[target], None, 'template'
+                    price = self.template_prices[target]
+                yield (
+                    new_uuid(), template_id, collection_id, user_id, workspace_id, purchase_type,
+                    price, 0.0, price, 'USD', 'stripe', f"pi_{rng.getrandbits(64):016x}",
+                    PURCHASE_STATUSES[status][0], 'standard', rng.randint(0, 5), purchased_at,
+                    purchased_at, purchased_at
+                )
+
+        loader.insert('template_purchases', (
+            'id', 'template_id', 'template_collection_id', 'user_id', 'workspace_id', 'purchase_type',
+            'price', 'discount_amount', 'total_amount', 'currency', 'payment_method', 'payment_id',
+            'status', 'license_type', 'download_count', 'purchased_at', 'created_at', 'updated_at'
+        ), rows())
+
+    def seed_reviews(self, loader):
+        rng = self.rng
+
+        def rows():
+            for template, rating, status in zip(self.review_templates, self.review_ratings, self.review_statuses):
+                user_id, workspace_id = self.accounts[rng.randrange(len(self.accounts))]
+                reviewed_at = self.timestamps.sample()
+                review_status = REVIEW_STATUSES[status][0]
+                yield (
+                    new_uuid(), self.template_ids[template], user_id, workspace_id, rating,
+                    f"{rating} star review", "Generated review text for load testing.",
+                    rng.random() < 0.7, review_status == 'active', rng.randint(0, 50), review_status,
+                    reviewed_at, reviewed_at, reviewed_at
+                )
+
+        loader.insert('template_reviews', (
+            'id', 'template_id', 'user_id', 'workspace_id', 'rating', 'title', 'review',
+            'is_verified_purchase', 'is_approved', 'helpful_count', 'status', 'reviewed_at',
+            'created_at', 'updated_at'
+        ), rows())
+
+    def seed_usages(self, loader):
+        rng = self.rng
+
+        def rows():
+            for template, usage_type in zip(self.usage_templates, self.usage_types):
+                user_id, workspace_id = self.accounts[rng.randrange(len(self.accounts))]
+                used_at = self.timestamps.sample()
+                yield (
+                    new_uuid(), self.template_ids[template], user_id, workspace_id, USAGE_TYPES[usage_type],
+                    USAGE_CONTEXTS[rng.randrange(len(USAGE_CONTEXTS))], None, rng.randint(5, 3600),
+                    round(rng.uniform(50, 100), 2), used_at, used_at, used_at
+                )
+
+        loader.insert('template_usages', (
+            'id', 'template_id', 'user_id', 'workspace_id', 'usage_type', 'usage_context', 'project_name',
+            'usage_duration', 'success_rate', 'used_at', 'created_at', 'updated_at'
+        ), rows())
+
+
 if __name__ == "__main__":
-    seeder = TemplateDataSeeder()
+    parser = argparse.ArgumentParser(description="Seed template marketplace data")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="Path to the Laravel SQLite database")
+    parser.add_argument('--scale', type=float, default=None,
+                        help="Generate SCALE x %s rows directly in SQLite instead of the small API-backed sample"
+                             % ', '.join(f"{count:,} {name}" for name, count in SCALE_VOLUMES.items()))
+    parser.add_argument('--seed', type=int, default=None, help="Random seed for reproducible scale datasets")
+    args = parser.parse_args()
+
+    if args.scale:
+        seeder = MarketplaceScaleSeeder(args.db, args.scale, args.seed)
+    else:
+        seeder = TemplateDataSeeder(args.db)
     success = seeder.run()
-    exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
@@ -4,14 +4,17 @@ Focused Stripe Integration Testing Script for Mewayz Laravel Application
 Tests Stripe payment processing and subscription management endpoints
 """
 
-import requests
 import json
 import sys
 from datetime import datetime
 
+from tests.harness.client import get_client
+from tests.harness.fixtures import shared_fixture
+
 class StripeIntegrationTester:
     def __init__(self):
-        self.base_url = "http://localhost:8001/api"
+        self.client = get_client()
+        self.base_url = self.client.base_url
         self.token = None
         self.user_id = None
         self.workspace_id = None
@@ -35,7 +38,6 @@ class StripeIntegrationTester:
     
     def make_request(self, method, endpoint, data=None, headers=None):
         """Make HTTP request with error handling"""
-        url = f"{self.base_url}{endpoint}"
         default_headers = {'Content-Type': 'application/json'}
         
         if headers:
@@ -43,25 +45,18 @@ class StripeIntegrationTester:
             
         if self.token and 'Authorization' not in default_headers:
             default_headers['Authorization'] = f'Bearer {self.token}'
-        
-        try:
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=default_headers, timeout=10)
-            elif method.upper() == 'POST':
-                response = requests.post(url, json=data, headers=default_headers, timeout=10)
-            elif method.upper() == 'PUT':
-                response = requests.put(url, json=data, headers=default_headers, timeout=10)
-            elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=default_headers, timeout=10)
-            else:
-                return None, f"Unsupported method: {method}"
-                
-            return response, None
-        except requests.exceptions.RequestException as e:
-            return None, str(e)
+
+        return self.client.request(method, endpoint, data, default_headers)
     
     def setup_authentication(self):
         """Setup authentication for testing"""
+        # Reuse a cached user/workspace/token instead of registering a new account every run
+        fixture = shared_fixture(self.client)
+        if fixture:
+            fixture.apply(self)
+            print(f"✅ Using cached test user: {self.user_id}")
+            return True
+        
         # Register a test user
         test_email = f"stripe_test_{datetime.now().strftime('%Y%m%d_%H%M%S')}@mewayz.com"
         data = {
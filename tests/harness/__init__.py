@@ -0,0 +1,8 @@
+"""
+Shared testing harness for the Mewayz backend scripts
+Provides the pooled HTTP client used by every tester class
+"""
+
+from tests.harness.client import ApiClient, get_client
+
+__all__ = ['ApiClient', 'get_client']
@@ -0,0 +1,432 @@
+#!/usr/bin/env python3
+"""
+API-driven seeder with adaptive concurrency for the Mewayz backend
+Creates records through the Laravel API instead of raw SQL so model events run (the UUID
+`creating` hooks on Analytics, UserProgress and UserAchievement, achievement checks, ...).
+Concurrency follows AIMD: it grows by one request per round trip while latency stays under
+the target and is cut multiplicatively on 429/5xx responses, timeouts or high latency.
+Progress is checkpointed to disk so an interrupted run resumes where it stopped.
+
+Usage:
+    python -m tests.harness.apiseed --kind analytics --count 50000
+    python -m tests.harness.apiseed --kind contacts --count 20000 --checkpoint contacts.json
+    python -m tests.harness.apiseed --checkpoint contacts.json --resume
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.harness.client import DEFAULT_BASE_URL, ApiClient
+from tests.harness.metrics import LatencyHistogram, format_ms
+from tests.harness.seeding import unique_tag
+
+SCHEMA_VERSION = 1
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def analytics_payload(index, tag, workspace_id, rng):
+    module, action = rng.choice((('dashboard', 'view'), ('crm', 'create'), ('ecommerce', 'purchase'),
+                                 ('email', 'send'), ('social_media', 'publish'), ('courses', 'enroll')))
+    return {
+        'workspace_id': workspace_id,
+        'module': module,
+        'action': action,
+        'metadata': {'source': 'apiseed', 'seed_tag': tag, 'index': index},
+        'value': round(rng.uniform(5, 500), 2) if action == 'purchase' else 0
+    }
+
+
+def progress_payload(index, tag, workspace_id, rng):
+    module, action = rng.choice((('crm', 'contact_created'), ('ecommerce', 'product_created'),
+                                 ('social_media', 'post_published'), ('courses', 'lesson_completed')))
+    return {
+        'workspace_id': workspace_id,
+        'module': module,
+        'action': action,
+        'increment': rng.randint(1, 5),
+        'metadata': {'seed_tag': tag, 'index': index}
+    }
+
+
+def contact_payload(index, tag, workspace_id, rng):
+    return {
+        'workspace_id': workspace_id,
+        'first_name': rng.choice(('Ada', 'Grace', 'Linus', 'Margaret', 'Alan', 'Barbara')),
+        'last_name': f"Seed{index}",
+        'email': f"contact_{tag}_{index}@mewayz.test",
+        'company': rng.choice(('Acme', 'Globex', 'Initech', 'Umbrella', None)),
+        'status': rng.choice(('active', 'active', 'active', 'inactive')),
+        'lead_score': rng.randint(0, 100),
+        'tags': rng.sample(['lead', 'customer', 'vip', 'newsletter', 'partner'], rng.randint(0, 2))
+    }
+
+
+def product_payload(index, tag, workspace_id, rng):
+    return {
+        'workspace_id': workspace_id,
+        'name': f"Seed Product {index}",
+        'slug': f"seed-{tag}-{index}",
+        'price': round(rng.uniform(5, 500), 2),
+        'stock_quantity': rng.randint(0, 500),
+        'status': rng.choice(('draft', 'active', 'active', 'archived')),
+        'type': rng.choice(('physical', 'digital', 'service'))
+    }
+
+
+# kind -> (endpoint, payload builder, unique): creates of a unique kind that already went
+# through before an interruption come back as 422 on resume and are counted as done
+KINDS = {
+    'analytics': ('/analytics/track', analytics_payload, False),
+    'progress': ('/gamification/progress', progress_payload, False),
+    'contacts': ('/crm-contacts', contact_payload, True),
+    'products': ('/products', product_payload, True),
+}
+
+
+class AimdLimiter:
+    """
+    Concurrency window adjusted by additive-increase / multiplicative-decrease. Each good
+    response adds 1/limit (one slot per round trip); a congestion signal multiplies the
+    limit by `decrease`, at most once per smoothed round trip so a burst of failures from
+    one window only counts once. Retry-After on a 429 pauses new requests entirely.
+    """
+
+    def __init__(self, initial=4, minimum=1, maximum=64, target_latency_ms=500, decrease=0.5, alpha=0.2):
+        self.limit = float(max(minimum, min(initial, maximum)))
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency_ms = target_latency_ms
+        self.decrease = decrease
+        self.alpha = alpha
+        self.smoothed_ms = None
+        self.in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+        self.peak = self.limit
+        self._paused_until = 0
+        self._last_decrease = 0
+        self._condition = threading.Condition()
+
+    def acquire(self):
+        with self._condition:
+            while True:
+                wait = self._paused_until - time.monotonic()
+                if wait <= 0 and self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                self._condition.wait(timeout=wait if wait > 0 else 0.5)
+
+    def release(self):
+        with self._condition:
+            self.in_flight -= 1
+            self._condition.notify()
+
+    def record(self, latency_ms, congested, retry_after=None):
+        """Feed one response back into the window"""
+        with self._condition:
+            if latency_ms is not None:
+                self.smoothed_ms = latency_ms if self.smoothed_ms is None else \
+                    self.alpha * latency_ms + (1 - self.alpha) * self.smoothed_ms
+            now = time.monotonic()
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+            if congested or (self.smoothed_ms or 0) > self.target_latency_ms:
+                round_trip = (self.smoothed_ms or self.target_latency_ms) / 1000
+                if now - self._last_decrease >= round_trip:
+                    self.limit = max(self.minimum, self.limit * self.decrease)
+                    self._last_decrease = now
+                    self.decreases += 1
+            elif self.limit < self.maximum:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+                self.peak = max(self.peak, self.limit)
+                self.increases += 1
+            self._condition.notify_all()
+
+
+def to_ranges(indexes):
+    """Collapse a set of ints into [[first, last], ...] for a compact checkpoint"""
+    ranges = []
+    for index in sorted(indexes):
+        if ranges and index == ranges[-1][1] + 1:
+            ranges[-1][1] = index
+        else:
+            ranges.append([index, index])
+    return ranges
+
+
+def from_ranges(ranges):
+    return {index for first, last in ranges for index in range(first, last + 1)}
+
+
+class Checkpoint:
+    """
+    On-disk record of which job indexes finished. Jobs in flight when the file was written
+    are kept separately: on resume they are retried, and for unique kinds a 422 then means
+    the original request had already been committed.
+    """
+
+    def __init__(self, path, kind=None, count=0, tag=None, workspace_id=None, base_url=None, interval=2.0):
+        self.path = path
+        self.kind = kind
+        self.count = count
+        self.tag = tag
+        self.workspace_id = workspace_id
+        self.base_url = base_url
+        self.interval = interval
+        self.done = set()
+        self.failed = set()
+        self.in_flight = set()
+        self.uncertain = set()
+        self._saved_at = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            document = json.load(f)
+        if document.get('schema_version') != SCHEMA_VERSION:
+            raise ValueError(f"Unsupported checkpoint schema in {path}")
+        checkpoint = cls(path, document['kind'], document['count'], document['tag'], document['workspace_id'],
+                         document.get('base_url'))
+        checkpoint.done = from_ranges(document.get('done', []))
+        checkpoint.uncertain = from_ranges(document.get('in_flight', []))
+        return checkpoint
+
+    def pending(self):
+        return [index for index in range(self.count) if index not in self.done]
+
+    def started(self, index):
+        with self._lock:
+            self.in_flight.add(index)
+
+    def finished(self, index, ok):
+        """Record a job's outcome; ok=None means it was cancelled and stays pending"""
+        with self._lock:
+            self.in_flight.discard(index)
+            if ok is not None:
+                (self.done if ok else self.failed).add(index)
+        self.maybe_save()
+
+    def maybe_save(self):
+        if time.monotonic() - self._saved_at >= self.interval:
+            self.save()
+
+    def save(self):
+        with self._lock:
+            document = {
+                'schema_version': SCHEMA_VERSION,
+                'kind': self.kind,
+                'count': self.count,
+                'tag': self.tag,
+                'workspace_id': self.workspace_id,
+                'base_url': self.base_url,
+                'done': to_ranges(self.done),
+                'in_flight': to_ranges(self.in_flight | (self.uncertain - self.done)),
+                'updated_at': time.strftime('%Y-%m-%dT%H:%M:%S')
+            }
+            self._saved_at = time.monotonic()
+            temp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(document, f)
+            os.replace(temp_path, self.path)
+
+
+def retry_after_seconds(response):
+    try:
+        return float(response.headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        return None
+
+
+class ApiSeeder:
+    def __init__(self, client, token, checkpoint, limiter, max_attempts=5, progress_interval=5.0):
+        self.client = client
+        self.headers = {'Content-Type': 'application/json', 'Accept': 'application/json',
+                        'Authorization': f'Bearer {token}'}
+        self.checkpoint = checkpoint
+        self.limiter = limiter
+        self.max_attempts = max_attempts
+        self.progress_interval = progress_interval
+        self.endpoint, self.build_payload, self.unique = KINDS[checkpoint.kind]
+        self.latency = LatencyHistogram()
+        self.statuses = {}
+        self.retries = 0
+        self.errors = []
+        self.elapsed = 0
+        self._done_at_start = len(checkpoint.done)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def _count(self, status):
+        with self._lock:
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def send(self, index):
+        """Create one record, retrying congestion failures; returns True once it is stored"""
+        checkpoint = self.checkpoint
+        payload = self.build_payload(index, checkpoint.tag, checkpoint.workspace_id,
+                                     random.Random(f"{checkpoint.tag}:{index}"))
+        checkpoint.started(index)
+        ok = False
+        for attempt in range(self.max_attempts):
+            if self._stop.is_set():
+                ok = None
+                break
+            self.limiter.acquire()
+            try:
+                start = time.perf_counter()
+                response, error = self.client.request('POST', self.endpoint, payload, self.headers)
+                elapsed_ms = (time.perf_counter() - start) * 1000
+            finally:
+                self.limiter.release()
+
+            status = response.status_code if response is not None else 'error'
+            self._count(status)
+            congested = error is not None or status in RETRY_STATUSES
+            self.limiter.record(elapsed_ms, congested, retry_after_seconds(response) if status == 429 else None)
+            if not congested:
+                with self._lock:
+                    self.latency.record(elapsed_ms)
+            if status in (200, 201) or (status == 422 and self.unique and index in checkpoint.uncertain):
+                ok = True
+                break
+            if not congested:
+                with self._lock:
+                    if len(self.errors) < 10:
+                        self.errors.append(f"#{index}: HTTP {status} {response.text[:200]}")
+                break
+            with self._lock:
+                self.retries += 1
+            time.sleep(min(0.1 * 2 ** attempt, 5) * random.random())
+        checkpoint.finished(index, ok)
+        return ok
+
+    def _progress(self, started_at):
+        while not self._stop.wait(self.progress_interval):
+            checkpoint = self.checkpoint
+            elapsed = time.perf_counter() - started_at
+            rate = (len(checkpoint.done) - self._done_at_start) / elapsed if elapsed else 0
+            print(f"   {len(checkpoint.done):,}/{checkpoint.count:,} done, {len(checkpoint.failed):,} failed, "
+                  f"{rate:.0f}/s, concurrency {self.limiter.limit:.1f} "
+                  f"(latency ~{format_ms(self.limiter.smoothed_ms)}ms)")
+
+    def run(self):
+        checkpoint = self.checkpoint
+        pending = checkpoint.pending()
+        print(f"🚀 Seeding {checkpoint.kind} via POST {self.endpoint}: {len(pending):,} of {checkpoint.count:,} "
+              f"remaining (tag {checkpoint.tag})")
+        print("=" * 50)
+        if not pending:
+            print("✅ Nothing left to seed")
+            return True
+
+        started_at = time.perf_counter()
+        reporter = threading.Thread(target=self._progress, args=(started_at,), daemon=True)
+        reporter.start()
+        # Threads only block on the limiter, so the pool just has to cover the window's ceiling
+        window = threading.BoundedSemaphore(self.limiter.maximum * 2)
+
+        def job(index):
+            try:
+                return self.send(index)
+            finally:
+                window.release()
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.limiter.maximum) as executor:
+                try:
+                    for index in pending:
+                        window.acquire()
+                        executor.submit(job, index)
+                except KeyboardInterrupt:
+                    print("\n⚠️ Interrupted, letting in-flight requests finish...")
+                    self._stop.set()
+        finally:
+            self._stop.set()
+            checkpoint.save()
+
+        self.elapsed = time.perf_counter() - started_at
+        return not checkpoint.failed and len(checkpoint.done) == checkpoint.count
+
+    def print_report(self):
+        checkpoint = self.checkpoint
+        completed = len(checkpoint.done) - self._done_at_start
+        print(f"\n📊 {checkpoint.kind}: {completed:,} created in {self.elapsed:.1f}s "
+              f"({completed / self.elapsed if self.elapsed else 0:.0f}/s), {self.retries:,} retries")
+        print(f"   Latency p50 {format_ms(self.latency.percentile(50))}ms, "
+              f"p95 {format_ms(self.latency.percentile(95))}ms")
+        print(f"   Concurrency: final {self.limiter.limit:.1f}, peak {self.limiter.peak:.1f}, "
+              f"{self.limiter.decreases:,} decreases")
+        print(f"   Statuses: {', '.join(f'{status}={count:,}' for status, count in sorted(self.statuses.items(), key=str))}")
+        for error in self.errors:
+            print(f"   ❌ {error}")
+        total_done = len(checkpoint.done)
+        if total_done == checkpoint.count:
+            print(f"✅ All {checkpoint.count:,} records seeded")
+        else:
+            print(f"⚠️ {total_done:,}/{checkpoint.count:,} seeded, {len(checkpoint.failed):,} failed; "
+                  f"resume with --checkpoint {checkpoint.path} --resume")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Seed records through the API with AIMD-adjusted concurrency")
+    parser.add_argument('--kind', choices=sorted(KINDS), help="What to create")
+    parser.add_argument('--count', type=int, default=1000, help="Number of records to create")
+    parser.add_argument('--base-url', default=None, help="API base URL (default MEWAYZ_API_URL)")
+    parser.add_argument('--token', default=None, help="Bearer token (default: a cached fixture account)")
+    parser.add_argument('--workspace', default=None, help="Workspace id to seed into (required with --token)")
+    parser.add_argument('--checkpoint', default=None, help="Checkpoint file (default apiseed_<kind>.json)")
+    parser.add_argument('--resume', action='store_true', help="Continue the run recorded in --checkpoint")
+    parser.add_argument('--initial-concurrency', type=int, default=4)
+    parser.add_argument('--min-concurrency', type=int, default=1)
+    parser.add_argument('--max-concurrency', type=int, default=64)
+    parser.add_argument('--target-latency-ms', type=float, default=500,
+                        help="Smoothed latency above which concurrency is cut")
+    parser.add_argument('--max-attempts', type=int, default=5, help="Attempts per record on 429/5xx/timeouts")
+    args = parser.parse_args(argv)
+
+    if args.resume:
+        if not args.checkpoint:
+            parser.error("--resume needs --checkpoint")
+        checkpoint = Checkpoint.load(args.checkpoint)
+    else:
+        if not args.kind:
+            parser.error("--kind is required unless resuming")
+        checkpoint = Checkpoint(args.checkpoint or f"apiseed_{args.kind}.json", args.kind, args.count, unique_tag())
+
+    # Retries are handled here so every 429/5xx also feeds the concurrency window
+    client = ApiClient(args.base_url or checkpoint.base_url or DEFAULT_BASE_URL, pool_size=args.max_concurrency,
+                       retries=0)
+    checkpoint.base_url = client.base_url
+
+    token, workspace_id = args.token, args.workspace or checkpoint.workspace_id
+    if token is None:
+        from tests.harness.fixtures import shared_fixture
+
+        fixture = shared_fixture(client)
+        if fixture is None:
+            print("❌ Could not provision a fixture account; pass --token and --workspace")
+            return 1
+        token, workspace_id = fixture.token, workspace_id or fixture.workspace_id
+    if not workspace_id:
+        parser.error("--workspace is required with --token")
+    if checkpoint.workspace_id and checkpoint.workspace_id != workspace_id:
+        print(f"⚠️ Checkpoint targets workspace {checkpoint.workspace_id}; seeding into it instead of {workspace_id}")
+    checkpoint.workspace_id = checkpoint.workspace_id or workspace_id
+
+    limiter = AimdLimiter(args.initial_concurrency, args.min_concurrency, args.max_concurrency,
+                          args.target_latency_ms)
+    seeder = ApiSeeder(client, token, checkpoint, limiter, args.max_attempts)
+    success = seeder.run()
+    seeder.print_report()
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
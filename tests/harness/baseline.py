@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Performance baseline store and regression gate
+Saves a benchmark run (per-endpoint percentiles, throughput, query counts and the full
+latency histograms) as versioned JSON and compares later runs against it
+
+Usage:
+    python -m tests.harness.baseline compare baseline.json current.json --tolerance 0.15
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+from datetime import datetime, timezone
+
+from tests.harness.metrics import LatencyHistogram, format_ms
+
+SCHEMA_VERSION = 1
+GATED_PERCENTILES = (50, 95, 99)
+
+DEFAULT_TOLERANCES = {
+    'latency': 0.10,         # relative increase allowed on each gated percentile
+    'min_delta_ms': 5.0,     # ignore increases smaller than this, whatever the ratio
+    'throughput': 0.10,      # relative throughput drop allowed
+    'error_rate': 1.0,       # absolute error-rate increase allowed, in percentage points
+    'queries': 0.0,          # absolute increase allowed in mean query count
+    'alpha': 0.01,           # significance level for the Mann-Whitney U test
+    'min_samples': 20,       # below this on either side, rely on thresholds alone
+}
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], stderr=subprocess.DEVNULL,
+                                       cwd=os.path.dirname(os.path.abspath(__file__))).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def endpoint_key(method, route):
+    return f"{method} {route}"
+
+
+def snapshot(registry, elapsed, label=None, source=None, throughput=True):
+    """
+    Build a baseline document from a MetricsRegistry. Pass throughput=False for functional
+    runs where each endpoint is hit a handful of times and requests/s means nothing.
+    """
+    endpoints = {}
+    for stats in registry.sorted_endpoints():
+        endpoints[endpoint_key(stats.method, stats.route)] = {
+            'count': stats.count,
+            'throughput': stats.count / elapsed if throughput and elapsed else None,
+            'error_rate': stats.error_rate,
+            'percentiles': {f"p{p}": stats.latency.percentile(p) for p in GATED_PERCENTILES},
+            'max': stats.latency.max,
+            'server_percentiles': {f"p{p}": stats.server_time.percentile(p) for p in GATED_PERCENTILES},
+            'queries_mean': stats.queries.mean,
+            'queries_max': stats.queries.max,
+            'histogram': stats.latency.to_dict()
+        }
+    return {
+        'schema_version': SCHEMA_VERSION,
+        'label': label,
+        'source': source,
+        'git_revision': git_revision(),
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'elapsed': elapsed,
+        'endpoints': endpoints
+    }
+
+
+def save(document, path):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(document, f, indent=2, sort_keys=True)
+
+
+def load(path):
+    with open(path) as f:
+        document = json.load(f)
+    if document.get('schema_version') != SCHEMA_VERSION:
+        raise ValueError(f"{path}: unsupported baseline schema_version {document.get('schema_version')}")
+    return document
+
+
+def mann_whitney_slower(baseline, current):
+    """
+    One-sided Mann-Whitney U test on two histograms with the same bucket layout.
+    Returns the p-value for "current latencies are stochastically larger than baseline";
+    values within one bucket count as ties, with the usual tie correction.
+    """
+    n1, n2 = current.count, baseline.count
+    if n1 == 0 or n2 == 0:
+        return None
+
+    keys = sorted(set(current.buckets) | set(baseline.buckets))
+    cells = [(current.zero_count, baseline.zero_count)] + [
+        (current.buckets.get(k, 0), baseline.buckets.get(k, 0)) for k in keys
+    ]
+
+    u = 0.0
+    below = 0
+    tie_term = 0
+    for a, b in cells:
+        u += a * (below + 0.5 * b)
+        below += b
+        t = a + b
+        tie_term += t ** 3 - t
+
+    n = n1 + n2
+    variance = n1 * n2 / 12.0 * ((n + 1) - tie_term / (n * (n - 1))) if n > 1 else 0
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2.0) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+class Finding:
+    def __init__(self, endpoint, metric, baseline, current, limit, p_value=None):
+        self.endpoint = endpoint
+        self.metric = metric
+        self.baseline = baseline
+        self.current = current
+        self.limit = limit
+        self.p_value = p_value
+
+    def describe(self):
+        detail = f"{self.metric}: {format_ms(self.baseline)} -> {format_ms(self.current)} (limit {format_ms(self.limit)})"
+        if self.p_value is not None:
+            detail += f", p={self.p_value:.4f}"
+        return f"{self.endpoint} {detail}"
+
+
+def tolerances_for(endpoint, tolerances, overrides):
+    merged = dict(tolerances)
+    merged.update(overrides.get(endpoint, {}))
+    return merged
+
+
+def compare(baseline, current, tolerances=None, overrides=None):
+    """Return (regressions, missing) comparing two baseline documents"""
+    tolerances = dict(DEFAULT_TOLERANCES, **(tolerances or {}))
+    overrides = overrides or {}
+    regressions = []
+    missing = []
+
+    for endpoint, base in baseline['endpoints'].items():
+        cur = current['endpoints'].get(endpoint)
+        if cur is None:
+            missing.append(endpoint)
+            continue
+        limits = tolerances_for(endpoint, tolerances, overrides)
+
+        base_hist = LatencyHistogram.from_dict(base['histogram'])
+        cur_hist = LatencyHistogram.from_dict(cur['histogram'])
+        enough = min(base_hist.count, cur_hist.count) >= limits['min_samples']
+        p_value = mann_whitney_slower(base_hist, cur_hist) if enough else None
+        significant = p_value is not None and p_value < limits['alpha']
+
+        for name, base_value in base['percentiles'].items():
+            cur_value = cur['percentiles'].get(name)
+            if base_value is None or cur_value is None:
+                continue
+            limit = max(base_value * (1 + limits['latency']), base_value + limits['min_delta_ms'])
+            if cur_value > limit and (significant or not enough):
+                regressions.append(Finding(endpoint, name, base_value, cur_value, limit, p_value))
+
+        if base.get('throughput') and cur.get('throughput') is not None:
+            limit = base['throughput'] * (1 - limits['throughput'])
+            if cur['throughput'] < limit:
+                regressions.append(Finding(endpoint, 'throughput', base['throughput'], cur['throughput'], limit))
+
+        limit = base['error_rate'] + limits['error_rate']
+        if cur['error_rate'] > limit:
+            regressions.append(Finding(endpoint, 'error_rate', base['error_rate'], cur['error_rate'], limit))
+
+        if base.get('queries_mean') is not None and cur.get('queries_mean') is not None:
+            limit = base['queries_mean'] + limits['queries']
+            if cur['queries_mean'] > limit:
+                regressions.append(Finding(endpoint, 'queries', base['queries_mean'], cur['queries_mean'], limit))
+
+    return regressions, missing
+
+
+def print_comparison(baseline, regressions, missing):
+    print("\n" + "=" * 80)
+    print(f"PERFORMANCE REGRESSION CHECK (baseline {baseline.get('label') or baseline.get('git_revision') or '?'}, "
+          f"{baseline.get('created_at', '?')})")
+    print("=" * 80)
+    if missing:
+        print(f"⚠️ {len(missing)} baseline endpoint(s) not exercised in this run:")
+        for endpoint in missing:
+            print(f"   • {endpoint}")
+        print()
+    if regressions:
+        print(f"❌ {len(regressions)} REGRESSION(S):")
+        for finding in regressions:
+            print(f"   • {finding.describe()}")
+    else:
+        print("✅ No regressions beyond tolerance")
+    print()
+
+
+def gate(registry, elapsed, save_path=None, compare_path=None, label=None, source=None, tolerances=None,
+         overrides=None, throughput=True):
+    """Save and/or check a run; returns False when the comparison found regressions"""
+    document = snapshot(registry, elapsed, label, source, throughput)
+    if save_path:
+        save(document, save_path)
+        print(f"💾 Baseline saved to {save_path}")
+    if compare_path:
+        baseline = load(compare_path)
+        regressions, missing = compare(baseline, document, tolerances, overrides)
+        print_comparison(baseline, regressions, missing)
+        return not regressions
+    return True
+
+
+def load_overrides(path):
+    """Per-endpoint tolerance overrides: {"GET /analytics/dashboard": {"latency": 0.25}}"""
+    if not path:
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def add_arguments(parser):
+    """Register the baseline/gate options on a script's argument parser"""
+    group = parser.add_argument_group('performance baseline')
+    group.add_argument('--save-baseline', metavar='PATH', help="Save this run's per-endpoint metrics as a baseline")
+    group.add_argument('--compare-baseline', metavar='PATH', help="Fail if this run regresses against a baseline")
+    group.add_argument('--baseline-label', help="Label stored in the saved baseline (e.g. release name)")
+    group.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCES['latency'],
+                       help="Allowed relative increase of p50/p95/p99 latency")
+    group.add_argument('--min-delta-ms', type=float, default=DEFAULT_TOLERANCES['min_delta_ms'],
+                       help="Latency increases below this many ms are never regressions")
+    group.add_argument('--throughput-tolerance', type=float, default=DEFAULT_TOLERANCES['throughput'],
+                       help="Allowed relative throughput drop")
+    group.add_argument('--query-tolerance', type=float, default=DEFAULT_TOLERANCES['queries'],
+                       help="Allowed increase in mean query count per request")
+    group.add_argument('--alpha', type=float, default=DEFAULT_TOLERANCES['alpha'],
+                       help="Significance level of the Mann-Whitney U test on latency distributions")
+    group.add_argument('--tolerance-overrides', metavar='JSON', help="Per-endpoint tolerance overrides file")
+
+
+def tolerances_from_args(args):
+    return {
+        'latency': args.tolerance,
+        'min_delta_ms': args.min_delta_ms,
+        'throughput': args.throughput_tolerance,
+        'queries': args.query_tolerance,
+        'alpha': args.alpha,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two saved performance baselines")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    compare_parser = subparsers.add_parser('compare', help="Compare a run against a baseline")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    add_arguments(compare_parser)
+    args = parser.parse_args(argv)
+
+    baseline = load(args.baseline)
+    current = load(args.current)
+    regressions, missing = compare(baseline, current, tolerances_from_args(args),
+                                   load_overrides(args.tolerance_overrides))
+    print_comparison(baseline, regressions, missing)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Benchmark for CrmContactController::analytics and ProductController::analytics
+Seeds one workspace with a large CRM (1M contacts by default) and product catalogue, then
+times both analytics endpoints cold (after a write that invalidates the workspace's cached
+figures) and warm, recording query counts from PerformanceMonitoringMiddleware. The numbers
+returned are checked against the database, and --save-baseline / --compare-baseline compare
+latency and query count between two builds.
+
+Usage:
+    python -m tests.harness.bench_analytics --contacts 1000000 --save-baseline analytics_before.json
+    python -m tests.harness.bench_analytics --contacts 1000000 --compare-baseline analytics_before.json
+"""
+
+import argparse
+import random
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+
+from tests.harness import baseline
+from tests.harness.client import DEFAULT_BASE_URL, ApiClient
+from tests.harness.metrics import MetricsRegistry, print_latency_table
+from tests.harness.seeding import (DEFAULT_DB_PATH, BulkLoader, TimestampSampler, account_email, new_uuid,
+                                   seed_accounts, unique_tag)
+
+CONTACT_STATUSES = ('active', 'active', 'active', 'inactive', 'blocked')
+PRODUCT_STATUSES = ('active', 'active', 'draft', 'archived')
+PRODUCT_TYPES = ('physical', 'physical', 'digital', 'service')
+
+# name -> (analytics endpoint, SQL check of the returned figures)
+ENDPOINTS = {
+    'crm': ('/crm-analytics', {
+        'total_contacts': "SELECT COUNT(*) FROM crm_contacts WHERE workspace_id = :workspace",
+        'active_contacts': "SELECT COUNT(*) FROM crm_contacts WHERE workspace_id = :workspace AND status = 'active'",
+        'blocked_contacts': "SELECT COUNT(*) FROM crm_contacts WHERE workspace_id = :workspace AND status = 'blocked'",
+        'hot_leads': "SELECT COUNT(*) FROM crm_contacts WHERE workspace_id = :workspace AND lead_score >= 80",
+        'unqualified_leads': "SELECT COUNT(*) FROM crm_contacts WHERE workspace_id = :workspace AND lead_score < 40",
+        'follow_up_needed': "SELECT COUNT(*) FROM crm_contacts WHERE workspace_id = :workspace "
+                            "AND (last_contacted_at IS NULL OR last_contacted_at <= :follow_up)",
+    }),
+    'products': ('/products-analytics', {
+        'total_products': "SELECT COUNT(*) FROM products WHERE workspace_id = :workspace",
+        'archived_products': "SELECT COUNT(*) FROM products WHERE workspace_id = :workspace AND status = 'archived'",
+        'service_products': "SELECT COUNT(*) FROM products WHERE workspace_id = :workspace AND type = 'service'",
+        'out_of_stock_products': "SELECT COUNT(*) FROM products WHERE workspace_id = :workspace "
+                                 "AND track_inventory = 1 AND stock_quantity <= 0",
+        'total_inventory_value': "SELECT SUM(price * stock_quantity) FROM products WHERE workspace_id = :workspace",
+    }),
+}
+
+
+class AnalyticsBenchmark:
+    def __init__(self, base_url=DEFAULT_BASE_URL, db_path=DEFAULT_DB_PATH, contacts=1000000, products=100000,
+                 requests=20, warmup=2, days=365, seed=None):
+        self.client = ApiClient(base_url, retries=0)
+        self.db_path = db_path
+        self.contacts = contacts
+        self.products = products
+        self.requests = requests
+        self.warmup = warmup
+        self.days = days
+        self.rng = random.Random(seed)
+        self.tag = unique_tag()
+        self.registry = MetricsRegistry()
+        self.workspace_id = None
+        self.contact_id = None
+        self.product_id = None
+        self.headers = None
+        self.elapsed = 0.0
+
+    def contact_rows(self, user_id, timestamps):
+        for i in range(self.contacts):
+            created = timestamps.sample()
+            contacted = timestamps.after(created) if self.rng.random() < 0.7 else None
+            yield (self.contact_id if i == 0 else new_uuid(), self.workspace_id, 'Bench', f"Contact {i}",
+                   f"analytics_{self.tag}_{i}@mewayz.test", self.rng.choice(CONTACT_STATUSES),
+                   self.rng.randrange(0, 101), contacted, user_id, created, created)
+
+    def product_rows(self, user_id, timestamps):
+        for i in range(self.products):
+            created = timestamps.sample()
+            yield (self.product_id if i == 0 else new_uuid(), self.workspace_id, f"Bench Product {i}",
+                   f"analytics-{self.tag}-{i}", round(self.rng.uniform(1, 500), 2), self.rng.randrange(0, 60),
+                   self.rng.random() < 0.8, self.rng.choice(PRODUCT_STATUSES), self.rng.choice(PRODUCT_TYPES),
+                   user_id, created, created)
+
+    def setup(self):
+        print(f"🌱 Seeding {self.contacts:,} contacts and {self.products:,} products into one workspace...")
+        self.contact_id = new_uuid()
+        self.product_id = new_uuid()
+        with BulkLoader(self.db_path) as loader:
+            loader.require_tables('crm_contacts', 'products')
+            timestamps = TimestampSampler(days=self.days, rng=self.rng)
+            (user_id, self.workspace_id), = seed_accounts(loader, 1, self.rng, timestamps, self.tag)
+            loader.insert('crm_contacts', (
+                'id', 'workspace_id', 'first_name', 'last_name', 'email', 'status', 'lead_score',
+                'last_contacted_at', 'created_by', 'created_at', 'updated_at'
+            ), self.contact_rows(user_id, timestamps))
+            loader.insert('products', (
+                'id', 'workspace_id', 'name', 'slug', 'price', 'stock_quantity', 'track_inventory', 'status',
+                'type', 'created_by', 'created_at', 'updated_at'
+            ), self.product_rows(user_id, timestamps))
+            loader.analyze('crm_contacts', 'products')
+
+        response, error = self.client.request('POST', '/auth/login', {'email': account_email(self.tag, 0),
+                                                                      'password': 'password'})
+        if error or response.status_code != 200:
+            raise RuntimeError(f"Login failed: {error or response.text[:200]}")
+        self.headers = {'Authorization': f"Bearer {response.json()['token']}"}
+
+    def invalidate(self, name):
+        """Write one row of the workspace through the API so its cached figures are dropped"""
+        if name == 'crm':
+            self.client.request('POST', f'/crm-contacts/{self.contact_id}/update-lead-score',
+                                {'lead_score': self.rng.randrange(0, 101)}, headers=self.headers)
+        else:
+            self.client.request('PUT', f'/products/{self.product_id}',
+                                {'stock_quantity': self.rng.randrange(1, 60)}, headers=self.headers)
+
+    def timed(self, name, label):
+        endpoint = f"{ENDPOINTS[name][0]}?workspace_id={self.workspace_id}"
+        start = time.perf_counter()
+        response, error = self.client.request('GET', endpoint, headers=self.headers)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        # Cold and warm runs are recorded as separate routes so baselines compare them separately
+        self.registry.record('GET', f"{ENDPOINTS[name][0]} [{label}]", response, error, elapsed_ms)
+        return response
+
+    def run(self):
+        start = time.perf_counter()
+        responses = {}
+        for name in ENDPOINTS:
+            print(f"⏱️  {ENDPOINTS[name][0]}: {self.requests} cold and {self.requests} warm requests...")
+            for _ in range(self.warmup):
+                self.client.request('GET', f"{ENDPOINTS[name][0]}?workspace_id={self.workspace_id}",
+                                    headers=self.headers)
+            for _ in range(self.requests):
+                self.invalidate(name)
+                self.timed(name, 'cold')
+            for _ in range(self.requests):
+                responses[name] = self.timed(name, 'warm')
+        self.elapsed = time.perf_counter() - start
+        return responses
+
+    def verify(self, responses):
+        """Compare the figures the endpoints returned with direct SQL; returns the mismatches"""
+        params = {'workspace': self.workspace_id,
+                  'follow_up': (datetime.now() - timedelta(days=30)).strftime('%Y-%m-%d %H:%M:%S')}
+        mismatches = []
+        conn = sqlite3.connect(self.db_path)
+        try:
+            for name, (endpoint, checks) in ENDPOINTS.items():
+                response = responses.get(name)
+                if response is None or response.status_code != 200:
+                    mismatches.append(f"{endpoint}: no successful response")
+                    continue
+                figures = response.json().get('analytics') or {}
+                for field, sql in checks.items():
+                    expected = conn.execute(sql, params).fetchone()[0] or 0
+                    actual = figures.get(field)
+                    if actual is None or abs(float(actual) - float(expected)) > 0.01:
+                        mismatches.append(f"{endpoint} {field}: api {actual} != db {expected}")
+        finally:
+            conn.close()
+        return mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the CRM and product analytics endpoints")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="SQLite database the backend is serving")
+    parser.add_argument('--contacts', type=int, default=1000000, help="Contacts in the benchmark workspace")
+    parser.add_argument('--products', type=int, default=100000, help="Products in the benchmark workspace")
+    parser.add_argument('--requests', type=int, default=20, help="Timed cold and warm requests per endpoint")
+    parser.add_argument('--warmup', type=int, default=2, help="Untimed requests per endpoint")
+    parser.add_argument('--seed', type=int, default=None)
+    baseline.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    benchmark = AnalyticsBenchmark(args.base_url, args.db, args.contacts, args.products, args.requests, args.warmup,
+                                   seed=args.seed)
+    print(f"🚀 CRM and product analytics benchmark against {args.base_url}")
+    print("=" * 50)
+    benchmark.setup()
+    responses = benchmark.run()
+
+    print()
+    print_latency_table(benchmark.registry, "ANALYTICS ENDPOINTS")
+    mismatches = benchmark.verify(responses)
+    for mismatch in mismatches:
+        print(f"❌ {mismatch}")
+    if not mismatches:
+        print("✅ Analytics figures match the database")
+
+    passed = baseline.gate(benchmark.registry, benchmark.elapsed, args.save_baseline, args.compare_baseline,
+                           args.baseline_label, 'bench_analytics', baseline.tolerances_from_args(args),
+                           baseline.load_overrides(args.tolerance_overrides), throughput=False)
+    return 0 if passed and not mismatches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the DashboardController stats endpoints backed by workspace_counters
+Grows the tables the dashboard summarises (contacts, posts, payments, products, campaigns,
+link pages, courses) step by step, reconciles the counters through artisan, checks the
+API numbers against direct SQL and times getStats / getQuickStats / getWorkspaceOverview
+at every size. Latency and query counts should stay flat as the tables grow.
+
+Usage:
+    python -m tests.harness.bench_dashboard --sizes 10000,100000,1000000,5000000
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+from tests.harness.client import DEFAULT_BASE_URL, ApiClient
+from tests.harness.metrics import (SERVER_QUERIES_HEADER, SERVER_TIME_HEADER, LatencyHistogram, format_ms,
+                                   parse_header_number)
+from tests.harness.seeding import (DEFAULT_DB_PATH, REPO_ROOT, BulkLoader, TimestampSampler, account_email,
+                                   new_uuid, seed_accounts, unique_tag)
+
+ARTISAN = os.path.join(REPO_ROOT, 'backend', 'artisan')
+
+ENDPOINTS = (
+    ('stats', '/dashboard/stats/{workspace}'),
+    ('quick-stats', '/dashboard/quick-stats/{workspace}'),
+    ('overview', '/dashboard/workspace-overview/{workspace}'),
+)
+
+# Share of the generated rows that goes to each table
+TABLE_SHARES = {
+    'crm_contacts': 40, 'social_media_posts': 20, 'payment_transactions': 15, 'products': 10,
+    'email_campaigns': 5, 'link_in_bio_pages': 5, 'courses': 5,
+}
+
+COLUMNS = {
+    'crm_contacts': ('id', 'workspace_id', 'first_name', 'last_name', 'email', 'status', 'created_by',
+                     'created_at', 'updated_at'),
+    'social_media_posts': ('id', 'workspace_id', 'social_media_account_id', 'content', 'created_by',
+                           'created_at', 'updated_at'),
+    'payment_transactions': ('id', 'user_id', 'workspace_id', 'package_id', 'amount', 'session_id',
+                             'payment_status', 'created_at', 'updated_at'),
+    'products': ('id', 'workspace_id', 'name', 'slug', 'status', 'created_by', 'created_at', 'updated_at'),
+    'email_campaigns': ('id', 'workspace_id', 'subject', 'sender', 'template', 'audience', 'sent_count',
+                        'created_by', 'created_at', 'updated_at'),
+    'link_in_bio_pages': ('id', 'workspace_id', 'title', 'slug', 'is_active', 'total_views', 'total_clicks',
+                          'created_by', 'created_at', 'updated_at'),
+    'courses': ('id', 'workspace_id', 'title', 'slug', 'status', 'created_by', 'created_at', 'updated_at'),
+}
+
+
+def table_row(table, index, tag, owner, rng, timestamps):
+    """Row `index` of a table for the workspace owned by `owner` = (user_id, workspace_id, account_id)"""
+    user_id, workspace_id, account_id = owner
+    created = timestamps.sample()
+    if table == 'crm_contacts':
+        return (new_uuid(), workspace_id, 'Bench', f"Contact {index}", f"bench_{tag}_{index}@mewayz.test",
+                rng.choice(('active', 'inactive')), user_id, created, created)
+    if table == 'social_media_posts':
+        return (new_uuid(), workspace_id, account_id, "Generated for dashboard benchmarking", user_id, created, created)
+    if table == 'payment_transactions':
+        return (new_uuid(), user_id, workspace_id, 'pro', round(rng.uniform(5, 500), 2), f"cs_bench_{tag}_{index}",
+                rng.choice(('paid', 'paid', 'pending', 'failed')), created, created)
+    if table == 'products':
+        return (new_uuid(), workspace_id, f"Bench Product {index}", f"bench-{tag}-product-{index}",
+                rng.choice(('draft', 'active')), user_id, created, created)
+    if table == 'email_campaigns':
+        return (new_uuid(), workspace_id, f"Bench Campaign {index}", 'bench@mewayz.test', 'default', 'all',
+                rng.randrange(0, 5000), user_id, created, created)
+    if table == 'link_in_bio_pages':
+        return (new_uuid(), workspace_id, f"Bench Page {index}", f"bench-{tag}-page-{index}", rng.random() < 0.8,
+                rng.randrange(0, 10000), rng.randrange(0, 1000), user_id, created, created)
+    return (new_uuid(), workspace_id, f"Bench Course {index}", f"bench-{tag}-course-{index}",
+            rng.choice(('draft', 'published')), user_id, created, created)
+
+
+class DashboardBenchmark:
+    def __init__(self, base_url=DEFAULT_BASE_URL, db_path=DEFAULT_DB_PATH, other_workspaces=20, focus_share=0.5,
+                 requests=30, warmup=3, artisan=ARTISAN, reconcile=True, days=365, seed=None):
+        self.client = ApiClient(base_url, retries=0)
+        self.db_path = db_path
+        self.other_workspaces = other_workspaces
+        self.focus_share = focus_share
+        self.requests = requests
+        self.warmup = warmup
+        self.artisan = artisan
+        self.reconcile_counters = reconcile
+        self.days = days
+        self.rng = random.Random(seed)
+        self.tag = unique_tag()
+        self.owners = []
+        self.generated = 0
+        self.token = None
+        self.results = []
+
+    def setup(self):
+        """One measured workspace plus background workspaces that share the tables"""
+        with BulkLoader(self.db_path) as loader:
+            loader.require_tables('workspace_counters', 'social_media_accounts', *TABLE_SHARES)
+            timestamps = TimestampSampler(days=self.days, rng=self.rng)
+            accounts = seed_accounts(loader, 1 + self.other_workspaces, self.rng, timestamps, self.tag)
+            self.owners = [(user_id, workspace_id, new_uuid()) for user_id, workspace_id in accounts]
+            now = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            loader.insert('social_media_accounts', (
+                'id', 'workspace_id', 'platform', 'account_id', 'username', 'created_at', 'updated_at'
+            ), (
+                (account_id, workspace_id, 'instagram', f"bench_{self.tag}_{i}", f"bench_{self.tag}_{i}", now, now)
+                for i, (_, workspace_id, account_id) in enumerate(self.owners)
+            ))
+
+        response, error = self.client.request('POST', '/auth/login', {'email': account_email(self.tag, 0),
+                                                                      'password': 'password'})
+        if error or response.status_code != 200:
+            raise RuntimeError(f"Login failed: {error or response.text[:200]}")
+        self.token = response.json()['token']
+
+    @property
+    def workspace_id(self):
+        return self.owners[0][1]
+
+    def grow(self, total):
+        """Add rows until the dashboard tables hold `total` generated rows"""
+        missing = total - self.generated
+        if missing <= 0:
+            return
+        weight = sum(TABLE_SHARES.values())
+        timestamps = TimestampSampler(days=self.days, rng=self.rng)
+        print(f"\n🌱 Growing dashboard tables to {total:,} rows...")
+        with BulkLoader(self.db_path) as loader:
+            for table, share in TABLE_SHARES.items():
+                count = missing * share // weight
+                start = self.generated * share // weight
+                rows = (table_row(table, start + i, self.tag, self.pick_owner(), self.rng, timestamps)
+                        for i in range(count))
+                loader.insert(table, COLUMNS[table], rows)
+            loader.analyze(*TABLE_SHARES)
+        self.generated = total
+
+    def pick_owner(self):
+        if self.rng.random() < self.focus_share or len(self.owners) == 1:
+            return self.owners[0]
+        return self.owners[self.rng.randrange(1, len(self.owners))]
+
+    def reconcile(self):
+        """Rows were bulk-loaded past the model events, so rebuild the counters through artisan"""
+        if not self.reconcile_counters:
+            return
+        try:
+            result = subprocess.run(['php', self.artisan, 'workspace-counters:reconcile', self.workspace_id],
+                                    capture_output=True, text=True, timeout=600)
+        except FileNotFoundError:
+            print("⚠️ php not found; counters were not reconciled and the check below will show the drift")
+            return
+        if result.returncode != 0:
+            print(f"⚠️ Reconcile failed: {(result.stderr or result.stdout).strip()[:300]}")
+
+    def expected(self):
+        """getStats numbers computed straight from the source tables"""
+        params = {'workspace': self.workspace_id, 'month': datetime.now().strftime('%Y-%m-01 00:00:00')}
+        queries = {
+            'totalRevenue': "SELECT SUM(amount) FROM payment_transactions "
+                            "WHERE workspace_id = :workspace AND payment_status = 'paid'",
+            'monthlyRevenue': "SELECT SUM(amount) FROM payment_transactions "
+                              "WHERE workspace_id = :workspace AND payment_status = 'paid' AND created_at >= :month",
+            'totalPosts': "SELECT COUNT(*) FROM social_media_posts WHERE workspace_id = :workspace",
+            'activeLinks': "SELECT COUNT(*) FROM link_in_bio_pages WHERE workspace_id = :workspace AND is_active = 1",
+            'totalViews': "SELECT SUM(total_views) FROM link_in_bio_pages WHERE workspace_id = :workspace",
+            'totalClicks': "SELECT SUM(total_clicks) FROM link_in_bio_pages WHERE workspace_id = :workspace",
+            'emailCampaigns': "SELECT COUNT(*) FROM email_campaigns WHERE workspace_id = :workspace",
+            'crmContacts': "SELECT COUNT(*) FROM crm_contacts WHERE workspace_id = :workspace",
+            'courses': "SELECT COUNT(*) FROM courses WHERE workspace_id = :workspace",
+            'products': "SELECT COUNT(*) FROM products WHERE workspace_id = :workspace",
+        }
+        with BulkLoader(self.db_path, verbose=False) as loader:
+            return {name: loader.conn.execute(sql, params).fetchone()[0] or 0 for name, sql in queries.items()}
+
+    def verify(self, stats):
+        """Names of getStats fields that disagree with the source tables"""
+        expected = self.expected()
+        return [f"{name}: api {stats.get(name)} != db {value}" for name, value in expected.items()
+                if stats.get(name) is None or abs(float(stats[name]) - float(value)) > 0.01]
+
+    def measure(self, total):
+        headers = {'Authorization': f'Bearer {self.token}'}
+        mismatches = None
+        for name, template in ENDPOINTS:
+            endpoint = template.format(workspace=self.workspace_id)
+            for _ in range(self.warmup):
+                self.client.request('GET', endpoint, headers=headers)
+
+            latency = LatencyHistogram()
+            server = LatencyHistogram()
+            queries = set()
+            failures = 0
+            response = None
+            for _ in range(self.requests):
+                start = time.perf_counter()
+                response, error = self.client.request('GET', endpoint, headers=headers)
+                latency.record((time.perf_counter() - start) * 1000)
+                if error or response.status_code != 200:
+                    failures += 1
+                    continue
+                server_ms = parse_header_number(response.headers.get(SERVER_TIME_HEADER))
+                if server_ms is not None:
+                    server.record(server_ms)
+                count = parse_header_number(response.headers.get(SERVER_QUERIES_HEADER))
+                if count is not None:
+                    queries.add(int(count))
+
+            if name == 'stats' and response is not None and response.status_code == 200:
+                mismatches = self.verify(response.json().get('stats') or {})
+            self.results.append({
+                'rows': total,
+                'endpoint': name,
+                'p50_ms': latency.percentile(50),
+                'p95_ms': latency.percentile(95),
+                'server_p50_ms': server.percentile(50),
+                'queries': max(queries) if queries else None,
+                'failures': failures,
+            })
+
+        if mismatches:
+            print(f"❌ Counters disagree with the source tables at {total:,} rows:")
+            for mismatch in mismatches:
+                print(f"   {mismatch}")
+        elif mismatches is not None:
+            print(f"✅ Counters match the source tables at {total:,} rows")
+        return not mismatches
+
+    def growth(self):
+        """{endpoint: p50 at the largest size / p50 at the smallest}"""
+        ratios = {}
+        for name, _ in ENDPOINTS:
+            runs = [r for r in self.results if r['endpoint'] == name and r['p50_ms']]
+            if len(runs) > 1:
+                ratios[name] = runs[-1]['p50_ms'] / runs[0]['p50_ms']
+        return ratios
+
+    def print_report(self, max_growth):
+        print("\n" + "=" * 80)
+        print("DASHBOARD COUNTERS BENCHMARK")
+        print("=" * 80)
+        header = (f"{'ROWS':>12}  {'ENDPOINT':<14}{'p50 ms':>10}{'p95 ms':>10}{'SERVER ms':>11}"
+                  f"{'QUERIES':>9}{'FAILED':>8}")
+        print(header)
+        print("-" * len(header))
+        for r in self.results:
+            print(f"{r['rows']:>12,}  {r['endpoint']:<14}{format_ms(r['p50_ms']):>10}{format_ms(r['p95_ms']):>10}"
+                  f"{format_ms(r['server_p50_ms']):>11}{str(r['queries'] if r['queries'] is not None else '-'):>9}"
+                  f"{r['failures']:>8}")
+
+        flat = True
+        for name, ratio in self.growth().items():
+            ok = ratio <= max_growth
+            flat = flat and ok
+            print(f"{'✅' if ok else '❌'} {name}: p50 x{ratio:.2f} from smallest to largest size "
+                  f"(limit x{max_growth:.2f})")
+        return flat
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the dashboard stats endpoints as the tables grow")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="SQLite database the backend is serving")
+    parser.add_argument('--sizes', default='10000,100000,1000000',
+                        help="Comma-separated cumulative row counts across the dashboard tables")
+    parser.add_argument('--other-workspaces', type=int, default=20,
+                        help="Background workspaces that share the tables with the measured one")
+    parser.add_argument('--focus-share', type=float, default=0.5,
+                        help="Share of the rows that belongs to the measured workspace")
+    parser.add_argument('--requests', type=int, default=30, help="Timed requests per endpoint and size")
+    parser.add_argument('--warmup', type=int, default=3, help="Untimed requests per endpoint and size")
+    parser.add_argument('--artisan', default=ARTISAN, help="Path to artisan for workspace-counters:reconcile")
+    parser.add_argument('--no-reconcile', action='store_true',
+                        help="Do not rebuild the counters after loading (shows drift from bulk loads)")
+    parser.add_argument('--max-growth', type=float, default=1.5,
+                        help="Fail if p50 grows by more than this factor from the smallest to the largest size")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--json', help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    benchmark = DashboardBenchmark(args.base_url, args.db, args.other_workspaces, args.focus_share, args.requests,
+                                   args.warmup, args.artisan, not args.no_reconcile, seed=args.seed)
+    print(f"🚀 Dashboard counters benchmark against {args.base_url}")
+    print("=" * 50)
+    benchmark.setup()
+
+    consistent = True
+    for size in (int(s) for s in args.sizes.split(',') if s.strip()):
+        benchmark.grow(size)
+        benchmark.reconcile()
+        consistent = benchmark.measure(size) and consistent
+    flat = benchmark.print_report(args.max_growth)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(benchmark.results, f, indent=2)
+    failed = any(r['failures'] for r in benchmark.results)
+    return 0 if consistent and flat and not failed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark driver for CrmContactController::importFromEcommerce
+Seeds a fresh workspace per dataset size, runs the import through the API and records
+wall time, server time, query count and memory from PerformanceMonitoringMiddleware.
+Imports large enough to be queued (HTTP 202) are polled until they finish; their wall time
+covers the whole import and the server figures cover only the request that queued it
+
+Usage:
+    python -m tests.harness.bench_import --sizes 1000,10000,100000 --repeat-share 0.3
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from tests.harness.client import DEFAULT_BASE_URL, ApiClient
+from tests.harness.metrics import (SERVER_MEMORY_HEADER, SERVER_QUERIES_HEADER, SERVER_TIME_HEADER, format_ms,
+                                   parse_header_number)
+from tests.harness.seeding import DEFAULT_DB_PATH
+
+IMPORT_ENDPOINT = '/crm-contacts/import/ecommerce'
+IMPORT_STATUS_ENDPOINT = '/crm-contacts/imports/{id}'
+POLL_INTERVAL = 0.5
+
+
+class ImportBenchmark:
+    def __init__(self, base_url=DEFAULT_BASE_URL, db_path=DEFAULT_DB_PATH, repeat_share=0.3, existing_share=0.2,
+                 timeout=600, seed=None):
+        self.client = ApiClient(base_url, retries=0)
+        self.db_path = db_path
+        self.repeat_share = repeat_share
+        self.existing_share = existing_share
+        self.timeout = timeout
+        self.seed = seed
+        self.results = []
+
+    def login(self, email):
+        response, error = self.client.request('POST', '/auth/login', {'email': email, 'password': 'password'})
+        if error or response.status_code != 200:
+            raise RuntimeError(f"Login failed for {email}: {error or response.text[:200]}")
+        return response.json()['token']
+
+    def run_size(self, orders):
+        from seed_crm_orders import OrderDatasetGenerator
+
+        generator = OrderDatasetGenerator(self.db_path, orders, self.repeat_share, self.existing_share, seed=self.seed)
+        generator.run()
+        token = self.login(generator.login_email)
+
+        print(f"⏱️  Importing {orders:,} orders...")
+        start = time.perf_counter()
+        response, error = self.client.request(
+            'POST', IMPORT_ENDPOINT, {'workspace_id': generator.workspace_id},
+            headers={'Authorization': f'Bearer {token}'}, timeout=self.timeout
+        )
+
+        result = {
+            'orders': orders,
+            'customers': generator.customer_count,
+            'status': response.status_code if response is not None else None,
+            'mode': 'queued' if response is not None and response.status_code == 202 else 'sync',
+            'error': error
+        }
+        data = {}
+        if response is not None:
+            result.update({
+                'server_ms': parse_header_number(response.headers.get(SERVER_TIME_HEADER)),
+                'queries': parse_header_number(response.headers.get(SERVER_QUERIES_HEADER)),
+                'memory_mb': parse_header_number(response.headers.get(SERVER_MEMORY_HEADER))
+            })
+            try:
+                data = response.json().get('data') or {}
+            except ValueError:
+                pass
+        if result['mode'] == 'queued':
+            data, result['error'] = self.wait_for(data.get('import_id'), token, start)
+        result['wall_ms'] = (time.perf_counter() - start) * 1000
+        result['imported'] = data.get('imported_count')
+        result['updated'] = data.get('updated_count')
+        result['import_status'] = data.get('status')
+        self.results.append(result)
+        return result
+
+    def wait_for(self, import_id, token, start):
+        """Poll a queued import until it completes or fails; returns (progress, error)"""
+        if not import_id:
+            return {}, "Queued import returned no import_id"
+        endpoint = IMPORT_STATUS_ENDPOINT.format(id=import_id)
+        progress = {}
+        while time.perf_counter() - start < self.timeout:
+            response, error = self.client.request('GET', endpoint, headers={'Authorization': f'Bearer {token}'})
+            if error or response.status_code != 200:
+                return progress, error or f"HTTP {response.status_code} polling {endpoint}"
+            try:
+                progress = response.json().get('data') or {}
+            except ValueError:
+                return progress, f"Invalid JSON polling {endpoint}"
+            if progress.get('status') == 'completed':
+                return progress, None
+            if progress.get('status') == 'failed':
+                return progress, f"Import failed: {progress.get('error')}"
+            time.sleep(POLL_INTERVAL)
+        return progress, f"Import still {progress.get('status')} after {self.timeout:.0f}s"
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        print("IMPORT FROM E-COMMERCE BENCHMARK")
+        print("=" * 80)
+        header = (f"{'ORDERS':>10}{'STATUS':>8}{'MODE':>8}{'WALL ms':>12}{'SERVER ms':>12}{'QUERIES':>10}"
+                  f"{'Q/ORDER':>9}{'MB':>8}{'ORDERS/s':>10}{'NEW':>9}{'UPDATED':>9}")
+        print(header)
+        print("-" * len(header))
+        for r in self.results:
+            queries = r.get('queries')
+            per_order = queries / r['orders'] if queries is not None else None
+            rate = r['orders'] / (r['wall_ms'] / 1000) if r['wall_ms'] else 0
+            print(f"{r['orders']:>10,}{str(r['status'] or 'ERR'):>8}{r['mode']:>8}{format_ms(r['wall_ms']):>12}"
+                  f"{format_ms(r.get('server_ms')):>12}{format_ms(queries):>10}{format_ms(per_order):>9}"
+                  f"{format_ms(r.get('memory_mb')):>8}{rate:>10,.0f}{str(r.get('imported', '-')):>9}"
+                  f"{str(r.get('updated', '-')):>9}")
+        for r in self.results:
+            if r['error']:
+                print(f"❌ {r['orders']:,} orders: {r['error']}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark CRM import from e-commerce orders")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="SQLite database the backend is serving")
+    parser.add_argument('--sizes', default='1000,10000,100000', help="Comma-separated order counts")
+    parser.add_argument('--repeat-share', type=float, default=0.3)
+    parser.add_argument('--existing-share', type=float, default=0.2)
+    parser.add_argument('--timeout', type=float, default=600, help="Seconds to wait for each import request")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--json', help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    benchmark = ImportBenchmark(args.base_url, args.db, args.repeat_share, args.existing_share, args.timeout, args.seed)
+    for size in (int(s) for s in args.sizes.split(',') if s.strip()):
+        benchmark.run_size(size)
+    benchmark.print_report()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(benchmark.results, f, indent=2)
+    return 0 if all(r['status'] in (200, 202) and not r['error'] for r in benchmark.results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Per-endpoint query budgets and N+1 detection
+Maximum X-Query-Count each endpoint may report; a run fails when any response
+exceeds its endpoint's budget. The growth check seeds a small dataset, calls each
+probed endpoint, seeds 10x more rows and calls it again: the query count of an
+endpoint without N+1 patterns stays flat.
+
+Budgets include the 3 queries Sanctum spends authenticating every request
+(token lookup, user lookup, last_used_at update).
+
+Usage:
+    python -m tests.harness.budgets --db backend/database/database.sqlite --base 10 --factor 10
+"""
+
+import argparse
+import json
+import random
+import sys
+from datetime import datetime
+
+from tests.harness.client import DEFAULT_BASE_URL, ApiClient
+from tests.harness.metrics import SERVER_QUERIES_HEADER, format_ms, parse_header_number
+from tests.harness.seeding import (DEFAULT_DB_PATH, SEED_PASSWORD_HASH, BulkLoader, TimestampSampler, account_email,
+                                   new_uuid, seed_accounts, unique_tag)
+
+QUERY_BUDGETS = {
+    # auth + membership check + leaderboard query with eager loads (user, achievement);
+    # the per-row last_achievement lookup makes this grow with the number of ranked users
+    'GET /gamification/leaderboard': 10,
+    # auth + route binding + workspace + membership + communications + deals
+    'GET /crm-contacts/{id}/analytics': 10,
+    # auth + workspace + membership + cache read + one grouped SUM(CASE ...) pass + cache write
+    # (database cache store); measured uncached, see CrmAnalyticsProbe.invalidate
+    'GET /crm-analytics': 10,
+    'GET /analytics/dashboard': 20,
+    'GET /workspaces': 8,
+}
+
+
+def load_budgets(path=None):
+    """The built-in budgets, overridden by {"GET /route": max_queries} from a JSON file"""
+    budgets = dict(QUERY_BUDGETS)
+    if path:
+        with open(path) as f:
+            budgets.update(json.load(f))
+    return budgets
+
+
+def add_arguments(parser):
+    parser.add_argument('--query-budgets', metavar='PATH',
+                        help="JSON file overriding the built-in per-endpoint query budgets")
+
+
+def check(registry, budgets=None):
+    """Return [(endpoint, budget, max_queries, mean_queries)] for endpoints over budget"""
+    budgets = QUERY_BUDGETS if budgets is None else budgets
+    violations = []
+    for stats in registry.sorted_endpoints():
+        key = f"{stats.method} {stats.route}"
+        budget = budgets.get(key)
+        if budget is None or stats.queries.count == 0:
+            continue
+        if stats.queries.max > budget:
+            violations.append((key, budget, stats.queries.max, stats.queries.mean))
+    return violations
+
+
+def enforce(registry, budgets=None):
+    """
+    Print the budget check for endpoints this run exercised; False on any violation, or
+    when a budgeted endpoint answered without an X-Query-Count header to check
+    """
+    budgets = QUERY_BUDGETS if budgets is None else budgets
+    exercised = [s for s in registry.sorted_endpoints()
+                 if f"{s.method} {s.route}" in budgets and s.count > s.errors]
+    if not exercised:
+        return True
+    unmeasured = [f"{s.method} {s.route}" for s in exercised if not s.queries.count]
+    violations = check(registry, budgets)
+    if unmeasured:
+        print(f"❌ NO {SERVER_QUERIES_HEADER} HEADER from {len(unmeasured)} budgeted endpoint(s) - "
+              f"start the backend with PERF_HEADERS=true")
+        for key in unmeasured:
+            print(f"   • {key}")
+    if violations:
+        print(f"❌ QUERY BUDGET EXCEEDED on {len(violations)} endpoint(s):")
+        for key, budget, max_queries, mean_queries in violations:
+            print(f"   • {key}: {max_queries:.0f} queries (mean {mean_queries:.1f}), budget {budget}")
+    elif not unmeasured:
+        print(f"✅ {len(exercised)} endpoint(s) within query budgets")
+    print()
+    return not violations and not unmeasured
+
+
+def _now():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+class GrowthProbe:
+    """
+    One endpoint under the growth check. `setup` seeds what the probe needs once,
+    `grow(count)` adds `count` more rows of the data the endpoint iterates over, and
+    `endpoint()` is the request path. Endpoints that cache their figures drop the cache in
+    `invalidate()` before every measured call, since rows loaded with raw SQL fire no model events.
+    """
+
+    name = None
+    route = None
+
+    def __init__(self, loader, owner_id, workspace_id, rng):
+        self.loader = loader
+        self.owner_id = owner_id
+        self.workspace_id = workspace_id
+        self.rng = rng
+        self.rows = 0
+
+    def setup(self):
+        pass
+
+    def grow(self, count):
+        raise NotImplementedError
+
+    def endpoint(self):
+        raise NotImplementedError
+
+    def invalidate(self, client, headers):
+        pass
+
+
+class LeaderboardProbe(GrowthProbe):
+    """Ranked users with completed achievements; the limit is raised so growth is not capped at 20 rows"""
+
+    name = 'leaderboard'
+    route = 'GET /gamification/leaderboard'
+    ACHIEVEMENTS = 3
+
+    def setup(self):
+        now = _now()
+        self.achievements = [new_uuid() for _ in range(self.ACHIEVEMENTS)]
+        self.loader.insert('achievements', (
+            'id', 'name', 'description', 'icon', 'category', 'type', 'criteria', 'points', 'is_active',
+            'created_at', 'updated_at'
+        ), (
+            (achievement_id, f"Budget Achievement {i}", "Seeded for the query growth check", 'star', 'general',
+             'milestone', '{}', 10 * (i + 1), 1, now, now)
+            for i, achievement_id in enumerate(self.achievements)
+        ))
+        self.tag = unique_tag()
+
+    def grow(self, count):
+        now = _now()
+        users = [(new_uuid(), self.rows + i) for i in range(count)]
+        self.loader.insert('users', (
+            'id', 'name', 'email', 'email_verified_at', 'password', 'role', 'status', 'created_at', 'updated_at'
+        ), (
+            (user_id, f"Ranked User {index}", account_email(f"rank_{self.tag}", index), now, SEED_PASSWORD_HASH,
+             'user', 'active', now, now)
+            for user_id, index in users
+        ))
+        self.loader.insert('user_achievements', (
+            'id', 'user_id', 'workspace_id', 'achievement_id', 'earned_at', 'progress', 'is_completed',
+            'created_at', 'updated_at'
+        ), (
+            (new_uuid(), user_id, self.workspace_id, achievement_id, now, 100, 1, now, now)
+            for user_id, _ in users
+            for achievement_id in self.rng.sample(self.achievements, self.rng.randint(1, self.ACHIEVEMENTS))
+        ))
+        self.rows += count
+
+    def endpoint(self):
+        return f"/gamification/leaderboard?workspace_id={self.workspace_id}&limit=100000"
+
+
+class ContactAnalyticsProbe(GrowthProbe):
+    """One contact whose communications and deals grow"""
+
+    name = 'contact_analytics'
+    route = 'GET /crm-contacts/{id}/analytics'
+
+    def setup(self):
+        now = _now()
+        self.contact_id = new_uuid()
+        self.stage_id = new_uuid()
+        self.loader.insert('crm_contacts', (
+            'id', 'workspace_id', 'first_name', 'last_name', 'email', 'status', 'lead_score', 'created_by',
+            'created_at', 'updated_at'
+        ), [(self.contact_id, self.workspace_id, 'Budget', 'Contact', f"budget_{unique_tag()}@mewayz.test",
+             'active', 0, self.owner_id, now, now)])
+        self.loader.insert('crm_pipeline_stages', (
+            'id', 'workspace_id', 'name', '"order"', 'color', 'is_active', 'is_closing_stage', 'probability',
+            'created_at', 'updated_at'
+        ), [(self.stage_id, self.workspace_id, 'Qualified', 1, '#3b82f6', 1, 0, 50, now, now)])
+
+    def grow(self, count):
+        now = _now()
+        self.loader.insert('crm_communications', (
+            'id', 'workspace_id', 'contact_id', 'type', 'direction', 'subject', 'duration', 'created_by',
+            'created_at', 'updated_at'
+        ), (
+            (new_uuid(), self.workspace_id, self.contact_id, self.rng.choice(('call', 'email', 'meeting')),
+             self.rng.choice(('inbound', 'outbound')), f"Touchpoint {self.rows + i}", self.rng.randint(5, 60),
+             self.owner_id, now, now)
+            for i in range(count)
+        ))
+        self.loader.insert('crm_deals', (
+            'id', 'workspace_id', 'contact_id', 'pipeline_stage_id', 'title', 'value', 'probability', 'status',
+            'created_by', 'created_at', 'updated_at'
+        ), (
+            (new_uuid(), self.workspace_id, self.contact_id, self.stage_id, f"Deal {self.rows + i}",
+             self.rng.randint(100, 10000), 50, self.rng.choice(('active', 'won', 'lost')), self.owner_id, now, now)
+            for i in range(count)
+        ))
+        self.rows += count
+
+    def endpoint(self):
+        return f"/crm-contacts/{self.contact_id}/analytics?period=365d"
+
+
+class CrmAnalyticsProbe(GrowthProbe):
+    """Workspace-wide CRM analytics over a growing contact list"""
+
+    name = 'crm_analytics'
+    route = 'GET /crm-analytics'
+
+    def setup(self):
+        self.tag = unique_tag()
+        self.contact_id = None
+
+    def grow(self, count):
+        now = _now()
+        ids = [new_uuid() for _ in range(count)]
+        self.contact_id = self.contact_id or ids[0]
+        self.loader.insert('crm_contacts', (
+            'id', 'workspace_id', 'first_name', 'last_name', 'email', 'status', 'lead_score', 'created_by',
+            'created_at', 'updated_at'
+        ), (
+            (ids[i], self.workspace_id, 'Contact', str(self.rows + i),
+             f"contact_{self.tag}_{self.rows + i}@mewayz.test", self.rng.choice(('active', 'inactive')),
+             self.rng.randint(0, 100), self.owner_id, now, now)
+            for i in range(count)
+        ))
+        self.rows += count
+
+    def endpoint(self):
+        return f"/crm-analytics?workspace_id={self.workspace_id}"
+
+    def invalidate(self, client, headers):
+        """Saving a contact through the API drops the workspace's cached analytics"""
+        endpoint = f"/crm-contacts/{self.contact_id}/update-lead-score"
+        response, error = client.request('POST', endpoint, {'lead_score': self.rng.randint(0, 100)}, headers=headers)
+        if error or response.status_code != 200:
+            raise RuntimeError(f"POST {endpoint} failed: {error or response.status_code}")
+
+
+PROBES = (LeaderboardProbe, ContactAnalyticsProbe, CrmAnalyticsProbe)
+
+
+class GrowthCheck:
+    def __init__(self, base_url=DEFAULT_BASE_URL, db_path=DEFAULT_DB_PATH, base=10, factor=10, budgets=None,
+                 seed=None):
+        self.client = ApiClient(base_url, retries=0)
+        self.db_path = db_path
+        self.base = base
+        self.factor = factor
+        self.budgets = QUERY_BUDGETS if budgets is None else budgets
+        self.rng = random.Random(seed)
+        self.results = []
+
+    def query_count(self, token, probe):
+        """X-Query-Count of the second of two calls, so one-off warm-up queries are not counted"""
+        headers = {'Authorization': f'Bearer {token}'}
+        endpoint = probe.endpoint()
+        count = None
+        for _ in range(2):
+            probe.invalidate(self.client, headers)
+            response, error = self.client.request('GET', endpoint, headers=headers)
+            if error or response.status_code != 200:
+                raise RuntimeError(f"GET {endpoint} failed: {error or response.status_code}")
+            count = parse_header_number(response.headers.get(SERVER_QUERIES_HEADER))
+        if count is None:
+            raise RuntimeError(f"GET {endpoint} returned no {SERVER_QUERIES_HEADER} header")
+        return count
+
+    def login(self, email):
+        response, error = self.client.request('POST', '/auth/login', {'email': email, 'password': 'password'})
+        if error or response.status_code != 200:
+            raise RuntimeError(f"Login failed for {email}: {error or response.text[:200]}")
+        return response.json()['token']
+
+    def run(self, names=None):
+        tag = unique_tag()
+        with BulkLoader(self.db_path, verbose=False) as loader:
+            (owner_id, workspace_id), = seed_accounts(loader, 1, self.rng, TimestampSampler(days=30, rng=self.rng),
+                                                      tag)
+            probes = [cls(loader, owner_id, workspace_id, self.rng) for cls in PROBES
+                      if not names or cls.name in names]
+            for probe in probes:
+                probe.setup()
+                probe.grow(self.base)
+        token = self.login(account_email(tag, 0))
+
+        for probe in probes:
+            result = {'probe': probe.name, 'route': probe.route, 'budget': self.budgets.get(probe.route),
+                      'small_rows': probe.rows, 'error': None}
+            try:
+                result['small_queries'] = self.query_count(token, probe)
+                with BulkLoader(self.db_path, verbose=False) as loader:
+                    probe.loader = loader
+                    probe.grow(self.base * (self.factor - 1))
+                result['large_rows'] = probe.rows
+                result['large_queries'] = self.query_count(token, probe)
+            except RuntimeError as e:
+                result['error'] = str(e)
+            self.results.append(result)
+        return self.results
+
+    @staticmethod
+    def verdict(result):
+        if result['error']:
+            return 'ERROR'
+        if result['large_queries'] > result['small_queries']:
+            return 'N+1'
+        if result['budget'] is not None and result['large_queries'] > result['budget']:
+            return 'BUDGET'
+        return 'OK'
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        print(f"QUERY GROWTH CHECK ({self.factor}x data)")
+        print("=" * 80)
+        header = f"{'ENDPOINT':<36}{'ROWS':>8}{'QUERIES':>9}{'ROWS':>9}{'QUERIES':>9}{'BUDGET':>8}  VERDICT"
+        print(header)
+        print("-" * len(header))
+        for r in self.results:
+            print(f"{r['route']:<36}{r['small_rows']:>8,}{format_ms(r.get('small_queries')):>9}"
+                  f"{r.get('large_rows', 0):>9,}{format_ms(r.get('large_queries')):>9}"
+                  f"{str(r['budget'] or '-'):>8}  {self.verdict(r)}")
+        print()
+        for r in self.results:
+            verdict = self.verdict(r)
+            if verdict == 'ERROR':
+                print(f"❌ {r['route']}: {r['error']}")
+            elif verdict == 'N+1':
+                print(f"❌ {r['route']}: queries grew from {r['small_queries']:.0f} to {r['large_queries']:.0f} "
+                      f"with {self.factor}x the rows (likely N+1)")
+            elif verdict == 'BUDGET':
+                print(f"❌ {r['route']}: {r['large_queries']:.0f} queries, budget {r['budget']}")
+        if all(self.verdict(r) == 'OK' for r in self.results):
+            print("✅ Query counts stayed flat and within budget")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check that endpoint query counts stay flat as data grows")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="SQLite database the backend is serving")
+    parser.add_argument('--base', type=int, default=10, help="Rows seeded before the first measurement")
+    parser.add_argument('--factor', type=int, default=10, help="Data growth before the second measurement")
+    parser.add_argument('--probe', action='append', choices=[cls.name for cls in PROBES],
+                        help="Only run this probe (repeatable)")
+    parser.add_argument('--budgets', metavar='PATH', help="JSON file overriding the built-in query budgets")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--json', help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    check = GrowthCheck(args.base_url, args.db, args.base, args.factor, load_budgets(args.budgets), args.seed)
+    check.run(args.probe)
+    check.print_report()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(check.results, f, indent=2)
+    return 0 if all(GrowthCheck.verdict(r) == 'OK' for r in check.results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
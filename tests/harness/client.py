@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Pooled HTTP client shared by every Mewayz backend tester
+Keeps connections to the Laravel API alive between requests instead of opening a new
+TCP connection per call, with retry/backoff and per-endpoint timeouts
+"""
+
+import atexit
+import os
+import re
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_BASE_URL = os.environ.get('MEWAYZ_API_URL', 'http://localhost:8001/api')
+DEFAULT_POOL_SIZE = int(os.environ.get('MEWAYZ_POOL_SIZE', '20'))
+DEFAULT_RETRIES = int(os.environ.get('MEWAYZ_HTTP_RETRIES', '2'))
+DEFAULT_BACKOFF = float(os.environ.get('MEWAYZ_HTTP_BACKOFF', '0.2'))
+DEFAULT_TIMEOUT = 10
+
+# Record every request the shared client sends to this replay log (see tests.harness.replay)
+RECORD_PATH = os.environ.get('MEWAYZ_RECORD')
+
+# Endpoints known to be slower than the default timeout, matched as regexes against the path
+DEFAULT_ENDPOINT_TIMEOUTS = {
+    r'^/crm-contacts/import/ecommerce$': 60,
+    r'^/analytics/export$': 30,
+    r'^/analytics/custom-report$': 30,
+    r'^/workspaces/[^/]+/invitations/bulk$': 60,
+}
+
+# Only idempotent methods are retried on read errors and 5xx responses;
+# connection errors are retried for every method since nothing reached the server
+RETRY_METHODS = frozenset(['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS'])
+RETRY_STATUSES = (502, 503, 504)
+
+
+class ApiClient:
+    def __init__(self, base_url=DEFAULT_BASE_URL, pool_size=DEFAULT_POOL_SIZE, retries=DEFAULT_RETRIES,
+                 backoff_factor=DEFAULT_BACKOFF, timeout=DEFAULT_TIMEOUT, endpoint_timeouts=None):
+        self.base_url = base_url.rstrip('/')
+        self.pool_size = pool_size
+        self.timeout = timeout
+        timeouts = dict(DEFAULT_ENDPOINT_TIMEOUTS)
+        if endpoint_timeouts:
+            timeouts.update(endpoint_timeouts)
+        self.endpoint_timeouts = [(re.compile(pattern), seconds) for pattern, seconds in timeouts.items()]
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({'Accept': 'application/json'})
+        self.listeners = []
+
+    @property
+    def root_url(self):
+        """Server root without the /api prefix"""
+        return self.base_url[:-len('/api')] if self.base_url.endswith('/api') else self.base_url
+
+    def timeout_for(self, endpoint):
+        """Resolve the timeout for an endpoint, first matching pattern wins"""
+        path = endpoint.split('?', 1)[0]
+        for pattern, seconds in self.endpoint_timeouts:
+            if pattern.search(path):
+                return seconds
+        return self.timeout
+
+    def add_listener(self, listener):
+        """Register listener(method, endpoint, response, error, elapsed_ms) called after every request"""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def request(self, method, endpoint, data=None, headers=None, timeout=None):
+        """Send a request through the pooled session, returning (response, error)"""
+        method = method.upper()
+        if method not in ('GET', 'POST', 'PUT', 'PATCH', 'DELETE'):
+            return None, f"Unsupported method: {method}"
+
+        url = f"{self.base_url}{endpoint}"
+        body = data if method in ('POST', 'PUT', 'PATCH') else None
+
+        start = time.perf_counter()
+        try:
+            response = self.session.request(
+                method,
+                url,
+                json=body,
+                headers=headers,
+                timeout=timeout or self.timeout_for(endpoint)
+            )
+            error = None
+        except requests.exceptions.RequestException as e:
+            response, error = None, str(e)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        for listener in list(self.listeners):
+            listener(method, endpoint, response, error, elapsed_ms)
+
+        return response, error
+
+    def ping(self, timeout=5):
+        """GET the server root; raises on connection failure like requests.get"""
+        return self.session.get(self.root_url, timeout=timeout)
+
+    def close(self):
+        self.session.close()
+
+
+_shared_client = None
+_shared_lock = threading.Lock()
+
+
+def get_client(base_url=None):
+    """Return the process-wide client so every tester shares one connection pool"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = ApiClient(base_url or DEFAULT_BASE_URL)
+            if RECORD_PATH:
+                from tests.harness.replay import TrafficRecorder
+
+                recorder = TrafficRecorder(RECORD_PATH).attach(_shared_client)
+                atexit.register(recorder.close)
+        elif base_url and base_url.rstrip('/') != _shared_client.base_url:
+            return ApiClient(base_url)
+        return _shared_client
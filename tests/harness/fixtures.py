@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Cached auth/workspace fixtures for the Mewayz testing harness
+Pre-provisions users with a workspace and Sanctum token once, keeps them in a JSON
+cache on disk and hands them out to test scripts and load workers on later runs
+
+Usage:
+    python -m tests.harness.fixtures --count 16      # provision / top up the cache
+    python -m tests.harness.fixtures --clear
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from tests.harness.client import get_client
+from tests.harness.seeding import REPO_ROOT, unique_tag
+
+SCHEMA_VERSION = 1
+DEFAULT_CACHE_PATH = os.environ.get(
+    'MEWAYZ_FIXTURE_CACHE',
+    os.path.join(REPO_ROOT, 'tests', '.fixture_cache.json')
+)
+FIXTURE_PASSWORD = 'password123'
+
+# Set MEWAYZ_FIXTURES=0 to make scripts register a fresh user as they used to
+FIXTURES_ENABLED = os.environ.get('MEWAYZ_FIXTURES', '1') != '0'
+
+
+class Fixture:
+    def __init__(self, email, user_id, token, workspace_id, created_at=None):
+        self.email = email
+        self.user_id = user_id
+        self.token = token
+        self.workspace_id = workspace_id
+        self.created_at = created_at or datetime.now().isoformat()
+
+    def apply(self, tester):
+        """Point a tester at this fixture's user, token and workspace"""
+        tester.token = self.token
+        tester.user_id = self.user_id
+        tester.workspace_id = self.workspace_id
+
+    def to_dict(self):
+        return {
+            'email': self.email,
+            'user_id': self.user_id,
+            'token': self.token,
+            'workspace_id': self.workspace_id,
+            'created_at': self.created_at
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['email'], data['user_id'], data['token'], data['workspace_id'], data.get('created_at'))
+
+
+class FixturePool:
+    """
+    Disk-backed pool of ready-to-use accounts. On startup each cached token is checked
+    with one GET /auth/user (no bcrypt); a rejected token is renewed with a login, and
+    only accounts that cannot log in any more are replaced by registering new ones.
+    """
+
+    def __init__(self, client=None, path=DEFAULT_CACHE_PATH, concurrency=8):
+        self.client = client or get_client()
+        self.path = path
+        self.concurrency = concurrency
+        self.fixtures = []
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                document = json.load(f)
+        except (OSError, ValueError):
+            return []
+        # Tokens are only meaningful for the backend that issued them
+        if document.get('schema_version') != SCHEMA_VERSION or document.get('base_url') != self.client.base_url:
+            return []
+        return [Fixture.from_dict(data) for data in document.get('fixtures', [])]
+
+    def save(self):
+        document = {
+            'schema_version': SCHEMA_VERSION,
+            'base_url': self.client.base_url,
+            'fixtures': [fixture.to_dict() for fixture in self.fixtures]
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(document, f, indent=2)
+        os.replace(temp_path, self.path)
+
+    def _auth_headers(self, token):
+        return {'Content-Type': 'application/json', 'Accept': 'application/json', 'Authorization': f'Bearer {token}'}
+
+    def _post(self, endpoint, data, token=None):
+        headers = self._auth_headers(token) if token else {'Content-Type': 'application/json',
+                                                           'Accept': 'application/json'}
+        response, error = self.client.request('POST', endpoint, data, headers)
+        if error or response.status_code not in (200, 201):
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return None
+
+    def validate(self, fixture):
+        """Return the fixture with a working token, or None if the account is unusable"""
+        response, error = self.client.request('GET', '/auth/user', headers=self._auth_headers(fixture.token))
+        if not error and response.status_code == 200:
+            return fixture
+        if error or response.status_code != 401:
+            return None
+        result = self._post('/auth/login', {'email': fixture.email, 'password': FIXTURE_PASSWORD})
+        if result and result.get('token'):
+            fixture.token = result['token']
+            return fixture
+        return None
+
+    def provision(self, index, tag):
+        """Register one user and create its workspace; None on failure"""
+        email = f"fixture_{tag}_{index}@mewayz.test"
+        result = self._post('/auth/register', {
+            'name': f"Fixture User {index}",
+            'email': email,
+            'password': FIXTURE_PASSWORD,
+            'password_confirmation': FIXTURE_PASSWORD
+        })
+        if not result or not result.get('token'):
+            return None
+        token = result['token']
+        workspace = self._post('/workspaces', {
+            'name': f"Fixture Workspace {index}",
+            'description': "Shared test fixture workspace"
+        }, token)
+        if not workspace or not workspace.get('workspace'):
+            return None
+        return Fixture(email, result['user']['id'], token, workspace['workspace']['id'])
+
+    def ensure(self, count):
+        """Load, validate and top up the cache to at least `count` fixtures; returns them"""
+        cached = self.load()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            valid = [f for f in executor.map(self.validate, cached) if f is not None]
+            missing = max(0, count - len(valid))
+            tag = unique_tag()
+            created = [f for f in executor.map(lambda i: self.provision(i, tag), range(missing)) if f is not None]
+
+        self.fixtures = valid + created
+        if cached or created:
+            self.save()
+        return self.fixtures[:count]
+
+    def acquire(self):
+        """Hand out the cached fixtures round-robin"""
+        with self._lock:
+            if not self.fixtures:
+                return None
+            fixture = self.fixtures[self._next % len(self.fixtures)]
+            self._next += 1
+            return fixture
+
+    def clear(self):
+        self.fixtures = []
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def shared_fixture(client=None):
+    """One validated fixture for a test script, or None to fall back to registering a user"""
+    if not FIXTURES_ENABLED:
+        return None
+    pool = FixturePool(client)
+    fixtures = pool.ensure(1)
+    return fixtures[0] if fixtures else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Provision the cached auth/workspace fixture pool")
+    parser.add_argument('--count', type=int, default=8, help="Number of fixtures to keep ready")
+    parser.add_argument('--path', default=DEFAULT_CACHE_PATH, help="Cache file location")
+    parser.add_argument('--clear', action='store_true', help="Delete the cache instead")
+    args = parser.parse_args(argv)
+
+    pool = FixturePool(path=args.path)
+    if args.clear:
+        pool.clear()
+        print(f"🗑️ Removed {args.path}")
+        return 0
+
+    fixtures = pool.ensure(args.count)
+    print(f"{'✅' if len(fixtures) >= args.count else '❌'} {len(fixtures)}/{args.count} fixtures ready in {args.path}")
+    return 0 if len(fixtures) >= args.count else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
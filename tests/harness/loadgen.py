@@ -0,0 +1,521 @@
+#!/usr/bin/env python3
+"""
+Open-model load generator for the Mewayz Laravel API
+Replays the request sequences encoded in backend_test.py as weighted scenarios at a
+constant arrival rate and reports throughput, error rate and latency percentiles
+
+Usage:
+    python -m tests.harness.loadgen --rps 50 --ramp-up 30 --duration 120 \\
+        --scenario ecommerce_order_management=3 --scenario crm_deals_management=1
+    python -m tests.harness.loadgen --rps 2000 --duration 300 --workers 16
+"""
+
+import argparse
+import collections
+import copy
+import math
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from queue import Empty
+
+from tests.harness import baseline, budgets
+from tests.harness.client import DEFAULT_BASE_URL, ApiClient
+from tests.harness.fixtures import Fixture, FixturePool
+from tests.harness.metrics import LatencyHistogram, MetricsRegistry, format_ms
+from tests.harness.sink import ResultSink
+
+# Scenario name -> weight; names are BackendTester test methods without the test_ prefix
+DEFAULT_SCENARIOS = {
+    'ecommerce_order_management': 3,
+    'ecommerce_product_analytics': 2,
+    'crm_deals_management': 2,
+    'crm_contact_analytics': 1,
+    'analytics_dashboard': 2,
+    'workspace_listing': 2,
+}
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class ScenarioStats:
+    def __init__(self, name, weight):
+        self.name = name
+        self.weight = weight
+        self.started = 0
+        self.failed = 0
+        self.dropped = 0
+        self.latency = LatencyHistogram()
+
+    @property
+    def completed(self):
+        return self.latency.count
+
+    def merge(self, other):
+        self.started += other.started
+        self.failed += other.failed
+        self.dropped += other.dropped
+        self.latency.merge(other.latency)
+        return self
+
+
+class LoadSummary:
+    """Reporting shared by the in-process and multi-process generators"""
+
+    def to_dict(self):
+        """Machine-readable summary of the run"""
+        elapsed = self.elapsed or 1e-9
+        endpoints = []
+        for stats in self.metrics.sorted_endpoints():
+            endpoints.append({
+                'method': stats.method,
+                'route': stats.route,
+                'count': stats.count,
+                'throughput': stats.count / elapsed,
+                'error_rate': stats.error_rate,
+                'percentiles': {f"p{p}": stats.latency.percentile(p) for p in PERCENTILES},
+                'max': stats.latency.max
+            })
+        scenarios = []
+        for stats in self.scenarios.values():
+            scenarios.append({
+                'name': stats.name,
+                'weight': stats.weight,
+                'started': stats.started,
+                'completed': stats.completed,
+                'failed': stats.failed,
+                'dropped': stats.dropped,
+                'percentiles': {f"p{p}": stats.latency.percentile(p) for p in PERCENTILES},
+                'max': stats.latency.max
+            })
+        return {
+            'target_rps': self.rps,
+            'ramp_up': self.ramp_up,
+            'duration': self.duration,
+            'elapsed': self.elapsed,
+            'requests': sum(e['count'] for e in endpoints),
+            'scenarios': scenarios,
+            'endpoints': endpoints
+        }
+
+    def print_report(self):
+        summary = self.to_dict()
+        elapsed = summary['elapsed'] or 1e-9
+        completed = sum(s['completed'] for s in summary['scenarios'])
+        dropped = sum(s['dropped'] for s in summary['scenarios'])
+        failed = sum(s['failed'] for s in summary['scenarios'])
+
+        print("\n" + "=" * 80)
+        print("LOAD TEST SUMMARY")
+        print("=" * 80)
+        print(f"Target: {self.rps:.1f} scenarios/s (ramp-up {self.ramp_up:.0f}s, duration {self.duration:.0f}s)")
+        print(f"Achieved: {completed / elapsed:.1f} scenarios/s, {summary['requests'] / elapsed:.1f} requests/s")
+        print(f"Scenarios: {completed} completed, {failed} failed, {dropped} dropped")
+        print()
+
+        header = f"{'SCENARIO':<36}{'DONE':>7}{'FAIL%':>7}" + ''.join(f"{'p' + str(p):>9}" for p in PERCENTILES) + f"{'max':>9}"
+        print(header)
+        print("-" * len(header))
+        for s in summary['scenarios']:
+            fail_rate = (s['failed'] / s['completed']) * 100 if s['completed'] else 0.0
+            print(f"{s['name'][:35]:<36}{s['completed']:>7}{fail_rate:>7.1f}"
+                  + ''.join(f"{format_ms(s['percentiles'][f'p{p}']):>9}" for p in PERCENTILES)
+                  + f"{format_ms(s['max']):>9}")
+        print()
+
+        header = f"{'ENDPOINT':<44}{'COUNT':>7}{'RPS':>7}{'ERR%':>7}" + ''.join(f"{'p' + str(p):>9}" for p in PERCENTILES) + f"{'max':>9}"
+        print(header)
+        print("-" * len(header))
+        for e in summary['endpoints']:
+            name = f"{e['method']} {e['route']}"
+            print(f"{name[:43]:<44}{e['count']:>7}{e['throughput']:>7.1f}{e['error_rate']:>7.1f}"
+                  + ''.join(f"{format_ms(e['percentiles'][f'p{p}']):>9}" for p in PERCENTILES)
+                  + f"{format_ms(e['max']):>9}")
+        print("\nLatencies in ms; scenario latency is measured from the scheduled arrival time.")
+
+
+class LoadGenerator(LoadSummary):
+    """
+    Issues scenario arrivals on a fixed schedule regardless of how fast earlier ones
+    complete (open model). Scenario latency is measured from the scheduled arrival time
+    so a slow server cannot hide queueing delay (no coordinated omission). Arrivals that
+    find max_in_flight scenarios already running are counted as dropped.
+    """
+
+    def __init__(self, tester, scenarios, rps, duration, ramp_up=0, max_in_flight=256, seed=None, results=None):
+        self.tester = tester
+        self.results = results
+        self.rps = rps
+        self.duration = duration
+        self.ramp_up = min(ramp_up, duration)
+        self.max_in_flight = max_in_flight
+        self.random = random.Random(seed)
+        self.scenarios = collections.OrderedDict(
+            (name, ScenarioStats(name, weight)) for name, weight in scenarios.items() if weight > 0
+        )
+        for name in self.scenarios:
+            if not callable(getattr(tester, f"test_{name}", None)):
+                raise ValueError(f"Unknown scenario: {name} (no test_{name} on {type(tester).__name__})")
+
+        self.metrics = MetricsRegistry()
+        self.tester.client.add_listener(self.metrics)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.elapsed = 0.0
+
+    def arrival_offsets(self):
+        """Seconds from start of each arrival; rate ramps linearly to rps over ramp_up"""
+        ramp_arrivals = self.rps * self.ramp_up / 2.0
+        k = 1
+        while True:
+            if k <= ramp_arrivals:
+                offset = math.sqrt(2.0 * k * self.ramp_up / self.rps)
+            else:
+                offset = self.ramp_up + (k - ramp_arrivals) / self.rps
+            if offset >= self.duration:
+                return
+            yield offset
+            k += 1
+
+    def _worker_tester(self):
+        tester = getattr(self._local, 'tester', None)
+        if tester is None:
+            tester = copy.copy(self.tester)
+            # Scenario results are streamed to the sink (or dropped) rather than kept per thread
+            tester.test_results = self.results if self.results is not None else collections.deque(maxlen=0)
+            self._local.tester = tester
+        return tester
+
+    def _run_scenario(self, stats, scheduled_at):
+        try:
+            success = getattr(self._worker_tester(), f"test_{stats.name}")()
+        except Exception:
+            success = False
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        latency_ms = (time.perf_counter() - scheduled_at) * 1000
+        with self._lock:
+            stats.latency.record(latency_ms)
+            if success is False:
+                stats.failed += 1
+
+    def run(self, progress=None):
+        names = list(self.scenarios)
+        weights = [self.scenarios[name].weight for name in names]
+
+        start = time.perf_counter()
+        last_progress = start
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as executor:
+            for offset in self.arrival_offsets():
+                scheduled_at = start + offset
+                delay = scheduled_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+                stats = self.scenarios[self.random.choices(names, weights)[0]]
+                with self._lock:
+                    if self._in_flight >= self.max_in_flight:
+                        stats.dropped += 1
+                        continue
+                    self._in_flight += 1
+                    stats.started += 1
+                executor.submit(self._run_scenario, stats, scheduled_at)
+
+                now = time.perf_counter()
+                if progress and now - last_progress >= 5:
+                    last_progress = now
+                    progress(self._progress_line(now - start))
+
+        self.elapsed = time.perf_counter() - start
+        self.tester.client.remove_listener(self.metrics)
+        return self
+
+    def counters(self):
+        with self._lock:
+            started = sum(s.started for s in self.scenarios.values())
+            in_flight = self._in_flight
+        return {'started': started, 'in_flight': in_flight, 'requests': self.metrics.request_count}
+
+    def _progress_line(self, elapsed):
+        counters = self.counters()
+        rate = counters['requests'] / elapsed if elapsed else 0
+        return (f"[{elapsed:6.1f}s] started={counters['started']} in_flight={counters['in_flight']} "
+                f"requests={counters['requests']} ({rate:.0f}/s)")
+
+
+def _worker_main(index, options, queue, start_event):
+    """Body of one ProcessPoolLoadGenerator worker: own user, token and connection pool"""
+    sys.stdout = open(os.devnull, 'w')
+    try:
+        fixture = Fixture.from_dict(options['fixture']) if options['fixture'] else None
+        tester = prepare_tester(options['base_url'], options['max_in_flight'], fixture)
+        if tester is None:
+            queue.put(('failed', index, "could not register a user and workspace"))
+            return
+        results = ResultSink(options['results'], source=f"loadgen-w{index}") if options['results'] else None
+        generator = LoadGenerator(tester, options['scenarios'], options['rps'], options['duration'],
+                                  ramp_up=options['ramp_up'], max_in_flight=options['max_in_flight'],
+                                  seed=options['seed'], results=results)
+    except Exception as e:
+        queue.put(('failed', index, str(e)))
+        return
+
+    queue.put(('ready', index, None))
+    start_event.wait()
+    time.sleep(options['phase'])
+
+    stop = threading.Event()
+
+    def report():
+        while not stop.wait(1):
+            queue.put(('progress', index, generator.counters()))
+
+    threading.Thread(target=report, daemon=True).start()
+    try:
+        generator.run()
+    finally:
+        stop.set()
+        if results is not None:
+            results.close()
+    queue.put(('done', index, {
+        'elapsed': generator.elapsed + options['phase'],
+        'counters': generator.counters(),
+        'endpoints': list(generator.metrics.endpoints.values()),
+        'scenarios': list(generator.scenarios.values())
+    }))
+
+
+class ProcessPoolLoadGenerator(LoadSummary):
+    """
+    Runs the open-model schedule across N worker processes so the GIL does not cap the
+    offered load. Each worker uses its own cached fixture (or registers a user and
+    workspace when there is none for it), keeps its own
+    connection pool and runs rps/N arrivals (phase-shifted so workers interleave rather
+    than fire together). Workers stream counters for a live throughput line and send
+    their latency histograms at the end; histograms merge exactly, so the global
+    percentiles are the same as a single process recording every request would give.
+    """
+
+    def __init__(self, base_url, scenarios, rps, duration, ramp_up=0, max_in_flight=256, seed=None, workers=None,
+                 fixtures=None, results=None):
+        self.base_url = base_url
+        self.results = results
+        self.fixtures = fixtures or []
+        self.rps = rps
+        self.duration = duration
+        self.ramp_up = min(ramp_up, duration)
+        self.workers = workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight
+        self.seed = seed
+        self.scenario_weights = {name: weight for name, weight in scenarios.items() if weight > 0}
+        self.scenarios = collections.OrderedDict(
+            (name, ScenarioStats(name, weight)) for name, weight in self.scenario_weights.items()
+        )
+        self.metrics = MetricsRegistry()
+        self.elapsed = 0.0
+        self.failed_workers = []
+
+    def _options(self, index):
+        return {
+            'base_url': self.base_url,
+            'scenarios': self.scenario_weights,
+            'rps': self.rps / self.workers,
+            'duration': self.duration,
+            'ramp_up': self.ramp_up,
+            'max_in_flight': max(1, math.ceil(self.max_in_flight / self.workers)),
+            'seed': None if self.seed is None else self.seed + index,
+            'phase': index / self.rps if self.rps else 0,
+            'fixture': self.fixtures[index].to_dict() if index < len(self.fixtures) else None,
+            'results': worker_results_path(self.results, index) if self.results else None
+        }
+
+    def _merge(self, result):
+        self.metrics.merge(result['endpoints'])
+        for other in result['scenarios']:
+            self.scenarios[other.name].merge(other)
+
+    def run(self, progress=None):
+        """Returns False if no worker could start"""
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+        queue = context.Queue()
+        start_event = context.Event()
+        processes = [
+            context.Process(target=_worker_main, args=(i, self._options(i), queue, start_event), daemon=True)
+            for i in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+
+        ready = set()
+        while len(ready) + len(self.failed_workers) < self.workers:
+            try:
+                kind, index, payload = queue.get(timeout=120)
+            except Empty:
+                break
+            if kind == 'ready':
+                ready.add(index)
+            elif kind == 'failed':
+                self.failed_workers.append((index, payload))
+        if not ready:
+            for process in processes:
+                process.terminate()
+            return False
+
+        start = time.perf_counter()
+        start_event.set()
+        counters = {}
+        pending = set(ready)
+        last_progress, last_requests = start, 0
+        while pending:
+            try:
+                kind, index, payload = queue.get(timeout=1)
+            except Empty:
+                for index in [i for i in pending if not processes[i].is_alive()]:
+                    pending.discard(index)
+                    self.failed_workers.append((index, f"exited with code {processes[index].exitcode}"))
+                continue
+            if kind == 'progress':
+                counters[index] = payload
+            elif kind == 'done':
+                counters[index] = payload['counters']
+                self._merge(payload)
+                self.elapsed = max(self.elapsed, payload['elapsed'])
+                pending.discard(index)
+
+            now = time.perf_counter()
+            if progress and now - last_progress >= 2:
+                requests = sum(c['requests'] for c in counters.values())
+                in_flight = sum(c['in_flight'] for c in counters.values())
+                rate = (requests - last_requests) / (now - last_progress)
+                progress(f"[{now - start:6.1f}s] requests={requests} ({rate:.0f}/s) in_flight={in_flight} "
+                         f"workers={len(pending)}/{len(ready)}")
+                last_progress, last_requests = now, requests
+
+        self.elapsed = self.elapsed or time.perf_counter() - start
+        for process in processes:
+            process.join(timeout=5)
+        return True
+
+
+def worker_results_path(path, index):
+    """results.jsonl.gz -> results.w3.jsonl.gz; one file per worker process"""
+    directory, name = os.path.split(path)
+    stem, dot, extension = name.partition('.')
+    return os.path.join(directory, f"{stem}.w{index}{dot}{extension}")
+
+
+def parse_scenarios(values):
+    if not values:
+        return dict(DEFAULT_SCENARIOS)
+    scenarios = {}
+    for value in values:
+        name, _, weight = value.partition('=')
+        name = name[len('test_'):] if name.startswith('test_') else name
+        scenarios[name] = float(weight) if weight else 1.0
+    return scenarios
+
+
+def prepare_tester(base_url, pool_size, fixture=None):
+    """
+    Set up the tester every scenario runs with: a cached fixture's token and workspace
+    when one is given, otherwise a freshly registered user and workspace
+    """
+    from backend_test import BackendTester
+
+    tester = BackendTester()
+    tester.client = ApiClient(base_url, pool_size=pool_size, retries=0)
+    tester.base_url = tester.client.base_url
+    if fixture:
+        fixture.apply(tester)
+        return tester
+    if not tester.test_user_registration() or not tester.test_workspace_creation():
+        return None
+    return tester
+
+
+def load_fixtures(base_url, count):
+    """Validated fixtures from the on-disk cache, topped up to `count`"""
+    client = ApiClient(base_url, retries=0)
+    try:
+        return FixturePool(client).ensure(count)
+    finally:
+        client.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Constant-arrival-rate load generator for the Mewayz API")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--rps', type=float, default=10.0, help="Target scenario arrivals per second")
+    parser.add_argument('--ramp-up', type=float, default=10.0, help="Seconds to ramp linearly up to --rps")
+    parser.add_argument('--duration', type=float, default=60.0, help="Total run time in seconds, including ramp-up")
+    parser.add_argument('--scenario', action='append', metavar='NAME=WEIGHT',
+                        help="BackendTester scenario and weight (repeatable); defaults to a mixed workload")
+    parser.add_argument('--max-in-flight', type=int, default=256, help="Concurrent scenarios before arrivals are dropped")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=1,
+                        help="Worker processes, each with its own user, token and connection pool (0 = one per CPU)")
+    parser.add_argument('--fresh-users', action='store_true',
+                        help="Register new users instead of using the cached fixture pool")
+    parser.add_argument('--results', metavar='PATH',
+                        help="Stream every scenario test result to this JSONL file (.gz to compress)")
+    baseline.add_arguments(parser)
+    budgets.add_arguments(parser)
+    args = parser.parse_args(argv)
+    scenarios = parse_scenarios(args.scenario)
+    workers = args.workers or os.cpu_count() or 1
+    fixtures = [] if args.fresh_users else load_fixtures(args.base_url, workers)
+
+    if workers != 1:
+        generator = ProcessPoolLoadGenerator(args.base_url, scenarios, args.rps, args.duration,
+                                             ramp_up=args.ramp_up, max_in_flight=args.max_in_flight,
+                                             seed=args.seed, workers=workers, fixtures=fixtures, results=args.results)
+        print(f"Starting {generator.workers} load workers...")
+        started = generator.run(progress=lambda line: print(line, flush=True))
+        for index, reason in generator.failed_workers:
+            print(f"⚠️ Worker {index} failed: {reason}")
+        if not started:
+            print("❌ No load worker could register a user and workspace. Is the backend running?")
+            return 1
+    else:
+        print("Preparing load test user and workspace...")
+        tester = prepare_tester(args.base_url, args.max_in_flight, fixtures[0] if fixtures else None)
+        if tester is None:
+            print("❌ Could not register a user and workspace. Is the backend running?")
+            return 1
+
+        results = ResultSink(args.results, source='loadgen') if args.results else None
+        generator = LoadGenerator(tester, scenarios, args.rps, args.duration,
+                                  ramp_up=args.ramp_up, max_in_flight=args.max_in_flight, seed=args.seed,
+                                  results=results)
+
+        # Scenario methods print per-test output; silence it for the duration of the run
+        stdout = sys.stdout
+        with open(os.devnull, 'w') as devnull:
+            sys.stdout = devnull
+            try:
+                generator.run(progress=lambda line: print(line, file=stdout, flush=True))
+            finally:
+                sys.stdout = stdout
+                if results is not None:
+                    results.close()
+
+    generator.print_report()
+    if args.results:
+        pattern = worker_results_path(args.results, '*') if workers != 1 else args.results
+        print(f"Results streamed to {pattern}; summarize with: python -m tests.harness.sink summarize '{pattern}'")
+    passed = baseline.gate(generator.metrics, generator.elapsed, args.save_baseline, args.compare_baseline,
+                           args.baseline_label, 'loadgen', baseline.tolerances_from_args(args),
+                           baseline.load_overrides(args.tolerance_overrides))
+    passed = budgets.enforce(generator.metrics, budgets.load_budgets(args.query_budgets)) and passed
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Latency metrics for the Mewayz testing harness
+Route-template normalization, log-bucketed latency histograms and per-endpoint stats
+"""
+
+import math
+import re
+import threading
+
+_UUID = re.compile(r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$')
+_NUMERIC = re.compile(r'^\d+$')
+_OPAQUE = re.compile(r'^(?=.*\d)[A-Za-z0-9_]{16,}$')  # Stripe session ids, tokens and other generated keys
+_NUMBER = re.compile(r'-?\d+(?:\.\d+)?')
+
+# Headers added by PerformanceMonitoringMiddleware
+SERVER_TIME_HEADER = 'X-Response-Time'
+SERVER_MEMORY_HEADER = 'X-Memory-Usage'
+SERVER_QUERIES_HEADER = 'X-Query-Count'
+
+
+def route_template(endpoint):
+    """Normalize ids out of an endpoint path: /orders/5/status -> /orders/{id}/status"""
+    path = endpoint.split('?', 1)[0]
+    segments = []
+    for segment in path.split('/'):
+        if _UUID.match(segment) or _NUMERIC.match(segment) or _OPAQUE.match(segment):
+            segments.append('{id}')
+        else:
+            segments.append(segment)
+    return '/'.join(segments)
+
+
+def parse_header_number(value):
+    """Parse '12.5ms' / '0.75MB' / '7' style header values; None if absent or malformed"""
+    if value is None:
+        return None
+    match = _NUMBER.search(value)
+    return float(match.group()) if match else None
+
+
+class LatencyHistogram:
+    """
+    Log-bucketed latency histogram with bounded relative error (HDR/DDSketch style).
+
+    Values land in buckets whose width grows geometrically, so memory stays small for
+    any number of samples, percentiles are accurate to within `relative_accuracy`, and
+    two histograms with the same accuracy merge exactly by adding bucket counts.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def record(self, value, count=1):
+        if value <= 0:
+            self.zero_count += count
+        else:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge histograms with different relative accuracy")
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def percentile(self, p):
+        """Value at percentile p (0-100)"""
+        if self.count == 0:
+            return None
+        rank = max(1, math.ceil(self.count * p / 100.0))
+        if rank <= self.zero_count:
+            return 0.0
+        seen = self.zero_count
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= rank:
+                # Midpoint of the bucket (gamma^(k-1), gamma^k] keeps the error within relative_accuracy
+                value = 2 * self.gamma ** key / (1 + self.gamma)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def to_dict(self):
+        return {
+            'relative_accuracy': self.relative_accuracy,
+            'buckets': {str(key): count for key, count in self.buckets.items()},
+            'zero_count': self.zero_count,
+            'count': self.count,
+            'total': self.total,
+            'min': self.min,
+            'max': self.max
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls(data['relative_accuracy'])
+        histogram.buckets = {int(key): count for key, count in data['buckets'].items()}
+        histogram.zero_count = data['zero_count']
+        histogram.count = data['count']
+        histogram.total = data['total']
+        histogram.min = data['min']
+        histogram.max = data['max']
+        return histogram
+
+
+class EndpointStats:
+    def __init__(self, method, route):
+        self.method = method
+        self.route = route
+        self.latency = LatencyHistogram()
+        self.server_time = LatencyHistogram()
+        self.queries = LatencyHistogram()
+        self.memory_samples = 0
+        self.memory_total = 0.0
+        self.memory_max = None
+        self.errors = 0
+        self.statuses = {}
+
+    def record_server_timing(self, headers):
+        """Capture the PerformanceMonitoringMiddleware headers from a response"""
+        server_time = parse_header_number(headers.get(SERVER_TIME_HEADER))
+        if server_time is not None:
+            self.server_time.record(server_time)
+        queries = parse_header_number(headers.get(SERVER_QUERIES_HEADER))
+        if queries is not None:
+            self.queries.record(queries)
+        memory = parse_header_number(headers.get(SERVER_MEMORY_HEADER))
+        if memory is not None:
+            self.memory_samples += 1
+            self.memory_total += memory
+            self.memory_max = memory if self.memory_max is None else max(self.memory_max, memory)
+
+    @property
+    def memory_mean(self):
+        return self.memory_total / self.memory_samples if self.memory_samples else None
+
+    @property
+    def count(self):
+        return self.latency.count
+
+    @property
+    def error_rate(self):
+        return (self.errors / self.count) * 100 if self.count else 0.0
+
+    def merge(self, other):
+        self.latency.merge(other.latency)
+        self.server_time.merge(other.server_time)
+        self.queries.merge(other.queries)
+        self.memory_samples += other.memory_samples
+        self.memory_total += other.memory_total
+        if other.memory_max is not None:
+            self.memory_max = other.memory_max if self.memory_max is None else max(self.memory_max, other.memory_max)
+        self.errors += other.errors
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        return self
+
+
+class MetricsRegistry:
+    """Thread-safe per-route latency and error counters, usable as an ApiClient listener"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints = {}
+
+    def __call__(self, method, endpoint, response, error, elapsed_ms):
+        self.record(method, endpoint, response, error, elapsed_ms)
+
+    def record(self, method, endpoint, response, error, elapsed_ms):
+        key = (method.upper(), route_template(endpoint))
+        status = response.status_code if response is not None else 'error'
+        with self._lock:
+            stats = self.endpoints.get(key)
+            if stats is None:
+                stats = self.endpoints[key] = EndpointStats(*key)
+            stats.latency.record(elapsed_ms)
+            if response is not None:
+                stats.record_server_timing(response.headers)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            if error or response.status_code >= 400:
+                stats.errors += 1
+
+    def merge(self, endpoints):
+        """Fold EndpointStats from another registry (e.g. a worker process) into this one"""
+        with self._lock:
+            for other in endpoints:
+                key = (other.method, other.route)
+                stats = self.endpoints.get(key)
+                if stats is None:
+                    stats = self.endpoints[key] = EndpointStats(*key)
+                stats.merge(other)
+        return self
+
+    @property
+    def request_count(self):
+        with self._lock:
+            return sum(stats.count for stats in self.endpoints.values())
+
+    def sorted_endpoints(self):
+        with self._lock:
+            return sorted(self.endpoints.values(), key=lambda s: (-s.count, s.route, s.method))
+
+
+def format_ms(value):
+    return "-" if value is None else f"{value:.1f}"
+
+
+def print_latency_table(registry, title="ENDPOINT LATENCY"):
+    """
+    Print client and server latency percentiles per route template side by side.
+    Server time comes from X-Response-Time; the gap between client and server p50
+    is network plus framework bootstrap overhead outside the middleware.
+    """
+    endpoints = registry.sorted_endpoints()
+    if not endpoints:
+        return
+
+    print(f"{title} (ms, client | server)")
+    header = (f"{'ENDPOINT':<44}{'N':>5}{'ERR%':>6}"
+              f"{'p50':>8}{'p95':>8}{'p99':>8}{'max':>8} |"
+              f"{'p50':>8}{'p95':>8}{'p99':>8} |{'ovh':>7}{'qry':>6}{'qmax':>6}{'MB':>6}")
+    print(header)
+    print("-" * len(header))
+    for stats in endpoints:
+        name = f"{stats.method} {stats.route}"
+        client_p50 = stats.latency.percentile(50)
+        server_p50 = stats.server_time.percentile(50)
+        overhead = client_p50 - server_p50 if server_p50 is not None else None
+        queries = stats.queries.mean
+        print(f"{name[:43]:<44}{stats.count:>5}{stats.error_rate:>6.1f}"
+              f"{format_ms(client_p50):>8}{format_ms(stats.latency.percentile(95)):>8}"
+              f"{format_ms(stats.latency.percentile(99)):>8}{format_ms(stats.latency.max):>8} |"
+              f"{format_ms(server_p50):>8}{format_ms(stats.server_time.percentile(95)):>8}"
+              f"{format_ms(stats.server_time.percentile(99)):>8} |"
+              f"{format_ms(overhead):>7}{format_ms(queries):>6}{format_ms(stats.queries.max):>6}"
+              f"{format_ms(stats.memory_max):>6}")
+    if all(stats.server_time.percentile(50) is None for stats in endpoints):
+        print(f"⚠️ No {SERVER_TIME_HEADER} headers received - start the backend with PERF_HEADERS=true. "
+              f"Server columns are blank.")
+    print()
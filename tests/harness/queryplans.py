@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Query-plan verification for the Mewayz SQLite database
+Runs EXPLAIN QUERY PLAN over a catalogue of the query shapes the controllers issue
+(as Laravel's SQLite grammar renders them) and flags full table scans, temporary
+B-trees for sorting/grouping and expected indexes the planner no longer uses, so an
+index regression fails CI instead of surfacing as a slow endpoint
+
+Usage:
+    python -m tests.harness.queryplans --db backend/database/database.sqlite
+    python -m tests.harness.queryplans --only invitations --verbose
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+
+from tests.harness.seeding import DEFAULT_DB_PATH
+
+# Sample bind values; plans depend on the schema and sqlite_stat1, not on the values
+WORKSPACE = '9b1deb4d-3b7d-4bad-9bdd-2b0d7b3dcb6d'
+USER = '1b9d6bcd-bbfd-4b2d-9b5d-ab8dfbbd4bed'
+CONTACT = '6ec0bd7f-11c0-43da-975e-2a8ad9ebae0b'
+TOKEN = 'a' * 64
+NOW = '2025-01-31 12:00:00'
+MONTH_AGO = '2025-01-01 12:00:00'
+
+FULL_SCAN = 'full scan'
+INDEX_SCAN = 'full index scan'
+TEMP_SORT = 'temp b-tree'
+MISSING_INDEX = 'index not used'
+
+
+class QueryShape:
+    """
+    One query as a controller issues it. `expect_index` is (table, columns) of an index
+    the plan must use, matched by its leading columns so the check does not depend on
+    index names; `allow` lists issue kinds that are accepted for this shape (e.g. a temp B-tree
+    for ORDER BY on an aggregate, which no index can serve).
+    """
+
+    def __init__(self, name, source, sql, params=(), expect_index=None, allow=()):
+        self.name = name
+        self.source = source
+        self.sql = ' '.join(sql.split())
+        self.params = tuple(params)
+        self.expect_index = expect_index
+        self.allow = tuple(allow)
+
+
+CATALOGUE = [
+    # Workspace invitations
+    QueryShape(
+        'invitations.list', 'WorkspaceInvitationController::index',
+        'select * from "workspace_invitations" where "workspace_id" = ? order by "created_at" desc limit 20 offset 0',
+        (WORKSPACE,)),
+    QueryShape(
+        'invitations.list_by_status', 'WorkspaceInvitationController::index',
+        'select * from "workspace_invitations" where "workspace_id" = ? and "status" = ? '
+        'order by "created_at" desc limit 20 offset 0',
+        (WORKSPACE, 'pending'), expect_index=('workspace_invitations', ('workspace_id', 'status', 'created_at'))),
+    QueryShape(
+        'invitations.list_count', 'WorkspaceInvitationController::index',
+        'select count(*) as aggregate from "workspace_invitations" where "workspace_id" = ?',
+        (WORKSPACE,)),
+    QueryShape(
+        'invitations.by_token', 'WorkspaceInvitationController::show',
+        'select * from "workspace_invitations" where "token" = ? limit 1',
+        (TOKEN,)),
+    QueryShape(
+        'invitations.pending_by_token', 'WorkspaceInvitationController::accept',
+        'select * from "workspace_invitations" where "token" = ? and "status" = ? limit 1',
+        (TOKEN, 'pending')),
+    QueryShape(
+        'invitations.existing_for_email', 'WorkspaceInvitationController::store',
+        'select * from "workspace_invitations" where "workspace_id" = ? and "email" = ? and "status" = ? limit 1',
+        (WORKSPACE, 'someone@example.com', 'pending')),
+    QueryShape(
+        'invitations.bulk_members', 'InvitationBatch::createInvitations',
+        'select "users"."email" from "workspace_members" inner join "users" on "users"."id" = "workspace_members"."user_id" '
+        'where "workspace_members"."workspace_id" = ? and "users"."email" in (?, ?)',
+        (WORKSPACE, 'someone@example.com', 'other@example.com')),
+    QueryShape(
+        'invitations.bulk_pending', 'InvitationBatch::createInvitations',
+        'select "email" from "workspace_invitations" where "workspace_id" = ? and "status" = ? and "email" in (?, ?)',
+        (WORKSPACE, 'pending', 'someone@example.com', 'other@example.com'),
+        expect_index=('workspace_invitations', ('email',))),
+    QueryShape(
+        'invitations.batch_chunk', 'SendInvitationBatchEmails::handle',
+        'select * from "workspace_invitations" where "workspace_invitations"."batch_id" = ? '
+        'and "workspace_invitations"."batch_id" is not null and "status" = ? and "email_sent_at" is null '
+        'and "email_failed_at" is null and "id" > ? order by "id" asc limit 200',
+        (WORKSPACE, 'pending', CONTACT), expect_index=('workspace_invitations', ('batch_id', 'id'))),
+    QueryShape(
+        'invitations.analytics_status', 'WorkspaceInvitation::analyticsFor',
+        'select status, COUNT(*) as total from "workspace_invitations" where "workspace_id" = ? group by "status"',
+        (WORKSPACE,), expect_index=('workspace_invitations', ('workspace_id', 'status'))),
+    QueryShape(
+        'invitations.analytics_role', 'WorkspaceInvitation::analyticsFor',
+        'select role, COUNT(*) as total from "workspace_invitations" where "workspace_id" = ? group by "role"',
+        (WORKSPACE,), expect_index=('workspace_invitations', ('workspace_id', 'role'))),
+    QueryShape(
+        'invitations.analytics_department', 'WorkspaceInvitation::analyticsFor',
+        'select department, COUNT(*) as total from "workspace_invitations" where "workspace_id" = ? '
+        'and "department" is not null group by "department"',
+        (WORKSPACE,), expect_index=('workspace_invitations', ('workspace_id', 'department'))),
+
+    # Membership checks run by nearly every workspace-scoped endpoint
+    QueryShape(
+        'members.exists', 'Workspace::members()->where(user_id)->exists()',
+        'select exists(select * from "workspace_members" where "workspace_members"."workspace_id" = ? '
+        'and "workspace_members"."workspace_id" is not null and "user_id" = ?) as "exists"',
+        (WORKSPACE, USER)),
+    QueryShape(
+        'members.admin', 'WorkspaceInvitationController::index',
+        'select * from "workspace_members" where "workspace_id" = ? and "user_id" = ? and "role" in (?, ?) limit 1',
+        (WORKSPACE, USER, 'owner', 'admin')),
+    QueryShape(
+        'user.workspace_exists', 'User::workspaces()->where(workspaces.id)->exists()',
+        'select exists(select * from "workspaces" inner join "workspace_members" '
+        'on "workspaces"."id" = "workspace_members"."workspace_id" '
+        'where "workspace_members"."user_id" = ? and "workspaces"."id" = ?) as "exists"',
+        (USER, WORKSPACE)),
+    QueryShape(
+        'user.workspaces', 'WorkspaceController::index',
+        'select "workspaces".*, "workspace_members"."user_id" as "pivot_user_id", '
+        '"workspace_members"."workspace_id" as "pivot_workspace_id" from "workspaces" '
+        'inner join "workspace_members" on "workspaces"."id" = "workspace_members"."workspace_id" '
+        'where "workspace_members"."user_id" = ?',
+        (USER,)),
+    QueryShape(
+        'auth.token', 'Sanctum PersonalAccessToken::findToken',
+        'select * from "personal_access_tokens" where "token" = ? limit 1',
+        (TOKEN,)),
+
+    # CRM
+    QueryShape(
+        'crm.follow_up', 'CrmContactController::followUpNeeded',
+        'select * from "crm_contacts" where "workspace_id" = ? and ("last_contacted_at" is null '
+        'or "last_contacted_at" <= ?) order by "last_contacted_at" asc limit 15 offset 0',
+        (WORKSPACE, MONTH_AGO)),
+    QueryShape(
+        'crm.analytics', 'CrmContact::workspaceAnalytics',
+        'select workspace_id, COUNT(*) as total, SUM(CASE WHEN status = \'active\' THEN 1 ELSE 0 END) as active, '
+        'SUM(CASE WHEN last_contacted_at IS NULL OR last_contacted_at <= ? THEN 1 ELSE 0 END) as follow_up, '
+        'SUM(lead_score) as lead_score_sum from "crm_contacts" where "workspace_id" in (?) group by "workspace_id"',
+        (MONTH_AGO, WORKSPACE), expect_index=('crm_contacts', ('workspace_id',))),
+    QueryShape(
+        'products.analytics', 'Product::workspaceAnalytics',
+        'select workspace_id, COUNT(*) as total, SUM(CASE WHEN track_inventory = ? AND stock_quantity <= 0 '
+        'THEN 1 ELSE 0 END) as out_of_stock, SUM(price * stock_quantity) as inventory_value from "products" '
+        'where "workspace_id" in (?) group by "workspace_id"',
+        (1, WORKSPACE), expect_index=('products', ('workspace_id',))),
+    QueryShape(
+        'crm.import_orders', 'EcommerceContactImporter::run',
+        'select "id", "order_number", "customer_name", "customer_email", "customer_phone", "created_at" from "orders" '
+        'where "workspace_id" = ? and "customer_email" is not null and "id" > ? order by "id" asc limit 1000',
+        (WORKSPACE, CONTACT), expect_index=('orders', ('workspace_id', 'id'))),
+    QueryShape(
+        'crm.import_contacts', 'EcommerceContactImporter::importChunk',
+        'select * from "crm_contacts" where "email" in (?, ?)',
+        ('someone@example.com', 'other@example.com'), expect_index=('crm_contacts', ('email',))),
+    QueryShape(
+        'crm.contact_communications', 'CrmContactController::contactAnalytics',
+        'select * from "crm_communications" where "contact_id" = ? and "created_at" >= ?',
+        (CONTACT, MONTH_AGO)),
+    QueryShape(
+        'crm.contact_deals', 'CrmContactController::contactAnalytics',
+        'select * from "crm_deals" where "contact_id" = ?',
+        (CONTACT,)),
+    QueryShape(
+        'crm.deals_by_status', 'CrmDealController::index',
+        'select * from "crm_deals" where "workspace_id" = ? and "status" = ?',
+        (WORKSPACE, 'active')),
+
+    # Analytics by workspace and period
+    QueryShape(
+        'analytics.export', 'AnalyticsController::exportAnalytics',
+        'select * from "analytics" where "workspace_id" = ? and "timestamp" between ? and ? '
+        'order by "timestamp" desc',
+        (WORKSPACE, MONTH_AGO, NOW)),
+    QueryShape(
+        'analytics.realtime', 'AnalyticsController::getRealTimeAnalytics',
+        'select * from "analytics" where "workspace_id" = ? and "timestamp" >= ? '
+        'order by "timestamp" desc limit 100',
+        (WORKSPACE, MONTH_AGO)),
+    QueryShape(
+        'analytics.by_module', 'AnalyticsController::getAnalyticsOverview',
+        'select * from "analytics" where "workspace_id" = ? and "module" = ? and "action" = ?',
+        (WORKSPACE, 'crm', 'view')),
+
+    # Dashboard
+    QueryShape(
+        'dashboard.counters', 'WorkspaceCounter::forWorkspace',
+        'select * from "workspace_counters" where "workspace_counters"."workspace_id" = ? limit 1',
+        (WORKSPACE,)),
+    QueryShape(
+        'dashboard.activity', 'DashboardController::getRecentActivity',
+        'select * from "activity_logs" where "workspace_id" = ? order by "created_at" desc limit 10',
+        (WORKSPACE,)),
+    QueryShape(
+        'dashboard.reconcile_revenue', 'WorkspaceCounter::reconcile',
+        'select SUM(amount) as total, SUM(CASE WHEN created_at >= ? THEN amount ELSE 0 END) as month '
+        'from "payment_transactions" where "workspace_id" = ? and "payment_status" = ?',
+        (MONTH_AGO, WORKSPACE, 'paid')),
+    QueryShape(
+        'dashboard.reconcile_posts', 'WorkspaceCounter::reconcile',
+        'select count(*) as aggregate from "social_media_posts" where "workspace_id" = ?',
+        (WORKSPACE,)),
+
+    # Gamification
+    QueryShape(
+        'gamification.leaderboard', 'UserAchievement::getLeaderboard',
+        'select user_id, SUM(achievements.points) as total_points, COUNT(*) as total_achievements '
+        'from "user_achievements" inner join "achievements" '
+        'on "user_achievements"."achievement_id" = "achievements"."id" '
+        'where "workspace_id" = ? and "is_completed" = ? group by "user_id" order by "total_points" desc limit 20',
+        (WORKSPACE, 1), allow=(TEMP_SORT,)),
+]
+
+
+def explain(conn, shape):
+    """EXPLAIN QUERY PLAN rows as (id, parent, detail)"""
+    return [(row[0], row[1], row[3]) for row in conn.execute(f"EXPLAIN QUERY PLAN {shape.sql}", shape.params)]
+
+
+def indexes_covering(conn, table, columns):
+    """Names of the indexes on `table` whose leading columns are `columns`"""
+    names = []
+    for row in conn.execute(f'PRAGMA index_list("{table}")'):
+        indexed = [info[2] for info in conn.execute(f'PRAGMA index_info("{row[1]}")')]
+        if tuple(indexed[:len(columns)]) == tuple(columns):
+            names.append(row[1])
+    return names
+
+
+def issues_in(plan, shape, expected_names=()):
+    """Problems in a plan, as (kind, plan detail) pairs"""
+    found = []
+    for _, _, detail in plan:
+        text = detail.upper()
+        # "SCAN t" (SCAN TABLE t before SQLite 3.36) reads every row; constant
+        # subqueries and CTEs show up as SCAN too but carry no table name
+        if text.startswith('SCAN ') and 'SUBQUERY' not in text and 'CONSTANT ROW' not in text:
+            found.append((INDEX_SCAN if ' INDEX ' in f"{text} " else FULL_SCAN, detail))
+        if 'USE TEMP B-TREE' in text:
+            found.append((TEMP_SORT, detail))
+    if shape.expect_index:
+        table, columns = shape.expect_index
+        used = any(f"INDEX {name} " in f"{detail} " for name in expected_names for _, _, detail in plan)
+        if not used:
+            found.append((MISSING_INDEX, f"{table}({', '.join(columns)})"
+                                         + ('' if expected_names else ' does not exist')))
+    return [(kind, detail) for kind, detail in found if kind not in shape.allow]
+
+
+class PlanCheck:
+    def __init__(self, db_path=DEFAULT_DB_PATH, analyze=False):
+        if not os.path.exists(db_path):
+            raise FileNotFoundError(f"SQLite database not found: {db_path} (run php artisan migrate first)")
+        if analyze:
+            conn = sqlite3.connect(db_path)
+            conn.execute("ANALYZE")
+            conn.close()
+        self.conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+        self.has_stats = bool(self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'").fetchone())
+        self.results = []
+
+    def run(self, shapes):
+        for shape in shapes:
+            try:
+                plan = explain(self.conn, shape)
+                expected = indexes_covering(self.conn, *shape.expect_index) if shape.expect_index else ()
+                result = {'name': shape.name, 'source': shape.source, 'plan': [d for _, _, d in plan],
+                          'issues': issues_in(plan, shape, expected), 'error': None}
+            except sqlite3.Error as e:
+                # A missing table or column means the catalogue and schema drifted apart
+                result = {'name': shape.name, 'source': shape.source, 'plan': [], 'issues': [], 'error': str(e)}
+            self.results.append(result)
+        return self.results
+
+    def print_report(self, verbose=False):
+        print("=" * 80)
+        print(f"QUERY PLAN CHECK ({len(self.results)} query shapes)")
+        print("=" * 80)
+        if not self.has_stats:
+            print("⚠️ No sqlite_stat1 table; plans reflect an unanalyzed database (use --analyze on a seeded copy)")
+        header = f"{'QUERY':<32}{'SOURCE':<44}RESULT"
+        print(header)
+        print("-" * len(header))
+        for r in self.results:
+            if r['error']:
+                outcome = '❌ error'
+            elif r['issues']:
+                outcome = '❌ ' + ', '.join(sorted({kind for kind, _ in r['issues']}))
+            else:
+                outcome = '✅'
+            print(f"{r['name']:<32}{r['source'][:43]:<44}{outcome}")
+            if verbose or r['issues'] or r['error']:
+                for detail in r['plan']:
+                    print(f"{'':<6}{detail}")
+                for kind, detail in r['issues']:
+                    if kind == MISSING_INDEX:
+                        print(f"{'':<6}expected index on {detail}")
+                if r['error']:
+                    print(f"{'':<6}{r['error']}")
+        print()
+        failed = [r for r in self.results if r['issues'] or r['error']]
+        if failed:
+            print(f"❌ {len(failed)} of {len(self.results)} query shapes scan, sort in a temp B-tree or miss an index")
+        else:
+            print("✅ Every query shape is served by an index")
+        return not failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check the query plans of controller queries against SQLite")
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="Seeded SQLite database to explain against")
+    parser.add_argument('--analyze', action='store_true', help="Run ANALYZE first so plans use table statistics")
+    parser.add_argument('--only', action='append', default=[], metavar='PREFIX',
+                        help="Only check shapes whose name starts with this (repeatable)")
+    parser.add_argument('--list', action='store_true', help="List the catalogue without checking it")
+    parser.add_argument('--verbose', action='store_true', help="Print every plan, not only the failing ones")
+    parser.add_argument('--json', help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    shapes = [s for s in CATALOGUE if not args.only or any(s.name.startswith(p) for p in args.only)]
+    if args.list:
+        for shape in shapes:
+            print(f"{shape.name:<32}{shape.source}")
+        return 0
+
+    check = PlanCheck(args.db, args.analyze)
+    check.run(shapes)
+    ok = check.print_report(args.verbose)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(check.results, f, indent=2)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
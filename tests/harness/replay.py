@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Traffic record-and-replay for the Mewayz API
+TrafficRecorder is an ApiClient listener writing every request (method, path, JSON
+body, auth principal, timing, status and the ids the response created) to a compact
+JSONL replay log; set MEWAYZ_RECORD=path to record whatever a test script sends.
+TrafficReplayer re-issues a log against a target at 1x, 10x or maximum speed, maps
+ids and tokens created during the recording to the ones the target creates, and
+reports latency deltas per route.
+
+Replay logs contain request bodies, including test account passwords.
+
+Usage:
+    MEWAYZ_RECORD=crm_day.jsonl.gz python crm_test.py
+    python -m tests.harness.replay crm_day.jsonl.gz --speed 10 --base-url http://candidate:8001/api
+"""
+
+import argparse
+import json
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from tests.harness.client import DEFAULT_BASE_URL, ApiClient
+from tests.harness.metrics import LatencyHistogram, format_ms, route_template
+from tests.harness.seeding import unique_tag
+from tests.harness.sink import open_results
+
+SCHEMA_VERSION = 1
+
+# Response values remembered for substitution; short strings and integers are too
+# likely to collide with ordinary field values to be replaced safely
+ID_KEY = re.compile(r'(^id$|_id$)')
+MIN_ID_LENGTH = 8
+MAX_IDS_PER_RESPONSE = 50
+
+EMAIL = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+
+def extract_ids(document, prefix='', found=None):
+    """{'workspace.id': value, ...} for id-like string fields of a JSON response"""
+    found = {} if found is None else found
+    if len(found) >= MAX_IDS_PER_RESPONSE:
+        return found
+    if isinstance(document, dict):
+        for key, value in document.items():
+            path = f"{prefix}{key}"
+            if isinstance(value, (dict, list)):
+                extract_ids(value, f"{path}.", found)
+            elif isinstance(value, str) and len(value) >= MIN_ID_LENGTH and ID_KEY.search(str(key)):
+                found[path] = value
+    elif isinstance(document, list):
+        for index, value in enumerate(document):
+            extract_ids(value, f"{prefix}{index}.", found)
+    return found
+
+
+def lookup(document, path):
+    for part in path.split('.'):
+        if isinstance(document, list) and part.isdigit() and int(part) < len(document):
+            document = document[int(part)]
+        elif isinstance(document, dict) and part in document:
+            document = document[part]
+        else:
+            return None
+    return document
+
+
+def _bearer(headers):
+    value = headers.get('Authorization', '') if headers else ''
+    return value[7:] if value.startswith('Bearer ') else None
+
+
+def _json_or_none(payload):
+    if payload is None:
+        return None
+    try:
+        return json.loads(payload)
+    except (TypeError, ValueError):
+        return None
+
+
+class TrafficRecorder:
+    """
+    ApiClient listener writing one JSON line per request. Bearer tokens are replaced
+    by principal aliases ("p1", "p2", ...) so the log carries no live credentials;
+    a request whose response returned a token is marked as that principal's origin.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.start = time.perf_counter()
+        self.principals = {}
+        self.count = 0
+        self._lock = threading.Lock()
+        self._file = open_results(path, 'w')
+        self._write({'type': 'header', 'schema_version': SCHEMA_VERSION, 'started_at': datetime.now().isoformat()})
+
+    def attach(self, client):
+        client.add_listener(self)
+        return self
+
+    def _write(self, record):
+        self._file.write(json.dumps(record, separators=(',', ':'), default=str) + '\n')
+
+    def _principal(self, token):
+        if token is None:
+            return None
+        alias = self.principals.get(token)
+        if alias is None:
+            alias = self.principals[token] = f"p{len(self.principals) + 1}"
+        return alias
+
+    def __call__(self, method, endpoint, response, error, elapsed_ms):
+        offset_ms = (time.perf_counter() - self.start) * 1000 - elapsed_ms
+        record = {'t': round(max(offset_ms, 0), 1), 'm': method, 'p': endpoint, 'ms': round(elapsed_ms, 1)}
+        if response is None:
+            record['e'] = error
+        else:
+            record['s'] = response.status_code
+            request = response.request
+            body = _json_or_none(request.body)
+            if body is not None:
+                record['b'] = body
+            document = _json_or_none(response.content) if response.content else None
+            ids = extract_ids(document) if document is not None else {}
+            with self._lock:
+                principal = self._principal(_bearer(request.headers))
+                if principal:
+                    record['a'] = principal
+                token = document.get('token') if isinstance(document, dict) else None
+                if isinstance(token, str) and token not in self.principals:
+                    record['g'] = self._principal(token)
+            if ids:
+                record['ids'] = ids
+
+        with self._lock:
+            self._write(record)
+            self.count += 1
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def load_log(path):
+    """(header, entries) of a replay log"""
+    header, entries = None, []
+    with open_results(path, 'r') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if record.get('type') == 'header':
+                header = record
+            else:
+                entries.append(record)
+    if header is None or header.get('schema_version') != SCHEMA_VERSION:
+        raise ValueError(f"{path} is not a version {SCHEMA_VERSION} replay log")
+    return header, entries
+
+
+def _strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+
+
+def _path_values(endpoint):
+    path, _, query = endpoint.partition('?')
+    values = path.split('/')
+    for pair in query.split('&') if query else ():
+        values.append(pair.partition('=')[2])
+    return values
+
+
+def dependencies(entries):
+    """For each entry, the indexes of earlier entries that created an id or token it uses"""
+    producers = {}
+    result = []
+    for index, entry in enumerate(entries):
+        deps = set()
+        for value in _path_values(entry['p']) + list(_strings(entry.get('b'))):
+            producer = producers.get(value)
+            if producer is not None:
+                deps.add(producer)
+        principal = entry.get('a')
+        if principal and ('principal', principal) in producers:
+            deps.add(producers[('principal', principal)])
+        result.append(deps)
+        for value in entry.get('ids', {}).values():
+            producers.setdefault(value, index)
+        if entry.get('g'):
+            producers.setdefault(('principal', entry['g']), index)
+    return result
+
+
+class ReplayResult:
+    def __init__(self, entry, status, elapsed_ms, error=None):
+        self.entry = entry
+        self.status = status
+        self.elapsed_ms = elapsed_ms
+        self.error = error
+
+    @property
+    def mismatch(self):
+        recorded = self.entry.get('s')
+        return self.error is not None or (recorded is not None and (recorded < 400) != (self.status < 400))
+
+
+class TrafficReplayer:
+    """
+    Re-issues a replay log. Requests start at their recorded offset divided by `speed`
+    (speed 0 = as fast as the concurrency allows), but never before the requests that
+    created the ids and tokens they use have completed.
+    """
+
+    def __init__(self, entries, base_url=DEFAULT_BASE_URL, speed=1.0, concurrency=32, tokens=None,
+                 rewrite_emails=False, dependency_timeout=60):
+        self.entries = entries
+        self.client = ApiClient(base_url, pool_size=concurrency, retries=0)
+        self.speed = speed
+        self.concurrency = concurrency
+        self.tokens = dict(tokens or {})
+        self.rewrite_emails = rewrite_emails
+        self.dependency_timeout = dependency_timeout
+        self.deps = dependencies(entries)
+        self.done = [threading.Event() for _ in entries]
+        self.mapping = {}
+        self.emails = {}
+        self.tag = unique_tag()
+        self.results = [None] * len(entries)
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def _substitute(self, value):
+        if isinstance(value, str):
+            mapped = self.mapping.get(value)
+            if mapped is not None:
+                return mapped
+            if self.rewrite_emails and EMAIL.match(value):
+                # Keep re-registered accounts unique on a target that already has them
+                mapped = self.emails.get(value)
+                if mapped is None:
+                    mapped = self.emails[value] = f"r{self.tag}_{value}"
+                return mapped
+            return value
+        if isinstance(value, dict):
+            return {key: self._substitute(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._substitute(item) for item in value]
+        return value
+
+    def _substitute_endpoint(self, endpoint):
+        path, sep, query = endpoint.partition('?')
+        path = '/'.join(self.mapping.get(segment, segment) for segment in path.split('/'))
+        if query:
+            pairs = []
+            for pair in query.split('&'):
+                key, eq, value = pair.partition('=')
+                pairs.append(f"{key}{eq}{self.mapping.get(value, value)}")
+            query = '&'.join(pairs)
+        return f"{path}{sep}{query}"
+
+    def _send(self, index):
+        entry = self.entries[index]
+        try:
+            for dep in self.deps[index]:
+                self.done[dep].wait(self.dependency_timeout)
+
+            with self._lock:
+                endpoint = self._substitute_endpoint(entry['p'])
+                body = self._substitute(entry.get('b'))
+                token = self.tokens.get(entry.get('a'))
+            headers = {'Authorization': f'Bearer {token}'} if token else None
+
+            start = time.perf_counter()
+            response, error = self.client.request(entry['m'], endpoint, body, headers)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if response is None:
+                self.results[index] = ReplayResult(entry, None, None, error)
+                return
+            self.results[index] = ReplayResult(entry, response.status_code, elapsed_ms)
+
+            if entry.get('ids') or entry.get('g'):
+                document = _json_or_none(response.content)
+                with self._lock:
+                    for path, old in entry.get('ids', {}).items():
+                        new = lookup(document, path)
+                        if isinstance(new, str):
+                            self.mapping[old] = new
+                    if entry.get('g') and isinstance(document, dict) and document.get('token'):
+                        self.tokens[entry['g']] = document['token']
+        finally:
+            self.done[index].set()
+
+    def run(self):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for index, entry in enumerate(self.entries):
+                if self.speed:
+                    delay = entry['t'] / 1000 / self.speed - (time.perf_counter() - start)
+                    if delay > 0:
+                        time.sleep(delay)
+                executor.submit(self._send, index)
+        self.elapsed = time.perf_counter() - start
+        return self.results
+
+    def print_report(self):
+        results = [r for r in self.results if r is not None]
+        recorded_span = max((e['t'] + e.get('ms', 0) for e in self.entries), default=0) / 1000
+        mismatches = [r for r in results if r.mismatch]
+
+        print("\n" + "=" * 80)
+        speed = f"{self.speed:g}x" if self.speed else "max speed"
+        print(f"REPLAY ({len(results):,} requests at {speed}: {recorded_span:.1f}s recorded, "
+              f"{self.elapsed:.1f}s replayed)")
+        print("=" * 80)
+
+        routes = {}
+        for result in results:
+            key = f"{result.entry['m']} {route_template(result.entry['p'])}"
+            recorded, replayed, errors = routes.setdefault(key, (LatencyHistogram(), LatencyHistogram(), [0]))
+            if result.entry.get('ms') is not None and 's' in result.entry:
+                recorded.record(result.entry['ms'])
+            if result.elapsed_ms is not None:
+                replayed.record(result.elapsed_ms)
+            if result.mismatch:
+                errors[0] += 1
+
+        header = (f"{'ENDPOINT':<44}{'COUNT':>7}{'REC p50':>9}{'NEW p50':>9}{'Δp50':>8}"
+                  f"{'REC p95':>9}{'NEW p95':>9}{'Δp95':>8}{'DIFF':>6}")
+        print(header)
+        print("-" * len(header))
+        for key in sorted(routes, key=lambda k: -routes[k][1].count):
+            recorded, replayed, errors = routes[key]
+            cells = []
+            for p in (50, 95):
+                before, after = recorded.percentile(p), replayed.percentile(p)
+                delta = f"{(after - before) / before * 100:+.0f}%" if before and after is not None else '-'
+                cells.append(f"{format_ms(before):>9}{format_ms(after):>9}{delta:>8}")
+            print(f"{key[:43]:<44}{replayed.count:>7,}{''.join(cells)}{errors[0]:>6}")
+        print()
+
+        if mismatches:
+            print(f"❌ {len(mismatches)} request(s) succeeded when recorded but not on replay, or vice versa:")
+            for result in mismatches[:10]:
+                outcome = result.error or result.status
+                print(f"   • {result.entry['m']} {result.entry['p'][:60]}: recorded {result.entry.get('s')}, "
+                      f"replayed {outcome}")
+        else:
+            print("✅ Every request matched its recorded outcome")
+        print()
+        return not mismatches
+
+
+def parse_speed(value):
+    return 0.0 if value in ('max', '0') else float(value.rstrip('x'))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay recorded API traffic against a target")
+    parser.add_argument('log', help="Replay log written with MEWAYZ_RECORD")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help="Target to replay against")
+    parser.add_argument('--speed', type=parse_speed, default=1.0, help="1, 10 (x recorded speed) or max")
+    parser.add_argument('--concurrency', type=int, default=32, help="Maximum requests in flight")
+    parser.add_argument('--token', action='append', default=[], metavar='PRINCIPAL=TOKEN',
+                        help="Token for a principal whose login was not recorded (repeatable)")
+    parser.add_argument('--use-fixtures', action='store_true',
+                        help="Give principals whose login was not recorded a cached fixture token")
+    parser.add_argument('--rewrite-emails', action='store_true',
+                        help="Make emails unique so recorded registrations succeed on a non-empty target")
+    args = parser.parse_args(argv)
+
+    header, entries = load_log(args.log)
+    tokens = dict(item.split('=', 1) for item in args.token)
+    if args.use_fixtures:
+        from tests.harness.fixtures import FixturePool
+
+        produced = {entry['g'] for entry in entries if entry.get('g')}
+        unknown = sorted({entry['a'] for entry in entries if entry.get('a')} - produced - set(tokens))
+        pool = FixturePool(ApiClient(args.base_url))
+        fixtures = pool.ensure(len(unknown))
+        for principal, fixture in zip(unknown, fixtures):
+            tokens[principal] = fixture.token
+
+    print(f"🚀 Replaying {len(entries):,} requests recorded {header['started_at']} against {args.base_url}")
+    replayer = TrafficReplayer(entries, args.base_url, args.speed, args.concurrency, tokens, args.rewrite_emails)
+    replayer.run()
+    return 0 if replayer.print_report() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
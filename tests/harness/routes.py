@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+"""
+Route catalogue and generated read-path benchmark for the Mewayz API
+Parses backend/routes/api.php (groups, middleware, apiResource expansion) and the bound
+controller methods into an endpoint catalogue, fills route parameters from a fixture
+account and seeded data, benchmarks every GET route it can resolve and reports which
+routes no script exercises
+
+Usage:
+    python -m tests.harness.routes --list
+    python -m tests.harness.routes --coverage
+    python -m tests.harness.routes --requests 20 --db backend/database/database.sqlite
+    python -m tests.harness.routes --only '^/crm' --save-baseline routes.json
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+
+from tests.harness import baseline, budgets
+from tests.harness.client import DEFAULT_BASE_URL, ApiClient
+from tests.harness.metrics import MetricsRegistry, print_latency_table, route_template
+from tests.harness.seeding import REPO_ROOT
+
+ROUTES_PATH = os.path.join(REPO_ROOT, 'backend', 'routes', 'api.php')
+CONTROLLERS_DIR = os.path.join(REPO_ROOT, 'backend', 'app', 'Http', 'Controllers')
+
+# Where scripts live whose literal endpoints count as coverage: (directory, recursive)
+SCRIPT_DIRS = (
+    (REPO_ROOT, False),
+    (os.path.join(REPO_ROOT, 'tests', 'scripts'), True),
+    (os.path.join(REPO_ROOT, 'tests', 'suite'), True),
+)
+
+RESOURCE_ACTIONS = (
+    ('GET', '', 'index'),
+    ('POST', '', 'store'),
+    ('GET', '/{param}', 'show'),
+    ('PUT', '/{param}', 'update'),
+    ('PATCH', '/{param}', 'update'),
+    ('DELETE', '/{param}', 'destroy'),
+)
+
+# Parameters that are not row ids, with a value every workspace can use
+DEFAULT_PARAMS = {
+    'goalId': 'instagram_management',
+    'module': 'crm',
+}
+
+# Parameters whose table cannot be derived from the name: (uri prefix, param) -> (table, column)
+PARAM_TABLES = {
+    (None, 'token'): ('workspace_invitations', 'token'),
+    (None, 'slug'): ('link_in_bio_pages', 'slug'),
+    (None, 'campaignId'): ('email_campaigns', 'id'),
+    (None, 'sessionId'): ('payment_transactions', 'session_id'),
+    ('/marketplace/templates', 'id'): ('templates', 'id'),
+    ('/marketplace/collections', 'id'): ('template_collections', 'id'),
+    ('/creator/templates', 'id'): ('templates', 'id'),
+    ('/team/members', 'id'): ('workspace_members', 'id'),
+    ('/team/roles', 'id'): ('team_roles', 'id'),
+    ('/team/notifications', 'id'): ('team_notifications', 'id'),
+}
+
+# GET routes the generated benchmark must not call, with the reason shown in the report
+SKIPPED = {
+    '/auth/google': "redirects to Google OAuth",
+    '/auth/google/callback': "needs an OAuth callback code",
+    '/payments/checkout/status/{sessionId}': "looks the session up in Stripe",
+}
+
+_ROUTE = re.compile(r"Route::(get|post|put|patch|delete)\(\s*'([^']*)'\s*,\s*\[(\w+)::class\s*,\s*'(\w+)'\]")
+_RESOURCE = re.compile(r"Route::apiResource\(\s*'([^']*)'\s*,\s*(\w+)::class\s*\)((?:->(?:only|except)\(\[[^\]]*\]\))*)")
+_GROUP = re.compile(r"Route::((?:(?:middleware|prefix)\([^)]*\)->)*)group\(")
+_GROUP_OPTION = re.compile(r"(middleware|prefix)\(\s*\[?'([^']*)'")
+_ROUTE_MIDDLEWARE = re.compile(r"->middleware\(\s*'([^']*)'")
+_STRINGS = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+_PARAM = re.compile(r'\{(\w+)\??\}')
+_INPUT = re.compile(r"\$request->(?:input|get|query|has|filled)\(\s*'(\w+)'|\$request->(\w+)\b(?!\s*\()")
+_VALIDATE = re.compile(r"(?:->validate\(|Validator::make\([^,]+,)\s*\[")
+_RULE = re.compile(r"'([\w.*]+)'\s*=>\s*(?:'([^']*)'|\[)")
+_CALL = re.compile(r"""['"](GET|POST|PUT|PATCH|DELETE)['"]\s*,\s*f?['"](/[^'"?]*)""")
+
+REQUEST_PROPERTIES = {'user', 'input', 'validate', 'all', 'only', 'except', 'file', 'header', 'ip', 'route', 'merge'}
+
+
+class Route:
+    def __init__(self, method, uri, controller, action, middleware=(), line=None):
+        self.method = method
+        self.uri = uri
+        self.controller = controller
+        self.action = action
+        self.middleware = tuple(middleware)
+        self.line = line
+        self.params = _PARAM.findall(uri)
+        self.inputs = []
+        self.required_inputs = []
+        self.exists = None
+        self.scripts = []
+
+    @property
+    def key(self):
+        return f"{self.method} {self.uri}"
+
+    @property
+    def authenticated(self):
+        return any(m.startswith('auth') for m in self.middleware)
+
+    @property
+    def pattern(self):
+        """Regex matching concrete or f-string paths for this route"""
+        parts = re.split(r'\{\w+\??\}', self.uri)
+        return re.compile('^' + r'(?:\{[^}]*\}|[^/{}]+)'.join(re.escape(p) for p in parts) + '/?$')
+
+    def to_dict(self):
+        return {
+            'method': self.method,
+            'uri': self.uri,
+            'action': f"{self.controller}@{self.action}",
+            'middleware': list(self.middleware),
+            'params': self.params,
+            'inputs': self.inputs,
+            'required_inputs': self.required_inputs,
+            'controller_method_found': self.exists,
+            'scripts': self.scripts,
+        }
+
+
+def resource_param(name):
+    """Laravel's apiResource wildcard: crm-contacts -> crm_contact"""
+    last = name.split('/')[-1].replace('-', '_')
+    return last[:-3] + 'y' if last.endswith('ies') else last[:-1] if last.endswith('s') else last
+
+
+def parse_routes(path=ROUTES_PATH):
+    """Read api.php into Route objects, tracking group middleware/prefixes by brace depth"""
+    with open(path) as f:
+        lines = f.read().splitlines()
+
+    routes = []
+    groups = []  # (depth at which the group closes, middleware, prefix)
+    depth = 0
+    for number, line in enumerate(lines, 1):
+        code = line.split('//', 1)[0] if line.lstrip().startswith('//') else line
+        middleware = [name for _, names, _ in groups for name in names]
+        prefix = ''.join(p for _, _, p in groups)
+
+        group = _GROUP.search(code)
+        if group:
+            options = _GROUP_OPTION.findall(group.group(1))
+            groups.append((depth, [v for k, v in options if k == 'middleware'],
+                           ''.join('/' + v.strip('/') for k, v in options if k == 'prefix')))
+
+        for method, uri, controller, action in _ROUTE.findall(code):
+            extra = _ROUTE_MIDDLEWARE.findall(code)
+            routes.append(Route(method.upper(), normalize_uri(prefix, uri), controller, action, middleware + extra,
+                                number))
+
+        resource = _RESOURCE.search(code)
+        if resource:
+            name, controller, modifiers = resource.groups()
+            only = re.findall(r"only\(\[([^\]]*)\]", modifiers)
+            only = set(re.findall(r"'(\w+)'", only[0])) if only else None
+            except_ = re.findall(r"except\(\[([^\]]*)\]", modifiers)
+            except_ = set(re.findall(r"'(\w+)'", except_[0])) if except_ else set()
+            base = normalize_uri(prefix, name)
+            for method, suffix, action in RESOURCE_ACTIONS:
+                if (only is not None and action not in only) or action in except_:
+                    continue
+                routes.append(Route(method, base + suffix.replace('param', resource_param(name)), controller, action,
+                                    middleware, number))
+
+        stripped = _STRINGS.sub("''", code)
+        depth += stripped.count('{') - stripped.count('}')
+        while groups and depth <= groups[-1][0]:
+            groups.pop()
+    return routes
+
+
+def normalize_uri(prefix, uri):
+    return '/' + '/'.join(part.strip('/') for part in (prefix, uri) if part.strip('/'))
+
+
+def balanced(source, start, opening='{', closing='}'):
+    """Text from the bracket at `start` to its matching close"""
+    depth = 0
+    for index in range(start, len(source)):
+        if source[index] == opening:
+            depth += 1
+        elif source[index] == closing:
+            depth -= 1
+            if depth == 0:
+                return source[start:index + 1]
+    return source[start:]
+
+
+def method_body(source, name):
+    """Source of a PHP method found by brace matching, or None"""
+    match = re.search(r'function\s+' + re.escape(name) + r'\s*\(', source)
+    if not match:
+        return None
+    return balanced(source, source.find('{', match.end()))
+
+
+def bind_controllers(routes, controllers_dir=CONTROLLERS_DIR):
+    """Attach the request inputs each controller action reads or validates"""
+    sources = {}
+    for route in routes:
+        if route.controller not in sources:
+            path = os.path.join(controllers_dir, f"{route.controller}.php")
+            sources[route.controller] = open(path).read() if os.path.exists(path) else None
+        source = sources[route.controller]
+        body = method_body(source, route.action) if source else None
+        route.exists = body is not None
+        if body is None:
+            continue
+
+        inputs = []
+        for named, attribute in _INPUT.findall(body):
+            name = named or attribute
+            if name and name not in REQUEST_PROPERTIES and name not in inputs:
+                inputs.append(name)
+        required = []
+        for validate in _VALIDATE.finditer(body):
+            rules = balanced(body, validate.end() - 1, '[', ']')
+            for name, rule in _RULE.findall(rules):
+                if '.' in name:
+                    continue
+                if name not in inputs:
+                    inputs.append(name)
+                if rule and 'required' in rule.split('|'):
+                    required.append(name)
+        route.inputs = inputs
+        route.required_inputs = required
+    return routes
+
+
+def find_script_calls(dirs=SCRIPT_DIRS):
+    """(method, path, file) for every literal make_request('METHOD', '/path') style call"""
+    calls = []
+    for directory, recursive in dirs:
+        for root, subdirs, files in os.walk(directory):
+            subdirs[:] = [d for d in subdirs if recursive and d != '__pycache__']
+            for name in files:
+                if not name.endswith('.py'):
+                    continue
+                path = os.path.join(root, name)
+                with open(path, errors='replace') as f:
+                    source = f.read()
+                relative = os.path.relpath(path, REPO_ROOT)
+                calls.extend((method, endpoint, relative) for method, endpoint in _CALL.findall(source))
+    return calls
+
+
+def mark_coverage(routes, calls):
+    for route in routes:
+        pattern = route.pattern
+        route.scripts = sorted({path for method, endpoint, path in calls
+                                if method == route.method and pattern.match(endpoint)})
+    return routes
+
+
+def catalogue():
+    routes = bind_controllers(parse_routes())
+    return mark_coverage(routes, find_script_calls())
+
+
+class ParamResolver:
+    """
+    Fills route parameters: explicit overrides first, then the fixture's workspace, then a
+    row from the seeded SQLite database, then the first id listed by the matching index route
+    """
+
+    def __init__(self, client, headers, workspace_id, routes, db_path=None, overrides=None):
+        self.client = client
+        self.headers = headers
+        self.workspace_id = workspace_id
+        self.index_routes = {r.uri: r for r in routes if r.method == 'GET' and not r.params}
+        self.overrides = dict(DEFAULT_PARAMS, **(overrides or {}))
+        self.conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True) if db_path and os.path.exists(db_path) \
+            else None
+        self.cache = {}
+
+    def table_for(self, route, param):
+        for (prefix, name), target in PARAM_TABLES.items():
+            if name == param and (prefix is None or route.uri.startswith(prefix + '/')):
+                return target
+        snake = re.sub(r'(?<!^)(?=[A-Z])', '_', param).lower()
+        table = snake[:-1] + 'ies' if snake.endswith('y') else snake + 's'
+        return table, 'id'
+
+    def from_db(self, table, column):
+        if self.conn is None:
+            return None
+        try:
+            columns = {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            if column not in columns:
+                return None
+            if 'workspace_id' in columns:
+                row = self.conn.execute(f"SELECT {column} FROM {table} WHERE workspace_id = ? AND {column} IS NOT NULL "
+                                        f"LIMIT 1", (self.workspace_id,)).fetchone()
+            else:
+                row = self.conn.execute(f"SELECT {column} FROM {table} WHERE {column} IS NOT NULL LIMIT 1").fetchone()
+        except sqlite3.Error:
+            return None
+        return str(row[0]) if row else None
+
+    def from_index(self, table, column):
+        uri = '/' + table.replace('_', '-')
+        if uri not in self.index_routes:
+            return None
+        response, error = self.client.request('GET', f"{uri}?workspace_id={self.workspace_id}",
+                                              headers=self.headers)
+        if error or response.status_code != 200:
+            return None
+        try:
+            return first_value(response.json(), column)
+        except ValueError:
+            return None
+
+    def resolve(self, route, param):
+        if param in self.overrides:
+            return self.overrides[param]
+        if param in ('workspace', 'workspaceId', 'workspace_id'):
+            return self.workspace_id
+        table, column = self.table_for(route, param)
+        if (table, column) not in self.cache:
+            self.cache[(table, column)] = self.from_db(table, column) or self.from_index(table, column)
+        return self.cache[(table, column)]
+
+    def path_for(self, route):
+        """Concrete request path for a route, or (None, missing params)"""
+        path = route.uri
+        missing = []
+        for param in route.params:
+            value = self.resolve(route, param)
+            if value is None:
+                missing.append(param)
+            else:
+                path = re.sub(r'\{' + param + r'\??\}', value, path)
+        if missing:
+            return None, missing
+        if 'workspace_id' in route.inputs:
+            path += f"?workspace_id={self.workspace_id}"
+        return path, []
+
+
+def first_value(document, column):
+    """First `column` value of the first list of objects found in a JSON response"""
+    if isinstance(document, list):
+        for item in document:
+            if isinstance(item, dict) and item.get(column) is not None:
+                return str(item[column])
+        return None
+    if isinstance(document, dict):
+        for value in document.values():
+            if isinstance(value, (list, dict)):
+                found = first_value(value, column)
+                if found is not None:
+                    return found
+    return None
+
+
+class RouteBenchmark:
+    def __init__(self, client, routes, resolver, headers, requests=20, warmup=1):
+        self.client = client
+        self.routes = routes
+        self.resolver = resolver
+        self.headers = headers
+        self.requests = requests
+        self.warmup = warmup
+        self.registry = MetricsRegistry()
+        self.results = {}
+        self.elapsed = 0
+
+    def plan(self):
+        """[(route, path or None, reason)] for every GET route"""
+        planned = []
+        for route in self.routes:
+            if route.method != 'GET':
+                continue
+            if route.uri in SKIPPED:
+                planned.append((route, None, SKIPPED[route.uri]))
+                continue
+            if not route.exists:
+                planned.append((route, None, f"{route.controller}@{route.action} not found"))
+                continue
+            missing_inputs = [name for name in route.required_inputs if name != 'workspace_id']
+            if missing_inputs:
+                planned.append((route, None, f"needs input {', '.join(missing_inputs)}"))
+                continue
+            path, missing = self.resolver.path_for(route)
+            planned.append((route, path, f"no value for {{{', '.join(missing)}}}" if missing else None))
+        return planned
+
+    def run(self, planned):
+        start = time.perf_counter()
+        for route, path, reason in planned:
+            if path is None:
+                self.results[route.key] = {'route': route, 'skipped': reason}
+                continue
+            headers = self.headers if route.authenticated else None
+            for _ in range(self.warmup):
+                self.client.request('GET', path, headers=headers)
+            self.client.add_listener(self.registry)
+            try:
+                for _ in range(self.requests):
+                    self.client.request('GET', path, headers=headers)
+            finally:
+                self.client.remove_listener(self.registry)
+            self.results[route.key] = {'route': route, 'path': path,
+                                       'stats': self.registry.endpoints.get(('GET', route_template(path)))}
+        self.elapsed = time.perf_counter() - start
+
+    def print_report(self):
+        print("\n" + "=" * 80)
+        print("GENERATED READ-PATH BENCHMARK")
+        print("=" * 80)
+        print_latency_table(self.registry, title=f"GET ROUTES ({self.requests} requests each)")
+
+        failing = [(key, r['stats']) for key, r in self.results.items()
+                   if r.get('stats') is not None and r['stats'].errors]
+        for key, stats in failing:
+            statuses = ', '.join(f"{s}={c}" for s, c in sorted(stats.statuses.items(), key=str))
+            print(f"❌ {key}: {statuses}")
+        skipped = [(key, r['skipped']) for key, r in self.results.items() if 'skipped' in r]
+        if skipped:
+            print(f"\n⚠️ {len(skipped)} GET routes not benchmarked:")
+            for key, reason in skipped:
+                print(f"   {key:<56} {reason}")
+        benchmarked = len(self.results) - len(skipped)
+        print(f"\n📊 {benchmarked}/{len(self.results)} GET routes benchmarked in {self.elapsed:.1f}s")
+
+    def to_dict(self):
+        results = []
+        for key, result in self.results.items():
+            entry = {'route': key}
+            if 'skipped' in result:
+                entry['skipped'] = result['skipped']
+            else:
+                stats = result['stats']
+                entry.update({'path': result['path'], 'count': stats.count, 'error_rate': stats.error_rate,
+                              'p50': stats.latency.percentile(50), 'p95': stats.latency.percentile(95),
+                              'queries': stats.queries.mean})
+            results.append(entry)
+        return results
+
+
+def print_catalogue(routes):
+    print(f"{'METHOD':<7}{'URI':<50}{'ACTION':<58}{'INPUTS'}")
+    print("-" * 130)
+    for route in routes:
+        action = f"{route.controller}@{route.action}" + ("" if route.exists else " (missing)")
+        print(f"{route.method:<7}{route.uri:<50}{action:<58}{', '.join(route.inputs)}")
+    print(f"\n{len(routes)} routes")
+
+
+def print_coverage(routes, benchmarked=()):
+    """Routes no script calls; GET routes the generated benchmark reached count as covered"""
+    uncovered = [r for r in routes if not r.scripts and r.key not in benchmarked]
+    scripted = sum(1 for r in routes if r.scripts)
+    print("\n" + "=" * 80)
+    print("ROUTE COVERAGE")
+    print("=" * 80)
+    print(f"Called by scripts: {scripted}/{len(routes)}")
+    if benchmarked:
+        print(f"Covered by the generated benchmark only: "
+              f"{sum(1 for r in routes if not r.scripts and r.key in benchmarked)}")
+    print(f"Uncovered: {len(uncovered)}")
+    controller = None
+    for route in sorted(uncovered, key=lambda r: (r.controller, r.uri, r.method)):
+        if route.controller != controller:
+            controller = route.controller
+            print(f"\n  {controller}")
+        print(f"    {route.method:<7}{route.uri:<50}{route.action}")
+    print()
+    return uncovered
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Catalogue api.php routes and benchmark every GET route")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--list', action='store_true', help="Print the endpoint catalogue and exit")
+    parser.add_argument('--coverage', action='store_true', help="Only report which routes no script calls")
+    parser.add_argument('--only', help="Regex on the route URI to restrict the benchmark")
+    parser.add_argument('--requests', type=int, default=20, help="Measured requests per GET route")
+    parser.add_argument('--warmup', type=int, default=1, help="Unmeasured requests per route first")
+    parser.add_argument('--db', default=None, help="Seeded SQLite database to take route parameter values from")
+    parser.add_argument('--param', action='append', default=[], metavar='NAME=VALUE',
+                        help="Fixed value for a route parameter, e.g. crmContact=<uuid>")
+    parser.add_argument('--token', default=None, help="Bearer token (default: a cached fixture account)")
+    parser.add_argument('--workspace', default=None, help="Workspace id to use with --token")
+    parser.add_argument('--json', help="Write catalogue, benchmark results and coverage to this file")
+    baseline.add_arguments(parser)
+    budgets.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    routes = catalogue()
+    if args.list:
+        print_catalogue(routes)
+        return 0
+    if args.coverage:
+        print_coverage(routes)
+        return 0
+
+    client = ApiClient(args.base_url, retries=0)
+    token, workspace_id = args.token, args.workspace
+    if token is None:
+        from tests.harness.fixtures import shared_fixture
+
+        fixture = shared_fixture(client)
+        if fixture is None:
+            print("❌ Could not provision a fixture account; pass --token and --workspace")
+            return 1
+        token, workspace_id = fixture.token, workspace_id or fixture.workspace_id
+    if not workspace_id:
+        parser.error("--workspace is required with --token")
+    headers = {'Accept': 'application/json', 'Authorization': f'Bearer {token}'}
+
+    overrides = dict(value.split('=', 1) for value in args.param)
+    resolver = ParamResolver(client, headers, workspace_id, routes, args.db, overrides)
+    selected = [r for r in routes if not args.only or re.search(args.only, r.uri)]
+    benchmark = RouteBenchmark(client, selected, resolver, headers, args.requests, args.warmup)
+
+    print(f"🚀 Benchmarking {sum(1 for r in selected if r.method == 'GET')} GET routes from {ROUTES_PATH}")
+    print("=" * 50)
+    benchmark.run(benchmark.plan())
+    benchmark.print_report()
+    benchmarked = {key for key, result in benchmark.results.items() if 'stats' in result}
+    uncovered = print_coverage(routes, benchmarked)
+
+    success = baseline.gate(benchmark.registry, benchmark.elapsed, args.save_baseline, args.compare_baseline,
+                            args.baseline_label, 'routes', baseline.tolerances_from_args(args),
+                            baseline.load_overrides(args.tolerance_overrides), throughput=False)
+    success = budgets.enforce(benchmark.registry, budgets.load_budgets(args.query_budgets)) and success
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({
+                'catalogue': [route.to_dict() for route in routes],
+                'benchmark': benchmark.to_dict(),
+                'uncovered': [route.key for route in uncovered],
+            }, f, indent=2)
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
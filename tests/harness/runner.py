@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Dependency-aware concurrent runner for tester methods
+Each test declares the shared state it needs (auth, workspace, ...) and the state it
+creates; independent tests run concurrently while output stays in declaration order
+"""
+
+import os
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+DEFAULT_CONCURRENCY = int(os.environ.get('MEWAYZ_TEST_CONCURRENCY', '8'))
+
+
+def requires(*resources):
+    """Declare the shared resources a test method needs before it can run"""
+    def decorator(func):
+        func.requires = tuple(resources)
+        return func
+    return decorator
+
+
+def provides(*resources):
+    """Declare the shared resources a test method creates or replaces"""
+    def decorator(func):
+        func.provides = tuple(resources)
+        return func
+    return decorator
+
+
+def exclusive(func):
+    """Mark a test that mutates shared tester state and must not overlap other tests"""
+    func.exclusive = True
+    return func
+
+
+class _ThreadLocalStdout:
+    """Routes writes from runner threads into per-test buffers"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def capture(self, buffer):
+        self._local.buffer = buffer
+
+    def release(self):
+        self._local.buffer = None
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is not None:
+            buffer.append(text)
+            return len(text)
+        return self._stream.write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class _ThreadLocalResults(list):
+    """Collects results appended by runner threads into per-test buckets"""
+
+    def __init__(self, existing):
+        super().__init__(existing)
+        self._local = threading.local()
+
+    def capture(self, bucket):
+        self._local.bucket = bucket
+
+    def release(self):
+        self._local.bucket = None
+
+    def append(self, item):
+        bucket = getattr(self._local, 'bucket', None)
+        if bucket is not None:
+            bucket.append(item)
+        else:
+            super().append(item)
+
+
+class TestNode:
+    def __init__(self, index, func, requires, provides, critical, exclusive, on_fail, header):
+        self.index = index
+        self.func = func
+        self.requires = requires
+        self.provides = provides
+        self.critical = critical
+        self.exclusive = exclusive
+        self.on_fail = on_fail
+        self.header = header
+        self.dependencies = set()
+        self.output = []
+        self.results = []
+        self.success = None
+        self.done = False
+
+    @property
+    def name(self):
+        return getattr(self.func, '__name__', repr(self.func))
+
+
+class DependencyRunner:
+    """
+    Runs test callables as a DAG on a thread pool.
+
+    A test waits for every earlier test that provides one of the resources it requires,
+    and for every earlier critical test. A critical test returning False stops the run.
+    Exclusive tests (e.g. ones that temporarily clear the shared token) run alone.
+    """
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+        self.nodes = []
+
+    def add(self, func, requires=None, provides=None, critical=False, exclusive=None, on_fail=None, header=None):
+        """Register a test; requires/provides/exclusive default to the method's decorators"""
+        node = TestNode(
+            len(self.nodes),
+            func,
+            tuple(requires if requires is not None else getattr(func, 'requires', ())),
+            tuple(provides if provides is not None else getattr(func, 'provides', ())),
+            critical,
+            exclusive if exclusive is not None else getattr(func, 'exclusive', False),
+            on_fail,
+            header
+        )
+
+        for earlier in self.nodes:
+            if earlier.critical or set(earlier.provides) & set(node.requires):
+                node.dependencies.add(earlier.index)
+
+        self.nodes.append(node)
+        return node
+
+    def run(self, tester):
+        """Run every registered test against tester, returning False if a critical test failed"""
+        stdout = _ThreadLocalStdout(sys.stdout)
+        results = _ThreadLocalResults(tester.test_results)
+        original_stdout, original_results = sys.stdout, tester.test_results
+        sys.stdout, tester.test_results = stdout, results
+
+        stopped = None
+        emitted = 0
+        try:
+            with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+                waiting = list(self.nodes)
+                running = {}
+
+                while waiting or running:
+                    if stopped is None:
+                        for node in list(waiting):
+                            if len(running) >= self.concurrency:
+                                break
+                            if not all(self.nodes[dep].done for dep in node.dependencies):
+                                continue
+                            if node.exclusive or any(n.exclusive for n in running.values()):
+                                if running:
+                                    break
+                                waiting.remove(node)
+                                running[executor.submit(self._execute, node, stdout, results)] = node
+                                break
+                            waiting.remove(node)
+                            running[executor.submit(self._execute, node, stdout, results)] = node
+
+                    if not running:
+                        break
+
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        node = running.pop(future)
+                        future.result()
+                        node.done = True
+                        if node.critical and not node.success and stopped is None:
+                            stopped = node
+                            waiting.clear()
+
+                    emitted = self._emit(emitted, original_stdout, original_results)
+        finally:
+            sys.stdout, tester.test_results = original_stdout, original_results
+
+        return stopped is None
+
+    def _execute(self, node, stdout, results):
+        stdout.capture(node.output)
+        results.capture(node.results)
+        try:
+            node.success = node.func() is not False
+        except Exception as e:
+            print(f"❌ {node.name} raised {type(e).__name__}: {e}")
+            node.success = False
+        finally:
+            stdout.release()
+            results.release()
+
+    def _emit(self, emitted, stream, results):
+        """Flush finished tests in declaration order"""
+        while emitted < len(self.nodes) and self.nodes[emitted].done:
+            node = self.nodes[emitted]
+            if node.header:
+                stream.write(node.header)
+            stream.write(''.join(node.output))
+            results.extend(node.results)
+            if not node.success and node.on_fail:
+                stream.write(node.on_fail + '\n')
+            emitted += 1
+            if node.critical and not node.success:
+                break
+        stream.flush()
+        return emitted
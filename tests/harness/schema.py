@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Schema model read from the Laravel migrations
+Parses the up() method of every backend/database/migrations/*.php file into tables with
+typed columns (nullability, defaults, enum values, lengths, uniqueness) and foreign keys,
+and orders the tables so every referenced table comes before the tables pointing at it
+
+Usage:
+    python -m tests.harness.schema              # dependency-ordered table list
+    python -m tests.harness.schema crm_deals    # columns and foreign keys of one table
+"""
+
+import argparse
+import glob
+import os
+import re
+import sys
+
+from tests.harness.routes import balanced, method_body
+from tests.harness.seeding import REPO_ROOT
+
+MIGRATIONS_DIR = os.path.join(REPO_ROOT, 'backend', 'database', 'migrations')
+
+# Laravel framework tables nothing in the app writes rows to directly
+FRAMEWORK_TABLES = frozenset(['cache', 'cache_locks', 'jobs', 'job_batches', 'failed_jobs', 'sessions',
+                              'password_reset_tokens', 'personal_access_tokens', 'migrations'])
+
+COLUMN_TYPES = {
+    'uuid': 'uuid', 'string': 'string', 'char': 'string', 'ipAddress': 'string',
+    'text': 'text', 'mediumText': 'text', 'longText': 'text',
+    'integer': 'integer', 'bigInteger': 'integer', 'smallInteger': 'integer', 'tinyInteger': 'integer',
+    'unsignedInteger': 'integer', 'unsignedBigInteger': 'integer', 'unsignedSmallInteger': 'integer',
+    'unsignedTinyInteger': 'integer', 'year': 'integer',
+    'decimal': 'decimal', 'float': 'decimal', 'double': 'decimal',
+    'boolean': 'boolean', 'json': 'json', 'jsonb': 'json', 'enum': 'enum',
+    'timestamp': 'timestamp', 'dateTime': 'timestamp', 'datetime': 'timestamp', 'date': 'date', 'time': 'time',
+    'foreignUuid': 'uuid', 'foreignId': 'integer',
+}
+
+_SCHEMA = re.compile(r"Schema::(create|table)\(\s*'(\w+)'\s*,\s*function\s*\(\s*Blueprint\s+\$table\s*\)\s*\{")
+_STATEMENT = re.compile(r"\$table->(\w+)\((.*?)\)((?:->\w+\([^;]*?\))*)\s*;", re.S)
+_STRING = re.compile(r"'([^']*)'")
+_NUMBER = re.compile(r"^\s*(\d+)")
+_DEFAULT = re.compile(r"->default\(\s*([^)]*?)\s*\)")
+
+
+class Column:
+    def __init__(self, name, kind, nullable=False, default=None, length=None, precision=None, scale=None,
+                 values=None, unique=False, primary=False, autoincrement=False):
+        self.name = name
+        self.kind = kind
+        self.nullable = nullable
+        self.default = default
+        self.length = length
+        self.precision = precision
+        self.scale = scale
+        self.values = values or []
+        self.unique = unique
+        self.primary = primary
+        self.autoincrement = autoincrement
+
+    def describe(self):
+        detail = self.kind
+        if self.values:
+            detail += f"({', '.join(self.values)})"
+        elif self.precision:
+            detail += f"({self.precision},{self.scale})"
+        elif self.length:
+            detail += f"({self.length})"
+        flags = [flag for flag, on in (('primary', self.primary), ('unique', self.unique),
+                                       ('nullable', self.nullable)) if on]
+        if self.default is not None:
+            flags.append(f"default {self.default}")
+        return f"{self.name:<28}{detail:<40}{' '.join(flags)}"
+
+
+class ForeignKey:
+    def __init__(self, column, table, references='id', on_delete=None):
+        self.column = column
+        self.table = table
+        self.references = references
+        self.on_delete = on_delete
+
+
+class Table:
+    def __init__(self, name):
+        self.name = name
+        self.columns = {}
+        self.foreign_keys = []
+        self.unique_sets = []
+        self.migrations = []
+
+    @property
+    def primary_key(self):
+        for column in self.columns.values():
+            if column.primary:
+                return column
+        return None
+
+    def foreign_key(self, column):
+        for foreign_key in self.foreign_keys:
+            if foreign_key.column == column:
+                return foreign_key
+        return None
+
+    @property
+    def dependencies(self):
+        return {fk.table for fk in self.foreign_keys if fk.table != self.name}
+
+
+def parse_default(modifiers):
+    match = _DEFAULT.search(modifiers)
+    if not match:
+        return None
+    value = match.group(1)
+    if value.startswith("'"):
+        return value.strip("'")
+    return {'true': 1, 'false': 0, 'null': None}.get(value.lower(), value)
+
+
+def apply_statement(table, method, args, modifiers):
+    """Fold one $table->method(args)->modifiers(); statement into the table"""
+    strings = _STRING.findall(args)
+    name = strings[0] if strings else None
+
+    if method == 'id':
+        table.columns['id'] = Column('id', 'integer', primary=True, autoincrement=True)
+    elif method == 'timestamps':
+        for column in ('created_at', 'updated_at'):
+            table.columns[column] = Column(column, 'timestamp', nullable=True)
+    elif method == 'softDeletes':
+        table.columns['deleted_at'] = Column('deleted_at', 'timestamp', nullable=True)
+    elif method == 'rememberToken':
+        table.columns['remember_token'] = Column('remember_token', 'string', nullable=True, length=100)
+    elif method in ('uuidMorphs', 'morphs', 'nullableUuidMorphs', 'nullableMorphs'):
+        nullable = method.startswith('nullable')
+        table.columns[f"{name}_type"] = Column(f"{name}_type", 'string', nullable=nullable)
+        table.columns[f"{name}_id"] = Column(f"{name}_id", 'uuid' if 'Uuid' in method or 'uuid' in method else
+                                             'integer', nullable=nullable)
+    elif method == 'foreign' and name:
+        target = re.search(r"->on\(\s*'(\w+)'", modifiers)
+        references = re.search(r"->references\(\s*'(\w+)'", modifiers)
+        on_delete = re.search(r"->onDelete\(\s*'([\w ]+)'", modifiers)
+        if target:
+            existing = table.foreign_key(name)
+            if existing:
+                table.foreign_keys.remove(existing)
+            table.foreign_keys.append(ForeignKey(name, target.group(1), references.group(1) if references else 'id',
+                                                 on_delete.group(1) if on_delete else None))
+    elif method == 'dropForeign':
+        for column in strings:
+            existing = table.foreign_key(column)
+            if existing:
+                table.foreign_keys.remove(existing)
+    elif method == 'dropColumn':
+        for column in strings:
+            table.columns.pop(column, None)
+            existing = table.foreign_key(column)
+            if existing:
+                table.foreign_keys.remove(existing)
+    elif method == 'unique' and strings:
+        # unique(['a', 'b'], 'index_name') / unique('a', 'index_name')
+        columns = _STRING.findall(args[:args.find(']')]) if args.lstrip().startswith('[') else strings[:1]
+        if len(columns) == 1 and columns[0] in table.columns:
+            table.columns[columns[0]].unique = True
+        else:
+            table.unique_sets.append(tuple(columns))
+    elif method == 'primary' and strings:
+        for column in strings:
+            if column in table.columns:
+                table.columns[column].primary = True
+    elif method in COLUMN_TYPES and name:
+        column = Column(name, COLUMN_TYPES[method],
+                        nullable='->nullable(' in modifiers,
+                        default=parse_default(modifiers),
+                        unique='->unique(' in modifiers,
+                        primary='->primary(' in modifiers)
+        rest = args[args.find(name) + len(name) + 1:]
+        if method == 'enum':
+            column.values = _STRING.findall(rest)
+        elif method in ('decimal', 'float', 'double'):
+            numbers = re.findall(r"\d+", rest)
+            column.precision = int(numbers[0]) if numbers else 8
+            column.scale = int(numbers[1]) if len(numbers) > 1 else 2
+        else:
+            length = _NUMBER.match(rest.lstrip(', '))
+            column.length = int(length.group(1)) if length else None
+        table.columns[name] = column
+        if method in ('foreignUuid', 'foreignId') and '->constrained(' in modifiers:
+            target = re.search(r"->constrained\(\s*'(\w+)'", modifiers)
+            table.foreign_keys.append(ForeignKey(name, target.group(1) if target else name[:-3] + 's'))
+
+
+def parse_migrations(directory=MIGRATIONS_DIR):
+    """{table name: Table} after applying every migration's up() in filename order"""
+    tables = {}
+    for path in sorted(glob.glob(os.path.join(directory, '*.php'))):
+        with open(path) as f:
+            source = f.read()
+        body = method_body(source, 'up')
+        if not body:
+            continue
+        for schema in _SCHEMA.finditer(body):
+            kind, name = schema.groups()
+            block = balanced(body, schema.end() - 1)
+            table = tables.setdefault(name, Table(name))
+            table.migrations.append(os.path.basename(path))
+            code = re.sub(r"//[^\n]*", '', block)
+            for method, args, modifiers in _STATEMENT.findall(code):
+                apply_statement(table, method, args, modifiers)
+    return tables
+
+
+def dependency_order(tables, include_framework=False):
+    """
+    Tables sorted so referenced tables come first. A cycle is broken at a nullable foreign
+    key, whose column is then left empty for the rows of the first table in the cycle.
+    Returns (ordered names, {table: set of deferred fk columns}).
+    """
+    names = [name for name in tables if include_framework or name not in FRAMEWORK_TABLES]
+    edges = {name: {fk.table for fk in tables[name].foreign_keys if fk.table in names and fk.table != name}
+             for name in names}
+    deferred = {}
+    ordered = []
+    remaining = dict(edges)
+    while remaining:
+        ready = [name for name in names if name in remaining and not remaining[name] - set(ordered)]
+        if not ready:
+            # Break the cycle at the first nullable foreign key still pending
+            for name in names:
+                if name not in remaining:
+                    continue
+                table = tables[name]
+                nullable = [fk for fk in table.foreign_keys if fk.table in remaining and fk.table != name
+                            and table.columns.get(fk.column) is not None and table.columns[fk.column].nullable]
+                if nullable:
+                    deferred.setdefault(name, set()).update(fk.column for fk in nullable)
+                    remaining[name] = remaining[name] - {fk.table for fk in nullable}
+                    break
+            else:
+                raise ValueError(f"Unbreakable foreign key cycle between {', '.join(sorted(remaining))}")
+            continue
+        for name in ready:
+            ordered.append(name)
+            del remaining[name]
+    return ordered, deferred
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Show the schema described by the Laravel migrations")
+    parser.add_argument('table', nargs='?', help="Describe one table")
+    parser.add_argument('--framework', action='store_true', help="Include Laravel framework tables")
+    args = parser.parse_args(argv)
+
+    tables = parse_migrations()
+    if args.table:
+        table = tables.get(args.table)
+        if table is None:
+            print(f"❌ No migration creates {args.table}")
+            return 1
+        print(f"{table.name} ({', '.join(table.migrations)})")
+        for column in table.columns.values():
+            print(f"  {column.describe()}")
+        for fk in table.foreign_keys:
+            print(f"  FK {fk.column} -> {fk.table}.{fk.references}" + (f" on delete {fk.on_delete}" if fk.on_delete
+                                                                         else ""))
+        for columns in table.unique_sets:
+            print(f"  UNIQUE ({', '.join(columns)})")
+        return 0
+
+    ordered, deferred = dependency_order(tables, args.framework)
+    for position, name in enumerate(ordered, 1):
+        table = tables[name]
+        depends = ', '.join(sorted(table.dependencies)) or '-'
+        note = f"  (deferred: {', '.join(sorted(deferred[name]))})" if name in deferred else ""
+        print(f"{position:>3}. {name:<32}{len(table.columns):>3} columns  <- {depends}{note}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Streaming result sink for the Mewayz testers
+Drop-in replacement for a tester's test_results list: every logged result is appended
+to a JSONL file (gzip when the path ends in .gz) and only rolling aggregates stay in
+memory, so results from multi-hour load runs never accumulate in the process
+
+Usage:
+    python -m tests.harness.sink summarize results.jsonl.gz [more files...] --by minute
+"""
+
+import argparse
+import collections
+import glob
+import gzip
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+
+def record_success(record):
+    """Testers log either success=bool or status='PASS'/'FAIL'/'WARN'/'SKIP'"""
+    if 'success' in record:
+        return bool(record['success'])
+    return str(record.get('status', '')).upper() in ('PASS', 'WARN', 'WARNING')
+
+
+def record_skipped(record):
+    return 'success' not in record and str(record.get('status', '')).upper() in ('SKIP', 'SKIPPED')
+
+
+def open_results(path, mode):
+    if path.endswith('.gz'):
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class TestAggregate:
+    def __init__(self, name):
+        self.name = name
+        self.count = 0
+        self.passed = 0
+        self.skipped = 0
+        self.last_failure = None
+
+    @property
+    def failed(self):
+        return self.count - self.passed - self.skipped
+
+    def add(self, record):
+        self.count += 1
+        if record_success(record):
+            self.passed += 1
+        elif record_skipped(record):
+            self.skipped += 1
+        else:
+            self.last_failure = record.get('message')
+
+
+class ResultSink:
+    """
+    Append-only, thread-safe result stream with list-like append/extend/len/iter.
+
+    Memory holds one TestAggregate per distinct test name plus the last
+    `recent_failures` failures. Iterating re-reads the file, so summaries that loop
+    over test_results keep working without the records being kept in memory.
+    """
+
+    def __init__(self, path, source=None, recent_failures=50, flush_every=1.0):
+        self.path = path
+        self.source = source
+        self.flush_every = flush_every
+        self.aggregates = collections.OrderedDict()
+        self.recent_failures = collections.deque(maxlen=recent_failures)
+        self.count = 0
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._file = open_results(path, 'w')
+
+    def append(self, record):
+        record = dict(record)
+        record.setdefault('timestamp', datetime.now().isoformat())
+        if self.source:
+            record.setdefault('source', self.source)
+        line = json.dumps(record, default=str) + '\n'
+
+        with self._lock:
+            self._file.write(line)
+            self.count += 1
+            name = record.get('test', '?')
+            aggregate = self.aggregates.get(name)
+            if aggregate is None:
+                aggregate = self.aggregates[name] = TestAggregate(name)
+            aggregate.add(record)
+            if not record_success(record) and not record_skipped(record):
+                self.recent_failures.append(record)
+            now = time.monotonic()
+            if now - self._last_flush >= self.flush_every:
+                self._file.flush()
+                self._last_flush = now
+
+    def extend(self, records):
+        for record in records:
+            self.append(record)
+
+    def __len__(self):
+        return self.count
+
+    def __bool__(self):
+        return True
+
+    def __iter__(self):
+        self.flush()
+        return iter_records([self.path])
+
+    def flush(self):
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+def iter_records(paths):
+    """Stream records back from one or more result files (partial last lines are skipped)"""
+    for path in paths:
+        with open_results(path, 'r') as f:
+            try:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+            except EOFError:
+                # A gzip stream that is still being written has no end marker yet
+                continue
+
+
+def expand_paths(patterns):
+    paths = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern))
+        paths.extend(matches or [pattern])
+    return paths
+
+
+def summarize(paths, by='test', failures=10):
+    """Single streaming pass over result files; memory is bounded by the number of groups"""
+    groups = collections.OrderedDict()
+    failure_messages = collections.Counter()
+    first = last = None
+    total = 0
+
+    for record in iter_records(paths):
+        total += 1
+        timestamp = record.get('timestamp')
+        if timestamp:
+            first = timestamp if first is None or timestamp < first else first
+            last = timestamp if last is None or timestamp > last else last
+        key = record.get('test', '?') if by == 'test' else (timestamp or '?')[:16]
+        group = groups.get(key)
+        if group is None:
+            group = groups[key] = TestAggregate(key)
+        group.add(record)
+        if not record_success(record) and not record_skipped(record):
+            failure_messages[(record.get('test', '?'), str(record.get('message', ''))[:120])] += 1
+
+    print("=" * 80)
+    print(f"RESULT SUMMARY ({len(paths)} file(s), {total:,} results)")
+    print("=" * 80)
+    if first:
+        print(f"From {first} to {last}")
+    passed = sum(g.passed for g in groups.values())
+    skipped = sum(g.skipped for g in groups.values())
+    rate = (passed / total) * 100 if total else 0
+    print(f"Passed: {passed:,}/{total:,} ({rate:.1f}%), skipped {skipped:,}")
+    print()
+
+    label = 'TEST' if by == 'test' else 'MINUTE'
+    header = f"{label:<56}{'COUNT':>9}{'PASS%':>8}{'FAILED':>9}"
+    print(header)
+    print("-" * len(header))
+    items = groups.values() if by == 'minute' else sorted(groups.values(), key=lambda g: (-g.failed, g.name))
+    for group in items:
+        pass_rate = (group.passed / group.count) * 100 if group.count else 0
+        print(f"{group.name[:55]:<56}{group.count:>9,}{pass_rate:>8.1f}{group.failed:>9,}")
+    print()
+
+    if failure_messages:
+        print("❌ MOST COMMON FAILURES:")
+        for (test, message), count in failure_messages.most_common(failures):
+            print(f"   • {count:,}x {test}: {message}")
+        print()
+    return total - passed - skipped == 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarize streamed test results")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    summary_parser = subparsers.add_parser('summarize', help="Summarize one or more JSONL(.gz) result files")
+    summary_parser.add_argument('paths', nargs='+', help="Result files or glob patterns")
+    summary_parser.add_argument('--by', choices=('test', 'minute'), default='test')
+    summary_parser.add_argument('--failures', type=int, default=10, help="Number of failure messages to show")
+    args = parser.parse_args(argv)
+
+    ok = summarize(expand_paths(args.paths), args.by, args.failures)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
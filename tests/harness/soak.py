@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Soak-test runner for the Mewayz API
+Drives a fixed, modest workload for hours, buckets client latency and the
+PerformanceMonitoringMiddleware headers (X-Response-Time, X-Memory-Usage,
+X-Query-Count) into per-minute time series per endpoint, and flags monotonic growth
+and latency drift
+
+Usage:
+    python -m tests.harness.soak --rps 2 --hours 6 --timeseries soak.json
+    python -m tests.harness.soak analyze soak.json --warmup 10
+"""
+
+import argparse
+import collections
+import json
+import math
+import os
+import sys
+import threading
+import time
+
+from tests.harness.client import DEFAULT_BASE_URL
+from tests.harness.metrics import EndpointStats, format_ms, route_template
+
+# Per-minute value extracted from an endpoint's bucket for each tracked series
+SERIES = collections.OrderedDict([
+    ('client_p50', lambda stats: stats.latency.percentile(50)),
+    ('client_p95', lambda stats: stats.latency.percentile(95)),
+    ('server_p50', lambda stats: stats.server_time.percentile(50)),
+    ('memory_mb', lambda stats: stats.memory_mean),
+    ('queries', lambda stats: stats.queries.mean),
+])
+
+DEFAULT_THRESHOLDS = {
+    'alpha': 0.01,          # Mann-Kendall significance level for a trend
+    'growth': 0.10,         # relative change between first and last window that matters
+    'window': 15,           # minutes in the first/last comparison windows
+    'min_points': 20,       # minutes of data needed before judging a trend
+}
+
+
+class SoakMonitor:
+    """ApiClient listener keeping one EndpointStats per endpoint per minute of the run"""
+
+    def __init__(self, start=None):
+        self.start = start or time.time()
+        self.buckets = collections.defaultdict(dict)
+        self._lock = threading.Lock()
+
+    def __call__(self, method, endpoint, response, error, elapsed_ms):
+        minute = int((time.time() - self.start) // 60)
+        key = f"{method.upper()} {route_template(endpoint)}"
+        with self._lock:
+            stats = self.buckets[key].get(minute)
+            if stats is None:
+                method_name, route = key.split(' ', 1)
+                stats = self.buckets[key][minute] = EndpointStats(method_name, route)
+            stats.latency.record(elapsed_ms)
+            if response is not None:
+                stats.record_server_timing(response.headers)
+            if error or response.status_code >= 400:
+                stats.errors += 1
+
+    def timeseries(self):
+        """{endpoint: {series: [[minute, value], ...]}} plus request counts per minute"""
+        with self._lock:
+            result = {}
+            for key, minutes in self.buckets.items():
+                series = {name: [] for name in SERIES}
+                series['requests'] = []
+                series['errors'] = []
+                for minute in sorted(minutes):
+                    stats = minutes[minute]
+                    for name, extract in SERIES.items():
+                        value = extract(stats)
+                        if value is not None:
+                            series[name].append([minute, value])
+                    series['requests'].append([minute, stats.count])
+                    series['errors'].append([minute, stats.errors])
+                result[key] = series
+            return result
+
+    def to_dict(self):
+        return {'start': self.start, 'bucket_seconds': 60, 'endpoints': self.timeseries()}
+
+
+def mann_kendall(values):
+    """
+    Mann-Kendall trend test. Returns (z, p_two_sided); positive z means an increasing
+    trend. Needs no distribution assumptions, so it suits latency/memory series.
+    """
+    n = len(values)
+    if n < 3:
+        return 0.0, 1.0
+    s = 0
+    for i in range(n - 1):
+        vi = values[i]
+        for j in range(i + 1, n):
+            diff = values[j] - vi
+            s += (diff > 0) - (diff < 0)
+    ties = collections.Counter(values).values()
+    variance = (n * (n - 1) * (2 * n + 5) - sum(t * (t - 1) * (2 * t + 5) for t in ties)) / 18.0
+    if variance <= 0:
+        return 0.0, 1.0
+    if s > 0:
+        z = (s - 1) / math.sqrt(variance)
+    elif s < 0:
+        z = (s + 1) / math.sqrt(variance)
+    else:
+        z = 0.0
+    return z, math.erfc(abs(z) / math.sqrt(2))
+
+
+def sen_slope(points):
+    """Median pairwise slope of [[minute, value], ...]; robust to outlier minutes"""
+    slopes = []
+    for i in range(len(points) - 1):
+        x1, y1 = points[i]
+        for j in range(i + 1, len(points)):
+            x2, y2 = points[j]
+            if x2 != x1:
+                slopes.append((y2 - y1) / (x2 - x1))
+    if not slopes:
+        return 0.0
+    slopes.sort()
+    mid = len(slopes) // 2
+    return slopes[mid] if len(slopes) % 2 else (slopes[mid - 1] + slopes[mid]) / 2
+
+
+def median(values):
+    ordered = sorted(values)
+    mid = len(ordered) // 2
+    return ordered[mid] if len(ordered) % 2 else (ordered[mid - 1] + ordered[mid]) / 2
+
+
+def downsample(points, max_points=360):
+    """Median-bin long series so the O(n^2) trend statistics stay fast on multi-day runs"""
+    if len(points) <= max_points:
+        return points
+    size = math.ceil(len(points) / max_points)
+    binned = []
+    for i in range(0, len(points), size):
+        chunk = points[i:i + size]
+        binned.append([median([p[0] for p in chunk]), median([p[1] for p in chunk])])
+    return binned
+
+
+class Finding:
+    def __init__(self, endpoint, series, start, end, slope_per_hour, p_value, change):
+        self.endpoint = endpoint
+        self.series = series
+        self.start = start
+        self.end = end
+        self.slope_per_hour = slope_per_hour
+        self.p_value = p_value
+        self.change = change
+
+
+def analyze(timeseries, warmup=5, thresholds=None):
+    """Flag series with a significant upward trend and a material first-vs-last change"""
+    limits = dict(DEFAULT_THRESHOLDS, **(thresholds or {}))
+    findings = []
+    for endpoint, series in timeseries['endpoints'].items():
+        for name in SERIES:
+            # Thinly sampled minutes are noisy; skip those with a single request
+            counts = dict((minute, count) for minute, count in series.get('requests', []))
+            points = [p for p in series.get(name, []) if p[0] >= warmup and counts.get(p[0], 0) > 1]
+            if len(points) < limits['min_points']:
+                continue
+            points = downsample(points)
+            values = [value for _, value in points]
+            z, p_value = mann_kendall(values)
+            window = max(3, min(limits['window'], len(points) // 3))
+            start = median(values[:window])
+            end = median(values[-window:])
+            change = (end - start) / start if start else (math.inf if end > 0 else 0.0)
+            if z > 0 and p_value < limits['alpha'] and change > limits['growth']:
+                findings.append(Finding(endpoint, name, start, end, sen_slope(points) * 60, p_value, change))
+    return findings
+
+
+def print_analysis(timeseries, findings, warmup):
+    endpoints = timeseries['endpoints']
+    minutes = max((p[0] for s in endpoints.values() for p in s.get('requests', [])), default=-1) + 1
+    print("\n" + "=" * 80)
+    print(f"SOAK ANALYSIS ({minutes} minute(s), {len(endpoints)} endpoint(s), first {warmup} minute(s) ignored)")
+    print("=" * 80)
+    if not findings:
+        print("✅ No monotonic growth or latency drift detected")
+        print()
+        return
+    header = f"{'ENDPOINT':<44}{'SERIES':<12}{'START':>9}{'END':>9}{'CHANGE':>9}{'/HOUR':>9}{'p':>9}"
+    print(f"❌ {len(findings)} drifting series:")
+    print(header)
+    print("-" * len(header))
+    for f in sorted(findings, key=lambda f: -f.change):
+        print(f"{f.endpoint[:43]:<44}{f.series:<12}{format_ms(f.start):>9}{format_ms(f.end):>9}"
+              f"{f.change * 100:>8.0f}%{f.slope_per_hour:>+9.2f}{f.p_value:>9.1e}")
+    print()
+
+
+def save_timeseries(monitor, path):
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(monitor.to_dict(), f)
+    os.replace(temp_path, path)
+
+
+def run(args):
+    from tests.harness.loadgen import LoadGenerator, load_fixtures, parse_scenarios, prepare_tester
+
+    fixtures = [] if args.fresh_user else load_fixtures(args.base_url, 1)
+    tester = prepare_tester(args.base_url, 16, fixtures[0] if fixtures else None)
+    if tester is None:
+        print("❌ Could not set up a user and workspace. Is the backend running?")
+        return 1
+
+    duration = args.hours * 3600
+    generator = LoadGenerator(tester, parse_scenarios(args.scenario), args.rps, duration, ramp_up=0,
+                              max_in_flight=16, seed=args.seed)
+    monitor = SoakMonitor()
+    tester.client.add_listener(monitor)
+
+    stop = threading.Event()
+
+    def checkpoint():
+        # Minute-by-minute progress and a periodically rewritten time series file
+        while not stop.wait(60):
+            elapsed = (time.time() - monitor.start) / 60
+            print(f"[{elapsed:6.0f}m] requests={generator.metrics.request_count}", file=stdout, flush=True)
+            if args.timeseries:
+                save_timeseries(monitor, args.timeseries)
+
+    print(f"🚀 Soak test: {args.rps} scenarios/s for {args.hours}h against {args.base_url}")
+    stdout = sys.stdout
+    threading.Thread(target=checkpoint, daemon=True).start()
+    with open(os.devnull, 'w') as devnull:
+        sys.stdout = devnull
+        try:
+            generator.run()
+        except KeyboardInterrupt:
+            print("Interrupted; analyzing what was collected", file=stdout)
+        finally:
+            sys.stdout = stdout
+            stop.set()
+
+    if args.timeseries:
+        save_timeseries(monitor, args.timeseries)
+        print(f"💾 Time series saved to {args.timeseries}")
+    findings = analyze(monitor.to_dict(), args.warmup, thresholds_from_args(args))
+    print_analysis(monitor.to_dict(), findings, args.warmup)
+    return 1 if findings else 0
+
+
+def add_threshold_arguments(parser):
+    parser.add_argument('--warmup', type=int, default=5, help="Minutes at the start excluded from the analysis")
+    parser.add_argument('--growth', type=float, default=DEFAULT_THRESHOLDS['growth'],
+                        help="Relative first-to-last window change that counts as drift")
+    parser.add_argument('--alpha', type=float, default=DEFAULT_THRESHOLDS['alpha'],
+                        help="Significance level of the Mann-Kendall trend test")
+    parser.add_argument('--window', type=int, default=DEFAULT_THRESHOLDS['window'],
+                        help="Minutes in the first and last comparison windows")
+
+
+def thresholds_from_args(args):
+    return {'growth': args.growth, 'alpha': args.alpha, 'window': args.window}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == 'analyze':
+        parser = argparse.ArgumentParser(description="Analyze a saved soak time series")
+        parser.add_argument('path')
+        add_threshold_arguments(parser)
+        args = parser.parse_args(argv[1:])
+        with open(args.path) as f:
+            timeseries = json.load(f)
+        findings = analyze(timeseries, args.warmup, thresholds_from_args(args))
+        print_analysis(timeseries, findings, args.warmup)
+        return 1 if findings else 0
+
+    parser = argparse.ArgumentParser(description="Soak-test the Mewayz API and detect drift")
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL)
+    parser.add_argument('--rps', type=float, default=2.0, help="Scenario arrivals per second (keep it modest)")
+    parser.add_argument('--hours', type=float, default=4.0, help="Run time in hours")
+    parser.add_argument('--scenario', action='append', metavar='NAME=WEIGHT',
+                        help="BackendTester scenario and weight (repeatable); defaults to the loadgen mix")
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--timeseries', metavar='PATH', help="Write the per-minute time series here (every minute)")
+    parser.add_argument('--fresh-user', action='store_true',
+                        help="Register a new user instead of using the cached fixture pool")
+    add_threshold_arguments(parser)
+    return run(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Local Stripe and ElasticMail stand-in server for offline load tests
+A small asyncio HTTP/1.1 server implementing the parts of both APIs the backend uses:
+Stripe customers, checkout sessions and signed webhook delivery, and the ElasticMail
+v2 send endpoint. Latency, errors and stalls can be injected per service, on the
+command line or at runtime through POST /_standin/config.
+
+Point the backend at it with:
+    STRIPE_API_BASE=http://127.0.0.1:12111
+    ELASTICMAIL_BASE_URL=http://127.0.0.1:12111/v2
+    STRIPE_WEBHOOK_SECRET=whsec_standin
+
+Usage:
+    python -m tests.harness.standins --port 12111 --latency-ms 150 --jitter-ms 50 --error-rate 0.01
+    python -m tests.harness.standins --stripe latency_ms=400,error_rate=0.05 --webhook-url http://localhost:8001/api/stripe/webhook
+"""
+
+import argparse
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import random
+import sys
+import time
+from urllib.parse import parse_qsl, urlsplit
+
+SERVICES = ('stripe', 'elasticmail')
+DEFAULT_WEBHOOK_SECRET = 'whsec_standin'
+MAX_BODY = 10 * 1024 * 1024
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 401: 'Unauthorized', 404: 'Not Found', 405: 'Method Not Allowed',
+               413: 'Payload Too Large', 500: 'Internal Server Error', 502: 'Bad Gateway'}
+
+
+def object_id(prefix):
+    return f"{prefix}_{os.urandom(12).hex()}"
+
+
+def sign_payload(payload, secret, timestamp=None):
+    """Stripe-Signature header value for a webhook payload (t=...,v1=HMAC-SHA256)"""
+    timestamp = int(timestamp or time.time())
+    signature = hmac.new(secret.encode(), f"{timestamp}.{payload}".encode(), hashlib.sha256).hexdigest()
+    return f"t={timestamp},v1={signature}"
+
+
+def parse_stripe_form(body):
+    """Decode Stripe's bracketed form encoding (line_items[0][price_data][currency]=usd) into nested data"""
+    result = {}
+    for key, value in parse_qsl(body, keep_blank_values=True):
+        parts = key.replace(']', '').split('[')
+        target = result
+        for part, following in zip(parts, parts[1:]):
+            container = [] if following.isdigit() else {}
+            if isinstance(target, list):
+                index = int(part)
+                while len(target) <= index:
+                    target.append(None)
+                if target[index] is None:
+                    target[index] = container
+                target = target[index]
+            else:
+                target = target.setdefault(part, container)
+        last = parts[-1]
+        if isinstance(target, list):
+            index = int(last)
+            while len(target) <= index:
+                target.append(None)
+            target[index] = value
+        else:
+            target[last] = value
+    return result
+
+
+class FaultProfile:
+    """Injected behaviour for one service: base latency with jitter, error and stall rates"""
+
+    FIELDS = ('latency_ms', 'jitter_ms', 'error_rate', 'stall_rate', 'stall_ms')
+
+    def __init__(self, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0, stall_rate=0.0, stall_ms=30000.0):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.stall_rate = stall_rate
+        self.stall_ms = stall_ms
+
+    def update(self, values):
+        for key, value in values.items():
+            if key not in self.FIELDS:
+                raise ValueError(f"Unknown fault setting: {key}")
+            setattr(self, key, float(value))
+
+    def delay(self, rng):
+        if self.stall_rate and rng.random() < self.stall_rate:
+            return self.stall_ms / 1000
+        return max(0.0, self.latency_ms + rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+
+    def fails(self, rng):
+        return self.error_rate > 0 and rng.random() < self.error_rate
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+
+class ServiceStats:
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def to_dict(self):
+        return dict(vars(self))
+
+
+class Request:
+    def __init__(self, method, target, headers, body):
+        self.method = method
+        parts = urlsplit(target)
+        self.path = parts.path
+        self.query = dict(parse_qsl(parts.query))
+        self.headers = headers
+        self.body = body
+
+    def form(self):
+        return parse_stripe_form(self.body.decode('utf-8', 'replace'))
+
+    def json(self):
+        return json.loads(self.body or b'{}')
+
+
+class StandInServer:
+    def __init__(self, profiles=None, webhook_url=None, webhook_secret=DEFAULT_WEBHOOK_SECRET,
+                 webhook_delay=None, seed=None):
+        self.profiles = {service: FaultProfile() for service in SERVICES}
+        for service, profile in (profiles or {}).items():
+            self.profiles[service] = profile
+        self.stats = {service: ServiceStats() for service in SERVICES}
+        self.webhook_url = webhook_url
+        self.webhook_secret = webhook_secret
+        self.webhook_delay = webhook_delay
+        self.rng = random.Random(seed)
+        self.customers = {}
+        self.sessions = {}
+        self.emails = 0
+        self.webhooks = {'sent': 0, 'failed': 0}
+
+    # HTTP plumbing
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                request = await self.read_request(reader)
+                if request is None:
+                    break
+                status, payload = await self.dispatch(request)
+                keep_alive = request.headers.get('connection', '').lower() != 'close'
+                self.write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def read_request(self, reader):
+        line = await reader.readline()
+        if not line:
+            return None
+        try:
+            method, target, _ = line.decode('latin-1').split(' ', 2)
+        except ValueError:
+            return None
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get('content-length') or 0)
+        if length > MAX_BODY:
+            return None
+        body = await reader.readexactly(length) if length else b''
+        return Request(method.upper(), target, headers, body)
+
+    def write_response(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload).encode()
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'OK')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode() + body)
+
+    async def dispatch(self, request):
+        if request.path.startswith('/_standin/'):
+            return self.control(request)
+        if request.path.startswith('/v1/'):
+            service, handler = 'stripe', self.stripe
+        elif request.path.startswith('/v2/'):
+            service, handler = 'elasticmail', self.elasticmail
+        else:
+            return 404, {'error': f"No stand-in for {request.path}"}
+
+        profile, stats = self.profiles[service], self.stats[service]
+        stats.requests += 1
+        stats.in_flight += 1
+        stats.max_in_flight = max(stats.max_in_flight, stats.in_flight)
+        try:
+            await asyncio.sleep(profile.delay(self.rng))
+            if profile.fails(self.rng):
+                stats.errors += 1
+                return self.injected_error(service)
+            return handler(request)
+        finally:
+            stats.in_flight -= 1
+
+    def injected_error(self, service):
+        if service == 'stripe':
+            return 500, {'error': {'type': 'api_error', 'message': "Injected stand-in failure"}}
+        # ElasticMail reports most failures as HTTP 200 with success=false
+        return 200, {'success': False, 'error': "Injected stand-in failure"}
+
+    # Stripe
+
+    def stripe(self, request):
+        if not request.headers.get('authorization', '').startswith('Bearer '):
+            return 401, {'error': {'type': 'invalid_request_error', 'message': "You did not provide an API key."}}
+        parts = request.path.strip('/').split('/')[1:]
+
+        if parts == ['customers'] and request.method == 'POST':
+            data = request.form()
+            customer = {'id': object_id('cus'), 'object': 'customer', 'email': data.get('email'),
+                        'name': data.get('name'), 'metadata': data.get('metadata', {}), 'created': int(time.time()),
+                        'livemode': False}
+            self.customers[customer['id']] = customer
+            return 200, customer
+        if len(parts) == 2 and parts[0] == 'customers' and request.method == 'GET':
+            customer = self.customers.get(parts[1])
+            return (200, customer) if customer else self.stripe_missing('customer', parts[1])
+
+        if parts == ['checkout', 'sessions'] and request.method == 'POST':
+            return 200, self.create_session(request.form())
+        if len(parts) == 3 and parts[:2] == ['checkout', 'sessions'] and request.method == 'GET':
+            session = self.sessions.get(parts[2])
+            return (200, session) if session else self.stripe_missing('checkout.session', parts[2])
+
+        return 404, {'error': {'type': 'invalid_request_error', 'message': f"Unrecognized request URL ({request.path})"}}
+
+    def stripe_missing(self, kind, missing_id):
+        return 404, {'error': {'type': 'invalid_request_error', 'code': 'resource_missing',
+                               'message': f"No such {kind}: '{missing_id}'"}}
+
+    def create_session(self, data):
+        session_id = object_id('cs_test')
+        amount = 0
+        for item in data.get('line_items') or []:
+            price = (item or {}).get('price_data') or {}
+            amount += int(price.get('unit_amount') or 0) * int(item.get('quantity') or 1)
+        session = {
+            'id': session_id,
+            'object': 'checkout.session',
+            'url': f"https://checkout.stripe.test/c/pay/{session_id}",
+            'mode': data.get('mode', 'payment'),
+            'customer': data.get('customer'),
+            'amount_total': amount,
+            'currency': (((data.get('line_items') or [{}])[0] or {}).get('price_data') or {}).get('currency', 'usd'),
+            'metadata': data.get('metadata', {}),
+            'payment_status': 'unpaid',
+            'status': 'open',
+            'subscription': None,
+            'success_url': data.get('success_url'),
+            'cancel_url': data.get('cancel_url'),
+            'created': int(time.time()),
+            'livemode': False,
+        }
+        self.sessions[session_id] = session
+        if self.webhook_url and self.webhook_delay is not None:
+            asyncio.get_running_loop().call_later(
+                self.webhook_delay, lambda: asyncio.ensure_future(self.complete_session(session_id)))
+        return session
+
+    async def complete_session(self, session_id):
+        """Mark a session paid and deliver a signed checkout.session.completed event"""
+        session = self.sessions.get(session_id)
+        if session is None:
+            return False
+        session.update({'payment_status': 'paid', 'status': 'complete',
+                        'subscription': session['subscription'] or object_id('sub')})
+        return await self.deliver_webhook('checkout.session.completed', session)
+
+    async def deliver_webhook(self, event_type, data_object):
+        if not self.webhook_url:
+            return False
+        event = {'id': object_id('evt'), 'object': 'event', 'type': event_type, 'created': int(time.time()),
+                 'data': {'object': data_object}, 'livemode': False, 'api_version': '2023-10-16'}
+        payload = json.dumps(event)
+        headers = {'Content-Type': 'application/json',
+                   'Stripe-Signature': sign_payload(payload, self.webhook_secret)}
+        ok = await post_json(self.webhook_url, payload, headers)
+        self.webhooks['sent' if ok else 'failed'] += 1
+        return ok
+
+    # ElasticMail
+
+    def elasticmail(self, request):
+        if request.path.rstrip('/') != '/v2/email/send' or request.method != 'POST':
+            return 404, {'success': False, 'error': f"Unknown endpoint {request.path}"}
+        data = dict(parse_qsl(request.body.decode('utf-8', 'replace')))
+        if not data.get('apikey'):
+            return 200, {'success': False, 'error': "Access denied."}
+        if not data.get('to'):
+            return 200, {'success': False, 'error': "Recipient list is empty."}
+        self.emails += 1
+        return 200, {'success': True, 'data': {'transactionid': os.urandom(16).hex(),
+                                               'messageid': os.urandom(12).hex()}}
+
+    # Control surface
+
+    def control(self, request):
+        action = request.path[len('/_standin/'):].strip('/')
+        if action == 'stats' and request.method == 'GET':
+            return 200, self.snapshot()
+        if action == 'config' and request.method == 'POST':
+            try:
+                for service, values in request.json().items():
+                    if service not in self.profiles:
+                        raise ValueError(f"Unknown service: {service}")
+                    self.profiles[service].update(values)
+            except ValueError as e:
+                return 400, {'error': str(e)}
+            return 200, self.snapshot()
+        if action == 'reset' and request.method == 'POST':
+            self.stats = {service: ServiceStats() for service in SERVICES}
+            self.emails = 0
+            self.webhooks = {'sent': 0, 'failed': 0}
+            return 200, self.snapshot()
+        if action.startswith('sessions/') and action.endswith('/complete') and request.method == 'POST':
+            session_id = action.split('/')[1]
+            if session_id not in self.sessions:
+                return 404, {'error': f"No such session {session_id}"}
+            asyncio.ensure_future(self.complete_session(session_id))
+            return 200, {'queued': session_id}
+        return 404, {'error': f"Unknown control endpoint {request.path}"}
+
+    def snapshot(self):
+        return {
+            'profiles': {service: profile.to_dict() for service, profile in self.profiles.items()},
+            'stats': {service: stats.to_dict() for service, stats in self.stats.items()},
+            'customers': len(self.customers),
+            'sessions': len(self.sessions),
+            'emails_sent': self.emails,
+            'webhooks': dict(self.webhooks),
+        }
+
+    async def serve(self, host, port):
+        server = await asyncio.start_server(self.handle_connection, host, port, backlog=1024)
+        print(f"🚀 Stripe/ElasticMail stand-in listening on http://{host}:{port}")
+        for service, profile in self.profiles.items():
+            print(f"   {service}: {profile.to_dict()}")
+        async with server:
+            await server.serve_forever()
+
+
+async def post_json(url, payload, headers, timeout=10):
+    """Minimal async HTTP/1.1 POST for webhook delivery; True on a 2xx response"""
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == 'https' else 80)
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(parts.hostname, port, ssl=parts.scheme == 'https'), timeout)
+        body = payload.encode()
+        path = parts.path + (f"?{parts.query}" if parts.query else '')
+        head = [f"POST {path or '/'} HTTP/1.1", f"Host: {parts.netloc}", f"Content-Length: {len(body)}",
+                "Connection: close"] + [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(('\r\n'.join(head) + '\r\n\r\n').encode() + body)
+        await writer.drain()
+        status_line = await asyncio.wait_for(reader.readline(), timeout)
+        writer.close()
+        status = status_line.split()
+        return len(status) > 1 and status[1].startswith(b'2')
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+
+def parse_profile(value, base):
+    """'latency_ms=200,error_rate=0.05' applied on top of the global settings"""
+    profile = FaultProfile(**base.to_dict())
+    profile.update(dict(item.split('=', 1) for item in value.split(',') if item.strip()))
+    return profile
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run local Stripe and ElasticMail stand-ins")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=12111)
+    parser.add_argument('--latency-ms', type=float, default=0.0, help="Added latency for every response")
+    parser.add_argument('--jitter-ms', type=float, default=0.0, help="Uniform +/- jitter around the latency")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="Share of requests answered with an error")
+    parser.add_argument('--stall-rate', type=float, default=0.0, help="Share of requests held for --stall-ms")
+    parser.add_argument('--stall-ms', type=float, default=30000.0)
+    for service in SERVICES:
+        parser.add_argument(f'--{service}', metavar='KEY=VALUE,...',
+                            help=f"Override the fault settings for {service} only")
+    parser.add_argument('--webhook-url', help="Backend Stripe webhook endpoint for signed events")
+    parser.add_argument('--webhook-secret', default=os.environ.get('STRIPE_WEBHOOK_SECRET', DEFAULT_WEBHOOK_SECRET))
+    parser.add_argument('--complete-after', type=float, default=None, metavar='SECONDS',
+                        help="Complete every checkout session after this delay and send its webhook")
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    base = FaultProfile(args.latency_ms, args.jitter_ms, args.error_rate, args.stall_rate, args.stall_ms)
+    profiles = {}
+    for service in SERVICES:
+        override = getattr(args, service)
+        profiles[service] = parse_profile(override, base) if override else FaultProfile(**base.to_dict())
+
+    server = StandInServer(profiles, args.webhook_url, args.webhook_secret, args.complete_after, args.seed)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        print(f"\n📊 {json.dumps(server.snapshot()['stats'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
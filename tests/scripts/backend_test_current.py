@@ -4,15 +4,20 @@ Backend Testing for Mewayz Laravel Application - January 2025
 Focus on verification of core systems and testing areas that need retesting
 """
 
-import requests
 import json
+import os
 import sys
 import time
 from datetime import datetime, timedelta
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from tests.harness.client import get_client
+
 class MewayzBackendTester:
     def __init__(self):
-        self.base_url = "http://localhost:8001/api"
+        self.client = get_client()
+        self.base_url = self.client.base_url
         self.token = None
         self.user_id = None
         self.workspace_id = None
@@ -36,7 +41,6 @@ class MewayzBackendTester:
     
     def make_request(self, method, endpoint, data=None, headers=None):
         """Make HTTP request with error handling"""
-        url = f"{self.base_url}{endpoint}"
         default_headers = {
             "Content-Type": "application/json",
             "Accept": "application/json"
@@ -47,22 +51,9 @@ class MewayzBackendTester:
         
         if headers:
             default_headers.update(headers)
-        
-        try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=default_headers, timeout=10)
-            elif method.upper() == "POST":
-                response = requests.post(url, json=data, headers=default_headers, timeout=10)
-            elif method.upper() == "PUT":
-                response = requests.put(url, json=data, headers=default_headers, timeout=10)
-            elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=default_headers, timeout=10)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-            
-            return response
-        except requests.exceptions.RequestException as e:
-            return None
+
+        response, error = self.client.request(method, endpoint, data, default_headers)
+        return response
     
     def test_authentication_system(self):
         """Test authentication endpoints"""
@@ -4,15 +4,35 @@ Comprehensive Workspace Invitation System Testing for Mewayz Laravel Application
 Tests all invitation endpoints, database structure, email integration, and edge cases
 """
 
-import requests
 import json
+import os
+import random
+import sqlite3
 import sys
 import time
 from datetime import datetime, timedelta
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
+from tests.harness.client import get_client
+from tests.harness.metrics import SERVER_MEMORY_HEADER, SERVER_QUERIES_HEADER, SERVER_TIME_HEADER, parse_header_number
+from tests.harness.seeding import DEFAULT_DB_PATH, BulkLoader, new_uuid, unique_tag
+
+# Invitations bulk-loaded into the test workspace for the analytics scale test; opt-in,
+# e.g. MEWAYZ_INVITATION_SCALE=100000 (0 skips it). The loaded rows are deleted afterwards.
+SCALE_INVITATIONS = int(os.environ.get('MEWAYZ_INVITATION_SCALE', '0'))
+# Most memory the analytics endpoint may allocate for that workspace, per X-Memory-Usage
+SCALE_MEMORY_BUDGET_MB = float(os.environ.get('MEWAYZ_INVITATION_SCALE_MAX_MB', '16'))
+
+INVITATION_STATUSES = ('pending', 'accepted', 'declined', 'expired', 'cancelled')
+SCALE_STATUSES = ('pending', 'pending', 'accepted', 'accepted', 'accepted', 'declined', 'expired', 'cancelled')
+SCALE_ROLES = ('viewer', 'viewer', 'viewer', 'contributor', 'editor', 'admin')
+SCALE_DEPARTMENTS = (None, None, 'Engineering', 'Sales', 'Marketing', 'Support', 'Finance')
+
 class WorkspaceInvitationTester:
     def __init__(self):
-        self.base_url = "http://localhost:8001/api"
+        self.client = get_client()
+        self.base_url = self.client.base_url
         self.token = None
         self.user_id = None
         self.workspace_id = None
@@ -38,7 +58,6 @@ class WorkspaceInvitationTester:
     
     def make_request(self, method, endpoint, data=None, headers=None):
         """Make HTTP request with error handling"""
-        url = f"{self.base_url}{endpoint}"
         default_headers = {
             "Content-Type": "application/json",
             "Accept": "application/json"
@@ -49,22 +68,8 @@ class WorkspaceInvitationTester:
         
         if headers:
             default_headers.update(headers)
-        
-        try:
-            if method.upper() == "GET":
-                response = requests.get(url, headers=default_headers, timeout=10)
-            elif method.upper() == "POST":
-                response = requests.post(url, json=data, headers=default_headers, timeout=10)
-            elif method.upper() == "PUT":
-                response = requests.put(url, json=data, headers=default_headers, timeout=10)
-            elif method.upper() == "DELETE":
-                response = requests.delete(url, headers=default_headers, timeout=10)
-            else:
-                return None, f"Unsupported method: {method}"
-            
-            return response, None
-        except requests.exceptions.RequestException as e:
-            return None, str(e)
+
+        return self.client.request(method, endpoint, data, default_headers)
     
     def test_authentication_setup(self):
         """Test authentication with existing test user"""
@@ -256,6 +261,37 @@ class WorkspaceInvitationTester:
             self.log_test("Create Bulk Invitations", "FAIL", f"HTTP {response.status_code}", response.text[:200])
             return False
     
+    def test_bulk_invitation_batch_progress(self):
+        """Test GET /api/invitation-batches/{batch} reports the queued email progress"""
+        if not self.token or not self.batch_id:
+            self.log_test("Bulk Invitation Batch Progress", "SKIP", "Missing authentication or batch")
+            return False
+
+        response, error = self.make_request("GET", f"/invitation-batches/{self.batch_id}")
+
+        if error:
+            self.log_test("Bulk Invitation Batch Progress", "FAIL", f"Request failed: {error}")
+            return False
+
+        if response.status_code == 200:
+            try:
+                data = response.json()
+                batch = data.get("data") or {}
+                if data.get("success") and batch.get("status") in ("processing", "completed", "completed_with_errors"):
+                    self.log_test("Bulk Invitation Batch Progress", "PASS",
+                                f"Batch {batch['status']}: {batch.get('emails_sent', 0)}/{batch.get('successful', 0)} "
+                                f"emails sent, {batch.get('emails_failed', 0)} failed")
+                    return True
+                else:
+                    self.log_test("Bulk Invitation Batch Progress", "FAIL", "Invalid response format", data)
+                    return False
+            except json.JSONDecodeError:
+                self.log_test("Bulk Invitation Batch Progress", "FAIL", "Invalid JSON response")
+                return False
+        else:
+            self.log_test("Bulk Invitation Batch Progress", "FAIL", f"HTTP {response.status_code}", response.text[:200])
+            return False
+
     def test_get_invitation_analytics(self):
         """Test GET /api/workspaces/{workspace}/invitations/analytics"""
         if not self.token or not self.workspace_id:
@@ -288,6 +324,152 @@ class WorkspaceInvitationTester:
             self.log_test("Get Invitation Analytics", "FAIL", f"HTTP {response.status_code}", response.text[:200])
             return False
     
+    def test_invitation_analytics_at_scale(self, count=SCALE_INVITATIONS, requests=5):
+        """Bulk-load invitations into the test workspace and check analytics stay cheap and correct"""
+        if not self.token or not self.workspace_id:
+            self.log_test("Invitation Analytics At Scale", "SKIP", "Missing authentication or workspace")
+            return False
+        if count <= 0 or not os.path.exists(DEFAULT_DB_PATH):
+            self.log_test("Invitation Analytics At Scale", "SKIP",
+                          f"Set MEWAYZ_INVITATION_SCALE to enable; needs a local database at {DEFAULT_DB_PATH}")
+            return False
+
+        print(f"🌱 Loading {count:,} invitations into the test workspace...")
+        rng = random.Random(count)
+        tag = unique_tag()
+        now = datetime.now()
+
+        def rows():
+            for i in range(count):
+                created = (now - timedelta(minutes=rng.randrange(0, 60 * 24 * 90))).strftime('%Y-%m-%d %H:%M:%S')
+                yield (new_uuid(), self.workspace_id, self.user_id, f"scale_{tag}_{i}@example.com",
+                       rng.choice(SCALE_ROLES), rng.choice(SCALE_DEPARTMENTS), os.urandom(32).hex(),
+                       rng.choice(SCALE_STATUSES), created, created, created)
+
+        try:
+            with BulkLoader(DEFAULT_DB_PATH) as loader:
+                loader.require_tables('workspace_invitations')
+                loader.insert('workspace_invitations', (
+                    'id', 'workspace_id', 'invited_by', 'email', 'role', 'department', 'token', 'status',
+                    'expires_at', 'created_at', 'updated_at'
+                ), rows())
+                loader.analyze('workspace_invitations')
+        except (OSError, RuntimeError, sqlite3.Error) as e:
+            self.log_test("Invitation Analytics At Scale", "FAIL", f"Could not load invitations: {e}")
+            self.remove_scale_invitations(tag)
+            return False
+
+        # Rows loaded behind the API's back fire no model events; one invitation created
+        # through it drops the workspace's cached analytics
+        response, error = self.make_request("POST", f"/workspaces/{self.workspace_id}/invitations",
+                                            {"email": f"scale_{tag}_api@example.com", "role": "viewer"})
+        invitation_id = None
+        if not error and response.status_code in [200, 201]:
+            try:
+                invitation_id = ((response.json().get("data") or {}).get("invitation") or {}).get("id")
+            except json.JSONDecodeError:
+                pass
+        try:
+            if invitation_id is None:
+                self.log_test("Invitation Analytics At Scale", "FAIL",
+                              f"Could not create an invitation to clear the analytics cache: "
+                              f"{error or f'HTTP {response.status_code}'}")
+                return False
+            return self.check_invitation_analytics_at_scale(requests)
+        finally:
+            self.remove_scale_invitations(tag, invitation_id)
+
+    def check_invitation_analytics_at_scale(self, requests):
+        """Time the analytics endpoint over the loaded workspace and compare it with the database"""
+        samples = []
+        data = None
+        for i in range(requests):
+            start = time.perf_counter()
+            response, error = self.make_request("GET", f"/workspaces/{self.workspace_id}/invitations/analytics")
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if error or response.status_code != 200:
+                self.log_test("Invitation Analytics At Scale", "FAIL",
+                              f"Request failed: {error or f'HTTP {response.status_code}'}")
+                return False
+            samples.append({
+                "run": "cold" if i == 0 else "warm",
+                "client_ms": round(elapsed_ms, 1),
+                "server_ms": parse_header_number(response.headers.get(SERVER_TIME_HEADER)),
+                "memory_mb": parse_header_number(response.headers.get(SERVER_MEMORY_HEADER)),
+                "queries": parse_header_number(response.headers.get(SERVER_QUERIES_HEADER))
+            })
+            try:
+                data = response.json().get("data") or {}
+            except json.JSONDecodeError:
+                self.log_test("Invitation Analytics At Scale", "FAIL", "Invalid JSON response")
+                return False
+
+        for sample in samples:
+            print(f"   ⏱️  {sample['run']}: {sample['client_ms']}ms client, {sample['server_ms']}ms server, "
+                  f"{sample['memory_mb']}MB, {sample['queries']} queries")
+
+        mismatches = self.compare_invitation_analytics(data)
+        memory = max((s["memory_mb"] for s in samples if s["memory_mb"] is not None), default=None)
+        if memory is not None and memory > SCALE_MEMORY_BUDGET_MB:
+            mismatches.append(f"analytics used {memory}MB, budget {SCALE_MEMORY_BUDGET_MB}MB")
+
+        if mismatches:
+            self.log_test("Invitation Analytics At Scale", "FAIL", "; ".join(mismatches[:5]), samples)
+            return False
+        self.log_test("Invitation Analytics At Scale", "PASS",
+                      f"{data['overview']['total']:,} invitations, cold {samples[0]['client_ms']}ms, "
+                      f"warm {samples[-1]['client_ms']}ms, peak {memory}MB")
+        return True
+
+    def remove_scale_invitations(self, tag, invitation_id=None):
+        """Delete the bulk-loaded invitations, then cancel the API-created one so the cached analytics are dropped"""
+        conn = sqlite3.connect(DEFAULT_DB_PATH)
+        try:
+            with conn:
+                conn.execute("DELETE FROM workspace_invitations WHERE workspace_id = ? AND email LIKE ? AND id != ?",
+                             (self.workspace_id, f"scale_{tag}_%", invitation_id or ""))
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not remove the loaded invitations: {e}")
+        finally:
+            conn.close()
+        if invitation_id:
+            self.make_request("DELETE", f"/invitations/{invitation_id}")
+
+    def compare_invitation_analytics(self, data):
+        """Differences between the analytics response and counts taken straight from the database"""
+        conn = sqlite3.connect(DEFAULT_DB_PATH)
+        try:
+            where = "FROM workspace_invitations WHERE workspace_id = ?"
+            statuses = dict(conn.execute(f"SELECT status, COUNT(*) {where} GROUP BY status", (self.workspace_id,)))
+            overview = {"total": sum(statuses.values())}
+            overview.update({status: statuses.get(status, 0) for status in INVITATION_STATUSES})
+            expected = {
+                "overview": overview,
+                "roles": dict(conn.execute(f"SELECT role, COUNT(*) {where} GROUP BY role", (self.workspace_id,))),
+                "departments": dict(conn.execute(f"SELECT department, COUNT(*) {where} AND department IS NOT NULL "
+                                                 "GROUP BY department", (self.workspace_id,)))
+            }
+        finally:
+            conn.close()
+
+        distribution = data.get("distribution") or {}
+        actual = {
+            "overview": data.get("overview") or {},
+            # An empty breakdown serializes as a JSON list
+            "roles": distribution.get("roles") or {},
+            "departments": distribution.get("departments") or {}
+        }
+        mismatches = []
+        for section, counts in expected.items():
+            for key, value in counts.items():
+                if actual[section].get(key) != value:
+                    mismatches.append(f"{section}.{key}: api {actual[section].get(key)} != db {value}")
+        total = expected["overview"]["total"]
+        rate = round(expected["overview"]["accepted"] / total * 100, 1) if total else 0
+        if abs(float(data.get("acceptance_rate") or 0) - rate) > 0.1:
+            mismatches.append(f"acceptance_rate: api {data.get('acceptance_rate')} != db {rate}")
+        return mismatches
+
     def test_get_invitation_by_token(self):
         """Test GET /api/invitations/{token} (public route)"""
         if not self.invitation_token:
@@ -682,6 +864,7 @@ class WorkspaceInvitationTester:
         self.test_get_workspace_invitations()
         self.test_create_single_invitation()
         self.test_create_bulk_invitations()
+        self.test_bulk_invitation_batch_progress()
         self.test_get_invitation_analytics()
         
         # Public invitation tests
@@ -712,6 +895,11 @@ class WorkspaceInvitationTester:
         print("\n💾 Testing Database Structure")
         print("-" * 50)
         self.test_database_structure()
+
+        # Scale tests
+        print("\n📈 Testing Analytics At Scale")
+        print("-" * 50)
+        self.test_invitation_analytics_at_scale()
         
         # Generate summary
         self.generate_test_summary()
@@ -0,0 +1,8 @@
+"""
+Unified Mewayz API test suite
+Tag-selected test cases from lazily imported plugin modules, run on one shared client
+"""
+
+from tests.suite.core import Case, TestResult, TestSuite
+
+__all__ = ['Case', 'TestResult', 'TestSuite']
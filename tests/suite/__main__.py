@@ -0,0 +1,5 @@
+import sys
+
+from tests.suite.core import main
+
+sys.exit(main())
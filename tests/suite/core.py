@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""
+Unified plugin-based test suite for the Mewayz API
+Plugin modules in tests/suite/plugins declare test cases by tag; the runner imports
+only the plugins (and tester classes) a selection needs, shares one client, session
+and result model across them, and runs the cases as a dependency DAG
+
+Usage:
+    python -m tests.suite --tags crm,smoke
+    python -m tests.suite --list
+"""
+
+import argparse
+import copy
+import importlib
+import pkgutil
+import sys
+import threading
+import time
+
+from tests.harness import baseline, budgets
+from tests.harness.client import get_client
+from tests.harness.fixtures import shared_fixture
+from tests.harness.metrics import MetricsRegistry, print_latency_table
+from tests.harness.runner import DEFAULT_CONCURRENCY, DependencyRunner
+
+PLUGIN_PACKAGE = 'tests.suite.plugins'
+
+# Plugins run in this order; any other discovered plugin runs after them alphabetically
+PLUGIN_ORDER = ('auth', 'workspace', 'ecommerce', 'crm', 'instagram', 'marketplace', 'stripe', 'invitations')
+
+# Shared across every tester instance; owned by the suite session, never by a test
+SESSION_FIELDS = ('token', 'user_id', 'workspace_id')
+
+BACKEND = 'backend_test:BackendTester'
+
+
+class Case:
+    """
+    One test case: `target` is "module:Class.method" of an existing tester method.
+    `requires`/`provides` name shared resources as in tests.harness.runner.
+    """
+
+    def __init__(self, name, target, tags=(), requires=('auth', 'workspace'), provides=(), critical=False,
+                 exclusive=False):
+        self.name = name
+        self.target = target
+        self.tags = tuple(tags)
+        self.requires = tuple(requires)
+        self.provides = tuple(provides)
+        self.critical = critical
+        self.exclusive = exclusive
+        self.module = None
+
+    @property
+    def tester_path(self):
+        return self.target.rsplit('.', 1)[0]
+
+    @property
+    def method(self):
+        return self.target.rsplit('.', 1)[1]
+
+    def all_tags(self):
+        return {self.module, self.name, *self.tags}
+
+
+class TestResult:
+    """Normalized result; accepts both the success=bool and status='PASS' styles of log_test"""
+
+    def __init__(self, case, name, status, message="", details=None):
+        self.case = case
+        self.name = name
+        self.status = status
+        self.message = message
+        self.details = details
+
+    @property
+    def success(self):
+        return self.status in ('PASS', 'WARN')
+
+    @classmethod
+    def from_record(cls, case, record):
+        if 'success' in record:
+            status = 'PASS' if record['success'] else 'FAIL'
+        else:
+            status = str(record.get('status', 'FAIL')).upper()
+            status = {'WARNING': 'WARN', 'SKIPPED': 'SKIP'}.get(status, status)
+        return cls(case, record.get('test', case.name), status, record.get('message', ''), record.get('details'))
+
+
+def discover():
+    """Names of the available plugin modules, without importing them"""
+    package = importlib.import_module(PLUGIN_PACKAGE)
+    names = [info.name for info in pkgutil.iter_modules(package.__path__) if not info.name.startswith('_')]
+    ordered = [name for name in PLUGIN_ORDER if name in names]
+    return ordered + sorted(name for name in names if name not in PLUGIN_ORDER)
+
+
+def load_plugin(name):
+    module = importlib.import_module(f"{PLUGIN_PACKAGE}.{name}")
+    for case in module.CASES:
+        case.module = name
+    return list(module.CASES)
+
+
+class SuiteContext:
+    """
+    Shared state for one suite run: a single client, the session (user, token and
+    workspace), the result list and lazily created tester instances.
+
+    Every case runs on a shallow copy of its tester so tests that temporarily clear
+    the token cannot leak it into concurrent tests; attributes a test sets on its copy
+    (e.g. a created invitation token) are written back for the cases that follow.
+    """
+
+    def __init__(self, fresh_user=False):
+        self.client = get_client()
+        self.metrics = MetricsRegistry()
+        self.client.add_listener(self.metrics)
+        self.fresh_user = fresh_user
+        self.token = None
+        self.user_id = None
+        self.workspace_id = None
+        self.test_results = []
+        self._testers = {}
+        self._lock = threading.Lock()
+
+    def tester(self, path):
+        with self._lock:
+            tester = self._testers.get(path)
+            if tester is None:
+                module_name, class_name = path.split(':')
+                tester = getattr(importlib.import_module(module_name), class_name)()
+                self._testers[path] = tester
+            return tester
+
+    def run_case(self, case):
+        base = self.tester(case.tester_path)
+        tester = copy.copy(base)
+        for field in SESSION_FIELDS:
+            setattr(tester, field, getattr(self, field))
+        tester.test_results = records = []
+
+        try:
+            outcome = getattr(tester, case.method)()
+        finally:
+            with self._lock:
+                for key, value in vars(tester).items():
+                    if key not in SESSION_FIELDS and key != 'test_results' and vars(base).get(key) is not value:
+                        setattr(base, key, value)
+
+        results = [TestResult.from_record(case, record) for record in records]
+        if outcome is False and not any(r.status in ('FAIL', 'SKIP') for r in results):
+            results.append(TestResult(case, case.name, 'FAIL', "Test returned False"))
+        for result in results:
+            self.test_results.append(result)
+        return outcome is not False and all(r.status != 'FAIL' for r in results)
+
+    def setup_session(self):
+        """Provide the shared user, token and workspace: a cached fixture or a fresh registration"""
+        fixture = None if self.fresh_user else shared_fixture(self.client)
+        if fixture:
+            fixture.apply(self)
+            print(f"✅ Using cached test user {self.user_id} (workspace {self.workspace_id})\n")
+            return True
+
+        tester = copy.copy(self.tester(BACKEND))
+        tester.test_results = []
+        tester.token = tester.user_id = tester.workspace_id = None
+        if not tester.test_user_registration() or not tester.test_workspace_creation():
+            return False
+        for field in SESSION_FIELDS:
+            setattr(self, field, getattr(tester, field))
+        return True
+
+
+SESSION_CASES = [
+    Case('backend_service_status', f'{BACKEND}.test_backend_service_status', tags=('smoke',), requires=(),
+         provides=('server',), critical=True),
+]
+
+
+class TestSuite:
+    def __init__(self, tags=None, exclude_tags=None, concurrency=DEFAULT_CONCURRENCY, fresh_user=False):
+        self.tags = set(tags or ())
+        self.exclude_tags = set(exclude_tags or ())
+        self.concurrency = concurrency
+        self.context = SuiteContext(fresh_user)
+        self.plugins = discover()
+        self.loaded = {}
+        for case in SESSION_CASES:
+            case.module = 'session'
+
+    def _load(self, names):
+        for name in names:
+            if name not in self.loaded:
+                self.loaded[name] = load_plugin(name)
+
+    def _loaded_cases(self):
+        return [case for name in self.plugins if name in self.loaded for case in self.loaded[name]]
+
+    def select(self):
+        """Selected cases in run order, plus the cases providing what they require"""
+        # Plugin names are tags too, so `--tags crm` only imports the crm plugin
+        if self.tags and self.tags <= set(self.plugins):
+            self._load(name for name in self.plugins if name in self.tags)
+        else:
+            self._load(self.plugins)
+
+        names = set()
+        for case in self._loaded_cases():
+            if case.name in names:
+                raise ValueError(f"Duplicate test case name: {case.name}")
+            names.add(case.name)
+
+        chosen = {
+            case.name for case in self._loaded_cases()
+            if (not self.tags or case.all_tags() & self.tags) and not case.all_tags() & self.exclude_tags
+        }
+
+        # Pull in the cases that create what the selection needs (e.g. a created invitation)
+        while True:
+            needed = {r for case in self._loaded_cases() if case.name in chosen for r in case.requires}
+            providers = {
+                case.name for case in self._loaded_cases()
+                if case.name not in chosen and set(case.provides) & needed
+            }
+            if not providers:
+                break
+            chosen |= providers
+        return [case for case in self._loaded_cases() if case.name in chosen]
+
+    def run(self):
+        cases = self.select()
+        runner = DependencyRunner(self.concurrency)
+        context = self.context
+
+        for case in SESSION_CASES:
+            runner.add(case_runner(context, case), requires=case.requires, provides=case.provides,
+                       critical=True, on_fail="❌ Backend service not running. Stopping tests.",
+                       header=section("SESSION"))
+        if any({'auth', 'user', 'workspace'} & set(case.requires) for case in cases):
+            runner.add(context.setup_session, requires=('server',), provides=('auth', 'user', 'workspace'),
+                       critical=True, on_fail="❌ Could not set up a test user and workspace. Stopping tests.")
+
+        module = None
+        for case in cases:
+            header = None
+            if case.module != module:
+                module = case.module
+                header = section(f"\n{module.upper()}")
+            runner.add(case_runner(context, case), requires=case.requires, provides=case.provides,
+                       critical=case.critical, exclusive=case.exclusive, header=header)
+
+        start = time.perf_counter()
+        completed = runner.run(context)
+        self.elapsed = time.perf_counter() - start
+        self.print_summary(cases)
+        return completed and all(result.status != 'FAIL' for result in context.test_results)
+
+    def print_summary(self, cases):
+        results = self.context.test_results
+        print("\n" + "=" * 80)
+        print("TEST SUITE SUMMARY")
+        print("=" * 80)
+        passed = sum(1 for r in results if r.success)
+        failed = [r for r in results if r.status == 'FAIL']
+        skipped = sum(1 for r in results if r.status == 'SKIP')
+        total = len(results)
+        rate = (passed / total) * 100 if total else 0
+        print(f"Tests Passed: {passed}/{total} ({rate:.1f}%), {len(failed)} failed, {skipped} skipped, "
+              f"{len(cases)} cases in {self.elapsed:.1f}s")
+        print()
+
+        modules = {}
+        for result in results:
+            counts = modules.setdefault(result.case.module, [0, 0])
+            counts[0 if result.success else 1] += 1
+        for module, (ok, bad) in modules.items():
+            print(f"   {'✅' if not bad else '❌'} {module}: {ok} passed, {bad} not passed")
+        print()
+
+        print_latency_table(self.context.metrics)
+
+        if failed:
+            print("❌ FAILED TESTS:")
+            for result in failed:
+                print(f"   • [{result.case.module}] {result.name}: {result.message}")
+            print()
+
+
+def case_runner(context, case):
+    def run():
+        return context.run_case(case)
+    run.__name__ = case.name
+    return run
+
+
+def section(title):
+    return f"{title}\n{'-' * 40}\n"
+
+
+def print_catalogue(suite):
+    for case in suite.select():
+        print(f"{case.module:<14}{case.name:<48}{','.join(case.tags)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Mewayz API test suite")
+    parser.add_argument('--tags', help="Comma-separated tags, plugin or case names to run (any match)")
+    parser.add_argument('--exclude-tags', help="Comma-separated tags to skip")
+    parser.add_argument('--list', action='store_true', help="List the selected cases without running them")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help="Maximum number of independent tests run at once (1 = sequential)")
+    parser.add_argument('--fresh-user', action='store_true',
+                        help="Register a new user instead of using the cached fixture pool")
+    baseline.add_arguments(parser)
+    budgets.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    split = lambda value: [t.strip() for t in value.split(',') if t.strip()] if value else []
+    suite = TestSuite(split(args.tags), split(args.exclude_tags), args.concurrency, args.fresh_user)
+    if args.list:
+        print_catalogue(suite)
+        return 0
+
+    success = suite.run()
+    success = baseline.gate(suite.context.metrics, suite.elapsed, args.save_baseline, args.compare_baseline,
+                            args.baseline_label, 'suite', baseline.tolerances_from_args(args),
+                            baseline.load_overrides(args.tolerance_overrides), throughput=False) and success
+    success = budgets.enforce(suite.context.metrics, budgets.load_budgets(args.query_budgets)) and success
+    return 0 if success else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,5 @@
+"""
+Test suite plugins
+Each module declares CASES, a list of tests.suite.Case; the module name is a tag.
+Modules are discovered without importing and loaded only when a selection needs them.
+"""
@@ -0,0 +1,22 @@
+"""Analytics dashboard, events, exports and custom reports"""
+
+from tests.suite.core import BACKEND, Case
+
+CASES = [
+    Case('analytics_dashboard', f'{BACKEND}.test_analytics_dashboard', tags=('smoke',)),
+    Case('analytics_module_specific', f'{BACKEND}.test_analytics_module_specific'),
+    Case('analytics_track_event', f'{BACKEND}.test_analytics_track_event'),
+    Case('analytics_export', f'{BACKEND}.test_analytics_export', tags=('slow',)),
+    Case('analytics_real_time', f'{BACKEND}.test_analytics_real_time'),
+    Case('analytics_custom_report', f'{BACKEND}.test_analytics_custom_report', tags=('slow',)),
+    Case('gamification_dashboard', f'{BACKEND}.test_gamification_dashboard', tags=('gamification',)),
+    Case('gamification_achievements', f'{BACKEND}.test_gamification_achievements', tags=('gamification',)),
+    Case('gamification_leaderboard', f'{BACKEND}.test_gamification_leaderboard', tags=('gamification',)),
+    Case('gamification_progress', f'{BACKEND}.test_gamification_progress', tags=('gamification',)),
+    Case('gamification_update_progress', f'{BACKEND}.test_gamification_update_progress', tags=('gamification',)),
+    Case('gamification_check_achievements', f'{BACKEND}.test_gamification_check_achievements',
+         tags=('gamification',)),
+    Case('gamification_stats', f'{BACKEND}.test_gamification_stats', tags=('gamification',)),
+    Case('gamification_initialize_achievements', f'{BACKEND}.test_gamification_initialize_achievements',
+         tags=('gamification',), requires=('auth',)),
+]
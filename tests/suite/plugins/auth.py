@@ -0,0 +1,14 @@
+"""Registration, login and token protection"""
+
+from tests.suite.core import BACKEND, Case
+
+# Registration and login replace the tester's token with another user's, so they only
+# run on their own tester copy and never provide the suite session
+CASES = [
+    Case('user_registration', f'{BACKEND}.test_user_registration', tags=('smoke',), requires=('server',)),
+    Case('user_login', f'{BACKEND}.test_user_login', requires=('server',)),
+    Case('authenticated_user_data', f'{BACKEND}.test_authenticated_user_data', tags=('smoke',), requires=('auth',)),
+    Case('authentication_protection', f'{BACKEND}.test_authentication_protection', tags=('smoke',),
+         requires=('auth',)),
+    Case('database_connectivity', f'{BACKEND}.test_database_connectivity', requires=('auth',)),
+]
@@ -0,0 +1,13 @@
+"""CRM contacts, pipeline, deals, tasks, communications and automation"""
+
+from tests.suite.core import BACKEND, Case
+
+CASES = [
+    Case('crm_endpoints', f'{BACKEND}.test_crm_endpoints', tags=('smoke',), requires=('auth',)),
+    Case('crm_pipeline_management', f'{BACKEND}.test_crm_pipeline_management'),
+    Case('crm_deals_management', f'{BACKEND}.test_crm_deals_management', tags=('smoke',)),
+    Case('crm_tasks_management', f'{BACKEND}.test_crm_tasks_management'),
+    Case('crm_communications_management', f'{BACKEND}.test_crm_communications_management'),
+    Case('crm_contact_analytics', f'{BACKEND}.test_crm_contact_analytics', tags=('analytics',)),
+    Case('crm_automation_rules', f'{BACKEND}.test_crm_automation_rules'),
+]
@@ -0,0 +1,12 @@
+"""Products, stock, orders and product analytics"""
+
+from tests.suite.core import BACKEND, Case
+
+CASES = [
+    Case('product_endpoints', f'{BACKEND}.test_product_endpoints', tags=('smoke',), requires=('auth',)),
+    Case('ecommerce_stock_management', f'{BACKEND}.test_ecommerce_stock_management'),
+    Case('ecommerce_order_management', f'{BACKEND}.test_ecommerce_order_management', tags=('smoke',)),
+    Case('ecommerce_inventory_alerts', f'{BACKEND}.test_ecommerce_inventory_alerts', requires=('auth',)),
+    Case('ecommerce_product_categories', f'{BACKEND}.test_ecommerce_product_categories', requires=('auth',)),
+    Case('ecommerce_product_analytics', f'{BACKEND}.test_ecommerce_product_analytics', tags=('analytics',)),
+]
@@ -0,0 +1,15 @@
+"""Instagram content calendar, stories, hashtags and competitor analysis"""
+
+from tests.suite.core import BACKEND, Case
+
+CASES = [
+    Case('social_media_endpoints', f'{BACKEND}.test_social_media_endpoints', tags=('smoke',)),
+    Case('instagram_content_calendar', f'{BACKEND}.test_instagram_content_calendar'),
+    Case('instagram_stories_management', f'{BACKEND}.test_instagram_stories_management'),
+    Case('instagram_hashtag_research', f'{BACKEND}.test_instagram_hashtag_research'),
+    Case('instagram_hashtag_analytics', f'{BACKEND}.test_instagram_hashtag_analytics', tags=('analytics',)),
+    Case('instagram_analytics_dashboard', f'{BACKEND}.test_instagram_analytics_dashboard',
+         tags=('analytics', 'smoke')),
+    Case('instagram_competitor_analysis', f'{BACKEND}.test_instagram_competitor_analysis'),
+    Case('instagram_optimal_posting_times', f'{BACKEND}.test_instagram_optimal_posting_times'),
+]
@@ -0,0 +1,29 @@
+"""Workspace invitations: single and bulk, public token routes, management and analytics"""
+
+from tests.suite.core import Case
+
+INVITATIONS = 'tests.scripts.workspace_invitation_test:WorkspaceInvitationTester'
+
+# The token-route and management cases share (and finally decline/cancel) the invitation
+# created by create_single_invitation, so each one requires and provides it to keep them in order
+CHAIN = ('auth', 'workspace', 'invitation')
+
+CASES = [
+    Case('get_workspace_invitations', f'{INVITATIONS}.test_get_workspace_invitations', tags=('smoke',)),
+    Case('create_single_invitation', f'{INVITATIONS}.test_create_single_invitation', tags=('smoke',),
+         provides=('invitation',)),
+    Case('create_bulk_invitations', f'{INVITATIONS}.test_create_bulk_invitations', tags=('bulk',)),
+    Case('invitation_analytics', f'{INVITATIONS}.test_get_invitation_analytics', tags=('analytics',)),
+    Case('invitation_by_token', f'{INVITATIONS}.test_get_invitation_by_token', requires=CHAIN,
+         provides=('invitation',)),
+    Case('decline_invitation', f'{INVITATIONS}.test_decline_invitation', requires=CHAIN, provides=('invitation',)),
+    Case('resend_invitation', f'{INVITATIONS}.test_resend_invitation', requires=CHAIN, provides=('invitation',)),
+    Case('cancel_invitation', f'{INVITATIONS}.test_cancel_invitation', requires=CHAIN, provides=('invitation',)),
+    Case('accept_invitation_authentication_required',
+         f'{INVITATIONS}.test_accept_invitation_authentication_required', requires=CHAIN,
+         provides=('invitation',)),
+    Case('unauthorized_invitation_access', f'{INVITATIONS}.test_unauthorized_access'),
+    Case('duplicate_invitation_handling', f'{INVITATIONS}.test_duplicate_invitation_handling'),
+    Case('invitation_validation', f'{INVITATIONS}.test_invitation_validation'),
+    Case('invitation_database_structure', f'{INVITATIONS}.test_database_structure'),
+]
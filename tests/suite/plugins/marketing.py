@@ -0,0 +1,14 @@
+"""Marketing hub, link in bio and courses"""
+
+from tests.suite.core import BACKEND, Case
+
+CASES = [
+    Case('marketing_analytics', f'{BACKEND}.test_marketing_analytics', tags=('analytics',)),
+    Case('marketing_automation', f'{BACKEND}.test_marketing_automation'),
+    Case('marketing_content_management', f'{BACKEND}.test_marketing_content_management'),
+    Case('marketing_lead_magnets', f'{BACKEND}.test_marketing_lead_magnets'),
+    Case('marketing_social_media_management', f'{BACKEND}.test_marketing_social_media_management'),
+    Case('marketing_conversion_funnels', f'{BACKEND}.test_marketing_conversion_funnels'),
+    Case('link_in_bio_endpoints', f'{BACKEND}.test_link_in_bio_endpoints', tags=('smoke',), requires=('auth',)),
+    Case('course_endpoints', f'{BACKEND}.test_course_endpoints', tags=('smoke',), requires=('auth',)),
+]
@@ -0,0 +1,35 @@
+"""Template marketplace: browsing, purchases, reviews and creator tools"""
+
+from tests.suite.core import BACKEND, Case
+
+# The creator cases after template_creation all work on the first of the creator's templates,
+# and template_deletion removes it, so each one requires and provides it to keep them in order
+CREATOR_CHAIN = ('auth', 'workspace', 'creator_template')
+
+CASES = [
+    Case('template_marketplace_browsing', f'{BACKEND}.test_template_marketplace_browsing', tags=('smoke',)),
+    Case('template_categories', f'{BACKEND}.test_template_categories', requires=('auth',)),
+    Case('template_collections', f'{BACKEND}.test_template_collections', requires=('auth',)),
+    Case('template_details', f'{BACKEND}.test_template_details', requires=('auth',)),
+    Case('collection_details', f'{BACKEND}.test_collection_details', requires=('auth',)),
+    Case('template_purchase', f'{BACKEND}.test_template_purchase', tags=('purchase',)),
+    Case('collection_purchase', f'{BACKEND}.test_collection_purchase', tags=('purchase',)),
+    Case('user_purchases', f'{BACKEND}.test_user_purchases', tags=('purchase',)),
+    Case('template_reviews', f'{BACKEND}.test_template_reviews', requires=('auth',)),
+    Case('template_review_submission', f'{BACKEND}.test_template_review_submission'),
+    Case('creator_templates', f'{BACKEND}.test_creator_templates', tags=('creator',)),
+    Case('template_creation', f'{BACKEND}.test_template_creation', tags=('creator',),
+         provides=('creator_template',)),
+    Case('template_updating', f'{BACKEND}.test_template_updating', tags=('creator',), requires=CREATOR_CHAIN,
+         provides=('creator_template',)),
+    Case('template_publishing', f'{BACKEND}.test_template_publishing', tags=('creator',), requires=CREATOR_CHAIN,
+         provides=('creator_template',)),
+    Case('creator_collections', f'{BACKEND}.test_creator_collections', tags=('creator',), requires=('auth',)),
+    Case('collection_creation', f'{BACKEND}.test_collection_creation', tags=('creator',), requires=CREATOR_CHAIN,
+         provides=('creator_template',)),
+    Case('template_analytics', f'{BACKEND}.test_template_analytics', tags=('creator', 'analytics'),
+         requires=CREATOR_CHAIN, provides=('creator_template',)),
+    Case('template_deletion', f'{BACKEND}.test_template_deletion', tags=('creator',), requires=CREATOR_CHAIN,
+         provides=('creator_template',)),
+    Case('creator_dashboard', f'{BACKEND}.test_creator_dashboard', tags=('creator',)),
+]
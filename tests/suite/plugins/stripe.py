@@ -0,0 +1,12 @@
+"""Subscriptions and Stripe checkout"""
+
+from tests.suite.core import BACKEND, Case
+
+CASES = [
+    Case('subscription_plans', f'{BACKEND}.test_subscription_plans', tags=('smoke',), requires=('auth',)),
+    Case('subscription_current', f'{BACKEND}.test_subscription_current', requires=('auth',)),
+    Case('subscription_usage', f'{BACKEND}.test_subscription_usage', requires=('auth',)),
+    Case('subscription_checkout', f'{BACKEND}.test_subscription_checkout', requires=('auth',)),
+    Case('free_subscription_creation', f'{BACKEND}.test_free_subscription_creation'),
+    Case('stripe_checkout_session_creation', f'{BACKEND}.test_stripe_checkout_session_creation', tags=('smoke',)),
+]
@@ -0,0 +1,23 @@
+"""Workspaces, setup wizard and team management"""
+
+from tests.suite.core import BACKEND, Case
+
+CASES = [
+    Case('workspace_creation', f'{BACKEND}.test_workspace_creation', requires=('auth',)),
+    Case('workspace_listing', f'{BACKEND}.test_workspace_listing', tags=('smoke',)),
+    Case('setup_wizard_goals', f'{BACKEND}.test_workspace_setup_wizard_goals', tags=('setup',)),
+    Case('setup_wizard_features_by_goal', f'{BACKEND}.test_workspace_setup_wizard_features_by_goal',
+         tags=('setup',)),
+    Case('setup_wizard_subscription_plans', f'{BACKEND}.test_workspace_setup_wizard_subscription_plans',
+         tags=('setup',)),
+    Case('workspace_setup_progress', f'{BACKEND}.test_workspace_setup_progress', tags=('setup', 'smoke')),
+    Case('workspace_complete_setup', f'{BACKEND}.test_workspace_complete_setup', tags=('setup',)),
+    Case('team_dashboard', f'{BACKEND}.test_team_dashboard', tags=('team', 'smoke')),
+    Case('team_members', f'{BACKEND}.test_team_members', tags=('team',)),
+    Case('team_invite', f'{BACKEND}.test_team_invite', tags=('team',)),
+    Case('team_roles', f'{BACKEND}.test_team_roles', tags=('team',)),
+    Case('team_role_creation', f'{BACKEND}.test_team_role_creation', tags=('team',)),
+    Case('team_activities', f'{BACKEND}.test_team_activities', tags=('team',)),
+    Case('team_notifications', f'{BACKEND}.test_team_notifications', tags=('team',)),
+    Case('team_initialize_roles', f'{BACKEND}.test_team_initialize_roles', tags=('team',)),
+]